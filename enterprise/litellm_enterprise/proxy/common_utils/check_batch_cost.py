@@ -40,7 +40,7 @@ class CheckBatchCost:
         )
 
         from litellm.batches.batch_utils import (
-            _get_file_content_as_dictionary,
+            _iter_file_content_as_dictionary,
             calculate_batch_cost_and_usage,
         )
         from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
@@ -125,7 +125,8 @@ class CheckBatchCost:
                     model_file_id_mapping=model_file_id_mapping,
                 )
 
-                file_content_as_dict = _get_file_content_as_dictionary(
+                # parsed one line at a time while cost and usage are aggregated
+                file_content_as_dict = _iter_file_content_as_dictionary(
                     _file_content.content
                 )
 
@@ -67,6 +67,8 @@ else:
 
 class _PROXY_LiteLLMManagedFiles(CustomLogger, BaseFileEndpoints):
     # Class variables or attributes
+    streaming_logging_fields = frozenset()  # no success logging
+
     def __init__(
         self, internal_usage_cache: InternalUsageCache, prisma_client: PrismaClient
     ):
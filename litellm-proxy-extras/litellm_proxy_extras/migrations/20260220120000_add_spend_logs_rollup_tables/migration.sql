@@ -0,0 +1,58 @@
+-- CreateTable
+CREATE TABLE "LiteLLM_SpendLogsRollup" (
+    "id" TEXT NOT NULL,
+    "granularity" TEXT NOT NULL,
+    "period_start" TIMESTAMP(3) NOT NULL,
+    "team_id" TEXT NOT NULL DEFAULT '',
+    "api_key" TEXT NOT NULL DEFAULT '',
+    "user" TEXT NOT NULL DEFAULT '',
+    "end_user" TEXT NOT NULL DEFAULT '',
+    "model" TEXT NOT NULL DEFAULT '',
+    "model_group" TEXT NOT NULL DEFAULT '',
+    "model_id" TEXT NOT NULL DEFAULT '',
+    "custom_llm_provider" TEXT NOT NULL DEFAULT '',
+    "status" TEXT NOT NULL DEFAULT '',
+    "prompt_tokens" BIGINT NOT NULL DEFAULT 0,
+    "completion_tokens" BIGINT NOT NULL DEFAULT 0,
+    "total_tokens" BIGINT NOT NULL DEFAULT 0,
+    "spend" DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    "api_requests" BIGINT NOT NULL DEFAULT 0,
+    "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "LiteLLM_SpendLogsRollup_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "LiteLLM_SpendLogsTagRollup" (
+    "id" TEXT NOT NULL,
+    "granularity" TEXT NOT NULL,
+    "period_start" TIMESTAMP(3) NOT NULL,
+    "tag" TEXT NOT NULL,
+    "team_id" TEXT NOT NULL DEFAULT '',
+    "api_key" TEXT NOT NULL DEFAULT '',
+    "model" TEXT NOT NULL DEFAULT '',
+    "model_id" TEXT NOT NULL DEFAULT '',
+    "status" TEXT NOT NULL DEFAULT '',
+    "prompt_tokens" BIGINT NOT NULL DEFAULT 0,
+    "completion_tokens" BIGINT NOT NULL DEFAULT 0,
+    "total_tokens" BIGINT NOT NULL DEFAULT 0,
+    "spend" DOUBLE PRECISION NOT NULL DEFAULT 0.0,
+    "api_requests" BIGINT NOT NULL DEFAULT 0,
+    "created_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "LiteLLM_SpendLogsTagRollup_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "LiteLLM_SpendLogsRollup_granularity_period_start_idx" ON "LiteLLM_SpendLogsRollup"("granularity", "period_start");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "LiteLLM_SpendLogsRollup_key" ON "LiteLLM_SpendLogsRollup"("granularity", "period_start", "team_id", "api_key", "user", "end_user", "model", "model_group", "model_id", "custom_llm_provider", "status");
+
+-- CreateIndex
+CREATE INDEX "LiteLLM_SpendLogsTagRollup_granularity_period_start_idx" ON "LiteLLM_SpendLogsTagRollup"("granularity", "period_start");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "LiteLLM_SpendLogsTagRollup_key" ON "LiteLLM_SpendLogsTagRollup"("granularity", "period_start", "tag", "team_id", "api_key", "model", "model_id", "status");
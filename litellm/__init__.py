@@ -141,6 +141,7 @@ _custom_logger_compatible_callbacks_literal = Literal[
     "levo",
 ]
 cold_storage_custom_logger: Optional[_custom_logger_compatible_callbacks_literal] = None
+responses_conversation_store: Optional[Dict[str, Any]] = None  # settings for ResponsesConversationStore
 logged_real_time_event_types: Optional[Union[List[str], Literal["*"]]] = None
 _known_custom_logger_compatible_callbacks: List = list(
     get_args(_custom_logger_compatible_callbacks_literal)
@@ -400,6 +401,9 @@ disable_aiohttp_trust_env: bool = (
 force_ipv4: bool = (
     False  # when True, litellm will force ipv4 for all LLM requests. Some users have seen httpx ConnectionError when using ipv6.
 )
+http2_providers: List[str] = (
+    []
+)  # providers whose requests are multiplexed over a shared HTTP/2 connection pool, e.g. ["openai", "azure", "anthropic"]. Requires `h2`.
 
 ####### STOP SEQUENCE LIMIT #######
 disable_stop_sequence_limit: bool = False  # when True, stop sequence limit is disabled
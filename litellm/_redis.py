@@ -7,18 +7,25 @@
 #
 #  Thank you users! We ❤️ you! - Krrish & Ishaan
 
+import asyncio
 import inspect
 import json
 
 # s/o [@Frank Colson](https://www.linkedin.com/in/frank-colson-422b9b183/) for this redis implementation
 import os
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import unquote, urlparse
 
 import redis  # type: ignore
 import redis.asyncio as async_redis  # type: ignore
 
 from litellm import get_secret, get_secret_str
-from litellm.constants import REDIS_CONNECTION_POOL_TIMEOUT, REDIS_SOCKET_TIMEOUT
+from litellm.constants import (
+    REDIS_CLIENT_SIDE_CACHING_HEALTH_CHECK_INTERVAL,
+    REDIS_CLIENT_SIDE_CACHING_MAX_RECONNECT_BACKOFF,
+    REDIS_CONNECTION_POOL_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT,
+)
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
 
 from ._logging import verbose_logger
@@ -560,3 +567,264 @@ def _pretty_print_redis_config(redis_kwargs: dict) -> None:
     except Exception as e:
         verbose_logger.error(f"Error pretty printing Redis configuration: {e}")
 
+
+class _RespPush(list):
+    """A RESP3 out-of-band push frame (`>`)."""
+
+
+class _RespError(Exception):
+    pass
+
+
+async def _read_resp3_frame(reader: asyncio.StreamReader) -> Any:
+    """Read one RESP3 frame. Bulk strings are returned as bytes."""
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Redis connection closed")
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix in (b"+", b"("):
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        return _RespError(payload.decode("utf-8", errors="replace"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b",":
+        return float(payload)
+    if prefix == b"#":
+        return payload == b"t"
+    if prefix == b"_":
+        return None
+    if prefix in (b"$", b"=", b"!"):
+        length = int(payload)
+        if length < 0:
+            return None
+        data = (await reader.readexactly(length + 2))[:-2]
+        if prefix == b"=":
+            return data[4:]  # strip the "txt:" / "mkd:" format
+        if prefix == b"!":
+            return _RespError(data.decode("utf-8", errors="replace"))
+        return data
+    if prefix in (b"*", b">", b"~"):
+        length = int(payload)
+        if length < 0:
+            return None
+        items = [await _read_resp3_frame(reader) for _ in range(length)]
+        return _RespPush(items) if prefix == b">" else items
+    if prefix in (b"%", b"|"):
+        pairs = {}
+        for _ in range(int(payload)):
+            key = await _read_resp3_frame(reader)
+            pairs[key] = await _read_resp3_frame(reader)
+        if prefix == b"|":
+            # attributes annotate the frame that follows them
+            return await _read_resp3_frame(reader)
+        return pairs
+    raise ConnectionError(f"Unexpected RESP3 frame type: {prefix!r}")
+
+
+def _encode_resp_command(*args: Union[str, bytes, int]) -> bytes:
+    out = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode("utf-8")
+        out.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(out)
+
+
+def _non_overlapping_prefixes(prefixes: List[str]) -> List[str]:
+    """Redis rejects BCAST prefixes that overlap - keep only the shortest ones."""
+    if any(prefix == "" for prefix in prefixes):
+        return []  # no prefix tracks every key
+    result: List[str] = []
+    for prefix in sorted(set(prefixes), key=len):
+        if not any(prefix.startswith(existing) for existing in result):
+            result.append(prefix)
+    return result
+
+
+class RedisInvalidationListener:
+    """
+    Dedicated RESP3 connection that subscribes to Redis client-side caching
+    invalidations (`CLIENT TRACKING ON BCAST PREFIX ...`).
+
+    `on_invalidate(keys)` is called with the invalidated keys, or with `None` when
+    every tracked key must be dropped (FLUSHALL / FLUSHDB, or the connection was
+    lost and invalidations may have been missed).
+
+    `epoch` is bumped on every invalidation and reconnect, so a caller can check
+    that nothing was invalidated between reading a key and caching it locally.
+
+    Only standalone Redis (host / port or url) is supported - cluster and
+    sentinel setups leave `connected` False.
+    """
+
+    def __init__(
+        self,
+        redis_kwargs: Dict[str, Any],
+        prefixes: List[str],
+        on_invalidate: Callable[[Optional[List[str]]], None],
+        health_check_interval: float = REDIS_CLIENT_SIDE_CACHING_HEALTH_CHECK_INTERVAL,
+        max_reconnect_backoff: float = REDIS_CLIENT_SIDE_CACHING_MAX_RECONNECT_BACKOFF,
+    ):
+        self.redis_kwargs = redis_kwargs
+        self.prefixes = _non_overlapping_prefixes(prefixes)
+        self.on_invalidate = on_invalidate
+        self.health_check_interval = health_check_interval
+        self.max_reconnect_backoff = max_reconnect_backoff
+        self.connected = False
+        self.epoch = 0
+        self._task: Optional[asyncio.Task] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending_pings = 0
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _connection_params(self) -> Optional[Dict[str, Any]]:
+        redis_kwargs = _get_redis_client_logic(**self.redis_kwargs)
+        if redis_kwargs.get("startup_nodes") or redis_kwargs.get("sentinel_nodes"):
+            verbose_logger.warning(
+                "Redis client-side caching is not supported for Redis Cluster / Sentinel. Falling back to the default in-memory TTL."
+            )
+            return None
+
+        params: Dict[str, Any] = {
+            "host": redis_kwargs.get("host") or "localhost",
+            "port": int(redis_kwargs.get("port") or 6379),
+            "username": redis_kwargs.get("username"),
+            "password": redis_kwargs.get("password"),
+            "ssl": bool(redis_kwargs.get("ssl")),
+        }
+        url = redis_kwargs.get("url")
+        if url:
+            parsed = urlparse(url)
+            params["host"] = parsed.hostname or params["host"]
+            params["port"] = parsed.port or params["port"]
+            params["username"] = unquote(parsed.username) if parsed.username else None
+            params["password"] = unquote(parsed.password) if parsed.password else None
+            params["ssl"] = parsed.scheme == "rediss"
+        return params
+
+    async def _run(self) -> None:
+        params = self._connection_params()
+        if params is None:
+            return
+        backoff = 0.1
+        while True:
+            try:
+                await self._listen(params)
+                backoff = 0.1
+            except asyncio.CancelledError:
+                self._mark_disconnected()
+                raise
+            except Exception as e:
+                verbose_logger.debug(
+                    "Redis invalidation listener disconnected - %s", str(e)
+                )
+            self._mark_disconnected()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_reconnect_backoff)
+
+    def _mark_disconnected(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        was_connected = self.connected
+        self.connected = False
+        self.epoch += 1
+        if was_connected:
+            # invalidations may be lost while disconnected
+            self._notify(None)
+
+    async def _listen(self, params: Dict[str, Any]) -> None:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                params["host"], params["port"], ssl=params["ssl"] or None
+            ),
+            timeout=max(self.health_check_interval, 1),
+        )
+        self._writer = writer
+
+        hello: List[Union[str, int]] = ["HELLO", 3]
+        if params["password"]:
+            hello += ["AUTH", params["username"] or "default", params["password"]]
+        tracking: List[Union[str, int]] = ["CLIENT", "TRACKING", "ON", "BCAST"]
+        for prefix in self.prefixes:
+            tracking += ["PREFIX", prefix]
+        for command in (hello, tracking):
+            writer.write(_encode_resp_command(*command))
+            await writer.drain()
+            reply = await _read_resp3_frame(reader)
+            if isinstance(reply, _RespError):
+                raise reply
+
+        self._pending_pings = 0
+        self.epoch += 1
+        self.connected = True
+        # anything cached before this connection existed may be stale
+        self._notify(None)
+        verbose_logger.debug(
+            "Redis invalidation listener connected - prefixes=%s", self.prefixes
+        )
+
+        health_check = asyncio.get_running_loop().create_task(
+            self._health_check(writer)
+        )
+        try:
+            while True:
+                frame = await _read_resp3_frame(reader)
+                if isinstance(frame, _RespPush):
+                    self._handle_push(frame)
+                elif frame == "PONG" or frame == b"PONG":
+                    self._pending_pings = 0
+        finally:
+            health_check.cancel()
+
+    async def _health_check(self, writer: asyncio.StreamWriter) -> None:
+        """PING periodically - a half-open connection would silently stop invalidations."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            if self._pending_pings > 0:
+                verbose_logger.debug(
+                    "Redis invalidation listener missed a PING reply, reconnecting"
+                )
+                writer.close()
+                return
+            self._pending_pings += 1
+            writer.write(_encode_resp_command("PING"))
+            await writer.drain()
+
+    def _handle_push(self, frame: _RespPush) -> None:
+        if len(frame) < 2 or frame[0] not in (b"invalidate", "invalidate"):
+            return
+        self.epoch += 1
+        keys = frame[1]
+        if keys is None:
+            self._notify(None)
+        else:
+            self._notify(
+                [
+                    key.decode("utf-8", errors="replace")
+                    if isinstance(key, bytes)
+                    else str(key)
+                    for key in keys
+                ]
+            )
+
+    def _notify(self, keys: Optional[List[str]]) -> None:
+        try:
+            self.on_invalidate(keys)
+        except Exception as e:
+            verbose_logger.exception("Redis invalidation callback failed - %s", str(e))
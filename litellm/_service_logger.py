@@ -29,6 +29,9 @@ class ServiceLogging(CustomLogger):
     Separate class used for monitoring health of litellm-adjacent services (redis/postgres).
     """
 
+    # only logs call latency
+    streaming_logging_fields = frozenset()
+
     def __init__(self, mock_testing: bool = False) -> None:
         self.mock_testing = mock_testing
         self.mock_testing_sync_success_hook = 0
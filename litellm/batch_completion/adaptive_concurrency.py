@@ -0,0 +1,106 @@
+"""
+AIMD (additive increase, multiplicative decrease) concurrency limit for async
+batch completion calls.
+
+Like TCP congestion control, the limit starts in "slow start" - it grows by 1
+per successful request, doubling every round trip - until the first decrease.
+After that it grows by ~1 for every `limit` successful requests, is halved when a
+request is rate limited and is reduced by `DEFAULT_BATCH_COMPLETION_LATENCY_DECREASE_FACTOR`
+when the smoothed request latency rises above `latency_tolerance` times the
+lowest smoothed latency seen - the provider is queueing requests. One decrease
+applies per "window": requests started before the last decrease do not
+decrease the limit again, so a burst of 429s from one window halves it once.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from litellm.constants import (
+    DEFAULT_BATCH_COMPLETION_INITIAL_CONCURRENCY,
+    DEFAULT_BATCH_COMPLETION_LATENCY_DECREASE_FACTOR,
+    DEFAULT_BATCH_COMPLETION_LATENCY_TOLERANCE,
+)
+
+_LATENCY_EWMA_ALPHA = 0.2
+_RATE_LIMIT_DECREASE_FACTOR = 0.5
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        max_concurrency: int,
+        initial_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        latency_tolerance: Optional[float] = DEFAULT_BATCH_COMPLETION_LATENCY_TOLERANCE,
+    ):
+        """
+        Args:
+            max_concurrency: upper bound of the limit
+            initial_concurrency: starting limit. Defaults to
+                `DEFAULT_BATCH_COMPLETION_INITIAL_CONCURRENCY`, capped at `max_concurrency`.
+            min_concurrency: lower bound of the limit
+            latency_tolerance: latency increase (as a multiple of the lowest
+                smoothed latency) that reduces the limit. None disables
+                latency-based decreases.
+        """
+        self.max_concurrency = max(max_concurrency, 1)
+        self.min_concurrency = max(min(min_concurrency, self.max_concurrency), 1)
+        self.limit: float = float(
+            min(
+                max(
+                    initial_concurrency or DEFAULT_BATCH_COMPLETION_INITIAL_CONCURRENCY,
+                    self.min_concurrency,
+                ),
+                self.max_concurrency,
+            )
+        )
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latency_ewma: Optional[float] = None
+        self._min_latency_ewma: Optional[float] = None
+        self._last_decrease_at = 0.0
+        self._slow_start = True
+
+    async def acquire(self) -> float:
+        """Wait for a free slot. Returns the start time to pass to `release`."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return time.monotonic()
+
+    async def release(self, started_at: float, rate_limited: bool = False) -> None:
+        """Free a slot and adjust the limit from the request's outcome."""
+        async with self._condition:
+            self.in_flight -= 1
+            if rate_limited:
+                self._decrease(started_at, _RATE_LIMIT_DECREASE_FACTOR)
+            elif self._is_latency_above_tolerance(time.monotonic() - started_at):
+                self._decrease(started_at, DEFAULT_BATCH_COMPLETION_LATENCY_DECREASE_FACTOR)
+            else:
+                increase = 1 if self._slow_start else 1 / self.limit
+                self.limit = min(self.limit + increase, float(self.max_concurrency))
+            self._condition.notify_all()
+
+    def _is_latency_above_tolerance(self, latency: float) -> bool:
+        if self.latency_tolerance is None:
+            return False
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += _LATENCY_EWMA_ALPHA * (latency - self._latency_ewma)
+        if self._min_latency_ewma is None or self._latency_ewma < self._min_latency_ewma:
+            self._min_latency_ewma = self._latency_ewma
+        return self._latency_ewma > self._min_latency_ewma * self.latency_tolerance
+
+    def _decrease(self, started_at: float, factor: float) -> None:
+        if started_at < self._last_decrease_at:
+            # already decreased for the window this request was sent in
+            return
+        self.limit = max(self.limit * factor, float(self.min_concurrency))
+        self._last_decrease_at = time.monotonic()
+        self._slow_start = False
+        # a lasting latency increase (e.g. longer prompts later in the batch)
+        # becomes the new baseline instead of shrinking the limit to the minimum
+        self._min_latency_ewma = self._latency_ewma
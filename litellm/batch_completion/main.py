@@ -1,9 +1,13 @@
+import asyncio
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import litellm
-from litellm._logging import print_verbose
-from litellm.utils import get_optional_params
+from litellm._logging import print_verbose, verbose_logger
+from litellm.batch_completion.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from litellm.constants import DEFAULT_BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES
+from litellm.types.utils import ModelResponse
+from litellm.utils import _calculate_retry_after, get_optional_params
 
 from ..llms.vllm.completion import handler as vllm_handler
 
@@ -271,3 +275,160 @@ def batch_completion_models_all_responses(*args, **kwargs):
                 continue
 
     return responses
+
+
+async def abatch_completion_iter(
+    model: str,
+    messages: List[List],
+    max_concurrency: int = 100,
+    initial_concurrency: Optional[int] = None,
+    max_rate_limit_retries: int = DEFAULT_BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES,
+    **kwargs,
+) -> AsyncIterator[Tuple[int, Union[ModelResponse, Exception]]]:
+    """
+    Async batch litellm.acompletion for a given model, yielding results as they complete.
+
+    Requests share litellm's async HTTP clients and run on the event loop - no
+    thread per request. Concurrency adapts to the provider (see
+    `AdaptiveConcurrencyLimiter`): it grows while requests succeed, is halved
+    on rate limit errors and shrinks when latency rises. Rate limited requests
+    are sent again after the provider's retry-after / exponential backoff, up
+    to `max_rate_limit_retries` times.
+
+    Args:
+        model (str): The model to use for generating completions.
+        messages (List[List]): One list of messages per completion call.
+        max_concurrency (int, optional): Upper bound of in-flight requests. Defaults to 100.
+        initial_concurrency (int, optional): Starting number of in-flight requests.
+        max_rate_limit_retries (int, optional): Times a rate limited request is sent again.
+        **kwargs: Passed to `litellm.acompletion`.
+
+    Yields:
+        (index, result): index of the messages in `messages`, and the
+        completion response or the exception it raised.
+    """
+    limiter = AdaptiveConcurrencyLimiter(
+        max_concurrency=max_concurrency, initial_concurrency=initial_concurrency
+    )
+    results: asyncio.Queue = asyncio.Queue()
+    tasks = set()
+
+    async def _run(index: int, message_list: List, started_at: float) -> None:
+        rate_limit_retries = 0
+        while True:
+            try:
+                response = await litellm.acompletion(
+                    model=model, messages=message_list, **kwargs
+                )
+            except litellm.RateLimitError as e:
+                await limiter.release(started_at, rate_limited=True)
+                if rate_limit_retries >= max_rate_limit_retries:
+                    results.put_nowait((index, e))
+                    return
+                rate_limit_retries += 1
+                retry_after = _calculate_retry_after(
+                    remaining_retries=max_rate_limit_retries - rate_limit_retries,
+                    max_retries=max_rate_limit_retries,
+                    response_headers=getattr(
+                        getattr(e, "response", None), "headers", None
+                    ),
+                )
+                verbose_logger.debug(
+                    f"abatch_completion: request {index} rate limited, retrying in {retry_after}s with concurrency {int(limiter.limit)}"
+                )
+                await asyncio.sleep(retry_after)
+                started_at = await limiter.acquire()
+                continue
+            except Exception as e:
+                await limiter.release(started_at)
+                results.put_nowait((index, e))
+                return
+            await limiter.release(started_at)
+            results.put_nowait((index, response))
+            return
+
+    async def _dispatch() -> None:
+        for index, message_list in enumerate(messages):
+            # tasks are only created for requests that can start, so thousands
+            # of prompts do not become thousands of waiting coroutines
+            started_at = await limiter.acquire()
+            task = asyncio.create_task(_run(index, message_list, started_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    dispatcher = asyncio.create_task(_dispatch())
+    try:
+        for _ in range(len(messages)):
+            yield await results.get()
+    finally:
+        # the caller stopped iterating (or failed) - drop the remaining requests
+        dispatcher.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+async def abatch_completion(
+    model: str,
+    messages: List[List],
+    max_concurrency: int = 100,
+    **kwargs,
+) -> List[Union[ModelResponse, Exception]]:
+    """
+    Async batch litellm.acompletion for a given model.
+
+    Same as `abatch_completion_iter`, but returns the results in the order of
+    `messages` once all requests completed. Failed requests return their
+    exception, like `batch_completion`.
+    """
+    results: Dict[int, Union[ModelResponse, Exception]] = {}
+    async for index, result in abatch_completion_iter(
+        model=model, messages=messages, max_concurrency=max_concurrency, **kwargs
+    ):
+        results[index] = result
+    return [results[index] for index in range(len(messages))]
+
+
+async def abatch_completion_models_all_responses(*args, **kwargs) -> List:
+    """
+    Async version of `batch_completion_models_all_responses` - send a request to
+    multiple language models concurrently with `litellm.acompletion` and return
+    the responses of all models that respond.
+
+    Args:
+        *args: Variable-length positional arguments passed to the acompletion function.
+        **kwargs: Additional keyword arguments:
+            - models (str or list of str): The language models to send requests to.
+            - Other keyword arguments to be passed to the acompletion function.
+
+    Returns:
+        list: A list of responses from the language models that responded.
+    """
+    if "model" in kwargs:
+        kwargs.pop("model")
+    if "models" in kwargs:
+        models = kwargs.pop("models")
+    else:
+        raise Exception("'models' param not in kwargs")
+
+    if isinstance(models, str):
+        models = [models]
+    elif isinstance(models, (list, tuple)):
+        models = list(models)
+    else:
+        raise TypeError("'models' must be a string or list of strings")
+
+    results = await asyncio.gather(
+        *[litellm.acompletion(*args, model=model, **kwargs) for model in models],
+        return_exceptions=True,
+    )
+
+    responses = []
+    for result in results:
+        if isinstance(result, Exception):
+            print_verbose(
+                f"abatch_completion_models_all_responses: model request failed: {str(result)}"
+            )
+            continue
+        if result is not None:
+            responses.append(result)
+    return responses
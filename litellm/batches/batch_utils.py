@@ -1,38 +1,33 @@
-import json
 import time
-from typing import Any, List, Literal, Optional, Tuple
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Tuple
 
 import httpx
 
 import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid
+from litellm.litellm_core_utils.jsonl_utils import JsonlSource, iter_jsonl_objects
 from litellm.types.llms.openai import Batch
 from litellm.types.utils import CallTypes, ModelResponse, Usage
 from litellm.utils import token_counter
 
 
 async def calculate_batch_cost_and_usage(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"],
     model_name: Optional[str] = None,
 ) -> Tuple[float, Usage, List[str]]:
     """
     Calculate the cost and usage of a batch
+
+    `file_content_dictionary` is read once, so it can be a generator over the
+    output file - see `_iter_file_content_as_dictionary`.
     """
-    batch_cost = _batch_cost_calculator(
-        custom_llm_provider=custom_llm_provider,
-        file_content_dictionary=file_content_dictionary,
-        model_name=model_name,
-    )
-    batch_usage = _get_batch_job_total_usage_from_file_content(
+    return _get_batch_job_cost_usage_and_models_from_file_content(
         file_content_dictionary=file_content_dictionary,
         custom_llm_provider=custom_llm_provider,
         model_name=model_name,
     )
-    batch_models = _get_batch_models_from_file_content(file_content_dictionary, model_name)
-
-    return batch_cost, batch_usage, batch_models
 
 
 async def _handle_completed_batch(
@@ -41,30 +36,72 @@ async def _handle_completed_batch(
     model_name: Optional[str] = None,
 ) -> Tuple[float, Usage, List[str]]:
     """Helper function to process a completed batch and handle logging"""
-    # Get batch results
+    # Get batch results, parsed one line at a time
     file_content_dictionary = await _get_batch_output_file_content_as_dictionary(
         batch, custom_llm_provider
     )
 
     # Calculate costs and usage
-    batch_cost = _batch_cost_calculator(
-        custom_llm_provider=custom_llm_provider,
-        file_content_dictionary=file_content_dictionary,
-        model_name=model_name,
-    )
-    batch_usage = _get_batch_job_total_usage_from_file_content(
+    return _get_batch_job_cost_usage_and_models_from_file_content(
         file_content_dictionary=file_content_dictionary,
         custom_llm_provider=custom_llm_provider,
         model_name=model_name,
     )
 
-    batch_models = _get_batch_models_from_file_content(file_content_dictionary, model_name)
 
-    return batch_cost, batch_usage, batch_models
+def _get_batch_job_cost_usage_and_models_from_file_content(
+    file_content_dictionary: Iterable[dict],
+    custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
+    model_name: Optional[str] = None,
+) -> Tuple[float, Usage, List[str]]:
+    """
+    Get the cost, usage and models of a batch job in a single pass over the file content
+    """
+    # Handle Vertex AI with specialized method
+    if custom_llm_provider == "vertex_ai" and model_name:
+        batch_cost, batch_usage = calculate_vertex_ai_batch_cost_and_usage(
+            file_content_dictionary, model_name
+        )
+        verbose_logger.debug("vertex_ai_total_cost=%s", batch_cost)
+        return batch_cost, batch_usage, [model_name]
+
+    total_cost: float = 0.0
+    total_tokens: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    batch_models: List[str] = []
+    for _item in file_content_dictionary:
+        if not _batch_response_was_successful(_item):
+            continue
+        _response_body = _get_response_from_batch_job_output_file(_item)
+        total_cost += litellm.completion_cost(
+            completion_response=_response_body,
+            custom_llm_provider=custom_llm_provider,
+            call_type=CallTypes.aretrieve_batch.value,
+        )
+        usage: Usage = _get_batch_job_usage_from_response_body(_response_body)
+        total_tokens += usage.total_tokens
+        prompt_tokens += usage.prompt_tokens
+        completion_tokens += usage.completion_tokens
+        if not model_name:
+            _model = _response_body.get("model")
+            if _model:
+                batch_models.append(_model)
+    verbose_logger.debug("total_cost=%s", total_cost)
+
+    return (
+        total_cost,
+        Usage(
+            total_tokens=total_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        ),
+        [model_name] if model_name else batch_models,
+    )
 
 
 def _get_batch_models_from_file_content(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     model_name: Optional[str] = None,
 ) -> List[str]:
     """
@@ -72,41 +109,30 @@ def _get_batch_models_from_file_content(
     """
     if model_name:
         return [model_name]
-    batch_models = []
-    for _item in file_content_dictionary:
-        if _batch_response_was_successful(_item):
-            _response_body = _get_response_from_batch_job_output_file(_item)
-            _model = _response_body.get("model")
-            if _model:
-                batch_models.append(_model)
+    _, _, batch_models = _get_batch_job_cost_usage_and_models_from_file_content(
+        file_content_dictionary=file_content_dictionary,
+    )
     return batch_models
 
 
 def _batch_cost_calculator(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
     model_name: Optional[str] = None,
 ) -> float:
     """
     Calculate the cost of a batch based on the output file id
     """
-    # Handle Vertex AI with specialized method
-    if custom_llm_provider == "vertex_ai" and model_name:
-        batch_cost, _ = calculate_vertex_ai_batch_cost_and_usage(file_content_dictionary, model_name)
-        verbose_logger.debug("vertex_ai_total_cost=%s", batch_cost)
-        return batch_cost
-    
-    # For other providers, use the existing logic
-    total_cost = _get_batch_job_cost_from_file_content(
+    batch_cost, _, _ = _get_batch_job_cost_usage_and_models_from_file_content(
         file_content_dictionary=file_content_dictionary,
         custom_llm_provider=custom_llm_provider,
+        model_name=model_name,
     )
-    verbose_logger.debug("total_cost=%s", total_cost)
-    return total_cost
+    return batch_cost
 
 
 def calculate_vertex_ai_batch_cost_and_usage(
-    vertex_ai_batch_responses: List[dict],
+    vertex_ai_batch_responses: Iterable[dict],
     model_name: Optional[str] = None,
 ) -> Tuple[float, Usage]:
     """
@@ -187,9 +213,9 @@ def calculate_vertex_ai_batch_cost_and_usage(
 async def _get_batch_output_file_content_as_dictionary(
     batch: Batch,
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
-) -> List[dict]:
+) -> Iterator[dict]:
     """
-    Get the batch output file content as a list of dictionaries
+    Get the batch output file content as an iterator of dictionaries, parsed one line at a time
     """
     from litellm.files.main import afile_content
     from litellm.proxy.openai_files_endpoints.common_utils import (
@@ -215,28 +241,28 @@ async def _get_batch_output_file_content_as_dictionary(
         file_id=file_id,
         custom_llm_provider=custom_llm_provider,
     )
-    return _get_file_content_as_dictionary(_file_content.content)
+    return _iter_file_content_as_dictionary(_file_content.content)
 
 
 def _get_file_content_as_dictionary(file_content: bytes) -> List[dict]:
     """
     Get the file content as a list of dictionaries from JSON Lines format
     """
-    try:
-        _file_content_str = file_content.decode("utf-8")
-        # Split by newlines and parse each line as a separate JSON object
-        json_objects = []
-        for line in _file_content_str.strip().split("\n"):
-            if line:  # Skip empty lines
-                json_objects.append(json.loads(line))
-        verbose_logger.debug("json_objects=%s", json.dumps(json_objects, indent=4))
-        return json_objects
-    except Exception as e:
-        raise e
+    return list(_iter_file_content_as_dictionary(file_content))
+
+
+def _iter_file_content_as_dictionary(file_content: JsonlSource) -> Iterator[dict]:
+    """
+    Parse JSON Lines file content one line at a time
+
+    `file_content` can be bytes, a file-like object or an iterable of byte
+    chunks; only the current line and its parsed object are held in memory.
+    """
+    return iter_jsonl_objects(file_content)
 
 
 def _get_batch_job_cost_from_file_content(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
 ) -> float:
     """
@@ -244,10 +270,6 @@ def _get_batch_job_cost_from_file_content(
     """
     try:
         total_cost: float = 0.0
-        # parse the file content as json
-        verbose_logger.debug(
-            "file_content_dictionary=%s", json.dumps(file_content_dictionary, indent=4)
-        )
         for _item in file_content_dictionary:
             if _batch_response_was_successful(_item):
                 _response_body = _get_response_from_batch_job_output_file(_item)
@@ -264,37 +286,22 @@ def _get_batch_job_cost_from_file_content(
 
 
 def _get_batch_job_total_usage_from_file_content(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai", "hosted_vllm", "anthropic"] = "openai",
     model_name: Optional[str] = None,
 ) -> Usage:
     """
     Get the tokens of a batch job from the file content
     """
-    # Handle Vertex AI with specialized method
-    if custom_llm_provider == "vertex_ai" and model_name:
-        _, batch_usage = calculate_vertex_ai_batch_cost_and_usage(file_content_dictionary, model_name)
-        return batch_usage
-    
-    # For other providers, use the existing logic
-    total_tokens: int = 0
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    for _item in file_content_dictionary:
-        if _batch_response_was_successful(_item):
-            _response_body = _get_response_from_batch_job_output_file(_item)
-            usage: Usage = _get_batch_job_usage_from_response_body(_response_body)
-            total_tokens += usage.total_tokens
-            prompt_tokens += usage.prompt_tokens
-            completion_tokens += usage.completion_tokens
-    return Usage(
-        total_tokens=total_tokens,
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
+    _, batch_usage, _ = _get_batch_job_cost_usage_and_models_from_file_content(
+        file_content_dictionary=file_content_dictionary,
+        custom_llm_provider=custom_llm_provider,
+        model_name=model_name,
     )
+    return batch_usage
 
 def _get_batch_job_input_file_usage(
-    file_content_dictionary: List[dict],
+    file_content_dictionary: Iterable[dict],
     custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
     model_name: Optional[str] = None,
 ) -> Usage:
@@ -303,10 +310,28 @@ def _get_batch_job_input_file_usage(
 
     Used for batch rate limiting to count the number of tokens in the input file
     """    
+    usage, _ = _get_batch_job_input_file_usage_and_request_count(
+        file_content_dictionary=file_content_dictionary,
+        custom_llm_provider=custom_llm_provider,
+        model_name=model_name,
+    )
+    return usage
+
+
+def _get_batch_job_input_file_usage_and_request_count(
+    file_content_dictionary: Iterable[dict],
+    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
+    model_name: Optional[str] = None,
+) -> Tuple[Usage, int]:
+    """
+    Count the number of tokens and requests in the input file, in a single pass
+    """
     prompt_tokens: int = 0
     completion_tokens: int = 0
-    
+    request_count: int = 0
+
     for _item in file_content_dictionary:
+        request_count += 1
         body = _item.get("body", {})
         model = body.get("model", model_name or "")
         messages = body.get("messages", [])
@@ -315,10 +340,13 @@ def _get_batch_job_input_file_usage(
             item_tokens = token_counter(model=model, messages=messages)
             prompt_tokens += item_tokens
         
-    return Usage(
-        total_tokens=prompt_tokens + completion_tokens,
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
+    return (
+        Usage(
+            total_tokens=prompt_tokens + completion_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        ),
+        request_count,
     )
 
 def _get_batch_job_usage_from_response_body(response_body: dict) -> Usage:
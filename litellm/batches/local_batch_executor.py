@@ -0,0 +1,570 @@
+"""
+Run OpenAI-format batch files through a Router.
+
+For model groups whose providers have no batch API: every line of the batch
+input file is sent as a regular request to a router model group, so retries
+and fallbacks go through the router as for any other request. Concurrency is
+bounded, the request rate is capped below the model group's rpm / tpm so that
+interactive traffic keeps headroom, results are appended to the output file as
+they come in, and progress is checkpointed so an interrupted batch resumes
+where it left off.
+
+A batch lives in its own directory:
+    input.jsonl   - the batch input file
+    output.jsonl  - results of successful requests, in the OpenAI batch output format
+    errors.jsonl  - results of failed requests
+    state.json    - `LocalBatchState`, rewritten at every checkpoint
+    cancel        - created to cancel the batch from another process
+"""
+
+import asyncio
+import copy
+import json
+import os
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm._uuid import uuid
+from litellm.constants import (
+    LOCAL_BATCH_CHECKPOINT_INTERVAL,
+    LOCAL_BATCH_HEADROOM_FRACTION,
+    LOCAL_BATCH_MAX_CONCURRENT_REQUESTS,
+    LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES,
+    LOCAL_BATCH_RATE_LIMIT_BACKOFF_SECONDS,
+)
+from litellm.litellm_core_utils.jsonl_utils import (
+    JsonlSource,
+    iter_jsonl_lines,
+    write_jsonl,
+)
+from litellm.types.batches import LocalBatchEndpoint, LocalBatchState
+
+if TYPE_CHECKING:
+    from litellm.router import Router
+else:
+    Router = Any
+
+LOCAL_BATCH_ROUTER_METHODS: Dict[str, str] = {
+    "/v1/chat/completions": "acompletion",
+    "/v1/completions": "atext_completion",
+    "/v1/embeddings": "aembedding",
+    "/v1/responses": "aresponses",
+}
+
+INPUT_FILE_NAME = "input.jsonl"
+OUTPUT_FILE_NAME = "output.jsonl"
+ERROR_FILE_NAME = "errors.jsonl"
+STATE_FILE_NAME = "state.json"
+CANCEL_FILE_NAME = "cancel"
+
+# results are written in input order - requests may run at most this many
+# concurrency windows ahead of the first line without a result
+_REORDER_WINDOW_MULTIPLIER = 4
+_CAPACITY_POLL_INTERVAL_SECONDS = 1.0
+
+# a `failed` batch can be resumed, e.g. after the disk filled up
+_TERMINAL_STATUSES = ("completed", "cancelled")
+_CHECKPOINT_KEYS = (
+    "next_line",
+    "output_file_offset",
+    "error_file_offset",
+    "request_counts",
+)
+
+
+class LocalBatchExecutor:
+    """
+    Run the batch stored in `batch_dir` against `router`.
+
+    Create a batch with `LocalBatchExecutor.create(...)` and run it with
+    `arun()`. Running a batch that was interrupted resumes it from its last
+    checkpoint: the output and error files are cut back to their checkpointed
+    size and input lines from `next_line` on are sent again, so every input
+    line ends up with exactly one result line. Requests sent after the last
+    checkpoint may be sent twice.
+    """
+
+    def __init__(self, router: Router, batch_dir: str):
+        self.router = router
+        self.batch_dir = batch_dir
+        self.state: LocalBatchState = self.load_state(batch_dir)
+        self._cancelled = False
+        self._running = False
+        self._next_request_at = 0.0
+        self._paused_until = 0.0
+        self._lines_since_checkpoint = 0
+        self._pending_results: Dict[int, Optional[Tuple[bool, dict]]] = {}
+        self._checkpointed_progress: Dict[str, Any] = {}
+
+    @classmethod
+    def create(
+        cls,
+        router: Router,
+        batch_dir: str,
+        input_file: JsonlSource,
+        model: Optional[str] = None,
+        endpoint: LocalBatchEndpoint = "/v1/chat/completions",
+        max_concurrent_requests: Optional[int] = None,
+        max_requests_per_minute: Optional[int] = None,
+        request_metadata: Optional[Dict[str, Any]] = None,
+        batch_id: Optional[str] = None,
+    ) -> "LocalBatchExecutor":
+        """
+        Validate `input_file` and copy it into a new batch directory.
+
+        Args:
+            model: router model group for every request. If None, each line's
+                `body.model` is used.
+            max_requests_per_minute: request rate cap. Defaults to the model
+                group's rpm minus `LOCAL_BATCH_HEADROOM_FRACTION`, or no cap.
+            request_metadata: litellm metadata sent with every request
+
+        Raises:
+            ValueError: if the endpoint is not supported or a line is not a
+                valid batch request for it
+        """
+        if endpoint not in LOCAL_BATCH_ROUTER_METHODS:
+            raise ValueError(
+                f"Unsupported batch endpoint: {endpoint}. Supported endpoints: {list(LOCAL_BATCH_ROUTER_METHODS)}"
+            )
+        os.makedirs(batch_dir, exist_ok=True)
+        total = 0
+        models: Set[str] = set()
+        with open(os.path.join(batch_dir, INPUT_FILE_NAME), "wb") as f:
+            for line_number, line in enumerate(iter_jsonl_lines(input_file), start=1):
+                if isinstance(line, str):
+                    line = line.encode("utf-8")
+                if line and not line.isspace():
+                    models.add(
+                        cls._validate_request(
+                            line=line,
+                            line_number=line_number,
+                            endpoint=endpoint,
+                            model=model,
+                        )
+                    )
+                    total += 1
+                f.write(line)
+                f.write(b"\n")
+        if total == 0:
+            raise ValueError("Batch input file has no requests")
+
+        now = int(time.time())
+        state = LocalBatchState(
+            id=batch_id or f"local_batch_{uuid.uuid4().hex}",
+            model=model,
+            models=sorted(models),
+            endpoint=endpoint,
+            status="validating",
+            created_at=now,
+            in_progress_at=None,
+            completed_at=None,
+            failed_at=None,
+            cancelled_at=None,
+            errors=[],
+            request_counts={"total": total, "completed": 0, "failed": 0},
+            request_metadata=request_metadata or {},
+            max_concurrent_requests=max_concurrent_requests
+            or LOCAL_BATCH_MAX_CONCURRENT_REQUESTS,
+            max_requests_per_minute=max_requests_per_minute,
+            next_line=0,
+            output_file_offset=0,
+            error_file_offset=0,
+        )
+        cls._write_state(batch_dir, state)
+        return cls(router=router, batch_dir=batch_dir)
+
+    @staticmethod
+    def _validate_request(
+        line: bytes, line_number: int, endpoint: str, model: Optional[str]
+    ) -> str:
+        """Returns the model group the line is sent to."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_number} is not valid JSON: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("body"), dict):
+            raise ValueError(f"Line {line_number} has no request `body`")
+        if request.get("custom_id") is None:
+            raise ValueError(f"Line {line_number} has no `custom_id`")
+        if request.get("url", endpoint) != endpoint:
+            raise ValueError(
+                f"Line {line_number} has url {request.get('url')}, expected {endpoint}"
+            )
+        line_model = model or request["body"].get("model")
+        if not isinstance(line_model, str) or not line_model:
+            raise ValueError(f"Line {line_number} has no `body.model`")
+        return line_model
+
+    @staticmethod
+    def load_state(batch_dir: str) -> LocalBatchState:
+        with open(os.path.join(batch_dir, STATE_FILE_NAME), "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_state(batch_dir: str, state: LocalBatchState) -> None:
+        # write-then-rename, so a crash never leaves a partial state file
+        state_path = os.path.join(batch_dir, STATE_FILE_NAME)
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, state_path)
+
+    @property
+    def output_file_path(self) -> str:
+        return os.path.join(self.batch_dir, OUTPUT_FILE_NAME)
+
+    @property
+    def error_file_path(self) -> str:
+        return os.path.join(self.batch_dir, ERROR_FILE_NAME)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def cancel(self) -> LocalBatchState:
+        """
+        Cancel the batch. A running batch stops sending requests and is marked
+        `cancelled` once its in-flight requests have their results written.
+        """
+        if self.state["status"] in _TERMINAL_STATUSES:
+            return self.state
+        self._cancelled = True
+        if self._running:
+            self.state["status"] = "cancelling"
+        else:
+            self.state["status"] = "cancelled"
+            self.state["cancelled_at"] = int(time.time())
+            self._write_state(self.batch_dir, self.state)
+        return self.state
+
+    async def arun(self) -> LocalBatchState:
+        """Run (or resume) the batch until every input line has a result."""
+        state = self.state
+        if state["status"] in _TERMINAL_STATUSES or self._running:
+            return state
+        self._running = True
+        self._checkpointed_progress = {
+            key: copy.deepcopy(state[key])  # type: ignore[literal-required]
+            for key in _CHECKPOINT_KEYS
+        }
+        state["status"] = "in_progress"
+        state["failed_at"] = None
+        state["in_progress_at"] = state.get("in_progress_at") or int(time.time())
+        self._truncate_to_checkpoint()
+
+        max_concurrent_requests = state["max_concurrent_requests"]
+        self._in_flight = asyncio.Semaphore(max_concurrent_requests)
+        self._window = asyncio.Semaphore(
+            max_concurrent_requests * _REORDER_WINDOW_MULTIPLIER
+        )
+        self._request_interval = self._get_request_interval()
+        tasks: Set[asyncio.Task] = set()
+        run_task = asyncio.current_task()
+        request_error: List[BaseException] = []
+
+        def _on_request_done(task: asyncio.Task) -> None:
+            tasks.discard(task)
+            if task.cancelled() or task.exception() is None or request_error:
+                return
+            # a result could not be written (e.g. disk full) - its line never
+            # commits, so stop the run instead of waiting for it
+            request_error.append(task.exception())  # type: ignore[arg-type]
+            if run_task is not None:
+                run_task.cancel()
+
+        try:
+            with open(self.output_file_path, "ab") as output_file, open(
+                self.error_file_path, "ab"
+            ) as error_file, open(
+                os.path.join(self.batch_dir, INPUT_FILE_NAME), "rb"
+            ) as input_file:
+                self._output_file = output_file
+                self._error_file = error_file
+                self._checkpoint()
+                await self._dispatch_requests(
+                    input_file=input_file,
+                    tasks=tasks,
+                    on_request_done=_on_request_done,
+                )
+                self._checkpoint()
+        except BaseException as e:
+            for task in list(tasks):
+                task.cancel()
+            # a result that could not be written is the error, not the
+            # cancellation of the run it caused
+            self._rollback_to_checkpoint(request_error[0] if request_error else e)
+            if request_error:
+                raise request_error[0]
+            raise
+
+        if self._is_cancelled():
+            state["status"] = "cancelled"
+            state["cancelled_at"] = int(time.time())
+        else:
+            state["status"] = "completed"
+            state["completed_at"] = int(time.time())
+        self._write_state(self.batch_dir, state)
+        self._running = False
+        return state
+
+    async def _dispatch_requests(
+        self,
+        input_file: BinaryIO,
+        tasks: Set[asyncio.Task],
+        on_request_done: Callable[[asyncio.Task], None],
+    ) -> None:
+        """Start a request for every input line after the checkpoint, then wait for them."""
+        state = self.state
+        for index, line in enumerate(iter_jsonl_lines(input_file)):
+            if index < state["next_line"]:
+                continue
+            await self._window.acquire()
+            if self._is_cancelled():
+                self._window.release()
+                break
+            if not line or line.isspace():
+                self._commit(index, None)
+                continue
+            request = json.loads(line)
+            await self._wait_for_capacity(
+                model_group=state.get("model") or request["body"].get("model")
+            )
+            task = asyncio.create_task(self._run_request(index, request))
+            tasks.add(task)
+            task.add_done_callback(on_request_done)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def _rollback_to_checkpoint(self, error: BaseException) -> None:
+        """Record the checkpointed progress of an interrupted run, so `arun()` resumes from there."""
+        state = self.state
+        # results after the last checkpoint may not be on disk
+        state.update(copy.deepcopy(self._checkpointed_progress))  # type: ignore[typeddict-item]
+        self._pending_results = {}
+        if isinstance(error, asyncio.CancelledError):
+            # e.g. proxy shutdown - the batch is still in progress
+            state["status"] = "in_progress"
+        else:
+            state["status"] = "failed"
+            state["failed_at"] = int(time.time())
+            state["errors"].append(str(error))
+        self._write_state(self.batch_dir, state)
+        self._running = False
+
+    def _is_cancelled(self) -> bool:
+        if not self._cancelled and os.path.exists(
+            os.path.join(self.batch_dir, CANCEL_FILE_NAME)
+        ):
+            self._cancelled = True
+            self.state["status"] = "cancelling"
+        return self._cancelled
+
+    def _truncate_to_checkpoint(self) -> None:
+        for path, offset in (
+            (self.output_file_path, self.state["output_file_offset"]),
+            (self.error_file_path, self.state["error_file_offset"]),
+        ):
+            if os.path.exists(path) and os.path.getsize(path) > offset:
+                # drop results written after the last checkpoint - those lines run again
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+
+    def _checkpoint(self) -> None:
+        for f in (self._output_file, self._error_file):
+            f.flush()
+            os.fsync(f.fileno())
+        self.state["output_file_offset"] = self._output_file.tell()
+        self.state["error_file_offset"] = self._error_file.tell()
+        self._write_state(self.batch_dir, self.state)
+        self._lines_since_checkpoint = 0
+        self._checkpointed_progress = {
+            key: copy.deepcopy(self.state[key])  # type: ignore[literal-required]
+            for key in _CHECKPOINT_KEYS
+        }
+
+    def _commit(self, index: int, result: Optional[Tuple[bool, dict]]) -> None:
+        """Record the result of input line `index` and write every result now in order."""
+        state = self.state
+        self._pending_results[index] = result
+        while state["next_line"] in self._pending_results:
+            result = self._pending_results.pop(state["next_line"])
+            if result is not None:
+                succeeded, result_line = result
+                write_jsonl(
+                    [result_line],
+                    self._output_file if succeeded else self._error_file,
+                )
+                state["request_counts"]["completed" if succeeded else "failed"] += 1
+            state["next_line"] += 1
+            self._window.release()
+            self._lines_since_checkpoint += 1
+            if self._lines_since_checkpoint >= LOCAL_BATCH_CHECKPOINT_INTERVAL:
+                self._checkpoint()
+
+    def _get_request_interval(self) -> Optional[float]:
+        max_requests_per_minute = self.state.get("max_requests_per_minute")
+        model = self.state.get("model")
+        if max_requests_per_minute is None and model is not None:
+            model_group_info = self.router.get_model_group_info(model_group=model)
+            if model_group_info is not None and model_group_info.rpm:
+                max_requests_per_minute = int(
+                    model_group_info.rpm * (1 - LOCAL_BATCH_HEADROOM_FRACTION)
+                )
+        if not max_requests_per_minute:
+            return None
+        return 60 / max_requests_per_minute
+
+    async def _wait_for_capacity(self, model_group: Optional[str]) -> None:
+        loop = asyncio.get_running_loop()
+        # back off after a rate limit error the router could not route around
+        pause = self._paused_until - loop.time()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        # pace requests to the batch's request rate cap
+        if self._request_interval is not None:
+            now = loop.time()
+            start_at = max(self._next_request_at, now)
+            self._next_request_at = start_at + self._request_interval
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+
+        # leave headroom on the model group for interactive traffic
+        while model_group is not None and not self._is_cancelled():
+            if await self._model_group_has_headroom(model_group):
+                return
+            await asyncio.sleep(_CAPACITY_POLL_INTERVAL_SECONDS)
+
+    async def _model_group_has_headroom(self, model_group: str) -> bool:
+        try:
+            remaining_usage = await self.router.get_remaining_model_group_usage(
+                model_group=model_group
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                f"LocalBatchExecutor: could not get usage of model group {model_group}: {e}"
+            )
+            return True
+        for remaining_key, limit_key in (
+            ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests"),
+            ("x-ratelimit-remaining-tokens", "x-ratelimit-limit-tokens"),
+        ):
+            limit = remaining_usage.get(limit_key)
+            if (
+                limit
+                and remaining_usage[remaining_key]
+                <= limit * LOCAL_BATCH_HEADROOM_FRACTION
+            ):
+                return False
+        return True
+
+    async def _run_request(self, index: int, request: dict) -> None:
+        custom_id = request.get("custom_id")
+        rate_limit_retries = 0
+        while True:
+            try:
+                async with self._in_flight:
+                    response = await self._call_router(request)
+                result = (
+                    True,
+                    self._build_result_line(
+                        custom_id=custom_id,
+                        status_code=200,
+                        request_id=getattr(response, "id", None),
+                        body=self._response_to_dict(response),
+                    ),
+                )
+                break
+            except litellm.RateLimitError as e:
+                if (
+                    rate_limit_retries < LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES
+                    and not self._cancelled
+                ):
+                    # the router's retries and fallbacks are exhausted - slow the
+                    # whole batch down before sending this request again
+                    loop = asyncio.get_running_loop()
+                    self._paused_until = max(
+                        self._paused_until,
+                        loop.time()
+                        + LOCAL_BATCH_RATE_LIMIT_BACKOFF_SECONDS
+                        * 2**rate_limit_retries,
+                    )
+                    rate_limit_retries += 1
+                    await self._wait_for_capacity(model_group=None)
+                    continue
+                result = (False, self._build_error_line(custom_id, e))
+                break
+            except Exception as e:
+                result = (False, self._build_error_line(custom_id, e))
+                break
+        self._commit(index, result)
+
+    async def _call_router(self, request: dict) -> Any:
+        endpoint = self.state["endpoint"]
+        body = dict(request["body"])
+        body.pop("stream", None)  # batch results are never streamed
+        if self.state.get("model"):
+            body["model"] = self.state["model"]
+        request_metadata = self.state.get("request_metadata")
+        if request_metadata and endpoint != "/v1/responses":
+            # `metadata` is a provider param on /v1/responses. The batch's
+            # metadata goes last - the file must not override key / team attribution
+            body["metadata"] = {**(body.get("metadata") or {}), **request_metadata}
+        router_method = getattr(self.router, LOCAL_BATCH_ROUTER_METHODS[endpoint])
+        return await router_method(**body)
+
+    @staticmethod
+    def _response_to_dict(response: Any) -> dict:
+        if hasattr(response, "model_dump"):
+            # response types hold subclasses of their declared field types
+            return response.model_dump(mode="json", warnings=False)
+        return dict(response)
+
+    @staticmethod
+    def _build_result_line(
+        custom_id: Optional[str],
+        status_code: int,
+        request_id: Optional[str],
+        body: dict,
+    ) -> dict:
+        return {
+            "id": f"batch_req_{uuid.uuid4().hex}",
+            "custom_id": custom_id,
+            "response": {
+                "status_code": status_code,
+                "request_id": request_id or "",
+                "body": body,
+            },
+            "error": None,
+        }
+
+    @classmethod
+    def _build_error_line(cls, custom_id: Optional[str], exception: Exception) -> dict:
+        status_code = getattr(exception, "status_code", None) or 500
+        return cls._build_result_line(
+            custom_id=custom_id,
+            status_code=status_code,
+            request_id=None,
+            body={
+                "error": {
+                    "message": str(exception),
+                    "type": type(exception).__name__,
+                    "code": str(status_code),
+                }
+            },
+        )
@@ -0,0 +1,200 @@
+"""
+Micro-batching for single-prompt embedding calls.
+
+Semantic cache lookups / writes and the MCP semantic tool filter each need the
+embedding of one prompt. Under load, many of those calls overlap - instead of one
+`aembedding` request per prompt, `BatchedEmbedder` collects pending prompts for up
+to `max_wait_ms` (or until `max_batch_size` prompts are queued) and sends a single
+`aembedding` call with a list input, then resolves each caller with its own vector.
+
+Prompts are only batched together when they share the embedding model, the router
+(or lack of one) and the `user_api_key` the call is attributed to. The callers'
+`litellm_trace_id`s are carried on the batched call.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_SIZE,
+    SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_WAIT_MS,
+)
+
+if TYPE_CHECKING:
+    from litellm.router import Router
+else:
+    Router = Any
+
+_BatchKey = Tuple[int, str, Optional[int], Optional[str]]
+
+
+class _PendingBatch:
+    def __init__(
+        self, model: str, llm_router: Optional[Router], user_api_key: Optional[str]
+    ):
+        self.model = model
+        self.llm_router = llm_router
+        self.user_api_key = user_api_key
+        self.inputs: List[str] = []
+        self.litellm_trace_ids: List[str] = []
+        self.futures: List["asyncio.Future[List[float]]"] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class BatchedEmbedder:
+    """Coalesces concurrent single-prompt embedding calls into batched requests."""
+
+    def __init__(
+        self,
+        max_batch_size: int = SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_SIZE,
+        max_wait_ms: float = SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_WAIT_MS,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0")
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: Dict[_BatchKey, _PendingBatch] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self.requests = 0
+        self.batches = 0
+
+    async def aembed(
+        self,
+        model: str,
+        input: str,
+        llm_router: Optional[Router] = None,
+        user_api_key: Optional[str] = None,
+        litellm_trace_id: Optional[str] = None,
+    ) -> List[float]:
+        """
+        Returns the embedding of `input`, sent as part of the next batch for `model`.
+
+        When `llm_router` is given the batch goes through `llm_router.aembedding`,
+        otherwise through `litellm.aembedding`. `litellm_trace_id` is the trace of
+        the request the embedding is for.
+        """
+        loop = asyncio.get_running_loop()
+        key: _BatchKey = (
+            id(loop),
+            model,
+            id(llm_router) if llm_router is not None else None,
+            user_api_key,
+        )
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(
+                model=model, llm_router=llm_router, user_api_key=user_api_key
+            )
+            self._pending[key] = batch
+            batch.timer = loop.call_later(
+                self.max_wait_ms / 1000, self._flush, key, batch
+            )
+
+        future: "asyncio.Future[List[float]]" = loop.create_future()
+        batch.inputs.append(input)
+        batch.futures.append(future)
+        if litellm_trace_id and litellm_trace_id not in batch.litellm_trace_ids:
+            batch.litellm_trace_ids.append(litellm_trace_id)
+        self.requests += 1
+        if len(batch.inputs) >= self.max_batch_size:
+            self._flush(key, batch)
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": (self.requests / self.batches) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+        }
+
+    def _flush(self, key: _BatchKey, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is not batch:
+            return  # already flushed
+        del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+        # keep a reference so the task isn't garbage collected mid-flight
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send_batch(self, batch: _PendingBatch) -> None:
+        self.batches += 1
+        # identical prompts in one batch are embedded once
+        unique_inputs = list(dict.fromkeys(batch.inputs))
+        try:
+            embeddings = await self._aembedding(batch, unique_inputs)
+            if len(embeddings) != len(unique_inputs):
+                raise ValueError(
+                    f"Expected {len(unique_inputs)} embeddings, got {len(embeddings)}"
+                )
+        except Exception as e:
+            verbose_logger.debug(
+                "BatchedEmbedder: batch of %s prompts failed - %s",
+                len(unique_inputs),
+                str(e),
+            )
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        embedding_by_input = dict(zip(unique_inputs, embeddings))
+        for prompt, future in zip(batch.inputs, batch.futures):
+            if not future.done():
+                future.set_result(embedding_by_input[prompt])
+
+    async def _aembedding(
+        self, batch: _PendingBatch, inputs: List[str]
+    ) -> List[List[float]]:
+        trace_kwargs: Dict[str, Any] = {}
+        if len(batch.litellm_trace_ids) == 1:
+            # every prompt in the batch belongs to the same request
+            trace_kwargs["litellm_trace_id"] = batch.litellm_trace_ids[0]
+        if batch.llm_router is not None:
+            response = await batch.llm_router.aembedding(
+                model=batch.model,
+                input=inputs,
+                cache={"no-store": True, "no-cache": True},
+                metadata={
+                    "user_api_key": batch.user_api_key or "",
+                    "semantic-cache-embedding": True,
+                    "batched_litellm_trace_ids": list(batch.litellm_trace_ids),
+                },
+                **trace_kwargs,
+            )
+        else:
+            response = await litellm.aembedding(
+                model=batch.model,
+                input=inputs,
+                cache={"no-store": True, "no-cache": True},
+                **trace_kwargs,
+            )
+
+        data = list(response["data"])
+        if all(_get_index(item) is not None for item in data):
+            data.sort(key=_get_index)
+        return [item["embedding"] for item in data]
+
+
+def _get_index(item: Any) -> Optional[int]:
+    if isinstance(item, dict):
+        return item.get("index")
+    return getattr(item, "index", None)
+
+
+_batched_embedder: Optional[BatchedEmbedder] = None
+
+
+def get_batched_embedder() -> BatchedEmbedder:
+    """The process-wide embedder shared by the semantic caches and tool filter."""
+    global _batched_embedder
+    if _batched_embedder is None:
+        _batched_embedder = BatchedEmbedder()
+    return _batched_embedder
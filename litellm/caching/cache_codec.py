@@ -0,0 +1,290 @@
+"""
+Binary codec for cached values (RedisCache / DualCache / S3Cache / DiskCache).
+
+By default cached values are stored as JSON text, and a cached response is a JSON
+string nested inside that JSON (`{"timestamp": ..., "response": "<json>"}`), so an
+embedding of 3072 floats takes ~60KB and is parsed twice on every hit.
+
+`CacheCodec` stores values as:
+
+    <tag byte><body>
+
+- body: msgpack or JSON (orjson when installed), with the nested `response` JSON
+  string expanded so it is serialized once
+- `embedding` float lists are packed as little-endian float32 arrays
+- body compressed with zstd / lz4 / zlib when larger than `compression_threshold`
+
+The tag byte (0x10-0x1F) records the serializer, compression and float32 packing,
+and never starts a JSON / `str()` value - so entries written before the codec was
+enabled (or after it is disabled) stay readable.
+
+Enable it in the proxy config:
+
+```yaml
+litellm_settings:
+  cache: true
+  cache_params:
+    type: redis
+    cache_codec:
+      serializer: msgpack      # or "json"
+      compression: zstd        # "zstd", "lz4", "zlib" or null
+      compression_threshold: 1024
+      pack_embeddings: true
+```
+"""
+
+import base64
+import json
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, Literal, Optional, Tuple, Union
+
+from litellm.constants import CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES
+
+Serializer = Literal["json", "msgpack"]
+Compression = Literal["zstd", "lz4", "zlib"]
+
+_TAG_BASE = 0x10
+_TAG_FLOAT32 = 0x08
+_TAG_MSGPACK = 0x04
+_COMPRESSION_BITS: Dict[Optional[str], int] = {None: 0, "zlib": 1, "zstd": 2, "lz4": 3}
+_COMPRESSION_BY_BITS = {bits: name for name, bits in _COMPRESSION_BITS.items()}
+
+_MSGPACK_FLOAT32_EXT_TYPE = 1
+_JSON_FLOAT32_MARKER = "__litellm_f32__"
+_EMBEDDING_KEY = "embedding"
+
+
+def _get_orjson() -> Optional[Any]:
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+def _import_optional(module: str, feature: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"`{module}` is required for {feature}. Run `pip install {module}`."
+        ) from e
+
+
+def _pack_float32(values: list) -> bytes:
+    packed = array("f", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_float32(data: bytes) -> list:
+    unpacked = array("f")
+    unpacked.frombytes(data)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def _is_float_list(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(v, float) for v in value)
+    )
+
+
+def is_codec_encoded(raw: Any) -> bool:
+    """True if `raw` was written by a CacheCodec (vs. a legacy JSON / str value)."""
+    return (
+        isinstance(raw, (bytes, bytearray, memoryview))
+        and len(raw) > 0
+        and _TAG_BASE <= raw[0] < _TAG_BASE + 0x10
+    )
+
+
+class CacheCodec:
+    def __init__(
+        self,
+        serializer: Serializer = "json",
+        compression: Optional[Compression] = None,
+        compression_threshold: int = CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES,
+        pack_embeddings: bool = True,
+    ):
+        if serializer not in ("json", "msgpack"):
+            raise ValueError(
+                f"Unsupported cache codec serializer: {serializer}. Use 'json' or 'msgpack'."
+            )
+        if compression not in _COMPRESSION_BITS:
+            raise ValueError(
+                f"Unsupported cache codec compression: {compression}. Use 'zstd', 'lz4', 'zlib' or None."
+            )
+        # fail at startup, not on the first cache write
+        if serializer == "msgpack":
+            _import_optional("msgpack", "the msgpack cache codec")
+        if compression == "zstd":
+            _import_optional("zstandard", "zstd cache compression")
+        if compression == "lz4":
+            _import_optional("lz4", "lz4 cache compression")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.pack_embeddings = pack_embeddings
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Union["CacheCodec", Dict[str, Any]]]
+    ) -> Optional["CacheCodec"]:
+        if config is None or isinstance(config, CacheCodec):
+            return config
+        return cls(**config)
+
+    def encode(self, value: Any) -> Union[str, bytes]:
+        """
+        Serialize `value` for storage.
+
+        Scalars are written as plain JSON text, as before, so counters stay
+        compatible with Redis INCR.
+        """
+        if not isinstance(value, (dict, list)):
+            return json.dumps(value)
+
+        value = _expand_json_response(value)
+        packed_embeddings = False
+        if self.pack_embeddings:
+            value, packed_embeddings = self._pack_embeddings(value)
+
+        if self.serializer == "msgpack":
+            import msgpack
+
+            body = msgpack.packb(value, use_bin_type=True)
+        else:
+            orjson = _get_orjson()
+            if orjson is not None:
+                body = orjson.dumps(value)
+            else:
+                body = json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+        compression: Optional[str] = None
+        if self.compression is not None and len(body) > self.compression_threshold:
+            body = _compress(body, self.compression)
+            compression = self.compression
+
+        tag = _TAG_BASE | _COMPRESSION_BITS[compression]
+        if self.serializer == "msgpack":
+            tag |= _TAG_MSGPACK
+        if packed_embeddings:
+            tag |= _TAG_FLOAT32
+        return bytes([tag]) + body
+
+    def _pack_embeddings(self, value: Any) -> Tuple[Any, bool]:
+        packed = False
+
+        def _pack(obj: Any) -> Any:
+            nonlocal packed
+            if isinstance(obj, dict):
+                result = {}
+                for k, v in obj.items():
+                    if k == _EMBEDDING_KEY and _is_float_list(v):
+                        packed = True
+                        result[k] = self._float32_value(v)
+                    else:
+                        result[k] = _pack(v)
+                return result
+            if isinstance(obj, list):
+                return [_pack(v) for v in obj]
+            return obj
+
+        return _pack(value), packed
+
+    def _float32_value(self, values: list) -> Any:
+        data = _pack_float32(values)
+        if self.serializer == "msgpack":
+            import msgpack
+
+            return msgpack.ExtType(_MSGPACK_FLOAT32_EXT_TYPE, data)
+        return {_JSON_FLOAT32_MARKER: base64.b64encode(data).decode("ascii")}
+
+
+def decode_cache_value(raw: Union[bytes, bytearray, memoryview]) -> Any:
+    """Decode a value written by `CacheCodec.encode` (see `is_codec_encoded`)."""
+    raw = bytes(raw)
+    tag = raw[0]
+    body = raw[1:]
+    compression = _COMPRESSION_BY_BITS[tag & 0x03]
+    if compression is not None:
+        body = _decompress(body, compression)
+
+    if tag & _TAG_MSGPACK:
+        msgpack = _import_optional("msgpack", "reading msgpack cache entries")
+
+        def _ext_hook(code: int, data: bytes) -> Any:
+            if code == _MSGPACK_FLOAT32_EXT_TYPE:
+                return _unpack_float32(data)
+            return msgpack.ExtType(code, data)
+
+        return msgpack.unpackb(body, raw=False, ext_hook=_ext_hook)
+
+    orjson = _get_orjson()
+    value = orjson.loads(body) if orjson is not None else json.loads(body)
+    if tag & _TAG_FLOAT32:
+        value = _unpack_json_float32(value)
+    return value
+
+
+def _unpack_json_float32(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and _JSON_FLOAT32_MARKER in value:
+            return _unpack_float32(base64.b64decode(value[_JSON_FLOAT32_MARKER]))
+        return {k: _unpack_json_float32(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_unpack_json_float32(v) for v in value]
+    return value
+
+
+def _expand_json_response(value: Any) -> Any:
+    """
+    `Cache` stores responses as `{"timestamp": ..., "response": "<json>"}` - parse the
+    nested JSON so it is serialized (and compressed / float32-packed) once. `Cache`
+    accepts either form when reading.
+    """
+    if isinstance(value, dict):
+        response = value.get("response")
+        if isinstance(response, str) and response[:1] in ("{", "["):
+            orjson = _get_orjson()
+            try:
+                parsed = (
+                    orjson.loads(response) if orjson is not None else json.loads(response)
+                )
+            except ValueError:
+                return value
+            return {**value, "response": parsed}
+    return value
+
+
+def _compress(body: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        import zstandard  # type: ignore
+
+        return zstandard.ZstdCompressor().compress(body)
+    if compression == "lz4":
+        import lz4.frame  # type: ignore
+
+        return lz4.frame.compress(body)
+    return zlib.compress(body)
+
+
+def _decompress(body: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        zstandard = _import_optional("zstandard", "reading zstd cache entries")
+        return zstandard.ZstdDecompressor().decompress(body)
+    if compression == "lz4":
+        _import_optional("lz4", "reading lz4 cache entries")
+        import lz4.frame  # type: ignore
+
+        return lz4.frame.decompress(body)
+    return zlib.decompress(body)
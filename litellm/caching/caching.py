@@ -108,6 +108,9 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        semantic_cache_local_tiers: Optional[Dict[str, Any]] = None,
+        semantic_cache_batch_embeddings: bool = False,
+        cache_codec: Optional[Dict[str, Any]] = None,
         # GCP IAM authentication parameters
         gcp_service_account: Optional[str] = None,
         gcp_ssl_ca_certs: Optional[str] = None,
@@ -133,6 +136,9 @@ class Cache:
             qdrant_api_key (str, optional): The api_key for the local or cloud qdrant cluster.
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
             similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
+            semantic_cache_local_tiers (dict, optional): Enables in-process exact-match / nearest-neighbour tiers in front of "redis-semantic" or "qdrant-semantic". e.g. {"similarity_threshold": 0.95, "max_entries": 10000, "ttl": 600}. Defaults to None (disabled).
+            semantic_cache_batch_embeddings (bool, optional): Coalesces concurrent prompt embeddings of "redis-semantic" / "qdrant-semantic" into batched embedding calls. Defaults to False.
+            cache_codec (dict, optional): Stores values of "redis", "s3" and "disk" caches as msgpack / JSON with optional zstd, lz4 or zlib compression and float32-packed embeddings. e.g. {"serializer": "msgpack", "compression": "zstd"}. Defaults to None (plain JSON).
 
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
@@ -173,6 +179,7 @@ class Cache:
                     "password": password,
                     "redis_flush_size": redis_flush_size,
                     "startup_nodes": redis_startup_nodes,
+                    "cache_codec": cache_codec,
                     **kwargs,
                 }
                 if gcp_service_account is not None:
@@ -187,6 +194,7 @@ class Cache:
                     port=port,
                     password=password,
                     redis_flush_size=redis_flush_size,
+                    cache_codec=cache_codec,
                     **kwargs,
                 )
         elif type == LiteLLMCacheType.REDIS_SEMANTIC:
@@ -197,6 +205,8 @@ class Cache:
                 similarity_threshold=similarity_threshold,
                 embedding_model=redis_semantic_cache_embedding_model,
                 index_name=redis_semantic_cache_index_name,
+                local_tiers=semantic_cache_local_tiers,
+                batch_embeddings=semantic_cache_batch_embeddings,
                 **kwargs,
             )
         elif type == LiteLLMCacheType.QDRANT_SEMANTIC:
@@ -207,6 +217,8 @@ class Cache:
                 similarity_threshold=similarity_threshold,
                 quantization_config=qdrant_quantization_config,
                 embedding_model=qdrant_semantic_cache_embedding_model,
+                local_tiers=semantic_cache_local_tiers,
+                batch_embeddings=semantic_cache_batch_embeddings,
             )
         elif type == LiteLLMCacheType.LOCAL:
             self.cache = InMemoryCache()
@@ -223,6 +235,7 @@ class Cache:
                 s3_aws_session_token=s3_aws_session_token,
                 s3_config=s3_config,
                 s3_path=s3_path,
+                cache_codec=cache_codec,
                 **kwargs,
             )
         elif type == LiteLLMCacheType.GCS:
@@ -237,7 +250,7 @@ class Cache:
                 container=azure_blob_container,
             )
         elif type == LiteLLMCacheType.DISK:
-            self.cache = DiskCache(disk_cache_dir=disk_cache_dir)
+            self.cache = DiskCache(disk_cache_dir=disk_cache_dir, cache_codec=cache_codec)
         if "cache" not in litellm.input_callback:
             litellm.input_callback.append("cache")
         if "cache" not in litellm.success_callback:
@@ -1,7 +1,8 @@
 import json
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from .base_cache import BaseCache
+from .cache_codec import CacheCodec, decode_cache_value, is_codec_encoded
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -12,7 +13,11 @@ else:
 
 
 class DiskCache(BaseCache):
-    def __init__(self, disk_cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        disk_cache_dir: Optional[str] = None,
+        cache_codec: Optional[Union[CacheCodec, Dict[str, Any]]] = None,
+    ):
         try:
             import diskcache as dc
         except ModuleNotFoundError as e:
@@ -25,8 +30,11 @@ class DiskCache(BaseCache):
             self.disk_cache = dc.Cache(".litellm_cache")
         else:
             self.disk_cache = dc.Cache(disk_cache_dir)
+        self.codec = CacheCodec.from_config(cache_codec)
 
     def set_cache(self, key, value, **kwargs):
+        if self.codec is not None and isinstance(value, (dict, list)):
+            value = self.codec.encode(value)
         if "ttl" in kwargs:
             self.disk_cache.set(key, value, expire=kwargs["ttl"])
         else:
@@ -45,6 +53,8 @@ class DiskCache(BaseCache):
     def get_cache(self, key, **kwargs):
         original_cached_response = self.disk_cache.get(key)
         if original_cached_response:
+            if is_codec_encoded(original_cached_response):
+                return decode_cache_value(original_cached_response)
             try:
                 cached_response = json.loads(original_cached_response)  # type: ignore
             except Exception:
@@ -20,7 +20,10 @@ if TYPE_CHECKING:
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE
+from litellm.constants import (
+    DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+    REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL,
+)
 
 from .base_cache import BaseCache
 from .in_memory_cache import InMemoryCache
@@ -53,6 +56,10 @@ class DualCache(BaseCache):
     DualCache is a cache implementation that updates both Redis and an in-memory cache simultaneously.
     When data is updated or inserted, it is written to both the in-memory cache + Redis.
     This ensures that even if Redis hasn't been updated yet, the in-memory cache reflects the most recent data.
+
+    If the redis cache has `client_side_caching=True`, values read from Redis for tracked
+    keys are kept in memory (up to REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL) and dropped
+    when Redis reports that another client wrote them.
     """
 
     def __init__(
@@ -82,6 +89,55 @@ class DualCache(BaseCache):
             default_in_memory_ttl or litellm.default_in_memory_ttl
         )
         self.default_redis_ttl = default_redis_ttl or litellm.default_redis_ttl
+        # keys held in memory until invalidated by Redis client-side caching
+        self._client_side_cached_keys: set = set()
+        self._invalidation_registered_for: Optional[RedisCache] = None
+
+    def _get_client_side_caching_epoch(self) -> Optional[int]:
+        """
+        Invalidation epoch before a Redis read, or None if client-side caching is off.
+
+        `redis_cache` can be assigned after __init__ (e.g. by the proxy), so the
+        invalidation callback is registered on first use.
+        """
+        redis_cache = self.redis_cache
+        if (
+            redis_cache is None
+            or getattr(redis_cache, "client_side_caching", False) is not True
+        ):
+            return None
+        if self._invalidation_registered_for is not redis_cache:
+            redis_cache.register_invalidation_callback(self._on_redis_invalidation)
+            self._invalidation_registered_for = redis_cache
+        return redis_cache.get_client_side_caching_epoch()
+
+    def _in_memory_kwargs_for_redis_value(
+        self, key: str, epoch: Optional[int], kwargs: dict
+    ) -> dict:
+        """kwargs to store a value read from Redis in memory with."""
+        if (
+            epoch is None
+            or self.redis_cache is None
+            or not self.redis_cache.is_client_side_cacheable(key, epoch)
+        ):
+            return kwargs
+        if (
+            len(self._client_side_cached_keys)
+            >= 2 * self.in_memory_cache.max_size_in_memory
+        ):
+            # drop keys the in-memory cache already evicted
+            self._client_side_cached_keys.intersection_update(
+                self.in_memory_cache.cache_dict.keys()
+            )
+        self._client_side_cached_keys.add(key)
+        return {**kwargs, "ttl": REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL}
+
+    def _on_redis_invalidation(self, keys: Optional[List[str]]) -> None:
+        if keys is None:
+            keys = list(self._client_side_cached_keys)
+        for key in keys:
+            self._client_side_cached_keys.discard(key)
+            self.in_memory_cache.delete_cache(key)
 
     def update_cache_ttl(
         self, default_in_memory_ttl: Optional[float], default_redis_ttl: Optional[float]
@@ -146,6 +202,7 @@ class DualCache(BaseCache):
                     result = in_memory_result
 
             if result is None and self.redis_cache is not None and local_only is False:
+                epoch = self._get_client_side_caching_epoch()
                 # If not found in in-memory cache, try fetching from Redis
                 redis_result = self.redis_cache.get_cache(
                     key, parent_otel_span=parent_otel_span
@@ -153,7 +210,11 @@ class DualCache(BaseCache):
 
                 if redis_result is not None:
                     # Update in-memory cache with the value from Redis
-                    self.in_memory_cache.set_cache(key, redis_result, **kwargs)
+                    self.in_memory_cache.set_cache(
+                        key,
+                        redis_result,
+                        **self._in_memory_kwargs_for_redis_value(key, epoch, kwargs),
+                    )
 
                 result = redis_result
 
@@ -220,6 +281,7 @@ class DualCache(BaseCache):
                     result = in_memory_result
 
             if result is None and self.redis_cache is not None and local_only is False:
+                epoch = self._get_client_side_caching_epoch()
                 # If not found in in-memory cache, try fetching from Redis
                 redis_result = await self.redis_cache.async_get_cache(
                     key, parent_otel_span=parent_otel_span
@@ -228,7 +290,9 @@ class DualCache(BaseCache):
                 if redis_result is not None:
                     # Update in-memory cache with the value from Redis
                     await self.in_memory_cache.async_set_cache(
-                        key, redis_result, **kwargs
+                        key,
+                        redis_result,
+                        **self._in_memory_kwargs_for_redis_value(key, epoch, kwargs),
                     )
 
                 result = redis_result
@@ -308,6 +372,7 @@ class DualCache(BaseCache):
 
                 # Only hit Redis if enough time has passed since last access.
                 if len(sublist_keys) > 0:
+                    epoch = self._get_client_side_caching_epoch()
                     try:
                         # If not found in in-memory cache, try fetching from Redis
                         redis_result = await self.redis_cache.async_batch_get_cache(
@@ -333,7 +398,11 @@ class DualCache(BaseCache):
                         
                         if value is not None and self.in_memory_cache is not None:
                             await self.in_memory_cache.async_set_cache(
-                                key, value, **kwargs
+                                key,
+                                value,
+                                **self._in_memory_kwargs_for_redis_value(
+                                    key, epoch, kwargs
+                                ),
                             )
 
             return result
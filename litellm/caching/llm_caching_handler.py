@@ -1,5 +1,8 @@
 """
 Add the event loop to the cache key, to prevent event loop closed errors.
+
+Evicted `AsyncHTTPHandler`s release their reference to the shared connection
+pool (see litellm/llms/custom_httpx/transport_pool.py) right away.
 """
 
 import asyncio
@@ -37,3 +40,20 @@ class LLMClientCache(InMemoryCache):
         key = self.update_cache_key_with_event_loop(key)
 
         return await super().async_get_cache(key, **kwargs)
+
+    def _remove_key(self, key: str) -> None:
+        value = self.cache_dict.get(key)
+        super()._remove_key(key)
+        self._release_shared_transport(value)
+
+    def flush_cache(self):
+        values = list(self.cache_dict.values())
+        super().flush_cache()
+        for value in values:
+            self._release_shared_transport(value)
+
+    @staticmethod
+    def _release_shared_transport(value) -> None:
+        release_shared_transport = getattr(value, "release_shared_transport", None)
+        if callable(release_shared_transport):
+            release_shared_transport()
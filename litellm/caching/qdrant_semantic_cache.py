@@ -11,7 +11,7 @@ Has 4 methods:
 import ast
 import asyncio
 import json
-from typing import Any, cast
+from typing import Any, Dict, List, Optional, cast
 
 import litellm
 from litellm._logging import print_verbose
@@ -19,6 +19,8 @@ from litellm.constants import QDRANT_SCALAR_QUANTILE, QDRANT_VECTOR_SIZE
 from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .batched_embedder import get_batched_embedder
+from .semantic_cache_local_tiers import SemanticCacheLocalTiers
 
 
 class QdrantSemanticCache(BaseCache):
@@ -31,6 +33,8 @@ class QdrantSemanticCache(BaseCache):
         quantization_config=None,
         embedding_model="text-embedding-ada-002",
         host_type=None,
+        local_tiers: Optional[Dict[str, Any]] = None,
+        batch_embeddings: bool = False,
     ):
         import os
 
@@ -53,6 +57,12 @@ class QdrantSemanticCache(BaseCache):
             raise Exception("similarity_threshold must be provided, passed None")
         self.similarity_threshold = similarity_threshold
         self.embedding_model = embedding_model
+        self.batch_embeddings = batch_embeddings
+        self.local_tiers = SemanticCacheLocalTiers.from_config(
+            local_tiers,
+            similarity_threshold=similarity_threshold,
+            cache_type="qdrant-semantic",
+        )
         headers = {}
 
         # check if defined as os.environ/ variable
@@ -278,25 +288,37 @@ class QdrantSemanticCache(BaseCache):
             return None
         pass
 
-    async def async_set_cache(self, key, value, **kwargs):
-        from litellm._uuid import uuid
-
+    async def _get_async_embedding(self, prompt: str, **kwargs) -> List[float]:
         from litellm.proxy.proxy_server import llm_model_list, llm_router
 
-        print_verbose(f"async qdrant semantic-cache set_cache, kwargs: {kwargs}")
+        if self.local_tiers is not None:
+            memoized_embedding = self.local_tiers.get_embedding(
+                self.embedding_model, prompt
+            )
+            if memoized_embedding is not None:
+                return memoized_embedding
 
-        # get the prompt
-        messages = kwargs["messages"]
-        prompt = ""
-        for message in messages:
-            prompt += message["content"]
-        # create an embedding for prompt
         router_model_names = (
             [m["model_name"] for m in llm_model_list]
             if llm_model_list is not None
             else []
         )
-        if llm_router is not None and self.embedding_model in router_model_names:
+        use_router = (
+            llm_router is not None and self.embedding_model in router_model_names
+        )
+        if self.batch_embeddings:
+            embedding = await get_batched_embedder().aembed(
+                model=self.embedding_model,
+                input=prompt,
+                llm_router=llm_router if use_router else None,
+                user_api_key=kwargs.get("metadata", {}).get("user_api_key", ""),
+                litellm_trace_id=kwargs.get("litellm_trace_id"),
+            )
+            if self.local_tiers is not None:
+                self.local_tiers.set_embedding(self.embedding_model, prompt, embedding)
+            return embedding
+
+        if use_router and llm_router is not None:
             user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
             embedding_response = await llm_router.aembedding(
                 model=self.embedding_model,
@@ -318,6 +340,22 @@ class QdrantSemanticCache(BaseCache):
 
         # get the embedding
         embedding = embedding_response["data"][0]["embedding"]
+        if self.local_tiers is not None:
+            self.local_tiers.set_embedding(self.embedding_model, prompt, embedding)
+        return embedding
+
+    async def async_set_cache(self, key, value, **kwargs):
+        from litellm._uuid import uuid
+
+        print_verbose(f"async qdrant semantic-cache set_cache, kwargs: {kwargs}")
+
+        # get the prompt
+        messages = kwargs["messages"]
+        prompt = ""
+        for message in messages:
+            prompt += message["content"]
+        # create an embedding for prompt
+        embedding = await self._get_async_embedding(prompt, **kwargs)
 
         value = str(value)
         assert isinstance(value, str)
@@ -340,11 +378,12 @@ class QdrantSemanticCache(BaseCache):
             headers=self.headers,
             json=data,
         )
+        if self.local_tiers is not None:
+            self.local_tiers.add(prompt, embedding, value, ttl=kwargs.get("ttl"))
         return
 
     async def async_get_cache(self, key, **kwargs):
         print_verbose(f"async qdrant semantic-cache get_cache, kwargs: {kwargs}")
-        from litellm.proxy.proxy_server import llm_model_list, llm_router
 
         # get the messages
         messages = kwargs["messages"]
@@ -352,33 +391,22 @@ class QdrantSemanticCache(BaseCache):
         for message in messages:
             prompt += message["content"]
 
-        router_model_names = (
-            [m["model_name"] for m in llm_model_list]
-            if llm_model_list is not None
-            else []
-        )
-        if llm_router is not None and self.embedding_model in router_model_names:
-            user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
-            embedding_response = await llm_router.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-                metadata={
-                    "user_api_key": user_api_key,
-                    "semantic-cache-embedding": True,
-                    "trace_id": kwargs.get("metadata", {}).get("trace_id", None),
-                },
-            )
-        else:
-            # convert to embedding
-            embedding_response = await litellm.aembedding(
-                model=self.embedding_model,
-                input=prompt,
-                cache={"no-store": True, "no-cache": True},
-            )
+        # L0: exact (normalized) prompt match, skips the embedding call
+        if self.local_tiers is not None:
+            local_response = self.local_tiers.get_exact(prompt)
+            if local_response is not None:
+                kwargs.setdefault("metadata", {})["semantic-similarity"] = 1.0
+                return self._get_cache_logic(cached_response=local_response)
 
-        # get the embedding
-        embedding = embedding_response["data"][0]["embedding"]
+        embedding = await self._get_async_embedding(prompt, **kwargs)
+
+        # L1: local nearest-neighbour index, skips the Qdrant round-trip
+        if self.local_tiers is not None:
+            local_match = self.local_tiers.search(embedding)
+            if local_match is not None:
+                local_response, similarity = local_match
+                kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
+                return self._get_cache_logic(cached_response=local_response)
 
         data = {
             "vector": embedding,
@@ -403,10 +431,14 @@ class QdrantSemanticCache(BaseCache):
 
         if results is None:
             kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+            if self.local_tiers is not None:
+                self.local_tiers.record("l2", hit=False)
             return None
         if isinstance(results, list):
             if len(results) == 0:
                 kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+                if self.local_tiers is not None:
+                    self.local_tiers.record("l2", hit=False)
                 return None
 
         similarity = results[0]["score"]
@@ -420,12 +452,18 @@ class QdrantSemanticCache(BaseCache):
         # update kwargs["metadata"] with similarity, don't rewrite the original metadata
         kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
 
+        if self.local_tiers is not None:
+            self.local_tiers.record("l2", hit=similarity >= self.similarity_threshold)
         if similarity >= self.similarity_threshold:
             # cache hit !
             cached_value = results[0]["payload"]["response"]
             print_verbose(
                 f"got a cache hit, similarity: {similarity}, Current prompt: {prompt}, cached_prompt: {cached_prompt}"
             )
+            if self.local_tiers is not None:
+                self.local_tiers.add(
+                    prompt, embedding, cached_value, ttl=kwargs.get("ttl")
+                )
             return self._get_cache_logic(cached_response=cached_value)
         else:
             # cache miss !
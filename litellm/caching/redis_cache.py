@@ -15,7 +15,17 @@ import inspect
 import json
 import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
@@ -26,6 +36,7 @@ from litellm.types.caching import RedisPipelineIncrementOperation
 from litellm.types.services import ServiceTypes
 
 from .base_cache import BaseCache
+from .cache_codec import CacheCodec, decode_cache_value, is_codec_encoded
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -33,6 +44,8 @@ if TYPE_CHECKING:
     from redis.asyncio.client import Pipeline
     from redis.asyncio.cluster import ClusterPipeline
 
+    from litellm._redis import RedisInvalidationListener
+
     pipeline = Pipeline
     cluster_pipeline = ClusterPipeline
     async_redis_client = Redis
@@ -44,6 +57,7 @@ else:
     async_redis_client = Any
     async_redis_cluster_client = Any
     Span = Any
+    RedisInvalidationListener = Any
 
 
 def _get_call_stack_info(num_frames: int = 2) -> str:
@@ -97,6 +111,9 @@ class RedisCache(BaseCache):
         namespace: Optional[str] = None,
         startup_nodes: Optional[List] = None,  # for redis-cluster
         socket_timeout: Optional[float] = 5.0,  # default 5 second timeout
+        cache_codec: Optional[Union[CacheCodec, Dict[str, Any]]] = None,
+        client_side_caching: bool = False,
+        client_side_caching_prefixes: Optional[List[str]] = None,
         **kwargs,
     ):
         from litellm._service_logger import ServiceLogging
@@ -133,6 +150,24 @@ class RedisCache(BaseCache):
 
         # redis namespaces
         self.namespace = namespace
+        # binary / compressed values - None keeps plain JSON values
+        self.codec = CacheCodec.from_config(cache_codec)
+        # RESP3 client-side caching - lets DualCache keep tracked keys in memory
+        # until another client writes them
+        self.client_side_caching = client_side_caching
+        if client_side_caching_prefixes:
+            self.client_side_caching_prefixes = [
+                self.check_and_fix_namespace(key=prefix)
+                for prefix in client_side_caching_prefixes
+            ]
+        elif namespace is not None:
+            self.client_side_caching_prefixes = [namespace + ":"]
+        else:
+            self.client_side_caching_prefixes = []
+        self._invalidation_callbacks: List[
+            Callable[[Optional[List[str]]], None]
+        ] = []
+        self._invalidation_listener: Optional["RedisInvalidationListener"] = None
         # for high traffic, we store the redis results in memory and then batch write to redis
         self.redis_batch_writing_buffer: list = []
         if redis_flush_size is None:
@@ -250,8 +285,78 @@ class RedisCache(BaseCache):
             )
 
         self.redis_async_client = redis_async_client  # type: ignore
+        self._start_invalidation_listener()
         return redis_async_client
 
+    def register_invalidation_callback(
+        self, callback: Callable[[Optional[List[str]]], None]
+    ) -> None:
+        """
+        Call `callback(keys)` when tracked keys are written by any client (keys are
+        passed without the namespace). `keys=None` means drop every tracked key.
+
+        No-op unless `client_side_caching=True`.
+        """
+        if not self.client_side_caching:
+            return
+        self._invalidation_callbacks.append(callback)
+        self._start_invalidation_listener()
+
+    def get_client_side_caching_epoch(self) -> Optional[int]:
+        """
+        Invalidation epoch to read before fetching a key - pass it to
+        `is_client_side_cacheable` after the fetch. None if tracking is not active.
+        """
+        self._start_invalidation_listener()
+        listener = self._invalidation_listener
+        if listener is None or not listener.connected:
+            return None
+        return listener.epoch
+
+    def is_client_side_cacheable(self, key: str, epoch: Optional[int]) -> bool:
+        """
+        True if `key` is tracked and nothing was invalidated since `epoch`, so a
+        value read from Redis can be kept in memory until it is invalidated.
+        """
+        listener = self._invalidation_listener
+        if epoch is None or listener is None or not listener.connected:
+            return False
+        if listener.epoch != epoch:
+            return False
+        if not self.client_side_caching_prefixes:
+            return True
+        key = self.check_and_fix_namespace(key=key)
+        return any(key.startswith(p) for p in self.client_side_caching_prefixes)
+
+    def _start_invalidation_listener(self) -> None:
+        if not self.client_side_caching or self._invalidation_listener is not None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # started on first use inside the event loop
+
+        from .._redis import RedisInvalidationListener
+
+        self._invalidation_listener = RedisInvalidationListener(
+            redis_kwargs=self.redis_kwargs,
+            prefixes=self.client_side_caching_prefixes,
+            on_invalidate=self._on_invalidate,
+        )
+        self._invalidation_listener.start()
+
+    def _on_invalidate(self, keys: Optional[List[str]]) -> None:
+        if keys is not None and self.namespace is not None:
+            _prefix = self.namespace + ":"
+            keys = [k[len(_prefix) :] if k.startswith(_prefix) else k for k in keys]
+        for callback in self._invalidation_callbacks:
+            try:
+                callback(keys)
+            except Exception as e:
+                verbose_logger.exception(
+                    "LiteLLM Redis Cache: invalidation callback failed - %s", str(e)
+                )
+
     def check_and_fix_namespace(self, key: str) -> str:
         """
         Make sure each key starts with the given namespace
@@ -298,7 +403,8 @@ class RedisCache(BaseCache):
         key = self.check_and_fix_namespace(key=key)
         try:
             start_time = time.time()
-            self.redis_client.set(name=key, value=str(value), ex=ttl)
+            _value = self.codec.encode(value) if self.codec is not None else str(value)
+            self.redis_client.set(name=key, value=_value, ex=ttl)
             end_time = time.time()
             _duration = end_time - start_time
             self.service_logger_obj.service_success_hook(
@@ -484,7 +590,7 @@ class RedisCache(BaseCache):
                 raise Exception("Redis client cannot set cache. Attribute not found.")
             result = await _redis_client.set(
                 name=key,
-                value=json.dumps(value),
+                value=self._serialize_value(value),
                 nx=nx,
                 ex=ttl,
             )
@@ -542,7 +648,7 @@ class RedisCache(BaseCache):
             print_verbose(
                 f"Set ASYNC Redis Cache PIPELINE: key: {cache_key}\nValue {cache_value}\nttl={ttl}"
             )
-            json_cache_value = json.dumps(cache_value)
+            json_cache_value = self._serialize_value(cache_value)
             # Set the value with a TTL if it's provided.
             _td: Optional[timedelta] = None
             if ttl is not None:
@@ -779,12 +885,20 @@ class RedisCache(BaseCache):
         await self.async_set_cache_pipeline(self.redis_batch_writing_buffer)
         self.redis_batch_writing_buffer = []
 
+    def _serialize_value(self, value: Any) -> Union[str, bytes]:
+        if self.codec is not None:
+            return self.codec.encode(value)
+        return json.dumps(value)
+
     def _get_cache_logic(self, cached_response: Any):
         """
         Common 'get_cache_logic' across sync + async redis client implementations
         """
         if cached_response is None:
             return cached_response
+        # written by a CacheCodec - readable whether or not one is configured now
+        if is_codec_encoded(cached_response):
+            return decode_cache_value(cached_response)
         # cached_response is in `b{} convert it to ModelResponse
         cached_response = cached_response.decode("utf-8")  # Convert bytes to string
         try:
@@ -1104,6 +1218,9 @@ class RedisCache(BaseCache):
         self.redis_client.flushall()
 
     async def disconnect(self):
+        if self._invalidation_listener is not None:
+            await self._invalidation_listener.stop()
+            self._invalidation_listener = None
         await self.async_redis_conn_pool.disconnect(inuse_connections=True)
     
     async def test_connection(self) -> dict:
@@ -1316,6 +1433,108 @@ class RedisCache(BaseCache):
             )
             raise e
 
+    async def async_stream_append(
+        self,
+        key: str,
+        values: List[str],
+        ttl: Optional[int] = None,
+        field: str = "data",
+        parent_otel_span: Optional[Span] = None,
+    ) -> List[str]:
+        """
+        Append values to a Redis Stream (XADD) in one pipeline and refresh its TTL.
+
+        Returns:
+            List[str]: The stream entry ids, in order
+        """
+        _redis_client: Any = self.init_async_client()
+        start_time = time.time()
+        try:
+            async with _redis_client.pipeline(transaction=False) as pipe:
+                for value in values:
+                    pipe.xadd(key, {field: value})
+                if ttl is not None:
+                    pipe.expire(key, ttl)
+                results = await pipe.execute()
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            asyncio.create_task(
+                self.service_logger_obj.async_service_success_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    call_type=f"async_stream_append <- {_get_call_stack_info()}",
+                )
+            )
+            return [
+                r.decode("utf-8") if isinstance(r, bytes) else str(r)
+                for r in results[: len(values)]
+            ]
+        except Exception as e:
+            ## LOGGING ##
+            end_time = time.time()
+            _duration = end_time - start_time
+            asyncio.create_task(
+                self.service_logger_obj.async_service_failure_hook(
+                    service=ServiceTypes.REDIS,
+                    duration=_duration,
+                    error=e,
+                    call_type=f"async_stream_append <- {_get_call_stack_info()}",
+                )
+            )
+            verbose_logger.error(
+                f"LiteLLM Redis Cache XADD: - Got exception from REDIS : {str(e)}"
+            )
+            raise e
+
+    async def async_stream_range(
+        self,
+        key: str,
+        after_id: Optional[str] = None,
+        count: Optional[int] = None,
+        field: str = "data",
+    ) -> List[Tuple[str, str]]:
+        """
+        Read Redis Stream entries (XRANGE) with ids greater than `after_id`
+        (from the start of the stream if None).
+
+        Returns:
+            List[Tuple[str, str]]: (entry id, value) pairs
+        """
+        _redis_client: Any = self.init_async_client()
+        start = f"({after_id}" if after_id else "-"
+        try:
+            entries = await _redis_client.xrange(key, min=start, max="+", count=count)
+        except Exception as e:
+            verbose_logger.error(
+                f"LiteLLM Redis Cache XRANGE: - Got exception from REDIS : {str(e)}"
+            )
+            raise e
+
+        result: List[Tuple[str, str]] = []
+        for entry_id, fields in entries:
+            value = fields.get(field.encode("utf-8"), fields.get(field))
+            result.append(
+                (
+                    entry_id.decode("utf-8")
+                    if isinstance(entry_id, bytes)
+                    else str(entry_id),
+                    value.decode("utf-8") if isinstance(value, bytes) else value,
+                )
+            )
+        return result
+
+    async def async_stream_trim(self, key: str, min_id: str) -> int:
+        """Remove Redis Stream entries with ids lower than `min_id` (XTRIM MINID)."""
+        _redis_client: Any = self.init_async_client()
+        try:
+            return await _redis_client.xtrim(key, minid=min_id, approximate=False)
+        except Exception as e:
+            verbose_logger.error(
+                f"LiteLLM Redis Cache XTRIM: - Got exception from REDIS : {str(e)}"
+            )
+            raise e
+
     async def handle_lpop_count_for_older_redis_versions(
         self, pipe: pipeline, key: str, count: int
     ) -> List[bytes]:
@@ -23,6 +23,8 @@ from litellm.litellm_core_utils.prompt_templates.common_utils import (
 from litellm.types.utils import EmbeddingResponse
 
 from .base_cache import BaseCache
+from .batched_embedder import get_batched_embedder
+from .semantic_cache_local_tiers import SemanticCacheLocalTiers
 
 
 class RedisSemanticCache(BaseCache):
@@ -45,6 +47,8 @@ class RedisSemanticCache(BaseCache):
         similarity_threshold: Optional[float] = None,
         embedding_model: str = "text-embedding-ada-002",
         index_name: Optional[str] = None,
+        local_tiers: Optional[Dict[str, Any]] = None,
+        batch_embeddings: bool = False,
         **kwargs,
     ):
         """
@@ -59,6 +63,10 @@ class RedisSemanticCache(BaseCache):
                 where 1.0 requires exact matches and 0.0 accepts any match
             embedding_model: Model to use for generating embeddings
             index_name: Name for the Redis index
+            local_tiers: Settings for the in-process L0 / L1 tiers checked before
+                Redis (see SemanticCacheLocalTiers). Disabled when None.
+            batch_embeddings: Coalesce concurrent prompt embeddings into batched
+                `aembedding` calls (see BatchedEmbedder)
             ttl: Default time-to-live for cache entries in seconds
             **kwargs: Additional arguments passed to the Redis client
 
@@ -86,6 +94,12 @@ class RedisSemanticCache(BaseCache):
         # While similarity: 1 = most similar, 0 = least similar
         self.distance_threshold = 1 - similarity_threshold
         self.embedding_model = embedding_model
+        self.batch_embeddings = batch_embeddings
+        self.local_tiers = SemanticCacheLocalTiers.from_config(
+            local_tiers,
+            similarity_threshold=similarity_threshold,
+            cache_type="redis-semantic",
+        )
 
         # Set up Redis connection
         if redis_url is None:
@@ -132,6 +146,18 @@ class RedisSemanticCache(BaseCache):
             ttl = int(ttl)
         return ttl
 
+    def _get_remote_ttl(self, **kwargs) -> Optional[int]:
+        """
+        TTL to keep a Redis hit in the local tiers for - the request's ttl, else
+        the default ttl of the Redis cache. None falls back to the local tiers' ttl.
+        """
+        ttl = self._get_ttl(**kwargs)
+        if ttl is None:
+            default_ttl = getattr(self.llmcache, "ttl", None)
+            if isinstance(default_ttl, (int, float)):
+                ttl = int(default_ttl)
+        return ttl
+
     def _get_embedding(self, prompt: str) -> List[float]:
         """
         Generate an embedding vector for the given prompt using the configured embedding model.
@@ -281,6 +307,13 @@ class RedisSemanticCache(BaseCache):
         """
         from litellm.proxy.proxy_server import llm_model_list, llm_router
 
+        if self.local_tiers is not None:
+            memoized_embedding = self.local_tiers.get_embedding(
+                self.embedding_model, prompt
+            )
+            if memoized_embedding is not None:
+                return memoized_embedding
+
         # Route the embedding request through the proxy if appropriate
         router_model_names = (
             [m["model_name"] for m in llm_model_list]
@@ -288,8 +321,27 @@ class RedisSemanticCache(BaseCache):
             else []
         )
 
+        use_router = (
+            llm_router is not None and self.embedding_model in router_model_names
+        )
+
         try:
-            if llm_router is not None and self.embedding_model in router_model_names:
+            if self.batch_embeddings:
+                # Coalesced with concurrent lookups / writes into one request
+                embedding = await get_batched_embedder().aembed(
+                    model=self.embedding_model,
+                    input=prompt,
+                    llm_router=llm_router if use_router else None,
+                    user_api_key=kwargs.get("metadata", {}).get("user_api_key", ""),
+                    litellm_trace_id=kwargs.get("litellm_trace_id"),
+                )
+                if self.local_tiers is not None:
+                    self.local_tiers.set_embedding(
+                        self.embedding_model, prompt, embedding
+                    )
+                return embedding
+
+            if use_router and llm_router is not None:
                 # Use the router for embedding generation
                 user_api_key = kwargs.get("metadata", {}).get("user_api_key", "")
                 embedding_response = await llm_router.aembedding(
@@ -311,7 +363,10 @@ class RedisSemanticCache(BaseCache):
                 )
 
             # Extract and return the embedding vector
-            return embedding_response["data"][0]["embedding"]
+            embedding = embedding_response["data"][0]["embedding"]
+            if self.local_tiers is not None:
+                self.local_tiers.set_embedding(self.embedding_model, prompt, embedding)
+            return embedding
         except Exception as e:
             print_verbose(f"Error generating async embedding: {str(e)}")
             raise ValueError(f"Failed to generate embedding: {str(e)}") from e
@@ -356,6 +411,8 @@ class RedisSemanticCache(BaseCache):
                     value_str,
                     vector=prompt_embedding,  # Pass through custom embedding
                 )
+            if self.local_tiers is not None:
+                self.local_tiers.add(prompt, prompt_embedding, value_str, ttl=ttl)
         except Exception as e:
             print_verbose(f"Error in async_set_cache: {str(e)}")
 
@@ -382,11 +439,30 @@ class RedisSemanticCache(BaseCache):
 
             prompt = get_str_from_messages(messages)
 
+            # L0: exact (normalized) prompt match, skips the embedding call
+            if self.local_tiers is not None:
+                local_response = self.local_tiers.get_exact(prompt)
+                if local_response is not None:
+                    kwargs.setdefault("metadata", {})["semantic-similarity"] = 1.0
+                    return self._get_cache_logic(cached_response=local_response)
+
             # Generate embedding for the prompt
             prompt_embedding = await self._get_async_embedding(prompt, **kwargs)
 
+            # L1: local nearest-neighbour index, skips the Redis round-trip
+            if self.local_tiers is not None:
+                local_match = self.local_tiers.search(prompt_embedding)
+                if local_match is not None:
+                    local_response, similarity = local_match
+                    kwargs.setdefault("metadata", {})[
+                        "semantic-similarity"
+                    ] = similarity
+                    return self._get_cache_logic(cached_response=local_response)
+
             # Check the cache for semantically similar prompts
             results = await self.llmcache.acheck(prompt=prompt, vector=prompt_embedding)
+            if self.local_tiers is not None:
+                self.local_tiers.record("l2", hit=bool(results))
 
             # handle results / cache hit
             if not results:
@@ -416,6 +492,13 @@ class RedisSemanticCache(BaseCache):
                 f"cached prompt: {cached_prompt}"
             )
 
+            if self.local_tiers is not None:
+                self.local_tiers.add(
+                    prompt,
+                    prompt_embedding,
+                    cached_response,
+                    ttl=self._get_remote_ttl(**kwargs),
+                )
             return self._get_cache_logic(cached_response=cached_response)
         except Exception as e:
             print_verbose(f"Error in async_get_cache: {str(e)}")
@@ -12,12 +12,13 @@ import ast
 import asyncio
 import json
 from functools import partial
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 from datetime import datetime, timezone, timedelta
 
 from litellm._logging import print_verbose, verbose_logger
 
 from .base_cache import BaseCache
+from .cache_codec import CacheCodec, decode_cache_value, is_codec_encoded
 
 
 class S3Cache(BaseCache):
@@ -34,10 +35,13 @@ class S3Cache(BaseCache):
         s3_aws_session_token=None,
         s3_config=None,
         s3_path=None,
+        cache_codec: Optional[Union[CacheCodec, Dict[str, Any]]] = None,
         **kwargs,
     ):
         import boto3
 
+        self.codec = CacheCodec.from_config(cache_codec)
+
         self.bucket_name = s3_bucket_name
         self.key_prefix = s3_path.rstrip("/") + "/" if s3_path else ""
         # Create an S3 client with custom endpoint URL
@@ -64,8 +68,15 @@ class S3Cache(BaseCache):
         try:
             print_verbose(f"LiteLLM SET Cache - S3. Key={key}. Value={value}")
             ttl = kwargs.get("ttl", None)
-            # Convert value to JSON before storing in S3
-            serialized_value = json.dumps(value)
+            # Convert value to JSON (or the configured codec) before storing in S3
+            serialized_value: Union[str, bytes] = (
+                self.codec.encode(value) if self.codec is not None else json.dumps(value)
+            )
+            content_type = (
+                "application/octet-stream"
+                if isinstance(serialized_value, bytes)
+                else "application/json"
+            )
             key = self._to_s3_key(key)
 
             if ttl is not None:
@@ -80,7 +91,7 @@ class S3Cache(BaseCache):
                     Body=serialized_value,
                     Expires=expiration_time,
                     CacheControl=cache_control,
-                    ContentType="application/json",
+                    ContentType=content_type,
                     ContentLanguage="en",
                     ContentDisposition=f'inline; filename="{key}.json"',
                 )
@@ -92,7 +103,7 @@ class S3Cache(BaseCache):
                     Key=key,
                     Body=serialized_value,
                     CacheControl=cache_control,
-                    ContentType="application/json",
+                    ContentType=content_type,
                     ContentLanguage="en",
                     ContentDisposition=f'inline; filename="{key}.json"',
                 )
@@ -132,16 +143,18 @@ class S3Cache(BaseCache):
                     if current_time > expires_time:
                         return None
 
-                # cached_response is in `b{} convert it to ModelResponse
-                cached_response = (
-                    cached_response["Body"].read().decode("utf-8")
-                )  # Convert bytes to string
-                try:
-                    cached_response = json.loads(
-                        cached_response
-                    )  # Convert string to dictionary
-                except Exception:
-                    cached_response = ast.literal_eval(cached_response)
+                body = cached_response["Body"].read()
+                if is_codec_encoded(body):
+                    cached_response = decode_cache_value(body)
+                else:
+                    # cached_response is in `b{} convert it to ModelResponse
+                    cached_response = body.decode("utf-8")  # Convert bytes to string
+                    try:
+                        cached_response = json.loads(
+                            cached_response
+                        )  # Convert string to dictionary
+                    except Exception:
+                        cached_response = ast.literal_eval(cached_response)
             if not isinstance(cached_response, dict):
                 cached_response = dict(cached_response)
             verbose_logger.debug(
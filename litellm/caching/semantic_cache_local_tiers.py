@@ -0,0 +1,462 @@
+"""
+In-process tiers in front of a remote semantic cache (Redis / Qdrant).
+
+Lookup order:
+    - L0: exact match on a hash of the normalized prompt - no embedding call
+    - embedding memo: reuse the embedding of a prompt seen before
+    - L1: local nearest-neighbour index over recently seen embeddings
+    - L2: the remote vector store (the semantic cache itself)
+
+L1 uses brute force (NumPy when installed) up to `brute_force_max_size` entries,
+and an HNSW graph beyond that.
+"""
+
+import hashlib
+import heapq
+import math
+import random
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    SEMANTIC_CACHE_LOCAL_BRUTE_FORCE_MAX_SIZE,
+    SEMANTIC_CACHE_LOCAL_EMBEDDING_MEMO_SIZE,
+    SEMANTIC_CACHE_LOCAL_HNSW_EF_CONSTRUCTION,
+    SEMANTIC_CACHE_LOCAL_HNSW_EF_SEARCH,
+    SEMANTIC_CACHE_LOCAL_HNSW_M,
+    SEMANTIC_CACHE_LOCAL_MAX_ENTRIES,
+    SEMANTIC_CACHE_LOCAL_TTL,
+)
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+SemanticCacheTier = Literal["l0", "embedding_memo", "l1", "l2"]
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Unicode-normalize and collapse whitespace, so trivially different prompts share an L0 key."""
+    return " ".join(unicodedata.normalize("NFKC", prompt).split())
+
+
+def get_prompt_hash(prompt: str, namespace: str = "") -> str:
+    return hashlib.sha256(
+        f"{namespace}\x00{normalize_prompt(prompt)}".encode("utf-8")
+    ).hexdigest()
+
+
+def _to_unit_vector(embedding: Sequence[float]) -> Any:
+    if np is not None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+    norm = math.sqrt(sum(x * x for x in embedding))
+    return [x / norm for x in embedding] if norm > 0 else list(embedding)
+
+
+def _dot(a: Any, b: Any) -> float:
+    if np is not None:
+        return float(np.dot(a, b))
+    return sum(x * y for x, y in zip(a, b))
+
+
+class HNSWIndex:
+    """
+    Hierarchical navigable small world graph over unit vectors, scored by cosine
+    similarity. Removed ids are tombstoned - they keep routing searches but are
+    never returned - so callers should rebuild once tombstones pile up.
+    """
+
+    def __init__(
+        self,
+        m: int = SEMANTIC_CACHE_LOCAL_HNSW_M,
+        ef_construction: int = SEMANTIC_CACHE_LOCAL_HNSW_EF_CONSTRUCTION,
+        ef_search: int = SEMANTIC_CACHE_LOCAL_HNSW_EF_SEARCH,
+    ):
+        self.m = m
+        self.max_m0 = 2 * m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._level_multiplier = 1 / math.log(max(m, 2))
+        self.vectors: Dict[str, Any] = {}
+        self.layers: List[Dict[str, List[str]]] = []
+        self.entry_point: Optional[str] = None
+        self.tombstones: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.vectors) - len(self.tombstones)
+
+    def _distance(self, a: Any, b: Any) -> float:
+        return 1.0 - _dot(a, b)
+
+    def _search_layer(
+        self, query: Any, entry_points: List[str], ef: int, layer: int
+    ) -> List[Tuple[float, str]]:
+        """Beam search on one layer. Returns up to `ef` (distance, id) pairs, closest first."""
+        visited = set(entry_points)
+        candidates = [(self._distance(query, self.vectors[e]), e) for e in entry_points]
+        heapq.heapify(candidates)
+        results = [(-d, e) for d, e in candidates]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        graph = self.layers[layer]
+        while candidates:
+            distance, current = heapq.heappop(candidates)
+            if distance > -results[0][0] and len(results) >= ef:
+                break
+            for neighbour in graph.get(current, []):
+                if neighbour in visited:
+                    continue
+                visited.add(neighbour)
+                neighbour_distance = self._distance(query, self.vectors[neighbour])
+                if len(results) < ef or neighbour_distance < -results[0][0]:
+                    heapq.heappush(candidates, (neighbour_distance, neighbour))
+                    heapq.heappush(results, (-neighbour_distance, neighbour))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted((-d, e) for d, e in results)
+
+    def _prune(self, node: str, layer: int) -> None:
+        max_neighbours = self.max_m0 if layer == 0 else self.m
+        neighbours = self.layers[layer][node]
+        if len(neighbours) > max_neighbours:
+            vector = self.vectors[node]
+            neighbours.sort(key=lambda n: self._distance(vector, self.vectors[n]))
+            del neighbours[max_neighbours:]
+
+    def add(self, item_id: str, vector: Any) -> None:
+        if item_id in self.vectors:
+            self.tombstones.discard(item_id)
+            return
+        self.vectors[item_id] = vector
+        level = int(-math.log(1.0 - random.random()) * self._level_multiplier)
+        while len(self.layers) <= level:
+            self.layers.append({})
+        for layer in range(level + 1):
+            self.layers[layer][item_id] = []
+
+        if self.entry_point is None:
+            self.entry_point = item_id
+            return
+
+        entry_points = [self.entry_point]
+        entry_level = self._level_of(self.entry_point)
+        for layer in range(entry_level, level, -1):
+            entry_points = [self._search_layer(vector, entry_points, 1, layer)[0][1]]
+
+        for layer in range(min(level, entry_level), -1, -1):
+            nearest = self._search_layer(
+                vector, entry_points, self.ef_construction, layer
+            )
+            max_neighbours = self.max_m0 if layer == 0 else self.m
+            neighbours = [n for _, n in nearest[:max_neighbours]]
+            self.layers[layer][item_id] = neighbours
+            for neighbour in neighbours:
+                self.layers[layer][neighbour].append(item_id)
+                self._prune(neighbour, layer)
+            entry_points = [n for _, n in nearest]
+
+        if level > entry_level:
+            self.entry_point = item_id
+
+    def _level_of(self, item_id: str) -> int:
+        for layer in range(len(self.layers) - 1, -1, -1):
+            if item_id in self.layers[layer]:
+                return layer
+        return 0
+
+    def remove(self, item_id: str) -> None:
+        if item_id in self.vectors:
+            self.tombstones.add(item_id)
+
+    def search(self, query: Any, k: int = 1) -> List[Tuple[float, str]]:
+        """Returns up to `k` (similarity, id) pairs, most similar first."""
+        if self.entry_point is None:
+            return []
+        entry_points = [self.entry_point]
+        for layer in range(self._level_of(self.entry_point), 0, -1):
+            entry_points = [self._search_layer(query, entry_points, 1, layer)[0][1]]
+        nearest = self._search_layer(query, entry_points, max(self.ef_search, k), 0)
+        return [
+            (1.0 - distance, item_id)
+            for distance, item_id in nearest
+            if item_id not in self.tombstones
+        ][:k]
+
+
+class _LocalEntry:
+    __slots__ = ("prompt_hash", "vector", "response", "expires_at")
+
+    def __init__(
+        self,
+        prompt_hash: str,
+        vector: Any,
+        response: Any,
+        expires_at: Optional[float],
+    ):
+        self.prompt_hash = prompt_hash
+        self.vector = vector
+        self.response = response
+        self.expires_at = expires_at
+
+
+class SemanticCacheLocalTiers:
+    """
+    Bounded, in-process L0 / embedding memo / L1 tiers for a semantic cache.
+
+    Entries are evicted least-recently-used once `max_entries` is reached, and
+    expire after `ttl` seconds (or the ttl passed on `add`). `ttl=None` keeps
+    entries until they are evicted.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        max_entries: int = SEMANTIC_CACHE_LOCAL_MAX_ENTRIES,
+        ttl: Optional[float] = SEMANTIC_CACHE_LOCAL_TTL,
+        embedding_memo_size: int = SEMANTIC_CACHE_LOCAL_EMBEDDING_MEMO_SIZE,
+        brute_force_max_size: int = SEMANTIC_CACHE_LOCAL_BRUTE_FORCE_MAX_SIZE,
+        cache_type: str = "semantic",
+        **hnsw_params: Any,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.embedding_memo_size = embedding_memo_size
+        self.brute_force_max_size = brute_force_max_size
+        self.cache_type = cache_type
+        self.hnsw_params = hnsw_params
+
+        self.entries: "OrderedDict[str, _LocalEntry]" = OrderedDict()
+        self.embedding_memo: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.hnsw_index: Optional[HNSWIndex] = None
+        # brute force L1 index: rows [0, _matrix_size) of `_matrix` hold the
+        # vectors of `_matrix_ids`, grown by doubling and updated in place
+        self._matrix: Optional[Any] = None
+        self._matrix_size = 0
+        self._matrix_ids: List[str] = []
+        self._matrix_rows: Dict[str, int] = {}
+        self.stats: Dict[str, Dict[str, int]] = {
+            tier: {"hits": 0, "misses": 0}
+            for tier in ("l0", "embedding_memo", "l1", "l2")
+        }
+        self.evictions = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict[str, Any]],
+        similarity_threshold: float,
+        cache_type: str,
+    ) -> Optional["SemanticCacheLocalTiers"]:
+        if not config:
+            return None
+        config = dict(config) if isinstance(config, dict) else {}
+        config.setdefault("similarity_threshold", similarity_threshold)
+        return cls(cache_type=cache_type, **config)
+
+    # --- stats ---
+
+    def record(self, tier: SemanticCacheTier, hit: bool) -> None:
+        self.stats[tier]["hits" if hit else "misses"] += 1
+        try:
+            import litellm
+            from litellm.integrations.prometheus import PrometheusLogger
+
+            for callback in litellm.callbacks:
+                if isinstance(callback, PrometheusLogger):
+                    callback._record_semantic_cache_tier_lookup(
+                        cache_type=self.cache_type, tier=tier, hit=hit
+                    )
+                    break
+        except Exception as e:
+            verbose_logger.debug(
+                "SemanticCacheLocalTiers: failed to record metrics: %s", str(e)
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        tiers: Dict[str, Any] = {}
+        for tier, counts in self.stats.items():
+            total = counts["hits"] + counts["misses"]
+            tiers[tier] = {
+                **counts,
+                "hit_rate": counts["hits"] / total if total else 0.0,
+            }
+        return {
+            "entries": len(self.entries),
+            "embedding_memo_entries": len(self.embedding_memo),
+            "evictions": self.evictions,
+            "index": "hnsw" if self.hnsw_index is not None else "brute_force",
+            "tiers": tiers,
+        }
+
+    # --- embedding memo ---
+
+    def get_embedding(self, model: str, prompt: str) -> Optional[List[float]]:
+        key = get_prompt_hash(prompt, namespace=model)
+        embedding = self.embedding_memo.get(key)
+        self.record("embedding_memo", hit=embedding is not None)
+        if embedding is not None:
+            self.embedding_memo.move_to_end(key)
+        return embedding
+
+    def set_embedding(self, model: str, prompt: str, embedding: List[float]) -> None:
+        if self.embedding_memo_size <= 0:
+            return
+        key = get_prompt_hash(prompt, namespace=model)
+        self.embedding_memo[key] = embedding
+        self.embedding_memo.move_to_end(key)
+        while len(self.embedding_memo) > self.embedding_memo_size:
+            self.embedding_memo.popitem(last=False)
+
+    # --- L0 / L1 ---
+
+    def _is_expired(self, entry: _LocalEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= time.time()
+
+    def get_exact(self, prompt: str) -> Optional[Any]:
+        """L0 lookup. Returns the cached response for this exact (normalized) prompt."""
+        prompt_hash = get_prompt_hash(prompt)
+        entry = self.entries.get(prompt_hash)
+        if entry is not None and self._is_expired(entry):
+            self._remove(prompt_hash)
+            entry = None
+        self.record("l0", hit=entry is not None)
+        if entry is None:
+            return None
+        self.entries.move_to_end(prompt_hash)
+        return entry.response
+
+    def search(self, embedding: Sequence[float]) -> Optional[Tuple[Any, float]]:
+        """L1 lookup. Returns (response, similarity) of the nearest entry above the threshold."""
+        match = self._nearest(_to_unit_vector(embedding)) if self.entries else None
+        if match is not None:
+            similarity, prompt_hash = match
+            entry = self.entries.get(prompt_hash)
+            if (
+                entry is not None
+                and similarity >= self.similarity_threshold
+                and not self._is_expired(entry)
+            ):
+                self.entries.move_to_end(prompt_hash)
+                self.record("l1", hit=True)
+                return entry.response, similarity
+            if entry is not None and self._is_expired(entry):
+                self._remove(prompt_hash)
+        self.record("l1", hit=False)
+        return None
+
+    def _nearest(self, vector: Any) -> Optional[Tuple[float, str]]:
+        if self.hnsw_index is not None:
+            results = self.hnsw_index.search(vector, k=1)
+            return results[0] if results else None
+
+        if np is not None:
+            if self._matrix is None:
+                self._rebuild_matrix()
+            similarities = self._matrix[: self._matrix_size] @ vector  # type: ignore
+            best = int(np.argmax(similarities))
+            return float(similarities[best]), self._matrix_ids[best]
+
+        return max(
+            (_dot(entry.vector, vector), prompt_hash)
+            for prompt_hash, entry in self.entries.items()
+        )
+
+    def add(
+        self,
+        prompt: str,
+        embedding: Sequence[float],
+        response: Any,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Add a prompt/response to L0 and L1, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        prompt_hash = get_prompt_hash(prompt)
+        if prompt_hash in self.entries:
+            self._remove(prompt_hash)
+        ttl = ttl if ttl is not None else self.ttl
+        entry = _LocalEntry(
+            prompt_hash=prompt_hash,
+            vector=_to_unit_vector(embedding),
+            response=response,
+            expires_at=time.time() + float(ttl) if ttl is not None else None,
+        )
+        self.entries[prompt_hash] = entry
+        if self.hnsw_index is not None:
+            self.hnsw_index.add(prompt_hash, entry.vector)
+        elif len(self.entries) > self.brute_force_max_size:
+            self._rebuild_hnsw_index()
+            self._matrix = None
+        elif self._matrix is not None:
+            self._append_matrix_row(prompt_hash, entry.vector)
+
+        while len(self.entries) > self.max_entries:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, prompt_hash: str) -> None:
+        self.entries.pop(prompt_hash, None)
+        if self._matrix is not None:
+            self._remove_matrix_row(prompt_hash)
+        if self.hnsw_index is not None:
+            self.hnsw_index.remove(prompt_hash)
+            if len(self.entries) <= self.brute_force_max_size // 2:
+                self.hnsw_index = None
+            elif len(self.hnsw_index.tombstones) > len(self.entries):
+                self._rebuild_hnsw_index()
+
+    def _rebuild_hnsw_index(self) -> None:
+        index = HNSWIndex(**self.hnsw_params)
+        for prompt_hash, entry in self.entries.items():
+            index.add(prompt_hash, entry.vector)
+        self.hnsw_index = index
+
+    def _rebuild_matrix(self) -> None:
+        self._matrix_ids = list(self.entries.keys())
+        self._matrix_rows = {i: row for row, i in enumerate(self._matrix_ids)}
+        self._matrix_size = len(self._matrix_ids)
+        self._matrix = np.stack([self.entries[i].vector for i in self._matrix_ids])
+
+    def _append_matrix_row(self, prompt_hash: str, vector: Any) -> None:
+        matrix = self._matrix
+        if matrix is None or matrix.shape[1:] != vector.shape:
+            # first row, or an embedding model with a different dimension
+            self._matrix = None
+            return
+        if self._matrix_size == matrix.shape[0]:
+            grown = np.empty(
+                (max(2 * self._matrix_size, 1),) + matrix.shape[1:],
+                dtype=matrix.dtype,
+            )
+            grown[: self._matrix_size] = matrix[: self._matrix_size]
+            self._matrix = matrix = grown
+        matrix[self._matrix_size] = vector
+        self._matrix_rows[prompt_hash] = self._matrix_size
+        self._matrix_ids.append(prompt_hash)
+        self._matrix_size += 1
+
+    def _remove_matrix_row(self, prompt_hash: str) -> None:
+        """Move the last row into the removed one."""
+        row = self._matrix_rows.pop(prompt_hash, None)
+        if row is None or self._matrix is None:
+            return
+        last = self._matrix_size - 1
+        if row != last:
+            last_id = self._matrix_ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._matrix_ids[row] = last_id
+            self._matrix_rows[last_id] = row
+        self._matrix_ids.pop()
+        self._matrix_size = last
+        if last == 0:
+            self._matrix = None
@@ -168,6 +168,18 @@ _DEFAULT_TTL_FOR_HTTPX_CLIENTS = 3600  # 1 hour, re-use the same httpx client fo
 # Set to 0 for unlimited (not recommended for production)
 AIOHTTP_CONNECTOR_LIMIT = int(os.getenv("AIOHTTP_CONNECTOR_LIMIT", 300))
 AIOHTTP_CONNECTOR_LIMIT_PER_HOST = int(os.getenv("AIOHTTP_CONNECTOR_LIMIT_PER_HOST", 50))
+# Limits of the connection pools shared by `get_async_httpx_client` clients - one
+# pool serves every client with the same transport settings, so the defaults are
+# 10x the per-client limits above. Set to 0 for unlimited.
+SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS = int(
+    os.getenv("SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS", AIOHTTP_CONNECTOR_LIMIT * 10)
+)
+SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS_PER_HOST = int(
+    os.getenv(
+        "SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS_PER_HOST",
+        AIOHTTP_CONNECTOR_LIMIT_PER_HOST * 10,
+    )
+)
 AIOHTTP_KEEPALIVE_TIMEOUT = int(os.getenv("AIOHTTP_KEEPALIVE_TIMEOUT", 120))
 AIOHTTP_TTL_DNS_CACHE = int(os.getenv("AIOHTTP_TTL_DNS_CACHE", 300))
 # enable_cleanup_closed is only needed for Python versions with the SSL leak bug
@@ -177,6 +189,12 @@ AIOHTTP_NEEDS_CLEANUP_CLOSED = (
     (3, 13, 0) <= sys.version_info < (3, 13, 1) or sys.version_info < (3, 12, 7)
 )
 
+# HTTP/2 connection pool (litellm.http2_providers) - max concurrent requests per host.
+# Set to 0 to only use the server's stream limit
+HTTP2_MAX_CONCURRENT_STREAMS_PER_HOST = int(
+    os.getenv("HTTP2_MAX_CONCURRENT_STREAMS_PER_HOST", 0)
+)
+
 # WebSocket constants
 # Default to None (unlimited) to match OpenAI's official agents SDK behavior
 # https://github.com/openai/openai-agents-python/blob/cf1b933660e44fd37b4350c41febab8221801409/src/agents/realtime/openai_realtime.py#L235
@@ -286,6 +304,9 @@ REPEATED_STREAMING_CHUNK_LIMIT = int(
     os.getenv("REPEATED_STREAMING_CHUNK_LIMIT", 100)
 )  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
 DEFAULT_MAX_LRU_CACHE_SIZE = int(os.getenv("DEFAULT_MAX_LRU_CACHE_SIZE", 16))
+COMPILED_MODEL_PRICING_CACHE_SIZE = int(
+    os.getenv("COMPILED_MODEL_PRICING_CACHE_SIZE", 1000)
+)  # compiled pricing records kept by the cost calculator, one per (model / deployment id, provider, service tier)
 _REALTIME_BODY_CACHE_SIZE = 1000  # Keep realtime helper caches bounded; workloads rarely exceed 1k models/intents
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", 0.5))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", 8.0))
@@ -308,6 +329,35 @@ AZURE_DOCUMENT_INTELLIGENCE_DEFAULT_DPI = int(
 )
 REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.1))
 REDIS_CONNECTION_POOL_TIMEOUT = int(os.getenv("REDIS_CONNECTION_POOL_TIMEOUT", 5))
+# Responses API conversation store (previous_response_id chaining)
+RESPONSES_CONVERSATION_STORE_TTL = int(
+    os.getenv("RESPONSES_CONVERSATION_STORE_TTL", 86400)
+)
+RESPONSES_CONVERSATION_STORE_MAX_IN_MEMORY_ENTRIES = int(
+    os.getenv("RESPONSES_CONVERSATION_STORE_MAX_IN_MEMORY_ENTRIES", 1000)
+)
+RESPONSES_CONVERSATION_STORE_COMPACTION_INTERVAL = int(
+    os.getenv("RESPONSES_CONVERSATION_STORE_COMPACTION_INTERVAL", 20)
+)
+# Background response polling with `state_backend: redis_stream`
+# Output events appended between two output snapshots written to the response header
+RESPONSE_POLLING_STREAM_CHECKPOINT_EVENTS = int(
+    os.getenv("RESPONSE_POLLING_STREAM_CHECKPOINT_EVENTS", 500)
+)
+RESPONSE_POLLING_STREAM_POLL_INTERVAL = float(
+    os.getenv("RESPONSE_POLLING_STREAM_POLL_INTERVAL", 0.15)
+)
+# Redis client-side caching (RESP3 CLIENT TRACKING) - see RedisCache(client_side_caching=True)
+# Upper bound on how long an invalidation-tracked value is kept in memory
+REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL = int(
+    os.getenv("REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL", 3600)
+)
+REDIS_CLIENT_SIDE_CACHING_HEALTH_CHECK_INTERVAL = int(
+    os.getenv("REDIS_CLIENT_SIDE_CACHING_HEALTH_CHECK_INTERVAL", 5)
+)
+REDIS_CLIENT_SIDE_CACHING_MAX_RECONNECT_BACKOFF = int(
+    os.getenv("REDIS_CLIENT_SIDE_CACHING_MAX_RECONNECT_BACKOFF", 30)
+)
 # Default Redis major version to assume when version cannot be determined
 # Using 7 as it's the modern version that supports LPOP with count parameter
 DEFAULT_REDIS_MAJOR_VERSION = int(os.getenv("DEFAULT_REDIS_MAJOR_VERSION", 7))
@@ -333,7 +383,33 @@ TOGETHER_AI_EMBEDDING_150_M = int(os.getenv("TOGETHER_AI_EMBEDDING_150_M", 150))
 TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
+SEMANTIC_CACHE_LOCAL_MAX_ENTRIES = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_MAX_ENTRIES", 10000)
+)
+SEMANTIC_CACHE_LOCAL_TTL = int(os.getenv("SEMANTIC_CACHE_LOCAL_TTL", 300))
+SEMANTIC_CACHE_LOCAL_EMBEDDING_MEMO_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_EMBEDDING_MEMO_SIZE", 10000)
+)
+SEMANTIC_CACHE_LOCAL_BRUTE_FORCE_MAX_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_BRUTE_FORCE_MAX_SIZE", 2048)
+)
+SEMANTIC_CACHE_LOCAL_HNSW_M = int(os.getenv("SEMANTIC_CACHE_LOCAL_HNSW_M", 16))
+SEMANTIC_CACHE_LOCAL_HNSW_EF_CONSTRUCTION = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_HNSW_EF_CONSTRUCTION", 100)
+)
+SEMANTIC_CACHE_LOCAL_HNSW_EF_SEARCH = int(
+    os.getenv("SEMANTIC_CACHE_LOCAL_HNSW_EF_SEARCH", 64)
+)
+SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_SIZE = int(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_SIZE", 64)
+)
+SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_WAIT_MS = float(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_BATCH_MAX_WAIT_MS", 5)
+)
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
+CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES = int(
+    os.getenv("CACHE_CODEC_COMPRESSION_THRESHOLD_BYTES", 1024)
+)
 AUDIO_SPEECH_CHUNK_SIZE = int(
     os.getenv("AUDIO_SPEECH_CHUNK_SIZE", 8192)
 )  # chunk_size for audio speech streaming. Balance between latency and memory usage
@@ -1262,9 +1338,15 @@ CLOUDZERO_EXPORT_USAGE_DATA_JOB_NAME = "cloudzero_export_usage_data"
 CLOUDZERO_MAX_FETCHED_DATA_RECORDS = int(
     os.getenv("CLOUDZERO_MAX_FETCHED_DATA_RECORDS", 50000)
 )
+EVENT_LOOP_LAG_MONITOR_INTERVAL_SECONDS = float(
+    os.getenv("EVENT_LOOP_LAG_MONITOR_INTERVAL_SECONDS", 0.5)
+)  # set to 0 to disable
+BUDGET_RESET_PAGE_SIZE = int(os.getenv("BUDGET_RESET_PAGE_SIZE", 1000))
 SPEND_LOG_CLEANUP_JOB_NAME = "spend_log_cleanup"
 SPEND_LOG_RUN_LOOPS = int(os.getenv("SPEND_LOG_RUN_LOOPS", 500))
 SPEND_LOG_CLEANUP_BATCH_SIZE = int(os.getenv("SPEND_LOG_CLEANUP_BATCH_SIZE", 1000))
+SPEND_LOG_ARCHIVE_BATCH_SIZE = int(os.getenv("SPEND_LOG_ARCHIVE_BATCH_SIZE", 10000))
+SPEND_LOGS_STREAM_BATCH_SIZE = int(os.getenv("SPEND_LOGS_STREAM_BATCH_SIZE", 1000))
 SPEND_LOG_QUEUE_SIZE_THRESHOLD = int(os.getenv("SPEND_LOG_QUEUE_SIZE_THRESHOLD", 100))
 SPEND_LOG_QUEUE_POLL_INTERVAL = float(os.getenv("SPEND_LOG_QUEUE_POLL_INTERVAL", 2.0))
 DEFAULT_CRON_JOB_LOCK_TTL_SECONDS = int(
@@ -1281,6 +1363,24 @@ PROXY_BATCH_WRITE_AT = int(
     os.getenv("PROXY_BATCH_WRITE_AT", 10)
 )  # in seconds, increased from 10
 
+# Parse Bedrock streaming responses with botocore's EventStreamBuffer / EventStreamJSONParser instead of the native decoder
+BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER = os.getenv(
+    "BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER", "False"
+).lower() in ["true", "1"]
+
+# Refresh cached STS credentials in the background once they are this close (seconds) to expiring
+AWS_CREDENTIAL_REFRESH_WINDOW_SECONDS = int(
+    os.getenv("AWS_CREDENTIAL_REFRESH_WINDOW_SECONDS", 300)
+)
+# Wait this long (seconds) before retrying a failed background credential refresh
+AWS_CREDENTIAL_REFRESH_RETRY_SECONDS = int(
+    os.getenv("AWS_CREDENTIAL_REFRESH_RETRY_SECONDS", 30)
+)
+# Max SigV4 signing keys cached - one per (credentials, date, region, service)
+AWS_SIGV4_SIGNING_KEY_CACHE_SIZE = int(
+    os.getenv("AWS_SIGV4_SIGNING_KEY_CACHE_SIZE", 128)
+)
+
 # APScheduler Configuration - MEMORY LEAK FIX
 # These settings prevent memory leaks in APScheduler's normalize() and _apply_jitter() functions
 APSCHEDULER_COALESCE = os.getenv("APSCHEDULER_COALESCE", "True").lower() in [
@@ -1309,6 +1409,15 @@ DEFAULT_SHARED_HEALTH_CHECK_TTL = int(
 DEFAULT_SHARED_HEALTH_CHECK_LOCK_TTL = int(
     os.getenv("DEFAULT_SHARED_HEALTH_CHECK_LOCK_TTL", 60)
 )  # 1 minute - TTL for health check lock
+HEALTH_CHECK_MAX_CONCURRENCY = int(
+    os.getenv("HEALTH_CHECK_MAX_CONCURRENCY", 20)
+)  # max deployments health checked at once
+HEALTH_CHECK_INTERVAL_JITTER = float(
+    os.getenv("HEALTH_CHECK_INTERVAL_JITTER", 0.1)
+)  # +/- fraction of health_check_interval - spreads out background health checks
+HEALTH_CHECK_MAX_BACKOFF_SECONDS = int(
+    os.getenv("HEALTH_CHECK_MAX_BACKOFF_SECONDS", 1800)
+)  # 30 minutes - max wait before re-checking a deployment that keeps failing
 PROMETHEUS_FALLBACK_STATS_SEND_TIME_HOURS = int(
     os.getenv("PROMETHEUS_FALLBACK_STATS_SEND_TIME_HOURS", 9)
 )
@@ -1418,12 +1527,60 @@ COROUTINE_CHECKER_MAX_SIZE_IN_MEMORY = int(
 DEFAULT_CHUNK_SIZE = int(os.getenv("DEFAULT_CHUNK_SIZE", 1000))
 DEFAULT_CHUNK_OVERLAP = int(os.getenv("DEFAULT_CHUNK_OVERLAP", 200))
 
+########################### RAG Ingestion Constants ###########################
+# Embedding requests are split into batches bounded by input count and (estimated) tokens
+RAG_INGEST_EMBEDDING_BATCH_SIZE = int(os.getenv("RAG_INGEST_EMBEDDING_BATCH_SIZE", 96))
+RAG_INGEST_EMBEDDING_MAX_TOKENS_PER_BATCH = int(
+    os.getenv("RAG_INGEST_EMBEDDING_MAX_TOKENS_PER_BATCH", 16000)
+)
+RAG_INGEST_EMBEDDING_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv("RAG_INGEST_EMBEDDING_MAX_CONCURRENT_REQUESTS", 4)
+)
+
 ########################### S3 Vectors RAG Constants ###########################
 S3_VECTORS_DEFAULT_DIMENSION = int(os.getenv("S3_VECTORS_DEFAULT_DIMENSION", 1024))
 S3_VECTORS_DEFAULT_DISTANCE_METRIC = str(
     os.getenv("S3_VECTORS_DEFAULT_DISTANCE_METRIC", "cosine")
 )
 S3_VECTORS_DEFAULT_NON_FILTERABLE_METADATA_KEYS = ["source_text"]
+S3_VECTORS_MAX_VECTORS_PER_PUT = int(os.getenv("S3_VECTORS_MAX_VECTORS_PER_PUT", 500))
+
+########################### Batch File Constants ###########################
+# Batch JSONL files are read and parsed in chunks of this size, never as a whole
+BATCH_JSONL_READ_CHUNK_SIZE_BYTES = int(
+    os.getenv("BATCH_JSONL_READ_CHUNK_SIZE_BYTES", 1024 * 1024)
+)
+# Rewritten batch input files are kept in memory up to this size, then spooled to disk
+BATCH_JSONL_SPOOL_MAX_SIZE_BYTES = int(
+    os.getenv("BATCH_JSONL_SPOOL_MAX_SIZE_BYTES", 16 * 1024 * 1024)
+)
+# Local batch execution - batch files run through the Router instead of a provider batch API
+LOCAL_BATCH_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv("LOCAL_BATCH_MAX_CONCURRENT_REQUESTS", 8)
+)
+# Share of a model group's rpm / tpm left free for interactive traffic
+LOCAL_BATCH_HEADROOM_FRACTION = float(os.getenv("LOCAL_BATCH_HEADROOM_FRACTION", 0.2))
+LOCAL_BATCH_CHECKPOINT_INTERVAL = int(os.getenv("LOCAL_BATCH_CHECKPOINT_INTERVAL", 100))
+LOCAL_BATCH_RATE_LIMIT_BACKOFF_SECONDS = float(
+    os.getenv("LOCAL_BATCH_RATE_LIMIT_BACKOFF_SECONDS", 5)
+)
+LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES = int(
+    os.getenv("LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES", 5)
+)
+LOCAL_BATCH_STORAGE_DIR = os.getenv("LOCAL_BATCH_STORAGE_DIR", None)
+# Async batch completion (`litellm.abatch_completion`) - AIMD concurrency limit
+DEFAULT_BATCH_COMPLETION_INITIAL_CONCURRENCY = int(
+    os.getenv("DEFAULT_BATCH_COMPLETION_INITIAL_CONCURRENCY", 10)
+)
+DEFAULT_BATCH_COMPLETION_LATENCY_TOLERANCE = float(
+    os.getenv("DEFAULT_BATCH_COMPLETION_LATENCY_TOLERANCE", 2.0)
+)
+DEFAULT_BATCH_COMPLETION_LATENCY_DECREASE_FACTOR = float(
+    os.getenv("DEFAULT_BATCH_COMPLETION_LATENCY_DECREASE_FACTOR", 0.9)
+)
+DEFAULT_BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES = int(
+    os.getenv("DEFAULT_BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES", 3)
+)
 
 ########################### Microsoft SSO Constants ###########################
 MICROSOFT_USER_EMAIL_ATTRIBUTE = str(
@@ -7,6 +7,7 @@ from typing import (
     Any,
     AsyncGenerator,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Tuple,
@@ -29,6 +30,7 @@ from litellm.types.utils import (
     ModelResponseStream,
     StandardCallbackDynamicParams,
     StandardLoggingPayload,
+    StreamingLoggingField,
 )
 
 if TYPE_CHECKING:
@@ -63,9 +65,21 @@ _BASE64_INLINE_PATTERN = re.compile(
     re.MULTILINE,
 )
 
+ALL_STREAMING_LOGGING_FIELDS: FrozenSet[StreamingLoggingField] = frozenset(
+    {"usage", "response_cost", "response"}
+)
+
 
 class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callback#callback-class
     # Class variables or attributes
+
+    # Fields of a finished streaming call read by this logger's success hooks.
+    # If no active logger reads "response", litellm skips re-assembling the streamed chunks
+    # and prices the call straight from the provider's final usage chunk.
+    streaming_logging_fields: FrozenSet[
+        StreamingLoggingField
+    ] = ALL_STREAMING_LOGGING_FIELDS
+
     def __init__(
         self,
         turn_off_message_logging: bool = False,
@@ -82,6 +96,12 @@ class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callbac
         self.turn_off_message_logging = turn_off_message_logging
         pass
 
+    def get_streaming_logging_fields(self) -> FrozenSet[StreamingLoggingField]:
+        """
+        Override when the fields read depend on runtime config (e.g. storing responses is a setting).
+        """
+        return self.streaming_logging_fields
+
     @staticmethod
     def get_callback_env_vars(callback_name: Optional[str] = None) -> List[str]:
         """
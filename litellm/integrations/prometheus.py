@@ -61,6 +61,8 @@ def _get_cached_end_user_id_for_cost_tracking():
 
 class PrometheusLogger(CustomLogger):
     # Class variables or attributes
+    streaming_logging_fields = frozenset({"usage", "response_cost"})
+
     def __init__(  # noqa: PLR0915
         self,
         **kwargs,
@@ -306,6 +308,47 @@ class PrometheusLogger(CustomLogger):
                 "Total number of guardrail invocations",
                 labelnames=["guardrail_name", "status", "hook_type"],
             )
+
+            # Proxy-internal latency breakdown
+            self.litellm_proxy_request_stage_latency_seconds = self._histogram_factory(
+                "litellm_proxy_request_stage_latency_seconds",
+                "Latency (seconds) per proxy request stage - auth, pre_call_hooks, routing, llm_api_call, upstream_ttfb, streaming, post_call_hooks, logging_enqueue",
+                labelnames=["stage"],
+                buckets=PROXY_STAGE_LATENCY_BUCKETS,
+            )
+
+            self.litellm_event_loop_lag_seconds = self._histogram_factory(
+                "litellm_event_loop_lag_seconds",
+                "How late (seconds) the proxy event loop ran a scheduled timer - high values mean the loop is blocked",
+                labelnames=[],
+                buckets=PROXY_STAGE_LATENCY_BUCKETS,
+            )
+
+            self.litellm_health_check_scheduler_lag_seconds = self._histogram_factory(
+                "litellm_health_check_scheduler_lag_seconds",
+                "How late (seconds) a background health check started vs. when it was due - high values mean health checks are backed up",
+                labelnames=[],
+                buckets=PROXY_STAGE_LATENCY_BUCKETS,
+            )
+
+            self.litellm_aws_credential_refresh_latency_seconds = self._histogram_factory(
+                "litellm_aws_credential_refresh_latency_seconds",
+                "Latency (seconds) for fetching AWS credentials - blocking (on a cache miss) or background (refresh ahead of expiry)",
+                labelnames=["refresh_type"],
+                buckets=PROXY_STAGE_LATENCY_BUCKETS,
+            )
+
+            self.litellm_aws_credential_refresh_failures_total = self._counter_factory(
+                "litellm_aws_credential_refresh_failures_total",
+                "Total number of failed AWS credential fetches",
+                labelnames=["refresh_type"],
+            )
+
+            self.litellm_semantic_cache_tier_requests_total = self._counter_factory(
+                "litellm_semantic_cache_tier_requests_total",
+                "Total semantic cache lookups per tier (l0 exact match, embedding_memo, l1 local index, l2 remote vector store), by result (hit / miss)",
+                labelnames=["cache_type", "tier", "result"],
+            )
             # llm api provider budget metrics
             self.litellm_provider_remaining_budget_metric = self._gauge_factory(
                 "litellm_provider_remaining_budget_metric",
@@ -2186,6 +2229,63 @@ class PrometheusLogger(CustomLogger):
         except Exception as e:
             verbose_logger.debug(f"Error recording guardrail metrics: {str(e)}")
 
+    def _record_request_stage_metrics(self, stage_durations: Dict[str, float]):
+        """
+        Record per-stage proxy request latencies.
+
+        Args:
+            stage_durations: stage name -> seconds, from `RequestStageTimer.durations`
+        """
+        try:
+            for stage, seconds in stage_durations.items():
+                self.litellm_proxy_request_stage_latency_seconds.labels(
+                    stage=stage
+                ).observe(seconds)
+        except Exception as e:
+            verbose_logger.debug(f"Error recording request stage metrics: {str(e)}")
+
+    def _record_event_loop_lag(self, lag_seconds: float):
+        try:
+            self.litellm_event_loop_lag_seconds.observe(lag_seconds)
+        except Exception as e:
+            verbose_logger.debug(f"Error recording event loop lag: {str(e)}")
+
+    def _record_health_check_scheduler_lag(self, lag_seconds: float):
+        try:
+            self.litellm_health_check_scheduler_lag_seconds.observe(lag_seconds)
+        except Exception as e:
+            verbose_logger.debug(
+                f"Error recording health check scheduler lag: {str(e)}"
+            )
+
+    def _record_aws_credential_refresh(
+        self, latency_seconds: float, refresh_type: str, success: bool
+    ):
+        try:
+            self.litellm_aws_credential_refresh_latency_seconds.labels(
+                refresh_type=refresh_type
+            ).observe(latency_seconds)
+            if not success:
+                self.litellm_aws_credential_refresh_failures_total.labels(
+                    refresh_type=refresh_type
+                ).inc()
+        except Exception as e:
+            verbose_logger.debug(
+                f"Error recording aws credential refresh metrics: {str(e)}"
+            )
+
+    def _record_semantic_cache_tier_lookup(
+        self, cache_type: str, tier: str, hit: bool
+    ):
+        try:
+            self.litellm_semantic_cache_tier_requests_total.labels(
+                cache_type=cache_type, tier=tier, result="hit" if hit else "miss"
+            ).inc()
+        except Exception as e:
+            verbose_logger.debug(
+                f"Error recording semantic cache tier metrics: {str(e)}"
+            )
+
     @staticmethod
     def _get_exception_class_name(exception: Exception) -> str:
         exception_class_name = ""
@@ -0,0 +1,145 @@
+"""
+Streaming JSON Lines reader / writer.
+
+Batch input and output files can be gigabytes. These helpers read them in
+fixed-size chunks and yield one parsed line at a time, so callers aggregate as
+they go instead of holding the file's text and every parsed object in memory.
+Lines are parsed with `orjson` when it is installed, `json` otherwise.
+"""
+
+import json
+from typing import IO, Any, Callable, Iterable, Iterator, List, Union
+
+from litellm.constants import BATCH_JSONL_READ_CHUNK_SIZE_BYTES
+
+JsonlSource = Union[
+    bytes, bytearray, memoryview, str, IO[bytes], IO[str], Iterable[bytes]
+]
+
+
+def _get_json_loads() -> Callable[[Union[bytes, str]], Any]:
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+def _get_json_dumps() -> Callable[[Any], bytes]:
+    try:
+        import orjson
+
+        return orjson.dumps
+    except ImportError:
+        return lambda obj: json.dumps(obj).encode("utf-8")
+
+
+def _iter_chunks(source: JsonlSource, chunk_size: int) -> Iterator[Union[bytes, str]]:
+    if isinstance(source, (bytes, bytearray, memoryview, str)):
+        # slice in-memory content so a line is the largest extra copy made
+        view = memoryview(source) if not isinstance(source, str) else source
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start : start + chunk_size]
+            yield chunk.tobytes() if isinstance(chunk, memoryview) else chunk
+    elif hasattr(source, "read"):
+        read = source.read  # type: ignore[union-attr]
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source  # type: ignore[misc]
+
+
+def iter_jsonl_lines(
+    source: JsonlSource,
+    chunk_size: int = BATCH_JSONL_READ_CHUNK_SIZE_BYTES,
+) -> Iterator[Union[bytes, str]]:
+    """
+    Yield the lines of JSONL content without their trailing newline.
+
+    `source` is the content itself, a file-like object (read `chunk_size` at a
+    time) or an iterable of byte chunks, e.g. `httpx.Response.iter_bytes()`.
+    """
+    pending: List[Any] = []
+    for chunk in _iter_chunks(source, chunk_size):
+        newline = "\n" if isinstance(chunk, str) else b"\n"
+        lines = chunk.split(newline)  # type: ignore[arg-type]
+        if len(lines) == 1:
+            # no line ends in this chunk - keep collecting the current line
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(lines[0])
+            lines[0] = chunk[:0].join(pending)
+            pending = []
+        last_line = lines.pop()
+        if last_line:
+            pending.append(last_line)
+        yield from lines
+    if pending:
+        yield pending[0][:0].join(pending)
+
+
+def iter_jsonl_objects(
+    source: JsonlSource,
+    allow_multiline_objects: bool = False,
+    chunk_size: int = BATCH_JSONL_READ_CHUNK_SIZE_BYTES,
+) -> Iterator[Any]:
+    """
+    Parse JSONL content one line at a time. Blank lines are skipped.
+
+    Args:
+        source: see `iter_jsonl_lines`
+        allow_multiline_objects: join a line that does not parse with the
+            following lines until they do - for hand-written files with
+            pretty-printed objects. Otherwise an invalid line raises at once.
+        chunk_size: bytes read from `source` at a time
+
+    Raises:
+        json.JSONDecodeError (`orjson.JSONDecodeError` is a subclass) on content
+        that is not valid JSONL.
+    """
+    loads = _get_json_loads()
+    buffered_lines: List[Any] = []
+    for line in iter_jsonl_lines(source, chunk_size=chunk_size):
+        if not buffered_lines and (not line or line.isspace()):
+            continue
+        if not allow_multiline_objects:
+            yield loads(line)
+            continue
+        buffered_lines.append(line)
+        if len(buffered_lines) > 1:
+            newline = "\n" if isinstance(line, str) else b"\n"
+            line = newline.join(buffered_lines)  # type: ignore[attr-defined]
+        try:
+            parsed = loads(line)
+        except json.JSONDecodeError:
+            # not a complete JSON object yet, keep accumulating
+            continue
+        buffered_lines = []
+        yield parsed
+
+    if buffered_lines:
+        newline = "\n" if isinstance(buffered_lines[0], str) else b"\n"
+        remainder = newline.join(buffered_lines)  # type: ignore[attr-defined]
+        if not remainder.isspace():
+            yield loads(remainder)
+
+
+def write_jsonl(objects: Iterable[Any], file: IO[bytes]) -> int:
+    """
+    Write `objects` to `file` as JSONL, one line each. Returns the number of lines.
+
+    `objects` is consumed lazily, so piping `iter_jsonl_objects` into it keeps
+    one object in memory at a time.
+    """
+    dumps = _get_json_dumps()
+    line_count = 0
+    for obj in objects:
+        file.write(dumps(obj))
+        file.write(b"\n")
+        line_count += 1
+    return line_count
@@ -379,6 +379,11 @@ class Logging(LiteLLMLoggingBaseClass):
         ## TIME TO FIRST TOKEN LOGGING ##
         self.completion_start_time: Optional[datetime.datetime] = None
         self._llm_caching_handler: Optional[LLMCachingHandler] = None
+        ## STREAMED CHUNKS - only kept when logging used the usage-only fast path ##
+        self._deferred_streaming_chunks: Optional[List[Any]] = None
+        self._assembled_streaming_response: Optional[
+            Union[ModelResponse, TextCompletionResponse]
+        ] = None
 
         # INITIAL LITELLM_PARAMS
         litellm_params = {}
@@ -3199,6 +3204,66 @@ class Logging(LiteLLMLoggingBaseClass):
             _new_callbacks.append(_c)
         return _new_callbacks
 
+    def should_assemble_streaming_response(self, cache_hit: Optional[bool] = None) -> bool:
+        """
+        Returns True if anything run after a stream finishes reads the assembled response
+        content - the response cache, or a success callback that doesn't declare it only
+        needs usage / cost (see `CustomLogger.streaming_logging_fields`).
+
+        Callbacks that aren't CustomLogger instances (e.g. "langfuse", custom functions) always
+        get the full response.
+        """
+        if litellm.cache is not None and cache_hit is not True:
+            return True
+
+        callbacks = (
+            self.get_combined_callback_list(
+                dynamic_success_callbacks=self.dynamic_success_callbacks,
+                global_callbacks=litellm.success_callback,
+            )
+            + self.get_combined_callback_list(
+                dynamic_success_callbacks=self.dynamic_async_success_callbacks,
+                global_callbacks=litellm._async_success_callback,
+            )
+            + litellm.callbacks
+        )
+        for callback in callbacks:
+            if not isinstance(callback, CustomLogger):
+                return True
+            if "response" in callback.get_streaming_logging_fields():
+                return True
+        return False
+
+    def defer_streaming_response_assembly(self, chunks: List[Any]) -> None:
+        """
+        Keep the streamed chunks so `get_assembled_streaming_response` can build the full
+        response on demand, after logging priced the call from its usage.
+        """
+        self._deferred_streaming_chunks = chunks
+
+    def get_assembled_streaming_response(
+        self,
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        Full response assembled from the streamed chunks.
+
+        Built lazily (once) when the usage-only fast path was used, otherwise it's the
+        `complete_streaming_response` already passed to the callbacks.
+        """
+        if self._assembled_streaming_response is not None:
+            return self._assembled_streaming_response
+        if self._deferred_streaming_chunks is None:
+            return self.model_call_details.get(
+                "async_complete_streaming_response"
+            ) or self.model_call_details.get("complete_streaming_response")
+
+        self._assembled_streaming_response = litellm.stream_chunk_builder(
+            chunks=self._deferred_streaming_chunks,
+            messages=self.messages,
+        )
+        self._deferred_streaming_chunks = None
+        return self._assembled_streaming_response
+
     def _get_assembled_streaming_response(
         self,
         result: Union[
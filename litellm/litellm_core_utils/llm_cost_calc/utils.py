@@ -1,10 +1,11 @@
 # What is this?
 ## Helper utilities for cost_per_token()
 
-from typing import Literal, Optional, Tuple, TypedDict, cast
+from typing import Dict, List, Literal, Optional, Tuple, TypedDict, cast
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.constants import COMPILED_MODEL_PRICING_CACHE_SIZE
 from litellm.types.utils import (
     CacheCreationTokenDetails,
     CallTypes,
@@ -547,32 +548,7 @@ def _calculate_input_cost(
     return prompt_cost
 
 
-def generic_cost_per_token(  # noqa: PLR0915
-    model: str,
-    usage: Usage,
-    custom_llm_provider: str,
-    service_tier: Optional[str] = None,
-) -> Tuple[float, float]:
-    """
-    Calculates the cost per token for a given model, prompt tokens, and completion tokens.
-
-    Handles context caching as well.
-
-    Input:
-        - model: str, the model name without provider prefix
-        - usage: LiteLLM Usage block, containing anthropic caching information
-
-    Returns:
-        Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
-    """
-
-    ## GET MODEL INFO
-    model_info = get_model_info(model=model, custom_llm_provider=custom_llm_provider)
-
-    ## CALCULATE INPUT COST
-    ### Cost of processing (non-cache hit + cache hit) + Cost of cache-writing (cache writing)
-    prompt_cost = 0.0
-    ### PROCESSING COST
+def _get_prompt_tokens_details_for_cost(usage: Usage) -> PromptTokensDetailsResult:
     prompt_tokens_details = PromptTokensDetailsResult(
         cache_hit_tokens=0,
         cache_creation_tokens=0,
@@ -611,27 +587,16 @@ def generic_cost_per_token(  # noqa: PLR0915
             - image_tokens
         )
         prompt_tokens_details["text_tokens"] = text_tokens
+    return prompt_tokens_details
 
-    (
-        prompt_base_cost,
-        completion_base_cost,
-        cache_creation_cost,
-        cache_creation_cost_above_1hr,
-        cache_read_cost,
-    ) = _get_token_base_cost(
-        model_info=model_info, usage=usage, service_tier=service_tier
-    )
 
-    prompt_cost = _calculate_input_cost(
-        prompt_tokens_details=prompt_tokens_details,
-        model_info=model_info,
-        prompt_base_cost=prompt_base_cost,
-        cache_read_cost=cache_read_cost,
-        cache_creation_cost=cache_creation_cost,
-        cache_creation_cost_above_1hr=cache_creation_cost_above_1hr,
-    )
-
-    ## CALCULATE OUTPUT COST
+def _get_completion_tokens_breakdown_for_cost(
+    usage: Usage,
+) -> Tuple[int, int, int, int, bool]:
+    """
+    Returns:
+        Tuple[int, int, int, int, bool] - (text_tokens, audio_tokens, reasoning_tokens, image_tokens, is_text_tokens_total)
+    """
     text_tokens = 0
     audio_tokens = 0
     reasoning_tokens = 0
@@ -664,6 +629,58 @@ def generic_cost_per_token(  # noqa: PLR0915
             # No breakdown at all, all tokens are text tokens
             text_tokens = usage.completion_tokens
             is_text_tokens_total = True
+    return (
+        text_tokens,
+        audio_tokens,
+        reasoning_tokens,
+        image_tokens,
+        is_text_tokens_total,
+    )
+
+
+def _generic_cost_per_token_from_model_info(
+    model_info: ModelInfo,
+    usage: Usage,
+    service_tier: Optional[str] = None,
+) -> Tuple[float, float]:
+    """
+    Reference (uncompiled) implementation of `generic_cost_per_token`.
+
+    Reads every rate from the model info dict on each call. `CompiledModelPricing` must
+    return the same result - this is used as the fallback if a model's pricing can't be compiled.
+    """
+    ## CALCULATE INPUT COST
+    ### Cost of processing (non-cache hit + cache hit) + Cost of cache-writing (cache writing)
+    prompt_tokens_details = _get_prompt_tokens_details_for_cost(usage)
+
+    (
+        prompt_base_cost,
+        completion_base_cost,
+        cache_creation_cost,
+        cache_creation_cost_above_1hr,
+        cache_read_cost,
+    ) = _get_token_base_cost(
+        model_info=model_info, usage=usage, service_tier=service_tier
+    )
+
+    prompt_cost = _calculate_input_cost(
+        prompt_tokens_details=prompt_tokens_details,
+        model_info=model_info,
+        prompt_base_cost=prompt_base_cost,
+        cache_read_cost=cache_read_cost,
+        cache_creation_cost=cache_creation_cost,
+        cache_creation_cost_above_1hr=cache_creation_cost_above_1hr,
+    )
+
+    ## CALCULATE OUTPUT COST
+    (
+        text_tokens,
+        audio_tokens,
+        reasoning_tokens,
+        image_tokens,
+        is_text_tokens_total,
+    ) = _get_completion_tokens_breakdown_for_cost(usage)
+
     ## TEXT COST
     completion_cost = float(text_tokens) * completion_base_cost
 
@@ -707,6 +724,412 @@ def generic_cost_per_token(  # noqa: PLR0915
     return prompt_cost, completion_cost
 
 
+def _get_pricing_fingerprint(model_info: ModelInfo) -> Tuple[Tuple[str, object], ...]:
+    """All pricing fields of a model info dict - every rate key contains `cost`."""
+    return tuple((key, value) for key, value in model_info.items() if "cost" in key)
+
+
+# (threshold, input, output, cache_creation, cache_creation_above_1hr, cache_read)
+_PricingTier = Tuple[
+    float,
+    Optional[float],
+    Optional[float],
+    Optional[float],
+    Optional[float],
+    Optional[float],
+]
+
+
+class CompiledModelPricing:
+    """
+    All token-class rates of one model (for one service tier), resolved once into floats.
+
+    `generic_cost_per_token` otherwise re-reads ~20 keys from the model info dict and
+    sorts all its items to find tier thresholds on every call. A compiled record
+    resolves service tier keys, string rates and threshold keys up front, so
+    pricing a call is a handful of float multiplications.
+    """
+
+    __slots__ = (
+        "model_info",
+        "pricing_fingerprint",
+        "input_cost_per_token",
+        "output_cost_per_token",
+        "cache_creation_input_token_cost",
+        "cache_creation_input_token_cost_above_1hr",
+        "cache_read_input_token_cost",
+        "input_cost_per_audio_token",
+        "input_cost_per_image_token",
+        "input_cost_per_character",
+        "input_cost_per_image",
+        "input_cost_per_video_per_second",
+        "output_cost_per_audio_token",
+        "output_cost_per_reasoning_token",
+        "output_cost_per_image_token",
+        "tiers",
+    )
+
+    def __init__(self, model_info: ModelInfo, service_tier: Optional[str] = None):
+        self.model_info = model_info
+        self.pricing_fingerprint = _get_pricing_fingerprint(model_info)
+
+        self.input_cost_per_token = cast(
+            float,
+            _get_cost_per_unit(
+                model_info,
+                _get_service_tier_cost_key("input_cost_per_token", service_tier),
+            ),
+        )
+        output_cost_per_token = cast(
+            float,
+            _get_cost_per_unit(
+                model_info,
+                _get_service_tier_cost_key("output_cost_per_token", service_tier),
+            ),
+        )
+        self.output_cost_per_image_token: Optional[float] = _get_cost_per_unit(
+            model_info, "output_cost_per_image_token", None
+        )
+        # For image generation models that don't have output_cost_per_token,
+        # use output_cost_per_image_token as the base cost (all output tokens are image tokens)
+        if output_cost_per_token == 0.0 or output_cost_per_token is None:
+            if self.output_cost_per_image_token is not None:
+                output_cost_per_token = self.output_cost_per_image_token
+        self.output_cost_per_token = output_cost_per_token
+        self.cache_creation_input_token_cost = cast(
+            float,
+            _get_cost_per_unit(
+                model_info,
+                _get_service_tier_cost_key(
+                    "cache_creation_input_token_cost", service_tier
+                ),
+            ),
+        )
+        self.cache_creation_input_token_cost_above_1hr = cast(
+            float,
+            _get_cost_per_unit(model_info, "cache_creation_input_token_cost_above_1hr"),
+        )
+        self.cache_read_input_token_cost = cast(
+            float,
+            _get_cost_per_unit(
+                model_info,
+                _get_service_tier_cost_key("cache_read_input_token_cost", service_tier),
+            ),
+        )
+
+        self.input_cost_per_audio_token = cast(
+            float, _get_cost_per_unit(model_info, "input_cost_per_audio_token")
+        )
+        # First check if input_cost_per_image_token is available. If not, default to generic input_cost_per_token.
+        self.input_cost_per_image_token = cast(
+            float,
+            _get_cost_per_unit(
+                model_info,
+                (
+                    "input_cost_per_image_token"
+                    if model_info.get("input_cost_per_image_token") is not None
+                    else "input_cost_per_token"
+                ),
+            ),
+        )
+        self.input_cost_per_character = cast(
+            float, _get_cost_per_unit(model_info, "input_cost_per_character")
+        )
+        self.input_cost_per_image = cast(
+            float, _get_cost_per_unit(model_info, "input_cost_per_image")
+        )
+        self.input_cost_per_video_per_second = cast(
+            float, _get_cost_per_unit(model_info, "input_cost_per_video_per_second")
+        )
+        self.output_cost_per_audio_token: Optional[float] = _get_cost_per_unit(
+            model_info, "output_cost_per_audio_token", None
+        )
+        self.output_cost_per_reasoning_token: Optional[float] = _get_cost_per_unit(
+            model_info, "output_cost_per_reasoning_token", None
+        )
+
+        self.tiers = self._compile_tiers(model_info)
+
+    @staticmethod
+    def _compile_tiers(
+        model_info: ModelInfo,
+    ) -> List[_PricingTier]:
+        """
+        One tier per `input_cost_per_token_above_[x]_tokens` key, in the order `_get_token_base_cost` checks them.
+
+        A `None` rate means "keep the base rate".
+        """
+        tiers: List[_PricingTier] = []
+        for key, value in sorted(model_info.items(), reverse=True):
+            if not key.startswith("input_cost_per_token_above_") or value is None:
+                continue
+            try:
+                threshold_str = key.split("_above_")[1].split("_tokens")[0]
+                threshold = float(threshold_str.replace("k", "")) * (
+                    1000 if "k" in threshold_str else 1
+                )
+                cache_creation_tiered_key = (
+                    f"cache_creation_input_token_cost_above_{threshold_str}_tokens"
+                )
+                cache_creation_1hr_tiered_key = f"cache_creation_input_token_cost_above_1hr_above_{threshold_str}_tokens"
+                cache_read_tiered_key = (
+                    f"cache_read_input_token_cost_above_{threshold_str}_tokens"
+                )
+                tiers.append(
+                    (
+                        threshold,
+                        _get_cost_per_unit(model_info, key, None),
+                        _get_cost_per_unit(
+                            model_info,
+                            f"output_cost_per_token_above_{threshold_str}_tokens",
+                            None,
+                        ),
+                        (
+                            _get_cost_per_unit(
+                                model_info, cache_creation_tiered_key, None
+                            )
+                            if cache_creation_tiered_key in model_info
+                            else None
+                        ),
+                        (
+                            _get_cost_per_unit(
+                                model_info, cache_creation_1hr_tiered_key, None
+                            )
+                            if cache_creation_1hr_tiered_key in model_info
+                            else None
+                        ),
+                        (
+                            _get_cost_per_unit(model_info, cache_read_tiered_key, None)
+                            if cache_read_tiered_key in model_info
+                            else None
+                        ),
+                    )
+                )
+            except (IndexError, ValueError):
+                continue
+        return tiers
+
+    def matches(self, model_info: ModelInfo) -> bool:
+        """True if `model_info` has the same pricing this record was compiled from."""
+        if model_info is self.model_info:
+            return True
+        if _get_pricing_fingerprint(model_info) != self.pricing_fingerprint:
+            return False
+        # same prices, new dict (e.g. get_model_info cache was cleared) - skip the next comparison
+        self.model_info = model_info
+        return True
+
+    def cost_per_token(self, usage: Usage) -> Tuple[float, float]:
+        """
+        Returns:
+            Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
+        """
+        prompt_tokens_details = _get_prompt_tokens_details_for_cost(usage)
+
+        prompt_base_cost = self.input_cost_per_token
+        completion_base_cost = self.output_cost_per_token
+        cache_creation_cost = self.cache_creation_input_token_cost
+        cache_creation_cost_above_1hr = self.cache_creation_input_token_cost_above_1hr
+        cache_read_cost = self.cache_read_input_token_cost
+
+        ## CHECK IF ABOVE THRESHOLD
+        prompt_tokens = usage.prompt_tokens
+        for (
+            threshold,
+            tier_input,
+            tier_output,
+            tier_cache_creation,
+            tier_cache_creation_above_1hr,
+            tier_cache_read,
+        ) in self.tiers:
+            if prompt_tokens > threshold:
+                if tier_input is not None:
+                    prompt_base_cost = tier_input
+                if tier_output is not None:
+                    completion_base_cost = tier_output
+                if tier_cache_creation is not None:
+                    cache_creation_cost = tier_cache_creation
+                if tier_cache_creation_above_1hr is not None:
+                    cache_creation_cost_above_1hr = tier_cache_creation_above_1hr
+                if tier_cache_read is not None:
+                    cache_read_cost = tier_cache_read
+                break
+
+        ## CALCULATE INPUT COST
+        prompt_cost = float(prompt_tokens_details["text_tokens"]) * prompt_base_cost
+        prompt_cost += float(prompt_tokens_details["cache_hit_tokens"]) * cache_read_cost
+        if prompt_tokens_details["audio_tokens"] > 0:
+            prompt_cost += (
+                float(prompt_tokens_details["audio_tokens"])
+                * self.input_cost_per_audio_token
+            )
+        if prompt_tokens_details["image_tokens"] > 0:
+            prompt_cost += (
+                float(prompt_tokens_details["image_tokens"])
+                * self.input_cost_per_image_token
+            )
+        prompt_cost += calculate_cache_writing_cost(
+            cache_creation_tokens=prompt_tokens_details["cache_creation_tokens"],
+            cache_creation_token_details=prompt_tokens_details[
+                "cache_creation_token_details"
+            ],
+            cache_creation_cost_above_1hr=cache_creation_cost_above_1hr,
+            cache_creation_cost=cache_creation_cost,
+        )
+        if prompt_tokens_details["character_count"] > 0:
+            prompt_cost += (
+                float(prompt_tokens_details["character_count"])
+                * self.input_cost_per_character
+            )
+        if prompt_tokens_details["image_count"] > 0:
+            prompt_cost += (
+                float(prompt_tokens_details["image_count"]) * self.input_cost_per_image
+            )
+        if prompt_tokens_details["video_length_seconds"] > 0:
+            prompt_cost += (
+                prompt_tokens_details["video_length_seconds"]
+                * self.input_cost_per_video_per_second
+            )
+
+        ## CALCULATE OUTPUT COST
+        (
+            text_tokens,
+            audio_tokens,
+            reasoning_tokens,
+            image_tokens,
+            is_text_tokens_total,
+        ) = _get_completion_tokens_breakdown_for_cost(usage)
+        completion_cost = float(text_tokens) * completion_base_cost
+        if not is_text_tokens_total:
+            if audio_tokens > 0:
+                completion_cost += float(audio_tokens) * (
+                    self.output_cost_per_audio_token
+                    if self.output_cost_per_audio_token is not None
+                    else completion_base_cost
+                )
+            if reasoning_tokens > 0:
+                completion_cost += float(reasoning_tokens) * (
+                    self.output_cost_per_reasoning_token
+                    if self.output_cost_per_reasoning_token is not None
+                    else completion_base_cost
+                )
+            if image_tokens > 0:
+                completion_cost += float(image_tokens) * (
+                    self.output_cost_per_image_token
+                    if self.output_cost_per_image_token is not None
+                    else completion_base_cost
+                )
+
+        return prompt_cost, completion_cost
+
+
+# (model, custom_llm_provider, service tier) -> compiled pricing
+# `model` is whatever the cost calculator looks up - a deployment id for custom pricing, else the model name
+_compiled_model_pricing: Dict[
+    Tuple[str, Optional[str], Optional[str]], CompiledModelPricing
+] = {}
+
+
+def _normalize_service_tier(service_tier: Optional[str]) -> Optional[str]:
+    if service_tier is None:
+        return None
+    service_tier = service_tier.lower()
+    if service_tier in (ServiceTier.FLEX.value, ServiceTier.PRIORITY.value):
+        return service_tier
+    return None
+
+
+def get_compiled_model_pricing(
+    model: str,
+    custom_llm_provider: Optional[str],
+    model_info: ModelInfo,
+    service_tier: Optional[str] = None,
+) -> CompiledModelPricing:
+    """
+    Return the compiled pricing for `model`, (re)compiling it if `model_info`'s prices changed
+    since it was built - e.g. after the cost map was reloaded or the model was re-registered.
+    """
+    service_tier = _normalize_service_tier(service_tier)
+    cache_key = (model, custom_llm_provider, service_tier)
+    compiled = _compiled_model_pricing.get(cache_key)
+    if compiled is not None and compiled.matches(model_info):
+        return compiled
+    compiled = CompiledModelPricing(model_info=model_info, service_tier=service_tier)
+    if len(_compiled_model_pricing) >= COMPILED_MODEL_PRICING_CACHE_SIZE:
+        _compiled_model_pricing.clear()
+    _compiled_model_pricing[cache_key] = compiled
+    return compiled
+
+
+def warm_compiled_model_pricing(
+    model: str, custom_llm_provider: Optional[str] = None
+) -> Optional[CompiledModelPricing]:
+    """
+    Compile pricing ahead of the first call (e.g. when the router adds a deployment).
+
+    Returns None if the model has no pricing in the cost map.
+    """
+    try:
+        model_info = get_model_info(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+        return get_compiled_model_pricing(
+            model=model,
+            custom_llm_provider=custom_llm_provider,
+            model_info=model_info,
+        )
+    except Exception as e:
+        verbose_logger.debug(
+            "Unable to compile pricing for model=%s, custom_llm_provider=%s: %s",
+            model,
+            custom_llm_provider,
+            str(e),
+        )
+        return None
+
+
+def generic_cost_per_token(
+    model: str,
+    usage: Usage,
+    custom_llm_provider: str,
+    service_tier: Optional[str] = None,
+) -> Tuple[float, float]:
+    """
+    Calculates the cost per token for a given model, prompt tokens, and completion tokens.
+
+    Handles context caching as well.
+
+    Input:
+        - model: str, the model name without provider prefix
+        - usage: LiteLLM Usage block, containing anthropic caching information
+
+    Returns:
+        Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd
+    """
+
+    ## GET MODEL INFO
+    model_info = get_model_info(model=model, custom_llm_provider=custom_llm_provider)
+
+    try:
+        compiled_pricing = get_compiled_model_pricing(
+            model=model,
+            custom_llm_provider=custom_llm_provider,
+            model_info=model_info,
+            service_tier=service_tier,
+        )
+    except Exception as e:
+        verbose_logger.debug(
+            "Unable to compile pricing for model=%s, falling back to uncompiled pricing: %s",
+            model,
+            str(e),
+        )
+        return _generic_cost_per_token_from_model_info(
+            model_info=model_info, usage=usage, service_tier=service_tier
+        )
+
+    return compiled_pricing.cost_per_token(usage)
+
+
 class CostCalculatorUtils:
     @staticmethod
     def _call_type_has_image_response(call_type: str) -> bool:
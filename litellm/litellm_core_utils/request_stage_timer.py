@@ -0,0 +1,107 @@
+"""
+Per-request stage timings (auth, pre-call hooks, routing, upstream TTFB, ...).
+
+The proxy attaches a `RequestStageTimer` to the current request context via a
+ContextVar, so SDK code on the request path (router, logging) can record stages
+without any plumbing. When no timer is set (plain SDK usage), recording is a no-op.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+# Header names are `x-litellm-timing-<stage>-ms`
+REQUEST_STAGE_HEADER_PREFIX = "x-litellm-timing-"
+
+
+class RequestStage:
+    AUTH = "auth"
+    PRE_CALL_HOOKS = "pre_call_hooks"
+    ROUTING = "routing"
+    LLM_API_CALL = "llm_api_call"
+    UPSTREAM_TTFB = "upstream_ttfb"
+    STREAMING = "streaming"
+    POST_CALL_HOOKS = "post_call_hooks"
+    LOGGING_ENQUEUE = "logging_enqueue"
+
+
+class RequestStageTimer:
+    """
+    Accumulates wall-clock seconds per stage. Re-entering a stage adds to it.
+    """
+
+    __slots__ = ("durations", "_started_at")
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self._started_at: Dict[str, float] = {}
+
+    def start(self, stage: str) -> None:
+        self._started_at[stage] = time.perf_counter()
+
+    def end(self, stage: str) -> Optional[float]:
+        started_at = self._started_at.pop(stage, None)
+        if started_at is None:
+            return None
+        duration = time.perf_counter() - started_at
+        self.record(stage, duration)
+        return duration
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started_at)
+
+    def get_response_headers(self) -> Dict[str, str]:
+        return {
+            "{}{}-ms".format(REQUEST_STAGE_HEADER_PREFIX, stage.replace("_", "-")): (
+                "{:.3f}".format(seconds * 1000)
+            )
+            for stage, seconds in self.durations.items()
+        }
+
+
+_request_stage_timer: ContextVar[Optional[RequestStageTimer]] = ContextVar(
+    "litellm_request_stage_timer", default=None
+)
+
+
+def get_request_stage_timer() -> Optional[RequestStageTimer]:
+    return _request_stage_timer.get()
+
+
+def set_request_stage_timer(timer: Optional[RequestStageTimer]) -> None:
+    _request_stage_timer.set(timer)
+
+
+def get_or_create_request_stage_timer() -> RequestStageTimer:
+    timer = _request_stage_timer.get()
+    if timer is None:
+        timer = RequestStageTimer()
+        _request_stage_timer.set(timer)
+    return timer
+
+
+def record_request_stage(stage: str, seconds: float) -> None:
+    """Record a stage on the current request, if one is being timed."""
+    timer = _request_stage_timer.get()
+    if timer is not None:
+        timer.record(stage, seconds)
+
+
+@contextmanager
+def time_request_stage(stage: str) -> Iterator[None]:
+    """Time the block as `stage` of the current request, if one is being timed."""
+    timer = _request_stage_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(stage):
+        yield
@@ -29,6 +29,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     StreamingChoices,
+    TextCompletionResponse,
     Usage,
 )
 
@@ -1704,6 +1705,31 @@ class CustomStreamWrapper:
         ## SYNC LOGGING
         self.logging_obj.success_handler(processed_chunk, None, None, cache_hit)
 
+    def _build_complete_streaming_response(
+        self, cache_hit: Optional[bool]
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        Builds the response passed to logging / caching once the stream ends.
+
+        If nothing reads the response content, the call is priced and logged from the
+        provider-reported usage, and assembling the full response is deferred to
+        `Logging.get_assembled_streaming_response()`.
+        """
+        if self.logging_obj.should_assemble_streaming_response(cache_hit=cache_hit) is False:
+            usage_response = litellm.stream_chunk_usage_builder(
+                chunks=self.chunks,
+                messages=self.messages,
+                logging_obj=self.logging_obj,
+            )
+            if usage_response is not None:
+                self.logging_obj.defer_streaming_response_assembly(chunks=self.chunks)
+                return usage_response
+        return litellm.stream_chunk_builder(
+            chunks=self.chunks,
+            messages=self.messages,
+            logging_obj=self.logging_obj,
+        )
+
     def finish_reason_handler(self):
         model_response = self.model_response_creator()
         _finish_reason = self.received_finish_reason or self.intermittent_finish_reason
@@ -1809,10 +1835,8 @@ class CustomStreamWrapper:
 
         except StopIteration:
             if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
+                complete_streaming_response = self._build_complete_streaming_response(
+                    cache_hit=cache_hit
                 )
 
                 response = self.model_response_creator()
@@ -2022,10 +2046,8 @@ class CustomStreamWrapper:
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
+                complete_streaming_response = self._build_complete_streaming_response(
+                    cache_hit=cache_hit
                 )
 
                 response = self.model_response_creator()
@@ -8,6 +8,7 @@ import httpx
 import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid
+from litellm.litellm_core_utils.jsonl_utils import iter_jsonl_objects
 from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
 )
@@ -200,13 +201,8 @@ class AnthropicFilesHandler:
             anthropic_config = AnthropicConfig()
             transformed_lines = []
             
-            # Parse JSONL content
-            content_str = anthropic_content.decode("utf-8")
-            for line in content_str.strip().split("\n"):
-                if not line.strip():
-                    continue
-                
-                anthropic_result = json.loads(line)
+            # Parse JSONL content one line at a time
+            for anthropic_result in iter_jsonl_objects(anthropic_content):
                 custom_id = anthropic_result.get("custom_id", "")
                 result = anthropic_result.get("result", {})
                 result_type = result.get("type", "")
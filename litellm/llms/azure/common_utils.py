@@ -608,7 +608,9 @@ class BaseAzureLLM(BaseOpenAILLM):
         }
         # init http client + SSL Verification settings
         if is_async is True:
-            azure_client_params["http_client"] = self._get_async_http_client()
+            azure_client_params["http_client"] = self._get_async_http_client(
+                llm_provider=litellm.LlmProviders.AZURE.value
+            )
         else:
             azure_client_params["http_client"] = self._get_sync_http_client()
 
@@ -0,0 +1,271 @@
+"""
+Refresh-ahead for expiring AWS credentials (STS AssumeRole / AssumeRoleWithWebIdentity),
+plus a SigV4 signing key cache.
+
+Without this, `BaseAWSLLM.get_credentials` calls STS synchronously on the request path
+whenever its cached credentials expire - blocking the event loop for an STS round-trip,
+with every concurrent request refreshing at once.
+
+`AWSCredentialRefresher`:
+- singleflight: concurrent cache misses for the same credential key make a single STS call
+- refresh-ahead: once cached credentials are within `AWS_CREDENTIAL_REFRESH_WINDOW_SECONDS` of
+  expiring, they are refreshed on a background thread while callers keep using the still-valid ones
+- records refresh latency / failures (`litellm_aws_credential_refresh_*` prometheus metrics)
+"""
+
+import hashlib
+import hmac
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.caching.dual_cache import DualCache, LimitedSizeOrderedDict
+from litellm.constants import (
+    AWS_CREDENTIAL_REFRESH_RETRY_SECONDS,
+    AWS_CREDENTIAL_REFRESH_WINDOW_SECONDS,
+    AWS_SIGV4_SIGNING_KEY_CACHE_SIZE,
+)
+from litellm.litellm_core_utils.thread_pool_executor import executor
+
+if TYPE_CHECKING:
+    from botocore.auth import SigV4Auth
+    from botocore.credentials import Credentials
+else:
+    Credentials = Any
+    SigV4Auth = Any
+
+CredentialsFetcher = Callable[[], Tuple[Credentials, Optional[float]]]
+RefreshType = Literal["blocking", "background"]
+
+
+class _RefreshableCredentialsEntry:
+    __slots__ = (
+        "iam_cache",
+        "fetch",
+        "expires_at",
+        "is_refreshing",
+        "next_refresh_attempt_at",
+    )
+
+    def __init__(
+        self, iam_cache: DualCache, fetch: CredentialsFetcher, expires_at: float
+    ):
+        self.iam_cache = iam_cache
+        self.fetch = fetch
+        self.expires_at = expires_at
+        self.is_refreshing = False
+        self.next_refresh_attempt_at = 0.0
+
+
+class AWSCredentialRefresher:
+    """
+    Fetches credentials into a `BaseAWSLLM.iam_cache` and keeps expiring ones fresh.
+
+    The cache stays the source of truth - this only decides who fetches, and when.
+    """
+
+    def __init__(
+        self,
+        refresh_window_seconds: float = AWS_CREDENTIAL_REFRESH_WINDOW_SECONDS,
+        retry_seconds: float = AWS_CREDENTIAL_REFRESH_RETRY_SECONDS,
+    ):
+        self.refresh_window_seconds = refresh_window_seconds
+        self.retry_seconds = retry_seconds
+        self._entries: Dict[str, _RefreshableCredentialsEntry] = {}
+        # a key's lock lives only while a caller holds it
+        self._key_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _get_key_lock(self, cache_key: str) -> threading.Lock:
+        with self._lock:
+            key_lock = self._key_locks.get(cache_key)
+            if key_lock is None:
+                key_lock = threading.Lock()
+                self._key_locks[cache_key] = key_lock
+            return key_lock
+
+    def fetch_credentials(
+        self, iam_cache: DualCache, cache_key: str, fetch: CredentialsFetcher
+    ) -> Credentials:
+        """
+        Call `fetch` and cache its result - once across concurrent callers missing the same key.
+
+        `fetch` returns `(credentials, ttl)`. Credentials with a ttl are refreshed ahead of expiry
+        by `refresh_if_expiring`.
+        """
+        with self._get_key_lock(cache_key):
+            # another caller may have fetched while we waited for the lock
+            cached_credentials = iam_cache.get_cache(cache_key)
+            if cached_credentials:
+                return cached_credentials
+
+            credentials, ttl = self._timed_fetch(fetch, refresh_type="blocking")
+            iam_cache.set_cache(cache_key, credentials, ttl=ttl)
+            if ttl is not None:
+                self._entries[cache_key] = _RefreshableCredentialsEntry(
+                    iam_cache=iam_cache,
+                    fetch=fetch,
+                    expires_at=time.monotonic() + ttl,
+                )
+            else:
+                self._entries.pop(cache_key, None)
+            return credentials
+
+    def refresh_if_expiring(self, cache_key: str) -> None:
+        """
+        Start a background refresh if the credentials for `cache_key` expire within the refresh window.
+
+        Cheap enough to call on every cache hit.
+        """
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return
+        now = time.monotonic()
+        if (
+            entry.is_refreshing
+            or entry.expires_at - now > self.refresh_window_seconds
+            or now < entry.next_refresh_attempt_at
+        ):
+            return
+        with self._lock:
+            if entry.is_refreshing:
+                return
+            entry.is_refreshing = True
+        try:
+            executor.submit(self._refresh_in_background, cache_key, entry)
+        except Exception as e:
+            entry.is_refreshing = False
+            verbose_logger.debug(
+                "AWSCredentialRefresher: could not schedule refresh: %s", str(e)
+            )
+
+    def _refresh_in_background(
+        self, cache_key: str, entry: _RefreshableCredentialsEntry
+    ) -> None:
+        try:
+            credentials, ttl = self._timed_fetch(entry.fetch, refresh_type="background")
+            entry.iam_cache.set_cache(cache_key, credentials, ttl=ttl)
+            if ttl is None:
+                # flow no longer reports an expiry - stop refreshing ahead
+                self._entries.pop(cache_key, None)
+                return
+            entry.expires_at = time.monotonic() + ttl
+        except Exception as e:
+            # the cached credentials are still valid - retry on a later cache hit
+            entry.next_refresh_attempt_at = time.monotonic() + self.retry_seconds
+            verbose_logger.warning(
+                "AWSCredentialRefresher: background credential refresh failed, retrying in %ss: %s",
+                self.retry_seconds,
+                str(e),
+            )
+        finally:
+            entry.is_refreshing = False
+
+    def _timed_fetch(
+        self, fetch: CredentialsFetcher, refresh_type: RefreshType
+    ) -> Tuple[Credentials, Optional[float]]:
+        start_time = time.perf_counter()
+        try:
+            credentials, ttl = fetch()
+        except Exception:
+            _record_credential_refresh(
+                latency_seconds=time.perf_counter() - start_time,
+                refresh_type=refresh_type,
+                success=False,
+            )
+            raise
+        _record_credential_refresh(
+            latency_seconds=time.perf_counter() - start_time,
+            refresh_type=refresh_type,
+            success=True,
+        )
+        return credentials, ttl
+
+
+def _record_credential_refresh(
+    latency_seconds: float, refresh_type: RefreshType, success: bool
+) -> None:
+    try:
+        from litellm.integrations.prometheus import PrometheusLogger
+
+        for callback in litellm.callbacks:
+            if isinstance(callback, PrometheusLogger):
+                callback._record_aws_credential_refresh(
+                    latency_seconds=latency_seconds,
+                    refresh_type=refresh_type,
+                    success=success,
+                )
+                break
+    except Exception as e:
+        verbose_logger.debug(
+            "AWSCredentialRefresher: failed to record refresh metrics: %s", str(e)
+        )
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+_sigv4_signing_keys: Dict[Tuple[bytes, str, str, str], bytes] = LimitedSizeOrderedDict(
+    max_size=AWS_SIGV4_SIGNING_KEY_CACHE_SIZE
+)
+_sigv4_signing_keys_lock = threading.Lock()
+
+
+def get_sigv4_signing_key(
+    secret_key: str, datestamp: str, region_name: str, service_name: str
+) -> bytes:
+    """
+    SigV4 signing key - the same for every request signed with these credentials on the same day,
+    region and service, so only the final HMAC over the string-to-sign is per request.
+
+    Cached by a hash of the secret key, so the plaintext secret is not kept as a cache key.
+    """
+    cache_key = (
+        hashlib.sha256(secret_key.encode("utf-8")).digest(),
+        datestamp,
+        region_name,
+        service_name,
+    )
+    signing_key = _sigv4_signing_keys.get(cache_key)
+    if signing_key is not None:
+        return signing_key
+
+    k_date = _hmac_sha256(("AWS4" + secret_key).encode("utf-8"), datestamp)
+    k_region = _hmac_sha256(k_date, region_name)
+    k_service = _hmac_sha256(k_region, service_name)
+    signing_key = _hmac_sha256(k_service, "aws4_request")
+    with _sigv4_signing_keys_lock:
+        _sigv4_signing_keys[cache_key] = signing_key
+    return signing_key
+
+
+_cached_signing_key_sigv4_auth_class: Optional[type] = None
+
+
+def get_sigv4_auth(
+    credentials: Credentials, service_name: str, region_name: str
+) -> SigV4Auth:
+    """botocore `SigV4Auth` that reuses signing keys via `get_sigv4_signing_key`."""
+    global _cached_signing_key_sigv4_auth_class
+    if _cached_signing_key_sigv4_auth_class is None:
+        from botocore.auth import SigV4Auth
+
+        class CachedSigningKeySigV4Auth(SigV4Auth):
+            def signature(self, string_to_sign, request):
+                signing_key = get_sigv4_signing_key(
+                    self.credentials.secret_key,
+                    request.context["timestamp"][0:8],
+                    self._region_name,
+                    self._service_name,
+                )
+                return self._sign(signing_key, string_to_sign, hex=True)
+
+        _cached_signing_key_sigv4_auth_class = CachedSigningKeySigV4Auth
+
+    return _cached_signing_key_sigv4_auth_class(credentials, service_name, region_name)
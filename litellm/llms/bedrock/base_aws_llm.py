@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import json
 import os
@@ -27,6 +28,10 @@ from litellm.constants import (
     BEDROCK_MAX_POLICY_SIZE,
 )
 from litellm.litellm_core_utils.dd_tracing import tracer
+from litellm.llms.bedrock.aws_credential_refresher import (
+    AWSCredentialRefresher,
+    get_sigv4_auth,
+)
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 if TYPE_CHECKING:
@@ -59,6 +64,7 @@ class AwsAuthError(Exception):
 class BaseAWSLLM:
     def __init__(self) -> None:
         self.iam_cache = DualCache()
+        self._credential_refresher = AWSCredentialRefresher()
         super().__init__()
         self.aws_authentication_params = [
             "aws_access_key_id",
@@ -188,8 +194,49 @@ class BaseAWSLLM:
         cache_key = self.get_cache_key(args)
         _cached_credentials = self.iam_cache.get_cache(cache_key)
         if _cached_credentials:
+            # refresh STS credentials in the background before they expire
+            self._credential_refresher.refresh_if_expiring(cache_key)
             return _cached_credentials
 
+        return self._credential_refresher.fetch_credentials(
+            iam_cache=self.iam_cache,
+            cache_key=cache_key,
+            fetch=functools.partial(
+                self._get_credentials_for_auth_flow,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                aws_session_token=aws_session_token,
+                aws_region_name=aws_region_name,
+                aws_session_name=aws_session_name,
+                aws_profile_name=aws_profile_name,
+                aws_role_name=aws_role_name,
+                aws_web_identity_token=aws_web_identity_token,
+                aws_sts_endpoint=aws_sts_endpoint,
+                aws_external_id=aws_external_id,
+                ssl_verify=ssl_verify,
+            ),
+        )
+
+    def _get_credentials_for_auth_flow(
+        self,
+        aws_access_key_id: Optional[str],
+        aws_secret_access_key: Optional[str],
+        aws_session_token: Optional[str],
+        aws_region_name: Optional[str],
+        aws_session_name: Optional[str],
+        aws_profile_name: Optional[str],
+        aws_role_name: Optional[str],
+        aws_web_identity_token: Optional[str],
+        aws_sts_endpoint: Optional[str],
+        aws_external_id: Optional[str],
+        ssl_verify: Optional[Union[bool, str]],
+    ) -> Tuple[Credentials, Optional[int]]:
+        """
+        Fetch credentials for the resolved auth params, bypassing `iam_cache`.
+
+        Called by `get_credentials` on a cache miss, and again by the credential refresher
+        when cached credentials are about to expire.
+        """
         #########################################################
         # Handle diff boto3 auth flows
         # for each helper
@@ -263,8 +310,7 @@ class BaseAWSLLM:
         else:
             credentials, _cache_ttl = self._auth_with_env_vars()
 
-        self.iam_cache.set_cache(cache_key, credentials, ttl=_cache_ttl)
-        return credentials
+        return credentials, _cache_ttl
 
     def _get_aws_region_from_model_arn(self, model: Optional[str]) -> Optional[str]:
         try:
@@ -1217,7 +1263,6 @@ class BaseAWSLLM:
             )
         else:
             try:
-                from botocore.auth import SigV4Auth
                 from botocore.awsrequest import AWSRequest
             except ImportError:
                 raise ImportError(
@@ -1227,7 +1272,7 @@ class BaseAWSLLM:
             # Filter headers for AWS signature calculation
             # AWS SigV4 only includes specific headers in signature calculation
             aws_signature_headers = self._filter_headers_for_aws_signature(headers)
-            sigv4 = SigV4Auth(credentials, "bedrock", aws_region_name)
+            sigv4 = get_sigv4_auth(credentials, "bedrock", aws_region_name)
             request = AWSRequest(
                 method="POST",
                 url=endpoint_url,
@@ -1310,7 +1355,6 @@ class BaseAWSLLM:
 
         # If no bearer token is set, proceed with the existing SigV4 authentication
         try:
-            from botocore.auth import SigV4Auth
             from botocore.awsrequest import AWSRequest
             from botocore.credentials import Credentials
         except ImportError:
@@ -1344,7 +1388,7 @@ class BaseAWSLLM:
             aws_external_id=aws_external_id,
         )
 
-        sigv4 = SigV4Auth(credentials, service_name, aws_region_name)
+        sigv4 = get_sigv4_auth(credentials, service_name, aws_region_name)
         if headers is not None:
             headers = {"Content-Type": "application/json", **headers}
         else:
@@ -66,7 +66,15 @@ from litellm.types.utils import (
 from litellm.utils import CustomStreamWrapper, get_secret
 
 from ..base_aws_llm import BaseAWSLLM
-from ..common_utils import BedrockError, ModelResponseIterator, get_bedrock_tool_name
+from ..common_utils import (
+    BedrockError,
+    ModelResponseIterator,
+    get_bedrock_tool_name,
+    get_event_stream_buffer,
+    parse_native_event_stream_message,
+    raise_event_stream_error,
+)
+from ..event_stream import EventStreamMessage
 
 _response_stream_shape_cache = None
 bedrock_tool_name_mappings: InMemoryCache = InMemoryCache(
@@ -1655,9 +1663,7 @@ class AWSEventStreamDecoder:
         self, iterator: Iterator[bytes]
     ) -> Iterator[Union[GChunk, ModelResponseStream, dict]]:
         """Given an iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_buffer = get_event_stream_buffer()
         for chunk in iterator:
             event_stream_buffer.add_data(chunk)
             for event in event_stream_buffer:
@@ -1671,9 +1677,7 @@ class AWSEventStreamDecoder:
         self, iterator: AsyncIterator[bytes]
     ) -> AsyncIterator[Union[GChunk, ModelResponseStream, dict]]:
         """Given an async iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_buffer = get_event_stream_buffer()
         async for chunk in iterator:
             event_stream_buffer.add_data(chunk)
             for event in event_stream_buffer:
@@ -1683,26 +1687,18 @@ class AWSEventStreamDecoder:
                     yield self._chunk_parser(chunk_data=_data)
 
     def _parse_message_from_event(self, event) -> Optional[str]:
+        if isinstance(event, EventStreamMessage):
+            return parse_native_event_stream_message(event)
+
+        # botocore fallback - BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER=true
         response_dict = event.to_response_dict()
         parsed_response = self.parser.parse(response_dict, get_response_stream_shape())
 
         if response_dict["status_code"] != 200:
-            decoded_body = response_dict["body"].decode()
-            if isinstance(decoded_body, dict):
-                error_message = decoded_body.get("message")
-            elif isinstance(decoded_body, str):
-                error_message = decoded_body
-            else:
-                error_message = ""
-            exception_status = response_dict["headers"].get(":exception-type")
-            error_message = exception_status + " " + error_message
-            raise BedrockError(
+            raise_event_stream_error(
                 status_code=response_dict["status_code"],
-                message=(
-                    json.dumps(error_message)
-                    if isinstance(error_message, dict)
-                    else error_message
-                ),
+                headers=response_dict["headers"],
+                body=response_dict["body"],
             )
         if "chunk" in parsed_response:
             chunk = parsed_response.get("chunk")
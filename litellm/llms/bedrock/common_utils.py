@@ -4,9 +4,10 @@ from __future__ import annotations
 Common utilities used across bedrock chat/embedding/image generation
 """
 
+import base64
 import json
 import os
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Union
 
 if TYPE_CHECKING:
     from litellm.types.llms.bedrock import BedrockCreateBatchRequest
@@ -14,11 +15,13 @@ if TYPE_CHECKING:
 import httpx
 
 import litellm
+from litellm.constants import BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER
 from litellm.llms.base_llm.anthropic_messages.transformation import (
     BaseAnthropicMessagesConfig,
 )
 from litellm.llms.base_llm.base_utils import BaseLLMModelInfo, BaseTokenCounter
 from litellm.llms.base_llm.chat.transformation import BaseLLMException
+from litellm.llms.bedrock.event_stream import EventStreamDecoder, EventStreamMessage
 from litellm.secret_managers.main import get_secret
 
 if TYPE_CHECKING:
@@ -752,6 +755,61 @@ def get_bedrock_chat_config(model: str):
         return litellm.AmazonInvokeConfig()
 
 
+def get_event_stream_buffer() -> Any:
+    """
+    Buffer that turns raw response bytes into event stream messages.
+
+    Uses the native decoder, unless `BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER` is set.
+    """
+    if BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER:
+        from botocore.eventstream import EventStreamBuffer
+
+        return EventStreamBuffer()
+    return EventStreamDecoder()
+
+
+def raise_event_stream_error(
+    status_code: int, headers: Mapping[str, Any], body: bytes
+) -> None:
+    """
+    Raise a BedrockError for an `exception` or `error` event stream message.
+
+    Modeled exceptions (e.g. `throttlingException`) carry the type in `:exception-type` and a JSON body,
+    unmodeled errors carry `:error-code` / `:error-message` headers.
+    """
+    error_type = headers.get(":exception-type") or headers.get(":error-code") or ""
+    error_message = body.decode() if body else headers.get(":error-message") or ""
+    raise BedrockError(
+        status_code=status_code,
+        message="{} {}".format(error_type, error_message),
+    )
+
+
+def parse_native_event_stream_message(message: EventStreamMessage) -> Optional[str]:
+    """
+    Return the JSON string carried by a Bedrock event stream message.
+
+    Same result as running the message through botocore's `EventStreamJSONParser` with the
+    bedrock-runtime `ResponseStream` shape, without building a response dict:
+    - `chunk` events (InvokeModelWithResponseStream): base64 decoded `bytes` field of the payload
+    - any other event (e.g. ConverseStream's `contentBlockDelta`): the payload itself
+    """
+    message_type = message.message_type
+    if message_type == "exception" or message_type == "error":
+        raise_event_stream_error(
+            status_code=400, headers=message.headers, body=message.payload.tobytes()
+        )
+    payload = message.payload
+    if not payload:
+        return None
+    if message.event_type == "chunk":
+        chunk_bytes = json.loads(str(payload, "utf-8")).get("bytes")
+        if not chunk_bytes:
+            return None
+        return base64.b64decode(chunk_bytes).decode()
+    return str(payload, "utf-8")
+
+
 class BedrockEventStreamDecoderBase:
     """
     Base class for event stream decoding for Bedrock
@@ -781,28 +839,19 @@ class BedrockEventStreamDecoderBase:
         return self._response_stream_shape_cache
 
     def _parse_message_from_event(self, event) -> Optional[str]:
+        if isinstance(event, EventStreamMessage):
+            return parse_native_event_stream_message(event)
+
         response_dict = event.to_response_dict()
         parsed_response = self.parser.parse(
             response_dict, self.get_response_stream_shape()
         )
 
         if response_dict["status_code"] != 200:
-            decoded_body = response_dict["body"].decode()
-            if isinstance(decoded_body, dict):
-                error_message = decoded_body.get("message")
-            elif isinstance(decoded_body, str):
-                error_message = decoded_body
-            else:
-                error_message = ""
-            exception_status = response_dict["headers"].get(":exception-type")
-            error_message = exception_status + " " + error_message
-            raise BedrockError(
+            raise_event_stream_error(
                 status_code=response_dict["status_code"],
-                message=(
-                    json.dumps(error_message)
-                    if isinstance(error_message, dict)
-                    else error_message
-                ),
+                headers=response_dict["headers"],
+                body=response_dict["body"],
             )
         if "chunk" in parsed_response:
             chunk = parsed_response.get("chunk")
@@ -0,0 +1,268 @@
+"""
+Decoder for the AWS event stream binary format (`application/vnd.amazon.eventstream`).
+
+Bedrock streams (InvokeModelWithResponseStream, ConverseStream) are framed as:
+
+    [total length: u32][headers length: u32][prelude crc: u32][headers][payload][message crc: u32]
+
+botocore's `EventStreamBuffer` re-slices (copies) its buffer for every message and the
+payload then goes through the generic `EventStreamJSONParser`. This decoder parses
+frames in place from memoryview slices of the received chunks - only a partial
+trailing frame is ever copied - and leaves payload interpretation to the caller.
+
+Ref: https://docs.aws.amazon.com/transcribe/latest/dg/streaming-setting-up.html#streaming-event-stream
+"""
+
+import struct
+import uuid
+import zlib
+from typing import Any, Dict, Iterator, Optional, Union
+
+# byte length of the prelude (total_length + headers_length + prelude_crc)
+_PRELUDE_LENGTH = 12
+_MESSAGE_CRC_LENGTH = 4
+# same limits as botocore
+_MAX_HEADERS_LENGTH = 128 * 1024
+_MAX_PAYLOAD_LENGTH = 24 * 1024 * 1024
+_MAX_CACHED_HEADER_BLOCKS = 32
+
+_PRELUDE = struct.Struct(">III")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+
+# header value type -> fixed size struct (variable length types are handled separately)
+_HEADER_BOOL_TRUE = 0
+_HEADER_BOOL_FALSE = 1
+_HEADER_BYTE_ARRAY = 6
+_HEADER_STRING = 7
+_HEADER_UUID = 9
+_FIXED_SIZE_HEADER_TYPES: Dict[int, struct.Struct] = {
+    2: struct.Struct(">b"),
+    3: struct.Struct(">h"),
+    4: struct.Struct(">i"),
+    5: struct.Struct(">q"),
+    8: struct.Struct(">q"),  # timestamp, epoch millis
+}
+
+EventStreamHeaderValue = Union[bool, int, str, bytes]
+
+
+class EventStreamParseError(Exception):
+    """The bytes received are not a valid event stream."""
+
+
+class EventStreamMessage:
+    """
+    A single decoded frame. `payload` is a memoryview into the received data.
+    """
+
+    __slots__ = ("headers", "payload")
+
+    def __init__(self, headers: Dict[str, EventStreamHeaderValue], payload: memoryview):
+        self.headers = headers
+        self.payload = payload
+
+    @property
+    def message_type(self) -> Optional[str]:
+        return self.headers.get(":message-type")  # type: ignore[return-value]
+
+    @property
+    def event_type(self) -> Optional[str]:
+        return self.headers.get(":event-type")  # type: ignore[return-value]
+
+    def to_response_dict(self, status_code: int = 200) -> Dict[str, Any]:
+        """Same shape as botocore's `EventStreamMessage.to_response_dict()`."""
+        if self.message_type in ("error", "exception"):
+            status_code = 400
+        return {
+            "status_code": status_code,
+            "headers": self.headers,
+            "body": self.payload.tobytes(),
+        }
+
+
+def _parse_headers(data: memoryview) -> Dict[str, EventStreamHeaderValue]:
+    headers: Dict[str, EventStreamHeaderValue] = {}
+    offset = 0
+    end = len(data)
+    try:
+        while offset < end:
+            name_length = data[offset]
+            offset += 1
+            name = str(data[offset : offset + name_length], "utf-8")
+            offset += name_length
+            header_type = data[offset]
+            offset += 1
+
+            value: EventStreamHeaderValue
+            if header_type == _HEADER_STRING or header_type == _HEADER_BYTE_ARRAY:
+                (value_length,) = _UINT16.unpack_from(data, offset)
+                offset += 2
+                raw_value = data[offset : offset + value_length]
+                if len(raw_value) != value_length:
+                    raise EventStreamParseError(
+                        "Header {} is truncated".format(name)
+                    )
+                offset += value_length
+                value = (
+                    str(raw_value, "utf-8")
+                    if header_type == _HEADER_STRING
+                    else raw_value.tobytes()
+                )
+            elif header_type == _HEADER_BOOL_TRUE:
+                value = True
+            elif header_type == _HEADER_BOOL_FALSE:
+                value = False
+            elif header_type == _HEADER_UUID:
+                value = data[offset : offset + 16].tobytes()
+                if len(value) != 16:
+                    raise EventStreamParseError(
+                        "Header {} is truncated".format(name)
+                    )
+                offset += 16
+            else:
+                value_struct = _FIXED_SIZE_HEADER_TYPES.get(header_type)
+                if value_struct is None:
+                    raise EventStreamParseError(
+                        "Unknown header type {} for header {}".format(header_type, name)
+                    )
+                (value,) = value_struct.unpack_from(data, offset)
+                offset += value_struct.size
+
+            if name in headers:
+                raise EventStreamParseError(
+                    'Duplicate header present: "{}"'.format(name)
+                )
+            headers[name] = value
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise EventStreamParseError("Invalid event stream headers: {}".format(e))
+    return headers
+
+
+class EventStreamDecoder:
+    """
+    Drop-in replacement for `botocore.eventstream.EventStreamBuffer`:
+
+        decoder = EventStreamDecoder()
+        for chunk in response.iter_bytes():
+            decoder.add_data(chunk)
+            for message in decoder:
+                ...
+    """
+
+    __slots__ = ("_data", "_view", "_offset", "_parsed_headers")
+
+    def __init__(self):
+        self._data: bytes = b""
+        self._view = memoryview(self._data)
+        self._offset = 0
+        # a stream repeats the same few header blocks (e.g. `:event-type: chunk`) - parse each once
+        self._parsed_headers: Dict[bytes, Dict[str, EventStreamHeaderValue]] = {}
+
+    def add_data(self, data: bytes) -> None:
+        if not isinstance(data, bytes):
+            # don't hold views into a buffer the caller may mutate
+            data = bytes(data)
+        if self._offset < len(self._data):
+            # only a partial frame is left over - copy it in front of the new data
+            data = self._view[self._offset :].tobytes() + data
+        self._data = data
+        self._view = memoryview(data)
+        self._offset = 0
+
+    def __iter__(self) -> Iterator[EventStreamMessage]:
+        return self
+
+    def __next__(self) -> EventStreamMessage:
+        message = self._next_message()
+        if message is None:
+            raise StopIteration
+        return message
+
+    def _next_message(self) -> Optional[EventStreamMessage]:
+        view = self._view
+        start = self._offset
+        available = len(view) - start
+        if available < _PRELUDE_LENGTH:
+            return None
+
+        total_length, headers_length, prelude_crc = _PRELUDE.unpack_from(view, start)
+        calculated_crc = zlib.crc32(view[start : start + 8])
+        if calculated_crc != prelude_crc:
+            raise EventStreamParseError(
+                "Prelude checksum mismatch: expected 0x{:08x}, calculated 0x{:08x}".format(
+                    prelude_crc, calculated_crc
+                )
+            )
+        payload_length = (
+            total_length - headers_length - _PRELUDE_LENGTH - _MESSAGE_CRC_LENGTH
+        )
+        if headers_length > _MAX_HEADERS_LENGTH:
+            raise EventStreamParseError(
+                "Header length of {} exceeded the maximum of {}".format(
+                    headers_length, _MAX_HEADERS_LENGTH
+                )
+            )
+        if payload_length < 0 or payload_length > _MAX_PAYLOAD_LENGTH:
+            raise EventStreamParseError(
+                "Invalid payload length of {}".format(payload_length)
+            )
+        if available < total_length:
+            return None
+
+        payload_end = start + total_length - _MESSAGE_CRC_LENGTH
+        (message_crc,) = _UINT32.unpack_from(view, payload_end)
+        calculated_crc = zlib.crc32(view[start:payload_end])
+        if calculated_crc != message_crc:
+            raise EventStreamParseError(
+                "Message checksum mismatch: expected 0x{:08x}, calculated 0x{:08x}".format(
+                    message_crc, calculated_crc
+                )
+            )
+
+        headers_start = start + _PRELUDE_LENGTH
+        headers_end = headers_start + headers_length
+        headers = self._get_headers(view[headers_start:headers_end])
+        self._offset = start + total_length
+        return EventStreamMessage(headers=headers, payload=view[headers_end:payload_end])
+
+    def _get_headers(self, data: memoryview) -> Dict[str, EventStreamHeaderValue]:
+        key = data.tobytes()
+        headers = self._parsed_headers.get(key)
+        if headers is None:
+            headers = _parse_headers(data)
+            if len(self._parsed_headers) >= _MAX_CACHED_HEADER_BLOCKS:
+                self._parsed_headers.clear()
+            self._parsed_headers[key] = headers
+        return dict(headers)
+
+
+def encode_event_stream_message(
+    headers: Dict[str, Union[str, bytes, bool, uuid.UUID]], payload: bytes
+) -> bytes:
+    """
+    Encode a single frame. Used to build test fixtures and benchmarks - the proxy only decodes.
+    """
+    encoded_headers = bytearray()
+    for name, value in headers.items():
+        encoded_name = name.encode("utf-8")
+        encoded_headers += bytes([len(encoded_name)]) + encoded_name
+        if isinstance(value, bool):
+            encoded_headers.append(_HEADER_BOOL_TRUE if value else _HEADER_BOOL_FALSE)
+        elif isinstance(value, uuid.UUID):
+            encoded_headers.append(_HEADER_UUID)
+            encoded_headers += value.bytes
+        else:
+            encoded_value = value.encode("utf-8") if isinstance(value, str) else value
+            encoded_headers.append(
+                _HEADER_STRING if isinstance(value, str) else _HEADER_BYTE_ARRAY
+            )
+            encoded_headers += _UINT16.pack(len(encoded_value)) + encoded_value
+
+    total_length = (
+        _PRELUDE_LENGTH + len(encoded_headers) + len(payload) + _MESSAGE_CRC_LENGTH
+    )
+    prelude = struct.pack(">II", total_length, len(encoded_headers))
+    prelude += _UINT32.pack(zlib.crc32(prelude))
+    message = prelude + bytes(encoded_headers) + payload
+    return message + _UINT32.pack(zlib.crc32(message))
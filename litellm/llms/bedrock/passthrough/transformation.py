@@ -7,7 +7,11 @@ from litellm.litellm_core_utils.litellm_logging import Logging
 from litellm.llms.base_llm.passthrough.transformation import BasePassthroughConfig
 
 from ..base_aws_llm import BaseAWSLLM
-from ..common_utils import BedrockEventStreamDecoderBase, BedrockModelInfo
+from ..common_utils import (
+    BedrockEventStreamDecoderBase,
+    BedrockModelInfo,
+    get_event_stream_buffer,
+)
 
 if TYPE_CHECKING:
     from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
@@ -155,10 +159,8 @@ class BedrockPassthroughConfig(
         return litellm_model_response
 
     def _convert_raw_bytes_to_str_lines(self, raw_bytes: List[bytes]) -> List[str]:
-        from botocore.eventstream import EventStreamBuffer
-
         all_chunks = []
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_buffer = get_event_stream_buffer()
         for chunk in raw_bytes:
             event_stream_buffer.add_data(chunk)
             for event in event_stream_buffer:
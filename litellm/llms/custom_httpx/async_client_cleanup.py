@@ -53,6 +53,15 @@ async def close_litellm_async_clients():
                 # Silently ignore errors during cleanup
                 pass
 
+    # Close the connection pools shared by get_async_httpx_client clients
+    from litellm.llms.custom_httpx.transport_pool import http_transport_pool
+
+    try:
+        await http_transport_pool.aclose()
+    except Exception:
+        # Silently ignore errors during cleanup
+        pass
+
     # Close the global base_llm_aiohttp_handler instance (issue #12443)
     # This is used by Gemini and other providers that use aiohttp
     if hasattr(litellm, 'base_llm_aiohttp_handler'):
@@ -0,0 +1,400 @@
+"""
+Opt-in HTTP/2 for upstream LLM API connections.
+
+With HTTP/1.1, every concurrent request to a provider holds its own TCP + TLS
+connection, and the handshakes are paid again whenever the pool churns.
+HTTP/2 multiplexes concurrent requests (including streams) over one
+connection per host.
+
+HTTP/2 is enabled
+- per provider: `litellm.http2_providers = ["openai", "anthropic"]` or the
+  `LITELLM_HTTP2_PROVIDERS` env var (comma separated)
+- per deployment: `http2: true` in a Router deployment's litellm_params, which
+  enables it for the deployment's api_base host
+
+Requests for enabled hosts go through one HTTP/2 connection pool shared by
+all clients (`get_http2_connection_pool`); everything else keeps using the
+client's regular transport. Requires the `h2` package (`pip install httpx[http2]`).
+"""
+
+import asyncio
+import os
+import ssl
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import urlparse
+
+import httpx
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import HTTP2_MAX_CONCURRENT_STREAMS_PER_HOST
+from litellm.types.llms.custom_http import HTTP2HostStats, VerifyTypes
+
+if TYPE_CHECKING:
+    from httpcore import AsyncConnectionPool
+else:
+    AsyncConnectionPool = object
+
+# api_base used to pre-warm deployments that do not set one
+_PROVIDER_DEFAULT_API_BASES = {
+    "openai": "https://api.openai.com",
+    "anthropic": "https://api.anthropic.com",
+}
+
+_http2_hosts: Set[str] = set()
+_http2_connection_pools: Dict[Tuple, "HTTP2ConnectionPool"] = {}
+
+
+def get_http2_providers() -> List[str]:
+    providers = list(litellm.http2_providers)
+    env_providers = os.getenv("LITELLM_HTTP2_PROVIDERS")
+    if env_providers:
+        providers.extend(p.strip() for p in env_providers.split(",") if p.strip())
+    return providers
+
+
+def is_http2_enabled_for_provider(llm_provider: Optional[str]) -> bool:
+    return llm_provider is not None and llm_provider in get_http2_providers()
+
+
+def register_http2_host(api_base: str) -> None:
+    """
+    Send requests to the host of `api_base` over HTTP/2.
+
+    Clients get `LiteLLMHTTP2Transport` when they are created, so the first time
+    a host is registered the cached clients are dropped - the next request
+    creates a client that routes the host over HTTP/2.
+    """
+    host = urlparse(api_base).hostname
+    if not host or host in _http2_hosts:
+        return
+    _http2_hosts.add(host)
+    _flush_cached_clients()
+
+
+def _flush_cached_clients() -> None:
+    try:
+        litellm.in_memory_llm_clients_cache.flush_cache()
+    except Exception as e:
+        verbose_logger.debug(f"HTTP/2: could not flush cached clients: {e}")
+
+
+def should_use_http2_transport(llm_provider: Optional[str]) -> bool:
+    """Whether a new client for `llm_provider` needs `LiteLLMHTTP2Transport`."""
+    return is_http2_enabled_for_provider(llm_provider) or len(_http2_hosts) > 0
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_pool_key(
+    ssl_verify: Optional[VerifyTypes], event_loop: Optional[asyncio.AbstractEventLoop]
+) -> Tuple:
+    # connections and stream semaphores belong to the event loop that opened them
+    event_loop_id = id(event_loop) if event_loop is not None else None
+    if isinstance(ssl_verify, ssl.SSLContext):
+        return ("ssl_context", id(ssl_verify), event_loop_id)
+    return ("ssl_verify", ssl_verify, event_loop_id)
+
+
+def _drop_closed_loop_pools() -> None:
+    """Forget pools whose event loop has closed - their connections can't be used or closed."""
+    for pool_key, pool in list(_http2_connection_pools.items()):
+        if pool.event_loop is not None and pool.event_loop.is_closed():
+            del _http2_connection_pools[pool_key]
+
+
+def get_http2_connection_pool(
+    ssl_verify: Optional[VerifyTypes] = None,
+) -> "HTTP2ConnectionPool":
+    """Get the shared HTTP/2 connection pool for an `ssl_verify` setting on the running event loop."""
+    from litellm.llms.custom_httpx.http_handler import get_ssl_configuration
+
+    event_loop = _get_running_loop()
+    pool_key = _get_pool_key(ssl_verify, event_loop)
+    pool = _http2_connection_pools.get(pool_key)
+    if pool is not None and pool.event_loop is not event_loop:
+        # a closed loop's id was reused by the running one
+        pool = None
+    if pool is None:
+        _drop_closed_loop_pools()
+        # httpcore sets the ALPN protocols on the SSL context it is given, so
+        # the pool gets its own context - HTTP/1.1 clients sharing the cached
+        # one must never negotiate h2.
+        pool = HTTP2ConnectionPool(
+            verify=get_ssl_configuration(ssl_verify, use_cached_ssl_context=False)
+        )
+        _http2_connection_pools[pool_key] = pool
+    return pool
+
+
+def get_http2_connection_stats() -> List[HTTP2HostStats]:
+    """Pool usage per host across the shared HTTP/2 connection pools."""
+    _drop_closed_loop_pools()
+    stats: List[HTTP2HostStats] = []
+    for pool in _http2_connection_pools.values():
+        stats.extend(pool.get_stats())
+    return stats
+
+
+async def prewarm_http2_connections(api_bases: List[str]) -> None:
+    """
+    Open the HTTP/2 connection to each host before the first request, so it
+    does not pay for the TCP + TLS handshake. Sends one HEAD request per host -
+    its status is ignored.
+    """
+    origins = {
+        f"{parsed.scheme}://{parsed.netloc}"
+        for parsed in (urlparse(api_base) for api_base in api_bases)
+        if parsed.scheme and parsed.netloc
+    }
+    try:
+        pool = get_http2_connection_pool()
+    except ImportError as e:
+        verbose_logger.warning(str(e))
+        return
+
+    async def _prewarm(origin: str) -> None:
+        try:
+            response = await pool.handle_async_request(httpx.Request("HEAD", origin))
+            await response.aclose()
+        except Exception as e:
+            verbose_logger.debug(
+                f"HTTP/2: could not pre-warm connection to {origin}: {e}"
+            )
+
+    await asyncio.gather(*[_prewarm(origin) for origin in origins])
+
+
+def _get_pool_connections(
+    transport: httpx.AsyncHTTPTransport,
+) -> Optional[List[Tuple[str, bool]]]:
+    """
+    (host, is idle) of every open connection in the httpcore pool of `transport`,
+    or None if this httpx / httpcore version does not expose them.
+    """
+    try:
+        pool: AsyncConnectionPool = transport._pool
+        return [
+            (connection._origin.host.decode("ascii"), connection.is_idle())  # type: ignore[attr-defined]
+            for connection in pool.connections
+        ]
+    except Exception as e:
+        verbose_logger.debug(f"HTTP/2: could not read open connections: {e}")
+        return None
+
+
+class _HostState:
+    def __init__(self, max_concurrent_streams: int):
+        self.semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_concurrent_streams)
+            if max_concurrent_streams > 0
+            else None
+        )
+        self.requests_in_flight = 0
+        self.peak_requests_in_flight = 0
+        self.requests_total = 0
+        self.connections_opened = 0
+
+
+class ReleasingByteStream(httpx.AsyncByteStream):
+    """Response body stream that calls `release` once, when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class HTTP2ConnectionPool:
+    """
+    HTTP/2 connection pool shared by every client, with a per-host limit on
+    concurrent streams (`HTTP2_MAX_CONCURRENT_STREAMS_PER_HOST`, 0 = the
+    server's limit) and per-host usage stats.
+    """
+
+    def __init__(
+        self,
+        verify: VerifyTypes,
+        max_concurrent_streams_per_host: int = HTTP2_MAX_CONCURRENT_STREAMS_PER_HOST,
+    ):
+        try:
+            self.transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                verify=verify,
+                local_address="0.0.0.0" if litellm.force_ipv4 else None,
+            )
+        except ImportError as e:
+            raise ImportError(
+                f"HTTP/2 is enabled but the `h2` package is missing - run `pip install httpx[http2]`. {e}"
+            )
+        self.max_concurrent_streams_per_host = max_concurrent_streams_per_host
+        self._hosts: Dict[str, _HostState] = {}
+        self.event_loop = _get_running_loop()
+
+    def _get_host_state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.max_concurrent_streams_per_host)
+            self._hosts[host] = state
+        return state
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = self._get_host_state(request.url.host)
+        if state.semaphore is not None:
+            await state.semaphore.acquire()
+        state.requests_in_flight += 1
+        state.requests_total += 1
+        state.peak_requests_in_flight = max(
+            state.peak_requests_in_flight, state.requests_in_flight
+        )
+
+        def _release() -> None:
+            state.requests_in_flight -= 1
+            if state.semaphore is not None:
+                state.semaphore.release()
+
+        request.extensions["trace"] = self._get_trace(
+            state, request.extensions.get("trace")
+        )
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            _release()
+            raise
+        # the stream slot is held until the response body is read / closed
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=ReleasingByteStream(response.stream, _release),  # type: ignore[arg-type]
+            extensions=response.extensions,
+        )
+
+    @staticmethod
+    def _get_trace(
+        state: _HostState,
+        trace: Optional[Callable[[str, dict], Awaitable[None]]],
+    ) -> Callable[[str, dict], Awaitable[None]]:
+        async def _trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                state.connections_opened += 1
+            if trace is not None:
+                await trace(event_name, info)
+
+        return _trace
+
+    def get_stats(self) -> List[HTTP2HostStats]:
+        pool_connections = _get_pool_connections(self.transport)
+        stats: List[HTTP2HostStats] = []
+        for host, state in self._hosts.items():
+            connections = (
+                [
+                    is_idle
+                    for connection_host, is_idle in pool_connections
+                    if connection_host == host
+                ]
+                if pool_connections is not None
+                else None
+            )
+            stats.append(
+                HTTP2HostStats(
+                    host=host,
+                    open_connections=(
+                        len(connections) if connections is not None else None
+                    ),
+                    idle_connections=(
+                        sum(connections) if connections is not None else None
+                    ),
+                    requests_in_flight=state.requests_in_flight,
+                    peak_requests_in_flight=state.peak_requests_in_flight,
+                    requests_total=state.requests_total,
+                    connections_opened=state.connections_opened,
+                    new_connection_rate=(
+                        state.connections_opened / state.requests_total
+                        if state.requests_total
+                        else 0.0
+                    ),
+                    stream_utilization=(
+                        state.requests_in_flight / self.max_concurrent_streams_per_host
+                        if self.max_concurrent_streams_per_host > 0
+                        else None
+                    ),
+                )
+            )
+        return stats
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class LiteLLMHTTP2Transport(httpx.AsyncBaseTransport):
+    """
+    Client transport that sends requests for HTTP/2-enabled hosts through the
+    shared HTTP/2 pool, and all other requests through `transport`.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        all_hosts: bool = False,
+        ssl_verify: Optional[VerifyTypes] = None,
+    ):
+        """
+        Args:
+            transport: transport for HTTP/1.1 requests
+            all_hosts: send every request over HTTP/2 - HTTP/2 is enabled for the client's provider
+            ssl_verify: the client's ssl_verify setting, selects the shared HTTP/2 pool
+        """
+        self.transport = transport
+        self.all_hosts = all_hosts
+        self.ssl_verify = ssl_verify
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.all_hosts or request.url.host in _http2_hosts:
+            pool = get_http2_connection_pool(ssl_verify=self.ssl_verify)
+            return await pool.handle_async_request(request)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # the HTTP/2 pool is shared with other clients and stays open
+        await self.transport.aclose()
+
+
+def wrap_transport_for_http2(
+    transport: httpx.AsyncBaseTransport,
+    llm_provider: Optional[str],
+    ssl_verify: Optional[VerifyTypes] = None,
+) -> httpx.AsyncBaseTransport:
+    """Wrap a client's transport with `LiteLLMHTTP2Transport` when HTTP/2 is enabled for any of its hosts."""
+    if not should_use_http2_transport(llm_provider):
+        return transport
+    return LiteLLMHTTP2Transport(
+        transport=transport,
+        all_hosts=is_http2_enabled_for_provider(llm_provider),
+        ssl_verify=ssl_verify,
+    )
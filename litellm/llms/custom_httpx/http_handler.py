@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import os
 import ssl
 import sys
@@ -30,8 +31,19 @@ from litellm.constants import (
     AIOHTTP_KEEPALIVE_TIMEOUT,
     AIOHTTP_TTL_DNS_CACHE,
     DEFAULT_SSL_CIPHERS,
+    SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS,
+    SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS_PER_HOST,
 )
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
+from litellm.llms.custom_httpx.http2_transport import (
+    should_use_http2_transport,
+    wrap_transport_for_http2,
+)
+from litellm.llms.custom_httpx.transport_pool import (
+    SharedTransport,
+    get_http_transport_config,
+    http_transport_pool,
+)
 from litellm.types.llms.custom_http import *
 
 if TYPE_CHECKING:
@@ -207,6 +219,7 @@ def get_ssl_verify(
 
 def get_ssl_configuration(
     ssl_verify: Optional[VerifyTypes] = None,
+    use_cached_ssl_context: bool = True,
 ) -> Union[bool, str, ssl.SSLContext]:
     """
     Unified SSL configuration function that handles ssl_context and ssl_verify logic.
@@ -229,6 +242,9 @@ def get_ssl_configuration(
             - False: Disable SSL verification
             - True: Enable SSL verification
             - str: Path to CA bundle file
+        use_cached_ssl_context: If False, create a new SSL context instead of
+            returning the shared cached one (e.g. for HTTP/2 connection pools,
+            which set ALPN protocols on their context)
 
     Returns:
         Union[bool, str, ssl.SSLContext]: Appropriate SSL configuration
@@ -257,6 +273,13 @@ def get_ssl_configuration(
         # Create cache key from configuration parameters
         cache_key = (cafile, ssl_security_level, ssl_ecdh_curve)
 
+        if not use_cached_ssl_context:
+            return _create_ssl_context(
+                cafile=cafile,
+                ssl_security_level=ssl_security_level,
+                ssl_ecdh_curve=ssl_ecdh_curve,
+            )
+
         # Check if we have a cached SSL context for this configuration
         if cache_key not in _ssl_context_cache:
             _ssl_context_cache[cache_key] = _create_ssl_context(
@@ -339,6 +362,13 @@ class MaskedHTTPStatusError(httpx.HTTPStatusError):
         self.text = text
 
 
+def _get_shared_transport_limits() -> httpx.Limits:
+    max_connections = SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS or None
+    return httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+
+
 class AsyncHTTPHandler:
     def __init__(
         self,
@@ -348,6 +378,8 @@ class AsyncHTTPHandler:
         client_alias: Optional[str] = None,  # name for client in logs
         ssl_verify: Optional[VerifyTypes] = None,
         shared_session: Optional["ClientSession"] = None,
+        llm_provider: Optional[str] = None,  # selects HTTP/2, see litellm.http2_providers
+        use_shared_transport: bool = False,  # share the connection pool of clients with the same transport config
     ):
         self.timeout = timeout
         self.event_hooks = event_hooks
@@ -356,6 +388,8 @@ class AsyncHTTPHandler:
             event_hooks=event_hooks,
             ssl_verify=ssl_verify,
             shared_session=shared_session,
+            llm_provider=llm_provider,
+            use_shared_transport=use_shared_transport,
         )
         self.client_alias = client_alias
 
@@ -365,6 +399,8 @@ class AsyncHTTPHandler:
         event_hooks: Optional[Mapping[str, List[Callable[..., Any]]]],
         ssl_verify: Optional[VerifyTypes] = None,
         shared_session: Optional["ClientSession"] = None,
+        llm_provider: Optional[str] = None,
+        use_shared_transport: bool = False,
     ) -> httpx.AsyncClient:
         # Get unified SSL configuration
         ssl_config = get_ssl_configuration(ssl_verify)
@@ -377,11 +413,50 @@ class AsyncHTTPHandler:
             timeout = _DEFAULT_TIMEOUT
         # Create a client with a connection pool
 
-        transport = AsyncHTTPHandler._create_async_transport(
-            ssl_context=ssl_config if isinstance(ssl_config, ssl.SSLContext) else None,
-            ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
-            shared_session=shared_session,
-        )
+        def _create_transport() -> Optional[httpx.AsyncBaseTransport]:
+            transport = AsyncHTTPHandler._create_async_transport(
+                ssl_context=ssl_config
+                if isinstance(ssl_config, ssl.SSLContext)
+                else None,
+                ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
+                shared_session=shared_session,
+                shared_transport=use_shared_transport,
+            )
+            if (
+                shared_session is None
+                and (use_shared_transport or should_use_http2_transport(llm_provider))
+                and transport is None
+            ):
+                transport = AsyncHTTPTransport(
+                    verify=ssl_config,  # type: ignore[arg-type]
+                    cert=cert,
+                    **(
+                        {"limits": _get_shared_transport_limits()}
+                        if use_shared_transport
+                        else {}
+                    ),
+                )
+            if shared_session is None and should_use_http2_transport(llm_provider):
+                transport = wrap_transport_for_http2(
+                    transport=transport,  # type: ignore[arg-type]
+                    llm_provider=llm_provider,
+                    ssl_verify=ssl_verify,
+                )
+            return transport
+
+        transport: Optional[httpx.AsyncBaseTransport]
+        if use_shared_transport and shared_session is None:
+            transport = http_transport_pool.acquire(
+                config=get_http_transport_config(
+                    ssl_config=ssl_config,
+                    cert=cert,
+                    use_aiohttp_transport=AsyncHTTPHandler._should_use_aiohttp_transport(),
+                    llm_provider=llm_provider,
+                ),
+                create_transport=_create_transport,  # type: ignore[arg-type]
+            )
+        else:
+            transport = _create_transport()
 
         # Get default headers (User-Agent, overridable via LITELLM_USER_AGENT)
         default_headers = get_default_headers()
@@ -400,6 +475,16 @@ class AsyncHTTPHandler:
         # Close the client when you're done with it
         await self.client.aclose()
 
+    def release_shared_transport(self) -> None:
+        """
+        Drop the client's reference to its shared connection pool, e.g. when
+        it is evicted from the client cache. Using the client afterwards takes
+        a new reference.
+        """
+        transport = getattr(self.client, "_transport", None)
+        if isinstance(transport, SharedTransport):
+            transport.release()
+
     async def __aenter__(self):
         return self.client
 
@@ -733,6 +818,7 @@ class AsyncHTTPHandler:
         ssl_context: Optional[ssl.SSLContext] = None,
         ssl_verify: Optional[bool] = None,
         shared_session: Optional["ClientSession"] = None,
+        shared_transport: bool = False,
     ) -> Optional[Union[LiteLLMAiohttpTransport, AsyncHTTPTransport]]:
         """
         - Creates a transport for httpx.AsyncClient
@@ -741,6 +827,9 @@ class AsyncHTTPHandler:
             - Users can opt out of using AiohttpTransport by setting litellm.use_aiohttp_transport to False
 
 
+        - shared_transport: the transport is pooled across clients (see transport_pool.py) and
+          gets the SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS* limits
+
         Notes on this handler:
         - Why AiohttpTransport?
             - By default, we use AiohttpTransport since it offers much higher throughput and lower latency than httpx.
@@ -756,12 +845,15 @@ class AsyncHTTPHandler:
                 ssl_context=ssl_context,
                 ssl_verify=ssl_verify,
                 shared_session=shared_session,
+                shared_transport=shared_transport,
             )
 
         #########################################################
         # HTTPX TRANSPORT is used when aiohttp is not installed
         #########################################################
-        return AsyncHTTPHandler._create_httpx_transport()
+        return AsyncHTTPHandler._create_httpx_transport(
+            shared_transport=shared_transport
+        )
 
     @staticmethod
     def _should_use_aiohttp_transport() -> bool:
@@ -824,6 +916,7 @@ class AsyncHTTPHandler:
         ssl_verify: Optional[bool] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
         shared_session: Optional["ClientSession"] = None,
+        shared_transport: bool = False,
     ) -> LiteLLMAiohttpTransport:
         """
         Creates an AiohttpTransport with RequestNotRead error handling
@@ -878,12 +971,19 @@ class AsyncHTTPHandler:
             "enable_cleanup_closed": True,
             **connector_kwargs,
         }
-        if AIOHTTP_CONNECTOR_LIMIT > 0:
-            transport_connector_kwargs["limit"] = AIOHTTP_CONNECTOR_LIMIT
-        if AIOHTTP_CONNECTOR_LIMIT_PER_HOST > 0:
-            transport_connector_kwargs[
-                "limit_per_host"
-            ] = AIOHTTP_CONNECTOR_LIMIT_PER_HOST
+        # a shared transport's connector serves every client with its config
+        connector_limit, connector_limit_per_host = (
+            (
+                SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS,
+                SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS_PER_HOST,
+            )
+            if shared_transport
+            else (AIOHTTP_CONNECTOR_LIMIT, AIOHTTP_CONNECTOR_LIMIT_PER_HOST)
+        )
+        if connector_limit > 0:
+            transport_connector_kwargs["limit"] = connector_limit
+        if connector_limit_per_host > 0:
+            transport_connector_kwargs["limit_per_host"] = connector_limit_per_host
 
         return LiteLLMAiohttpTransport(
             client=lambda: ClientSession(
@@ -894,7 +994,9 @@ class AsyncHTTPHandler:
         )
 
     @staticmethod
-    def _create_httpx_transport() -> Optional[AsyncHTTPTransport]:
+    def _create_httpx_transport(
+        shared_transport: bool = False,
+    ) -> Optional[AsyncHTTPTransport]:
         """
         Creates an AsyncHTTPTransport
 
@@ -902,6 +1004,10 @@ class AsyncHTTPHandler:
         - [Default] If force_ipv4 is False, it will return None
         """
         if litellm.force_ipv4:
+            if shared_transport:
+                return AsyncHTTPTransport(
+                    local_address="0.0.0.0", limits=_get_shared_transport_limits()
+                )
             return AsyncHTTPTransport(local_address="0.0.0.0")
         else:
             return None
@@ -1196,6 +1302,18 @@ class HTTPHandler:
             return getattr(litellm, "sync_transport", None)
 
 
+def _get_async_httpx_client_cache_key(
+    llm_provider: Union[LlmProviders, httpxSpecialProvider],
+    params: Optional[dict],
+) -> str:
+    """Cache key of the handler for `llm_provider` + `params`, independent of the order of `params`."""
+    params_key = sorted(
+        (str(key), repr(value)) for key, value in (params or {}).items()
+    )
+    params_hash = hashlib.sha256(repr(params_key).encode()).hexdigest()
+    return f"async_httpx_client_{getattr(llm_provider, 'value', llm_provider)}_{params_hash}"
+
+
 def get_async_httpx_client(
     llm_provider: Union[LlmProviders, httpxSpecialProvider],
     params: Optional[dict] = None,
@@ -1228,15 +1346,9 @@ def get_async_httpx_client(
                 shared_session=shared_session,
             )
 
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
+    _cache_key_name = _get_async_httpx_client_cache_key(
+        llm_provider=llm_provider, params=params
+    )
 
     # Lazily initialize the global in-memory client cache to avoid relying on
     # litellm globals being fully populated during import time.
@@ -1254,12 +1366,17 @@ def get_async_httpx_client(
     if params is not None:
         # Filter out params that are only used for cache key, not for AsyncHTTPHandler.__init__
         handler_params = {k: v for k, v in params.items() if k != "disable_aiohttp_transport"}
-        _new_client = AsyncHTTPHandler(**handler_params)
+        handler_params.setdefault("llm_provider", llm_provider)
+        _new_client = AsyncHTTPHandler(**handler_params, use_shared_transport=True)
     else:
         _new_client = AsyncHTTPHandler(
             timeout=httpx.Timeout(timeout=600.0, connect=5.0),
+            llm_provider=llm_provider,
+            use_shared_transport=True,
         )
 
+    # the handler expiring only drops its reference to the shared transport -
+    # the connection pool stays open while other handlers use it
     cache.set_cache(
         key=_cache_key_name,
         value=_new_client,
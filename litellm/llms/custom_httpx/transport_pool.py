@@ -0,0 +1,295 @@
+"""
+Shared connection pools (httpx transports) for `get_async_httpx_client` clients.
+
+Each distinct `params` combination passed to `get_async_httpx_client` gets its
+own `AsyncHTTPHandler`. Those handlers used to own their connection pool too,
+so every timeout / provider combination opened its own connections, and a pool
+was rebuilt cold whenever its cached handler expired.
+
+Handlers now borrow the transport of their `HTTPTransportConfig` - the settings
+that change how connections are made (transport type, SSL, proxy, HTTP
+version, event loop). Timeouts, headers and event hooks stay on each handler's
+own `httpx.AsyncClient`. A pooled transport is reference counted and closed
+when the last client using it is closed or evicted from the client cache, not
+on a TTL.
+
+A pooled transport serves many clients, so it has its own connection limits
+(`SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS` and
+`SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS_PER_HOST`) instead of the per-client
+`AIOHTTP_CONNECTOR_LIMIT` / `AIOHTTP_CONNECTOR_LIMIT_PER_HOST`.
+"""
+
+import asyncio
+import os
+import ssl
+import time
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.llms.custom_httpx.http2_transport import (
+    ReleasingByteStream,
+    is_http2_enabled_for_provider,
+    should_use_http2_transport,
+)
+from litellm.types.llms.custom_http import HTTPTransportPoolStats, VerifyTypes
+
+_PROXY_ENV_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+class HTTPTransportConfig(NamedTuple):
+    """Normalized, hashable settings of a pooled transport"""
+
+    transport: str  # "aiohttp" or "httpx"
+    ssl_verify: Hashable
+    cert: Optional[str]
+    proxy: Tuple
+    http_version: str
+    force_ipv4: bool
+    event_loop_id: Optional[int]
+
+
+def _normalize_ssl_verify(ssl_config: VerifyTypes) -> Hashable:
+    if isinstance(ssl_config, ssl.SSLContext):
+        # resolved SSL contexts are cached per configuration, see get_ssl_configuration
+        return ("ssl_context", id(ssl_config))
+    return ssl_config
+
+
+def get_http_transport_config(
+    ssl_config: VerifyTypes,
+    cert: Optional[str],
+    use_aiohttp_transport: bool,
+    llm_provider: Optional[str] = None,
+) -> HTTPTransportConfig:
+    from litellm.secret_managers.main import str_to_bool
+
+    trust_env = bool(litellm.aiohttp_trust_env) or (
+        str_to_bool(os.getenv("AIOHTTP_TRUST_ENV", "False")) is True
+    )
+    if is_http2_enabled_for_provider(llm_provider):
+        http_version = "2"
+    elif should_use_http2_transport(None):
+        # HTTP/2 for the hosts registered by `http2: true` deployments
+        http_version = "1.1+2"
+    else:
+        http_version = "1.1"
+    try:
+        event_loop_id: Optional[int] = id(asyncio.get_running_loop())
+    except RuntimeError:
+        event_loop_id = None
+
+    return HTTPTransportConfig(
+        transport="aiohttp" if use_aiohttp_transport else "httpx",
+        ssl_verify=_normalize_ssl_verify(ssl_config),
+        cert=cert,
+        proxy=(trust_env,) + tuple(os.getenv(name) for name in _PROXY_ENV_VARS),
+        http_version=http_version,
+        force_ipv4=bool(litellm.force_ipv4),
+        event_loop_id=event_loop_id,
+    )
+
+
+class _PooledTransport:
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+        self.references = 0
+        self.created_at = time.time()
+        self.requests_total = 0
+        self.requests_in_flight = 0
+        self.requests_per_host: Dict[str, int] = {}
+        # the last reference was released while requests were in flight
+        self.close_when_idle = False
+        try:
+            self.event_loop: Optional[
+                asyncio.AbstractEventLoop
+            ] = asyncio.get_running_loop()
+        except RuntimeError:
+            self.event_loop = None
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    One client's reference to a pooled transport. Closing it releases the
+    reference instead of closing the connections other clients still use.
+    """
+
+    def __init__(
+        self,
+        pool: "HTTPTransportPool",
+        config: HTTPTransportConfig,
+        pooled: _PooledTransport,
+        create_transport: Callable[[], httpx.AsyncBaseTransport],
+    ):
+        self.pool = pool
+        self.config = config
+        self.pooled = pooled
+        self.create_transport = create_transport
+        self._released = False
+
+    @property
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return self.pooled.transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._released:
+            # the client is still used after it was evicted from the client cache
+            self.pooled = self.pool._acquire_pooled(self.config, self.create_transport)
+            self._released = False
+        pooled = self.pooled
+        pooled.requests_total += 1
+        pooled.requests_in_flight += 1
+        host = request.url.host
+        pooled.requests_per_host[host] = pooled.requests_per_host.get(host, 0) + 1
+        try:
+            response = await pooled.transport.handle_async_request(request)
+        except BaseException:
+            self.pool._request_done(pooled)
+            raise
+        # the request holds its connection until the response body is closed
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=ReleasingByteStream(
+                response.stream,  # type: ignore[arg-type]
+                lambda: self.pool._request_done(pooled),
+            ),
+            extensions=response.extensions,
+        )
+
+    def release(self) -> None:
+        """
+        Drop the reference without awaiting the close of the pooled transport,
+        e.g. when the client is evicted from the client cache. The transport
+        is closed in the background once its in-flight requests are done.
+        """
+        if self._released:
+            return
+        self._released = True
+        transport = self.pool._release(self.config, self.pooled)
+        if transport is not None:
+            _close_in_background(transport, self.pooled.event_loop)
+
+    async def aclose(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        transport = self.pool._release(self.config, self.pooled)
+        if transport is not None:
+            await transport.aclose()
+
+    def __del__(self) -> None:
+        # the client was garbage collected without being closed
+        if not getattr(self, "_released", True):
+            self.release()
+
+
+def _close_in_background(
+    transport: httpx.AsyncBaseTransport, event_loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    if event_loop is None or event_loop.is_closed():
+        return
+    try:
+        if event_loop.is_running():
+            asyncio.run_coroutine_threadsafe(transport.aclose(), event_loop)
+    except Exception as e:
+        verbose_logger.debug(f"Error closing pooled transport: {e}")
+
+
+class HTTPTransportPool:
+    def __init__(self):
+        self._transports: Dict[HTTPTransportConfig, _PooledTransport] = {}
+
+    def acquire(
+        self,
+        config: HTTPTransportConfig,
+        create_transport: Callable[[], httpx.AsyncBaseTransport],
+    ) -> SharedTransport:
+        """Get a reference to the transport of `config`, creating it with `create_transport` if needed."""
+        return SharedTransport(
+            pool=self,
+            config=config,
+            pooled=self._acquire_pooled(config, create_transport),
+            create_transport=create_transport,
+        )
+
+    def _acquire_pooled(
+        self,
+        config: HTTPTransportConfig,
+        create_transport: Callable[[], httpx.AsyncBaseTransport],
+    ) -> _PooledTransport:
+        pooled = self._transports.get(config)
+        if pooled is None:
+            pooled = _PooledTransport(create_transport())
+            self._transports[config] = pooled
+        pooled.references += 1
+        return pooled
+
+    def _release(
+        self, config: HTTPTransportConfig, pooled: _PooledTransport
+    ) -> Optional[httpx.AsyncBaseTransport]:
+        """
+        Drop a reference. Returns the transport to close when it was the last
+        one and no request is in flight on it.
+        """
+        pooled.references -= 1
+        if pooled.references > 0:
+            return None
+        if self._transports.get(config) is pooled:
+            del self._transports[config]
+        if pooled.requests_in_flight > 0:
+            pooled.close_when_idle = True
+            return None
+        return pooled.transport
+
+    def _request_done(self, pooled: _PooledTransport) -> None:
+        pooled.requests_in_flight -= 1
+        if (
+            pooled.close_when_idle
+            and pooled.requests_in_flight == 0
+            and pooled.references == 0
+        ):
+            pooled.close_when_idle = False
+            _close_in_background(pooled.transport, pooled.event_loop)
+
+    def get_stats(self) -> List[HTTPTransportPoolStats]:
+        return [
+            HTTPTransportPoolStats(
+                transport=config.transport,
+                http_version=config.http_version,
+                ssl_verify=str(config.ssl_verify),
+                references=pooled.references,
+                age_seconds=time.time() - pooled.created_at,
+                requests_total=pooled.requests_total,
+                requests_in_flight=pooled.requests_in_flight,
+                requests_per_host=dict(pooled.requests_per_host),
+            )
+            for config, pooled in self._transports.items()
+        ]
+
+    async def aclose(self) -> None:
+        """Close every pooled transport, e.g. on shutdown"""
+        transports, self._transports = self._transports, {}
+        for pooled in transports.values():
+            try:
+                await pooled.transport.aclose()
+            except Exception as e:
+                verbose_logger.debug(f"Error closing pooled transport: {e}")
+
+
+http_transport_pool = HTTPTransportPool()
+
+
+def get_http_transport_pool_stats() -> List[HTTPTransportPoolStats]:
+    """Usage of the shared connection pools of `get_async_httpx_client` clients."""
+    return http_transport_pool.get_stats()
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
 import litellm
 from litellm.llms.base_llm.chat.transformation import BaseLLMException
+from litellm.llms.custom_httpx.http2_transport import (
+    should_use_http2_transport,
+    wrap_transport_for_http2,
+)
 from litellm.llms.custom_httpx.http_handler import (
     _DEFAULT_TTL_FOR_HTTPX_CLIENTS,
     AsyncHTTPHandler,
@@ -199,6 +203,7 @@ class BaseOpenAILLM:
     @staticmethod
     def _get_async_http_client(
         shared_session: Optional["ClientSession"] = None,
+        llm_provider: Optional[str] = None,
     ) -> Optional[httpx.AsyncClient]:
         if litellm.aclient_session is not None:
             return litellm.aclient_session
@@ -206,15 +211,20 @@ class BaseOpenAILLM:
         # Get unified SSL configuration
         ssl_config = get_ssl_configuration()
 
+        transport = AsyncHTTPHandler._create_async_transport(
+            ssl_context=ssl_config if isinstance(ssl_config, ssl.SSLContext) else None,
+            ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
+            shared_session=shared_session,
+        )
+        if shared_session is None and should_use_http2_transport(llm_provider):
+            transport = wrap_transport_for_http2(
+                transport=transport or httpx.AsyncHTTPTransport(verify=ssl_config),
+                llm_provider=llm_provider,
+            )
+
         return httpx.AsyncClient(
             verify=ssl_config,
-            transport=AsyncHTTPHandler._create_async_transport(
-                ssl_context=ssl_config
-                if isinstance(ssl_config, ssl.SSLContext)
-                else None,
-                ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
-                shared_session=shared_session,
-            ),
+            transport=transport,
             follow_redirects=True,
         )
 
@@ -386,7 +386,8 @@ class OpenAIChatCompletion(BaseLLM, BaseOpenAILLM):
                     api_key=api_key,
                     base_url=api_base,
                     http_client=OpenAIChatCompletion._get_async_http_client(
-                        shared_session=shared_session
+                        shared_session=shared_session,
+                        llm_provider=LlmProviders.OPENAI.value,
                     ),
                     timeout=timeout,
                     max_retries=max_retries,
@@ -7381,25 +7381,9 @@ def stream_chunk_builder(  # noqa: PLR0915
             reasoning_tokens=reasoning_tokens,
         )
 
-        setattr(response, "usage", usage)
-
-        # Propagate provider_specific_fields from the last chunk (contains provider
-        # metadata like traffic_type set during streaming)
-        for chunk in reversed(chunks):
-            hidden = getattr(chunk, "_hidden_params", None)
-            if hidden and "provider_specific_fields" in hidden:
-                response._hidden_params.setdefault(
-                    "provider_specific_fields", {}
-                ).update(hidden["provider_specific_fields"])
-                break
-
-        # Add cost to usage object if include_cost_in_streaming_usage is True
-        if litellm.include_cost_in_streaming_usage and logging_obj is not None:
-            setattr(
-                usage, "cost", logging_obj._response_cost_calculator(result=response)
-            )
-
-        return response
+        return _finalize_stream_chunk_builder_response(
+            response=response, chunks=chunks, usage=usage, logging_obj=logging_obj
+        )
     except Exception as e:
         verbose_logger.exception(
             "litellm.main.py::stream_chunk_builder() - Exception occurred - {}".format(
@@ -7414,6 +7398,90 @@ def stream_chunk_builder(  # noqa: PLR0915
         )
 
 
+def stream_chunk_usage_builder(
+    chunks: list,
+    messages: Optional[list] = None,
+    logging_obj: Optional["Logging"] = None,
+) -> Optional[ModelResponse]:
+    """
+    Fast path of `stream_chunk_builder` for logging: builds the response envelope
+    (id, model, finish_reason, hidden params) and usage, without assembling content.
+
+    Only used when the provider reported both prompt and completion tokens - otherwise
+    they have to be counted from the assembled content. Returns None if the fast path
+    doesn't apply, the caller should fall back to `stream_chunk_builder`.
+    """
+    try:
+        if not chunks:
+            return None
+
+        processor = ChunkProcessor(chunks, messages)
+        chunks = processor.chunks
+        if isinstance(chunks[0]["choices"][0], litellm.utils.TextChoices):
+            return None
+
+        reported_usage = processor._calculate_usage_per_chunk(chunks=chunks)
+        if not reported_usage["prompt_tokens"] or not reported_usage["completion_tokens"]:
+            return None
+
+        # the full path counts reasoning tokens from the assembled reasoning content
+        # when the provider doesn't report them
+        completion_tokens_details = reported_usage["completion_tokens_details"]
+        if (
+            completion_tokens_details is None
+            or completion_tokens_details.reasoning_tokens is None
+        ) and any(
+            len(chunk["choices"]) > 0
+            and chunk["choices"][0]["delta"].get("reasoning_content") is not None
+            for chunk in chunks
+        ):
+            return None
+
+        response = processor.build_base_response(chunks)
+        usage = processor.calculate_usage(
+            chunks=chunks,
+            model=chunks[0]["model"],
+            completion_output="",
+            messages=messages,
+            reasoning_tokens=0,
+        )
+        return _finalize_stream_chunk_builder_response(
+            response=response, chunks=chunks, usage=usage, logging_obj=logging_obj
+        )
+    except Exception as e:
+        verbose_logger.debug(
+            "litellm.main.py::stream_chunk_usage_builder() - falling back to stream_chunk_builder - {}".format(
+                str(e)
+            )
+        )
+        return None
+
+
+def _finalize_stream_chunk_builder_response(
+    response: ModelResponse,
+    chunks: list,
+    usage: Usage,
+    logging_obj: Optional["Logging"] = None,
+) -> ModelResponse:
+    setattr(response, "usage", usage)
+
+    # Propagate provider_specific_fields from the last chunk (contains provider
+    # metadata like traffic_type set during streaming)
+    for chunk in reversed(chunks):
+        hidden = getattr(chunk, "_hidden_params", None)
+        if hidden and "provider_specific_fields" in hidden:
+            response._hidden_params.setdefault(
+                "provider_specific_fields", {}
+            ).update(hidden["provider_specific_fields"])
+            break
+
+    # Add cost to usage object if include_cost_in_streaming_usage is True
+    if litellm.include_cost_in_streaming_usage and logging_obj is not None:
+        setattr(usage, "cost", logging_obj._response_cost_calculator(result=response))
+
+    return response
+
+
 # Cache for encoding to avoid repeated __getattr__ calls
 _encoding_cache: Optional[Any] = None
 
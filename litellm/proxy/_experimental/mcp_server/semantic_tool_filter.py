@@ -23,6 +23,7 @@ class SemanticMCPToolFilter:
         top_k: int = 10,
         similarity_threshold: float = 0.3,
         enabled: bool = True,
+        batch_embeddings: bool = False,
     ):
         """
         Initialize the semantic tool filter.
@@ -33,12 +34,15 @@ class SemanticMCPToolFilter:
             top_k: Maximum number of tools to return
             similarity_threshold: Minimum similarity score for filtering
             enabled: Whether filtering is enabled
+            batch_embeddings: Embed queries through the shared BatchedEmbedder, so
+                concurrent requests share one embedding call
         """
         self.enabled = enabled
         self.top_k = top_k
         self.similarity_threshold = similarity_threshold
         self.embedding_model = embedding_model
         self.router_instance = litellm_router_instance
+        self.batch_embeddings = batch_embeddings
         self.tool_router: Optional["SemanticRouter"] = None
         self._tool_map: Dict[str, Any] = {}  # MCPTool objects or OpenAI function dicts
 
@@ -180,7 +184,17 @@ class SemanticMCPToolFilter:
         # Run semantic filtering
         try:
             limit = top_k or self.top_k
-            matches = self.tool_router(text=query, limit=limit)
+            if self.batch_embeddings:
+                from litellm.caching.batched_embedder import get_batched_embedder
+
+                query_embedding = await get_batched_embedder().aembed(
+                    model=self.embedding_model,
+                    input=query,
+                    llm_router=self.router_instance,
+                )
+                matches = self.tool_router(vector=query_embedding, limit=limit)
+            else:
+                matches = self.tool_router(text=query, limit=limit)
             matched_tool_names = self._extract_tool_names_from_matches(matches)
             
             if not matched_tool_names:
@@ -297,6 +297,13 @@ class LiteLLMRoutes(enum.Enum):
         "/batches/{batch_id}",
         "/v1/batches/{batch_id}/cancel",
         "/batches/{batch_id}/cancel",
+        # local batches
+        "/v1/local_batches",
+        "/v1/local_batches/{batch_id}",
+        "/v1/local_batches/{batch_id}/output",
+        "/v1/local_batches/{batch_id}/errors",
+        "/v1/local_batches/{batch_id}/cancel",
+        "/v1/local_batches/{batch_id}/resume",
         # files
         "/v1/files",
         "/files",
@@ -3914,6 +3921,51 @@ class DailyAgentSpendTransaction(BaseDailySpendTransaction):
     agent_id: str
 
 
+class SpendLogsRollupTransaction(TypedDict):
+    """
+    Increment for one `LiteLLM_SpendLogsRollup` row, aggregated from a batch of spend logs
+    """
+
+    granularity: Literal["hour", "day"]
+    period_start: datetime
+    team_id: str
+    api_key: str
+    user: str
+    end_user: str
+    model: str
+    model_group: str
+    model_id: str
+    custom_llm_provider: str
+    status: str
+
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    spend: float
+    api_requests: int
+
+
+class SpendLogsTagRollupTransaction(TypedDict):
+    """
+    Increment for one `LiteLLM_SpendLogsTagRollup` row, aggregated from a batch of spend logs
+    """
+
+    granularity: Literal["hour", "day"]
+    period_start: datetime
+    tag: str
+    team_id: str
+    api_key: str
+    model: str
+    model_id: str
+    status: str
+
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    spend: float
+    api_requests: int
+
+
 class DBSpendUpdateTransactions(TypedDict):
     """
     Internal Data Structure for buffering spend updates in Redis or in memory before committing them to the database
@@ -22,6 +22,11 @@ from litellm._logging import verbose_logger, verbose_proxy_logger
 from litellm._service_logger import ServiceLogging
 from litellm.caching import DualCache
 from litellm.litellm_core_utils.dd_tracing import tracer
+from litellm.litellm_core_utils.request_stage_timer import (
+    RequestStage,
+    RequestStageTimer,
+    set_request_stage_timer,
+)
 from litellm.proxy._types import *
 from litellm.proxy.auth.auth_checks import (
     ExperimentalUIJWTToken,
@@ -1302,6 +1307,10 @@ async def user_api_key_auth(
     """
     Parent function to authenticate user api key / jwt token.
     """
+    # new request - start timing its stages (auth, pre-call hooks, routing, ...)
+    stage_timer = RequestStageTimer()
+    set_request_stage_timer(stage_timer)
+    stage_timer.start(RequestStage.AUTH)
 
     request_data = await _read_request_body(request=request)
     request_data = populate_request_with_path_params(
@@ -1331,6 +1340,7 @@ async def user_api_key_auth(
         user_api_key_auth_obj.end_user_id = end_user_id
 
     user_api_key_auth_obj.request_route = normalize_request_route(route)
+    stage_timer.end(RequestStage.AUTH)
     return user_api_key_auth_obj
 
 
@@ -0,0 +1,479 @@
+######################################################################
+
+#                     /v1/local_batches Endpoints
+
+# Run OpenAI-format batch files through the proxy's router, for model
+# groups whose providers have no batch API. See `LocalBatchExecutor`.
+
+######################################################################
+import asyncio
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import FileResponse
+
+import litellm
+from litellm._logging import verbose_proxy_logger
+from litellm._uuid import uuid
+from litellm.batches.local_batch_executor import LocalBatchExecutor
+from litellm.constants import LOCAL_BATCH_STORAGE_DIR
+from litellm.proxy._types import (
+    LiteLLM_TeamTable,
+    LiteLLM_UserTable,
+    LitellmUserRoles,
+    ProxyErrorTypes,
+    ProxyException,
+    UserAPIKeyAuth,
+)
+from litellm.proxy.auth.auth_checks import (
+    _is_model_cost_zero,
+    _virtual_key_max_budget_check,
+    can_key_call_model,
+    common_checks,
+    get_user_object,
+)
+from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+from litellm.proxy.common_utils.http_parsing_utils import UploadFileStream
+from litellm.proxy.litellm_pre_call_utils import LiteLLMProxyRequestSetup
+from litellm.proxy.utils import handle_exception_on_proxy, is_known_model
+from litellm.types.batches import LocalBatchState
+from litellm.types.utils import LiteLLMBatch
+
+router = APIRouter()
+
+# executors of the batches created or resumed by this proxy instance
+local_batch_executors: Dict[str, LocalBatchExecutor] = {}
+_local_batch_tasks: Dict[str, asyncio.Task] = {}
+
+_LOCAL_BATCH_ID_PATTERN = re.compile(r"^local_batch_[0-9a-f]{32}$")
+
+
+def get_local_batch_storage_dir() -> str:
+    return LOCAL_BATCH_STORAGE_DIR or os.path.join(
+        tempfile.gettempdir(), "litellm_local_batches"
+    )
+
+
+def _local_batch_state_to_litellm_batch(state: LocalBatchState) -> LiteLLMBatch:
+    return LiteLLMBatch(
+        id=state["id"],
+        object="batch",
+        endpoint=state["endpoint"],
+        # local batch files are not /v1/files objects - these are their download routes
+        input_file_id=state["id"],
+        output_file_id=f"/v1/local_batches/{state['id']}/output",
+        error_file_id=f"/v1/local_batches/{state['id']}/errors",
+        completion_window="24h",
+        status=state["status"],
+        created_at=state["created_at"],
+        in_progress_at=state.get("in_progress_at"),
+        completed_at=state.get("completed_at"),
+        failed_at=state.get("failed_at"),
+        cancelled_at=state.get("cancelled_at"),
+        request_counts=state["request_counts"],
+        metadata={"model": state.get("model") or ""},
+    )
+
+
+def _start_local_batch(executor: LocalBatchExecutor) -> None:
+    batch_id = executor.state["id"]
+
+    async def _run() -> None:
+        try:
+            await executor.arun()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                f"litellm.proxy.local_batch_endpoints: batch {batch_id} failed - {str(e)}"
+            )
+        finally:
+            _local_batch_tasks.pop(batch_id, None)
+
+    _local_batch_tasks[batch_id] = asyncio.create_task(_run())
+
+
+async def _check_local_batch_model_access(
+    models: List[str],
+    request: Request,
+    user_api_key_dict: UserAPIKeyAuth,
+) -> None:
+    """
+    Run the model access and budget checks of `user_api_key_auth` for every
+    model group the batch sends requests to - batch requests go to the router
+    directly, not through the proxy's auth.
+
+    Raises:
+        HTTPException: if a model is not on this proxy
+        ProxyException / BudgetExceededError: if the key, its team or its user
+            cannot call a model or is over budget
+    """
+    from litellm.proxy.proxy_server import (
+        llm_router,
+        prisma_client,
+        proxy_logging_obj,
+        user_api_key_cache,
+    )
+
+    if llm_router is None:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "LLM Router not initialized. Ensure models added to proxy."
+            },
+        )
+    team_object: Optional[LiteLLM_TeamTable] = None
+    if user_api_key_dict.team_id is not None:
+        team_object = LiteLLM_TeamTable(
+            team_id=user_api_key_dict.team_id,
+            max_budget=user_api_key_dict.team_max_budget,
+            soft_budget=user_api_key_dict.team_soft_budget,
+            spend=user_api_key_dict.team_spend,
+            tpm_limit=user_api_key_dict.team_tpm_limit,
+            rpm_limit=user_api_key_dict.team_rpm_limit,
+            blocked=user_api_key_dict.team_blocked,
+            models=user_api_key_dict.team_models,
+            metadata=user_api_key_dict.team_metadata,
+            object_permission_id=user_api_key_dict.team_object_permission_id,
+        )
+    user_object: Optional[LiteLLM_UserTable] = None
+    if user_api_key_dict.user_id is not None:
+        try:
+            user_object = await get_user_object(
+                user_id=user_api_key_dict.user_id,
+                prisma_client=prisma_client,
+                user_api_key_cache=user_api_key_cache,
+                user_id_upsert=False,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                f"local_batch_endpoints: unable to get user {user_api_key_dict.user_id} - {str(e)}"
+            )
+
+    for model in models:
+        if not is_known_model(model=model, llm_router=llm_router):
+            raise HTTPException(
+                status_code=400,
+                detail={"error": f"Model {model} is not a model on this proxy"},
+            )
+        if user_api_key_dict.user_role == LitellmUserRoles.PROXY_ADMIN:
+            continue
+        try:
+            await _check_local_batch_model(
+                model=model,
+                request=request,
+                user_api_key_dict=user_api_key_dict,
+                team_object=team_object,
+                user_object=user_object,
+            )
+        except litellm.BudgetExceededError as e:
+            # same responses as `user_api_key_auth`
+            raise ProxyException(
+                message=e.message,
+                type=ProxyErrorTypes.budget_exceeded,
+                param=None,
+                code=400,
+            )
+        except (HTTPException, ProxyException):
+            raise
+        except Exception as e:
+            raise ProxyException(
+                message="Authentication Error, " + str(e),
+                type=ProxyErrorTypes.auth_error,
+                param="model",
+                code=status.HTTP_401_UNAUTHORIZED,
+            )
+
+
+async def _check_local_batch_model(
+    model: str,
+    request: Request,
+    user_api_key_dict: UserAPIKeyAuth,
+    team_object: Optional[LiteLLM_TeamTable],
+    user_object: Optional[LiteLLM_UserTable],
+) -> None:
+    from litellm.proxy.proxy_server import (
+        general_settings,
+        llm_router,
+        proxy_logging_obj,
+    )
+
+    if not (
+        isinstance(user_api_key_dict.models, list)
+        and "all-team-models" in user_api_key_dict.models
+    ):
+        await can_key_call_model(
+            model=model,
+            llm_model_list=llm_router.get_model_list() if llm_router else None,
+            valid_token=user_api_key_dict,
+            llm_router=llm_router,
+        )
+    skip_budget_checks = _is_model_cost_zero(model=model, llm_router=llm_router)
+    if not skip_budget_checks:
+        await _virtual_key_max_budget_check(
+            valid_token=user_api_key_dict,
+            proxy_logging_obj=proxy_logging_obj,
+            user_obj=user_object,
+        )
+    await common_checks(
+        request_body={"model": model},
+        team_object=team_object,
+        user_object=user_object,
+        end_user_object=None,
+        global_proxy_spend=None,
+        general_settings=general_settings,
+        route=request.url.path,
+        llm_router=llm_router,
+        proxy_logging_obj=proxy_logging_obj,
+        valid_token=user_api_key_dict,
+        request=request,
+        skip_budget_checks=skip_budget_checks,
+    )
+
+
+def _get_local_batch_executor(
+    batch_id: str, user_api_key_dict: UserAPIKeyAuth
+) -> LocalBatchExecutor:
+    """
+    Get the executor of a batch, loading it from disk if it was created before
+    the proxy restarted. Only the key that created a batch and proxy admins
+    can access it.
+    """
+    from litellm.proxy.proxy_server import llm_router
+
+    executor = local_batch_executors.get(batch_id)
+    if executor is None:
+        batch_dir = os.path.join(get_local_batch_storage_dir(), batch_id)
+        if _LOCAL_BATCH_ID_PATTERN.match(batch_id) is None or not os.path.exists(
+            batch_dir
+        ):
+            raise HTTPException(
+                status_code=404, detail={"error": f"Batch {batch_id} not found"}
+            )
+        executor = LocalBatchExecutor(router=llm_router, batch_dir=batch_dir)
+        local_batch_executors[batch_id] = executor
+
+    if user_api_key_dict.user_role != LitellmUserRoles.PROXY_ADMIN and (
+        executor.state.get("request_metadata", {}).get("user_api_key")
+        != user_api_key_dict.api_key
+    ):
+        raise HTTPException(
+            status_code=404, detail={"error": f"Batch {batch_id} not found"}
+        )
+    return executor
+
+
+@router.post(
+    "/v1/local_batches",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def create_local_batch(
+    request: Request,
+    file: UploadFile = File(...),
+    model: Optional[str] = Form(default=None),
+    endpoint: str = Form(default="/v1/chat/completions"),
+    max_concurrent_requests: Optional[int] = Form(default=None),
+    max_requests_per_minute: Optional[int] = Form(default=None),
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    Run a batch input file (OpenAI batch JSONL format) through the proxy's router.
+
+    Requests are sent to the `model` router group (or each line's `body.model`)
+    with router retries and fallbacks, capped below the group's rpm / tpm limits.
+    The key must be allowed to call every model of the batch and be within budget.
+
+    Example Curl
+    ```
+    curl http://localhost:4000/v1/local_batches \
+        -H "Authorization: Bearer sk-1234" \
+        -F file="@batch_input.jsonl" \
+        -F model="gpt-4o" \
+        -F endpoint="/v1/chat/completions"
+    ```
+    """
+    from litellm.proxy.proxy_server import llm_router
+
+    try:
+        if llm_router is None:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": "LLM Router not initialized. Ensure models added to proxy."
+                },
+            )
+        if model is not None:
+            await _check_local_batch_model_access(
+                models=[model],
+                request=request,
+                user_api_key_dict=user_api_key_dict,
+            )
+
+        batch_id = f"local_batch_{uuid.uuid4().hex}"
+        request_metadata = dict(
+            LiteLLMProxyRequestSetup.get_sanitized_user_information_from_key(
+                user_api_key_dict=user_api_key_dict
+            )
+        )
+        request_metadata["user_api_key"] = user_api_key_dict.api_key
+        batch_dir = os.path.join(get_local_batch_storage_dir(), batch_id)
+        try:
+            # copying and validating the file is blocking disk I/O
+            executor = await asyncio.to_thread(
+                LocalBatchExecutor.create,
+                router=llm_router,
+                batch_dir=batch_dir,
+                input_file=UploadFileStream(file),
+                model=model,
+                endpoint=endpoint,  # type: ignore[arg-type]
+                max_concurrent_requests=max_concurrent_requests,
+                max_requests_per_minute=max_requests_per_minute,
+                request_metadata=request_metadata,
+                batch_id=batch_id,
+            )
+        except ValueError as e:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+            raise HTTPException(status_code=400, detail={"error": str(e)})
+        try:
+            await _check_local_batch_model_access(
+                models=executor.state["models"],
+                request=request,
+                user_api_key_dict=user_api_key_dict,
+            )
+        except Exception:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+            raise
+
+        local_batch_executors[batch_id] = executor
+        _start_local_batch(executor)
+        return _local_batch_state_to_litellm_batch(executor.state)
+    except Exception as e:
+        verbose_proxy_logger.exception(
+            "litellm.proxy.local_batch_endpoints.create_local_batch(): Exception occured - {}".format(
+                str(e)
+            )
+        )
+        raise handle_exception_on_proxy(e)
+
+
+@router.get(
+    "/v1/local_batches/{batch_id}",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def retrieve_local_batch(
+    batch_id: str,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """Get the status and request counts of a local batch."""
+    executor = _get_local_batch_executor(batch_id, user_api_key_dict)
+    return _local_batch_state_to_litellm_batch(executor.state)
+
+
+@router.get(
+    "/v1/local_batches/{batch_id}/output",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def get_local_batch_output(
+    batch_id: str,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    Download the results of successful requests (OpenAI batch output format).
+    Results are appended while the batch runs.
+    """
+    executor = _get_local_batch_executor(batch_id, user_api_key_dict)
+    return _local_batch_file_response(executor.output_file_path, batch_id)
+
+
+@router.get(
+    "/v1/local_batches/{batch_id}/errors",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def get_local_batch_errors(
+    batch_id: str,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """Download the results of failed requests (OpenAI batch error file format)."""
+    executor = _get_local_batch_executor(batch_id, user_api_key_dict)
+    return _local_batch_file_response(executor.error_file_path, batch_id)
+
+
+def _local_batch_file_response(path: str, batch_id: str) -> FileResponse:
+    if not os.path.exists(path):
+        raise HTTPException(
+            status_code=404,
+            detail={"error": f"Batch {batch_id} has no results yet"},
+        )
+    return FileResponse(
+        path,
+        media_type="application/jsonl",
+        filename=f"{batch_id}_{os.path.basename(path)}",
+    )
+
+
+@router.post(
+    "/v1/local_batches/{batch_id}/cancel",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def cancel_local_batch(
+    batch_id: str,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    Cancel a local batch. In-flight requests finish and have their results
+    written; no new requests are sent.
+    """
+    executor = _get_local_batch_executor(batch_id, user_api_key_dict)
+    return _local_batch_state_to_litellm_batch(executor.cancel())
+
+
+@router.post(
+    "/v1/local_batches/{batch_id}/resume",
+    dependencies=[Depends(user_api_key_auth)],
+    tags=["batch"],
+)
+async def resume_local_batch(
+    request: Request,
+    batch_id: str,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    Resume a batch from its last checkpoint - e.g. after a proxy restart, or
+    after it failed.
+    """
+    executor = _get_local_batch_executor(batch_id, user_api_key_dict)
+    if executor.state["status"] in ("completed", "cancelled"):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": f"Batch {batch_id} is {executor.state['status']} and cannot be resumed"
+            },
+        )
+    if batch_id not in _local_batch_tasks:
+        # the key may have lost access or run over budget since the batch was created
+        await _check_local_batch_model_access(
+            models=executor.state.get("models") or [],
+            request=request,
+            user_api_key_dict=user_api_key_dict,
+        )
+        _start_local_batch(executor)
+    return _local_batch_state_to_litellm_batch(executor.state)
@@ -1,12 +1,14 @@
 import asyncio
 import json
 import logging
+import time
 import traceback
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Awaitable,
     Callable,
     Literal,
     Optional,
@@ -31,6 +33,12 @@ from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
 from litellm.litellm_core_utils.llm_response_utils.get_headers import (
     get_response_headers,
 )
+from litellm.litellm_core_utils.request_stage_timer import (
+    RequestStage,
+    RequestStageTimer,
+    get_request_stage_timer,
+    time_request_stage,
+)
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.proxy._types import ProxyException, UserAPIKeyAuth
 from litellm.proxy.auth.auth_utils import check_response_size_is_safe
@@ -38,6 +46,7 @@ from litellm.proxy.common_utils.callback_utils import (
     get_logging_caching_headers,
     get_remaining_tokens_and_requests_from_request_data,
 )
+from litellm.proxy.common_utils.event_loop_lag_monitor import event_loop_lag_monitor
 from litellm.proxy.route_llm_request import route_request
 from litellm.proxy.utils import ProxyLogging
 from litellm.router import Router
@@ -151,6 +160,7 @@ async def create_response(
     """
     first_chunk_value: Optional[str] = None
     final_status_code = default_status_code
+    stage_timer = get_request_stage_timer()
 
     try:
         # Handle coroutine that returns a generator
@@ -222,12 +232,20 @@ async def create_response(
         )
 
     async def combined_generator() -> AsyncGenerator[str, None]:
-        if first_chunk_value is not None:
-            with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
-                yield first_chunk_value
-        async for chunk in generator:
-            with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
-                yield chunk
+        streaming_start_time = time.perf_counter()
+        try:
+            if first_chunk_value is not None:
+                with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
+                    yield first_chunk_value
+            async for chunk in generator:
+                with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
+                    yield chunk
+        finally:
+            if stage_timer is not None:
+                stage_timer.record(
+                    RequestStage.STREAMING, time.perf_counter() - streaming_start_time
+                )
+                emit_request_stage_metrics(stage_timer)
 
     return StreamingResponse(
         combined_generator(),
@@ -237,6 +255,42 @@ async def create_response(
     )
 
 
+def emit_request_stage_metrics(stage_timer: Optional[RequestStageTimer]) -> None:
+    """
+    Export a finished request's stage timings to Prometheus, if it is enabled.
+    """
+    if stage_timer is None or not stage_timer.durations:
+        return
+    try:
+        from litellm.integrations.prometheus import PrometheusLogger
+
+        for callback in litellm.callbacks:
+            if isinstance(callback, PrometheusLogger):
+                callback._record_request_stage_metrics(stage_timer.durations)
+                break
+    except Exception as e:
+        verbose_proxy_logger.debug(f"Error emitting request stage metrics: {e}")
+
+
+def _record_upstream_ttfb(
+    stage_timer: Optional[RequestStageTimer], logging_obj: LiteLLMLoggingObj
+) -> None:
+    """
+    Upstream time-to-first-byte, from the provider API call start to the first chunk
+    (streaming) or the full response (non-streaming).
+    """
+    if stage_timer is None or RequestStage.UPSTREAM_TTFB in stage_timer.durations:
+        return
+    api_call_start_time = logging_obj.model_call_details.get("api_call_start_time")
+    if not isinstance(api_call_start_time, datetime):
+        return
+    first_byte_time = logging_obj.completion_start_time or datetime.now()
+    stage_timer.record(
+        RequestStage.UPSTREAM_TTFB,
+        max(0.0, (first_byte_time - api_call_start_time).total_seconds()),
+    )
+
+
 def _override_openai_response_model(
     *,
     response_obj: Any,
@@ -435,8 +489,14 @@ class ProxyBaseLLMRequestProcessing:
                 else None
             ),
             "x-litellm-timeout": str(timeout) if timeout is not None else None,
+            "x-litellm-event-loop-lag-ms": "{:.3f}".format(
+                event_loop_lag_monitor.last_lag_seconds * 1000
+            ),
             **{k: str(v) for k, v in kwargs.items()},
         }
+        stage_timer = get_request_stage_timer()
+        if stage_timer is not None:
+            headers.update(stage_timer.get_response_headers())
         if request_data:
             remaining_tokens_header = (
                 get_remaining_tokens_and_requests_from_request_data(request_data)
@@ -616,9 +676,10 @@ class ProxyBaseLLMRequestProcessing:
 
         self.data["litellm_logging_obj"] = logging_obj
 
-        self.data = await proxy_logging_obj.pre_call_hook(  # type: ignore
-            user_api_key_dict=user_api_key_dict, data=self.data, call_type=route_type  # type: ignore
-        )
+        with time_request_stage(RequestStage.PRE_CALL_HOOKS):
+            self.data = await proxy_logging_obj.pre_call_hook(  # type: ignore
+                user_api_key_dict=user_api_key_dict, data=self.data, call_type=route_type  # type: ignore
+            )
 
         # Apply hierarchical router_settings (Key > Team)
         # Global router_settings are already on the Router object itself.
@@ -781,7 +842,9 @@ class ProxyBaseLLMRequestProcessing:
             *tasks
         )  # run the moderation check in parallel to the actual llm api call
 
-        responses = await llm_responses
+        responses = await self._await_llm_responses(
+            llm_responses=llm_responses, logging_obj=logging_obj
+        )
 
         response = responses[1]
 
@@ -811,6 +874,8 @@ class ProxyBaseLLMRequestProcessing:
         ) or self._is_streaming_response(
             response
         ):  # use generate_responses to stream responses
+            # headers go out before the stream starts - their stage timings
+            # never include post-call hooks (see docs/proxy/response_headers.md)
             custom_headers = ProxyBaseLLMRequestProcessing.get_custom_headers(
                 user_api_key_dict=user_api_key_dict,
                 call_id=logging_obj.litellm_call_id,
@@ -899,8 +964,10 @@ class ProxyBaseLLMRequestProcessing:
                 )
 
         ### CALL HOOKS ### - modify outgoing data
-        response = await proxy_logging_obj.post_call_success_hook(
-            data=self.data, user_api_key_dict=user_api_key_dict, response=response
+        response = await self._run_post_call_success_hook(
+            proxy_logging_obj=proxy_logging_obj,
+            user_api_key_dict=user_api_key_dict,
+            response=response,
         )
 
         # Always return the client-requested model name (not provider-prefixed internal identifiers)
@@ -948,6 +1015,32 @@ class ProxyBaseLLMRequestProcessing:
 
         return response
 
+    @staticmethod
+    async def _await_llm_responses(
+        llm_responses: Awaitable[Any], logging_obj: LiteLLMLoggingObj
+    ) -> Any:
+        """Await the LLM API call (and the checks running alongside it), timed as a request stage"""
+        with time_request_stage(RequestStage.LLM_API_CALL):
+            responses = await llm_responses
+        _record_upstream_ttfb(
+            stage_timer=get_request_stage_timer(), logging_obj=logging_obj
+        )
+        return responses
+
+    async def _run_post_call_success_hook(
+        self,
+        proxy_logging_obj: ProxyLogging,
+        user_api_key_dict: UserAPIKeyAuth,
+        response: Any,
+    ) -> Any:
+        """Run the post-call success hooks - the last timed stage of a non-streaming request"""
+        with time_request_stage(RequestStage.POST_CALL_HOOKS):
+            response = await proxy_logging_obj.post_call_success_hook(
+                data=self.data, user_api_key_dict=user_api_key_dict, response=response
+            )
+        emit_request_stage_metrics(get_request_stage_timer())
+        return response
+
     async def base_passthrough_process_llm_request(
         self,
         request: Request,
@@ -9,11 +9,12 @@ from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from litellm import get_secret_str
 from litellm._logging import verbose_proxy_logger
 from litellm.constants import PYTHON_GC_THRESHOLD
-from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 
 router = APIRouter()
@@ -669,6 +670,70 @@ async def configure_gc_thresholds_endpoint(
     }
 
 
+@router.post("/debug/profile/cpu", include_in_schema=False)
+async def profile_cpu_endpoint(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+    duration_seconds: float = Query(
+        10.0, gt=0, le=120, description="How long to sample for (max 120s)"
+    ),
+    interval_ms: float = Query(
+        10.0, ge=1, le=1000, description="Sampling interval in milliseconds"
+    ),
+    format: str = Query(
+        "collapsed", description="Output format: 'collapsed' or 'speedscope'"
+    ),
+):
+    """
+    Time-boxed sampling CPU profile of this worker's event loop.
+
+    A background thread samples the event-loop thread's stack every `interval_ms`,
+    attributing samples to the running asyncio task name. No per-function wiring
+    is needed and the overhead is a few microseconds per sample (~1% at 10ms).
+
+    Returns:
+    - format=collapsed: folded stacks (`frame;frame;frame count`), for flamegraph.pl / speedscope
+    - format=speedscope: speedscope.app JSON profile
+
+    Example:
+    curl -X POST "http://localhost:4000/debug/profile/cpu?duration_seconds=30" -H "Authorization: Bearer sk-1234" > profile.folded
+    """
+    from litellm.proxy.common_utils.stack_sampler import profile_event_loop
+
+    if user_api_key_dict.user_role != LitellmUserRoles.PROXY_ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "Only proxy admins can profile the proxy. Your role={}".format(
+                    user_api_key_dict.user_role
+                )
+            },
+        )
+    if format not in ("collapsed", "speedscope"):
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "format must be one of 'collapsed', 'speedscope'"},
+        )
+
+    try:
+        sampler = await profile_event_loop(
+            duration_seconds=duration_seconds,
+            interval_seconds=interval_ms / 1000.0,
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail={"error": str(e)})
+
+    headers = {
+        "x-litellm-profile-samples": str(sampler.num_samples),
+        "x-litellm-profile-overhead": "{:.4f}".format(sampler.overhead_ratio),
+    }
+    if format == "speedscope":
+        return JSONResponse(
+            content=sampler.to_speedscope(name="litellm-proxy-{}".format(os.getpid())),
+            headers=headers,
+        )
+    return PlainTextResponse(content=sampler.to_collapsed(), headers=headers)
+
+
 @router.get("/otel-spans", include_in_schema=False)
 async def get_otel_spans():
     from litellm.proxy.proxy_server import open_telemetry_logger
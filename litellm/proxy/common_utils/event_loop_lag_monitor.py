@@ -0,0 +1,68 @@
+"""
+Event loop lag monitor for the proxy.
+
+Sleeps for a fixed interval and measures how late the loop woke it up. Any delay
+beyond the interval is time the loop spent running something else without
+yielding - i.e. blocking work on the proxy side, not upstream latency.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import litellm
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import EVENT_LOOP_LAG_MONITOR_INTERVAL_SECONDS
+
+
+class EventLoopLagMonitor:
+    def __init__(self, interval_seconds: float = EVENT_LOOP_LAG_MONITOR_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.last_lag_seconds: float = 0.0
+        self.max_lag_seconds: float = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0:
+            verbose_proxy_logger.debug("EventLoopLagMonitor: disabled (interval <= 0)")
+            return
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(
+            self._run(), name="litellm-event-loop-lag-monitor"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected_wakeup = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag_seconds = max(0.0, time.perf_counter() - expected_wakeup)
+            self._record(lag_seconds)
+
+    def _record(self, lag_seconds: float) -> None:
+        self.last_lag_seconds = lag_seconds
+        self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+        try:
+            from litellm.integrations.prometheus import PrometheusLogger
+
+            for callback in litellm.callbacks:
+                if isinstance(callback, PrometheusLogger):
+                    callback._record_event_loop_lag(lag_seconds)
+                    break
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                "EventLoopLagMonitor: failed to record lag: %s", str(e)
+            )
+
+
+event_loop_lag_monitor = EventLoopLagMonitor()
@@ -1,3 +1,4 @@
+import io
 import json
 import re
 from typing import Any, Collection, Dict, List, Optional
@@ -234,8 +235,65 @@ async def get_form_data(request: Request) -> Dict[str, Any]:
     return parsed_form_data
 
 
+class UploadFileStream(io.RawIOBase):
+    """
+    Read-only, seekable view of an UploadFile's spooled body.
+
+    Starlette parses multipart uploads incrementally into a SpooledTemporaryFile
+    (in memory up to 1MB, then on disk). Passing this view to the provider call
+    instead of `await file.read()` keeps the upload out of memory - httpx / the
+    OpenAI SDK read it in chunks while sending the request. Code that needs the
+    bytes (e.g. `extract_file_data`, JSONL model replacement) reads it on demand
+    and seeks back to the start.
+    """
+
+    def __init__(self, upload_file: UploadFile):
+        super().__init__()
+        self._file = upload_file.file
+        self._file.seek(0)
+        self.name = upload_file.filename
+        self.content_type = upload_file.content_type
+        self.size = upload_file.size
+
+    def __len__(self) -> int:
+        # hooks written for bytes content use len() for the file size
+        if self.size is not None:
+            return self.size
+        position = self._file.tell()
+        size = self._file.seek(0, io.SEEK_END)
+        self._file.seek(position)
+        return size
+
+    def __bool__(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._file.read(-1 if size is None else size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        return self._file.readline(-1 if size is None else size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+
 async def convert_upload_files_to_file_data(
-    form_data: Dict[str, Any]
+    form_data: Dict[str, Any],
+    stream_files: bool = False,
 ) -> Dict[str, Any]:
     """
     Convert FastAPI UploadFile objects to file data tuples for litellm.
@@ -245,6 +303,8 @@ async def convert_upload_files_to_file_data(
     
     Args:
         form_data: Dictionary containing form data with potential UploadFile objects
+        stream_files: Pass each file as an `UploadFileStream` instead of reading it
+            into bytes - for provider calls that accept file objects
         
     Returns:
         Dictionary with UploadFile objects converted to file data tuples
@@ -263,7 +323,9 @@ async def convert_upload_files_to_file_data(
             if value and hasattr(value[0], "read"):
                 files = []
                 for f in value:
-                    file_content = await f.read()
+                    file_content = (
+                        UploadFileStream(f) if stream_files else await f.read()
+                    )
                     # Create tuple: (filename, content, content_type)
                     files.append((f.filename, file_content, f.content_type))
                 data[key] = files
@@ -271,7 +333,9 @@ async def convert_upload_files_to_file_data(
                 data[key] = value
         elif hasattr(value, "read"):
             # Single UploadFile object - read and convert to list for consistency
-            file_content = await value.read()
+            file_content = (
+                UploadFileStream(value) if stream_files else await value.read()
+            )
             data[key] = [(value.filename, file_content, value.content_type)]
         else:
             # Regular form field
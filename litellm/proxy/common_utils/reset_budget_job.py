@@ -2,28 +2,51 @@ import asyncio
 import json
 import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from litellm._logging import verbose_proxy_logger
-from litellm.proxy._types import (
-    LiteLLM_BudgetTableFull,
-    LiteLLM_EndUserTable,
-    LiteLLM_TeamTable,
-    LiteLLM_UserTable,
-    LiteLLM_VerificationToken,
+from litellm.caching.dual_cache import DualCache
+from litellm.constants import (
+    BUDGET_RESET_PAGE_SIZE,
+    DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL,
 )
+from litellm.proxy._types import LiteLLM_BudgetTableFull, LiteLLM_EndUserTable
 from litellm.proxy.utils import PrismaClient, ProxyLogging
 from litellm.types.services import ServiceTypes
 
+# entity type -> (table name, primary key column, has `expires` column)
+_BUDGET_RESET_TABLES: Dict[str, Tuple[str, str, bool]] = {
+    "key": ("LiteLLM_VerificationToken", "token", True),
+    "user": ("LiteLLM_UserTable", "user_id", False),
+    "team": ("LiteLLM_TeamTable", "team_id", False),
+}
+
+_NOT_EXPIRED_FILTER = 'AND ("expires" IS NULL OR "expires" > {param}::timestamp)'
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    """Prisma `DateTime` columns are `timestamp(3)` (UTC, no tz info)."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
 
 class ResetBudgetJob:
     """
     Resets the budget for all the keys, users, and teams that need it
     """
 
-    def __init__(self, proxy_logging_obj: ProxyLogging, prisma_client: PrismaClient):
+    def __init__(
+        self,
+        proxy_logging_obj: ProxyLogging,
+        prisma_client: PrismaClient,
+        user_api_key_cache: Optional[DualCache] = None,
+        page_size: int = BUDGET_RESET_PAGE_SIZE,
+    ):
         self.proxy_logging_obj: ProxyLogging = proxy_logging_obj
         self.prisma_client: PrismaClient = prisma_client
+        self.user_api_key_cache: Optional[DualCache] = user_api_key_cache
+        self.page_size: int = page_size
 
     async def reset_budget(
         self,
@@ -214,159 +237,85 @@ class ResetBudgetJob:
     async def reset_budget_for_litellm_keys(self):
         """
         Resets the budget for all the litellm keys
+        """
+        await self._reset_budget_for_entity(entity_type="key")
 
-        Catches Exceptions and logs them
+    async def reset_budget_for_litellm_users(self):
         """
-        now = datetime.utcnow()
-        start_time = time.time()
-        keys_to_reset: Optional[List[LiteLLM_VerificationToken]] = None
-        try:
-            keys_to_reset = await self.prisma_client.get_data(
-                table_name="key", query_type="find_all", expires=now, reset_at=now
-            )
-            verbose_proxy_logger.debug(
-                "Keys to reset %s", json.dumps(keys_to_reset, indent=4, default=str)
-            )
-            updated_keys: List[LiteLLM_VerificationToken] = []
-            failed_keys = []
-            if keys_to_reset is not None and len(keys_to_reset) > 0:
-                for key in keys_to_reset:
-                    try:
-                        updated_key = await ResetBudgetJob._reset_budget_for_key(
-                            key=key, current_time=now
-                        )
-                        if updated_key is not None:
-                            updated_keys.append(updated_key)
-                        else:
-                            failed_keys.append(
-                                {"key": key, "error": "Returned None without exception"}
-                            )
-                    except Exception as e:
-                        failed_keys.append({"key": key, "error": str(e)})
-                        verbose_proxy_logger.exception(
-                            "Failed to reset budget for key: %s", key
-                        )
+        Resets the budget for all LiteLLM Internal Users if their budget has expired
+        """
+        await self._reset_budget_for_entity(entity_type="user")
 
-                verbose_proxy_logger.debug(
-                    "Updated keys %s", json.dumps(updated_keys, indent=4, default=str)
-                )
+    async def reset_budget_for_litellm_teams(self):
+        """
+        Resets the budget for all LiteLLM Internal Teams if their budget has expired
+        """
+        await self._reset_budget_for_entity(entity_type="team")
 
-                if updated_keys:
-                    await self.prisma_client.update_data(
-                        query_type="update_many",
-                        data_list=updated_keys,
-                        table_name="key",
-                    )
+    async def _reset_budget_for_entity(
+        self, entity_type: Literal["key", "team", "user"]
+    ):
+        """
+        Set-based budget reset for keys, users or teams.
 
-            end_time = time.time()
-            if len(failed_keys) > 0:  # If any keys failed to reset
-                raise Exception(
-                    f"Failed to reset {len(failed_keys)} keys: {json.dumps(failed_keys, default=str)}"
-                )
+        Rows are never loaded into memory. For every distinct `budget_duration` due
+        for a reset, runs bounded `UPDATE ... RETURNING` pages until no due rows are
+        left, and patches the matching objects in `user_api_key_cache` per page.
 
-            asyncio.create_task(
-                self.proxy_logging_obj.service_logging_obj.async_service_success_hook(
-                    service=ServiceTypes.RESET_BUDGET_JOB,
-                    duration=end_time - start_time,
-                    call_type="reset_budget_keys",
-                    start_time=start_time,
-                    end_time=end_time,
-                    event_metadata={
-                        "num_keys_found": len(keys_to_reset) if keys_to_reset else 0,
-                        "keys_found": json.dumps(keys_to_reset, indent=4, default=str),
-                        "num_keys_updated": len(updated_keys),
-                        "keys_updated": json.dumps(updated_keys, indent=4, default=str),
-                        "num_keys_failed": len(failed_keys),
-                        "keys_failed": json.dumps(failed_keys, indent=4, default=str),
-                    },
-                )
-            )
-        except Exception as e:
-            end_time = time.time()
-            asyncio.create_task(
-                self.proxy_logging_obj.service_logging_obj.async_service_failure_hook(
-                    service=ServiceTypes.RESET_BUDGET_JOB,
-                    duration=end_time - start_time,
-                    error=e,
-                    call_type="reset_budget_keys",
-                    start_time=start_time,
-                    end_time=end_time,
-                    event_metadata={
-                        "num_keys_found": len(keys_to_reset) if keys_to_reset else 0,
-                        "keys_found": json.dumps(keys_to_reset, indent=4, default=str),
-                    },
-                )
-            )
-            verbose_proxy_logger.exception("Failed to reset budget for keys: %s", e)
-
-    async def reset_budget_for_litellm_users(self):
-        """
-        Resets the budget for all LiteLLM Internal Users if their budget has expired
+        Catches Exceptions and logs them
         """
         now = datetime.utcnow()
         start_time = time.time()
-        users_to_reset: Optional[List[LiteLLM_UserTable]] = None
+        call_type = "reset_budget_{}s".format(entity_type)
+        num_updated = 0
+        num_durations = 0
         try:
-            users_to_reset = await self.prisma_client.get_data(
-                table_name="user", query_type="find_all", reset_at=now
+            table_name, pk_column, _ = _BUDGET_RESET_TABLES[entity_type]
+            budget_durations = await self._get_due_budget_durations(
+                entity_type=entity_type, now=now
             )
-            updated_users: List[LiteLLM_UserTable] = []
-            failed_users = []
-            if users_to_reset is not None and len(users_to_reset) > 0:
-                for user in users_to_reset:
-                    try:
-                        updated_user = await ResetBudgetJob._reset_budget_for_user(
-                            user=user, current_time=now
-                        )
-                        if updated_user is not None:
-                            updated_users.append(updated_user)
-                        else:
-                            failed_users.append(
-                                {
-                                    "user": user,
-                                    "error": "Returned None without exception",
-                                }
-                            )
-                    except Exception as e:
-                        failed_users.append({"user": user, "error": str(e)})
-                        verbose_proxy_logger.exception(
-                            "Failed to reset budget for user: %s", user
-                        )
+            num_durations = len(budget_durations)
+            for budget_duration in budget_durations:
+                budget_reset_at: Optional[datetime] = None
+                if budget_duration is not None:
+                    from litellm.proxy.common_utils.timezone_utils import (
+                        get_budget_reset_time,
+                    )
 
-                verbose_proxy_logger.debug(
-                    "Updated users %s", json.dumps(updated_users, indent=4, default=str)
-                )
-                if updated_users:
-                    await self.prisma_client.update_data(
-                        query_type="update_many",
-                        data_list=updated_users,
-                        table_name="user",
+                    budget_reset_at = get_budget_reset_time(
+                        budget_duration=budget_duration
                     )
 
-            end_time = time.time()
-            if len(failed_users) > 0:  # If any users failed to reset
-                raise Exception(
-                    f"Failed to reset {len(failed_users)} users: {json.dumps(failed_users, default=str)}"
-                )
+                while True:
+                    reset_ids = await self._reset_budget_page(
+                        entity_type=entity_type,
+                        now=now,
+                        budget_duration=budget_duration,
+                        budget_reset_at=budget_reset_at,
+                    )
+                    num_updated += len(reset_ids)
+                    await self._reset_cached_budget_objects(
+                        entity_type=entity_type,
+                        ids=reset_ids,
+                        budget_reset_at=budget_reset_at,
+                    )
+                    if len(reset_ids) < self.page_size:
+                        break
 
+            verbose_proxy_logger.debug(
+                "Reset budget for %s rows in %s", num_updated, table_name
+            )
+            end_time = time.time()
             asyncio.create_task(
                 self.proxy_logging_obj.service_logging_obj.async_service_success_hook(
                     service=ServiceTypes.RESET_BUDGET_JOB,
                     duration=end_time - start_time,
-                    call_type="reset_budget_users",
+                    call_type=call_type,
                     start_time=start_time,
                     end_time=end_time,
                     event_metadata={
-                        "num_users_found": len(users_to_reset) if users_to_reset else 0,
-                        "users_found": json.dumps(
-                            users_to_reset, indent=4, default=str
-                        ),
-                        "num_users_updated": len(updated_users),
-                        "users_updated": json.dumps(
-                            updated_users, indent=4, default=str
-                        ),
-                        "num_users_failed": len(failed_users),
-                        "users_failed": json.dumps(failed_users, indent=4, default=str),
+                        "num_budget_durations": num_durations,
+                        "num_{}s_updated".format(entity_type): num_updated,
                     },
                 )
             )
@@ -377,156 +326,140 @@ class ResetBudgetJob:
                     service=ServiceTypes.RESET_BUDGET_JOB,
                     duration=end_time - start_time,
                     error=e,
-                    call_type="reset_budget_users",
+                    call_type=call_type,
                     start_time=start_time,
                     end_time=end_time,
                     event_metadata={
-                        "num_users_found": len(users_to_reset) if users_to_reset else 0,
-                        "users_found": json.dumps(
-                            users_to_reset, indent=4, default=str
-                        ),
+                        "num_budget_durations": num_durations,
+                        "num_{}s_updated".format(entity_type): num_updated,
                     },
                 )
             )
-            verbose_proxy_logger.exception("Failed to reset budget for users: %s", e)
+            verbose_proxy_logger.exception(
+                "Failed to reset budget for %ss: %s", entity_type, e
+            )
 
-    async def reset_budget_for_litellm_teams(self):
+    async def _get_due_budget_durations(
+        self, entity_type: Literal["key", "team", "user"], now: datetime
+    ) -> List[Optional[str]]:
         """
-        Resets the budget for all LiteLLM Internal Teams if their budget has expired
+        Returns the distinct `budget_duration` values of all rows due for a reset
         """
-        now = datetime.utcnow()
-        start_time = time.time()
-        teams_to_reset: Optional[List[LiteLLM_TeamTable]] = None
-        try:
-            teams_to_reset = await self.prisma_client.get_data(
-                table_name="team", query_type="find_all", reset_at=now
-            )
-            updated_teams: List[LiteLLM_TeamTable] = []
-            failed_teams = []
-            if teams_to_reset is not None and len(teams_to_reset) > 0:
-                for team in teams_to_reset:
-                    try:
-                        updated_team = await ResetBudgetJob._reset_budget_for_team(
-                            team=team, current_time=now
-                        )
-                        if updated_team is not None:
-                            updated_teams.append(updated_team)
-                        else:
-                            failed_teams.append(
-                                {
-                                    "team": team,
-                                    "error": "Returned None without exception",
-                                }
-                            )
-                    except Exception as e:
-                        failed_teams.append({"team": team, "error": str(e)})
-                        verbose_proxy_logger.exception(
-                            "Failed to reset budget for team: %s", team
-                        )
+        table_name, _, has_expires = _BUDGET_RESET_TABLES[entity_type]
+        sql_query = f"""
+        SELECT DISTINCT "budget_duration"
+        FROM "{table_name}"
+        WHERE "budget_reset_at" < $1::timestamp
+        {_NOT_EXPIRED_FILTER.format(param="$1") if has_expires else ""}
+        """
+        rows = await self.prisma_client.db.query_raw(sql_query, now.isoformat())
+        return [row["budget_duration"] for row in rows or []]
 
-                verbose_proxy_logger.debug(
-                    "Updated teams %s", json.dumps(updated_teams, indent=4, default=str)
-                )
-                if updated_teams:
-                    await self.prisma_client.update_data(
-                        query_type="update_many",
-                        data_list=updated_teams,
-                        table_name="team",
-                    )
+    async def _reset_budget_page(
+        self,
+        entity_type: Literal["key", "team", "user"],
+        now: datetime,
+        budget_duration: Optional[str],
+        budget_reset_at: Optional[datetime],
+    ) -> List[str]:
+        """
+        Resets `spend` (and moves `budget_reset_at` forward) for at most `page_size` due rows.
 
-            end_time = time.time()
-            if len(failed_teams) > 0:  # If any teams failed to reset
-                raise Exception(
-                    f"Failed to reset {len(failed_teams)} teams: {json.dumps(failed_teams, default=str)}"
-                )
+        Rows without a `budget_duration` keep their `budget_reset_at`, so they only
+        match while their spend is non-zero.
 
-            asyncio.create_task(
-                self.proxy_logging_obj.service_logging_obj.async_service_success_hook(
-                    service=ServiceTypes.RESET_BUDGET_JOB,
-                    duration=end_time - start_time,
-                    call_type="reset_budget_teams",
-                    start_time=start_time,
-                    end_time=end_time,
-                    event_metadata={
-                        "num_teams_found": len(teams_to_reset) if teams_to_reset else 0,
-                        "teams_found": json.dumps(
-                            teams_to_reset, indent=4, default=str
-                        ),
-                        "num_teams_updated": len(updated_teams),
-                        "teams_updated": json.dumps(
-                            updated_teams, indent=4, default=str
-                        ),
-                        "num_teams_failed": len(failed_teams),
-                        "teams_failed": json.dumps(failed_teams, indent=4, default=str),
-                    },
-                )
+        Returns the ids of the rows that were reset.
+        """
+        table_name, pk_column, has_expires = _BUDGET_RESET_TABLES[entity_type]
+        if budget_duration is None or budget_reset_at is None:
+            sql_query = f"""
+            UPDATE "{table_name}"
+            SET "spend" = 0
+            WHERE "{pk_column}" IN (
+                SELECT "{pk_column}"
+                FROM "{table_name}"
+                WHERE "budget_reset_at" < $1::timestamp
+                AND "budget_duration" IS NULL
+                AND "spend" <> 0
+                {_NOT_EXPIRED_FILTER.format(param="$1") if has_expires else ""}
+                LIMIT $2
+                FOR UPDATE SKIP LOCKED
             )
-        except Exception as e:
-            end_time = time.time()
-            asyncio.create_task(
-                self.proxy_logging_obj.service_logging_obj.async_service_failure_hook(
-                    service=ServiceTypes.RESET_BUDGET_JOB,
-                    duration=end_time - start_time,
-                    error=e,
-                    call_type="reset_budget_teams",
-                    start_time=start_time,
-                    end_time=end_time,
-                    event_metadata={
-                        "num_teams_found": len(teams_to_reset) if teams_to_reset else 0,
-                        "teams_found": json.dumps(
-                            teams_to_reset, indent=4, default=str
-                        ),
-                    },
-                )
+            RETURNING "{pk_column}" AS id
+            """
+            params: tuple = (now.isoformat(), self.page_size)
+        else:
+            sql_query = f"""
+            UPDATE "{table_name}"
+            SET "spend" = 0, "budget_reset_at" = $2::timestamp
+            WHERE "{pk_column}" IN (
+                SELECT "{pk_column}"
+                FROM "{table_name}"
+                WHERE "budget_reset_at" < $1::timestamp
+                AND "budget_duration" = $3
+                {_NOT_EXPIRED_FILTER.format(param="$1") if has_expires else ""}
+                LIMIT $4
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING "{pk_column}" AS id
+            """
+            params = (
+                now.isoformat(),
+                _to_naive_utc(budget_reset_at).isoformat(),
+                budget_duration,
+                self.page_size,
             )
-            verbose_proxy_logger.exception("Failed to reset budget for teams: %s", e)
+        rows = await self.prisma_client.db.query_raw(sql_query, *params)
+        return [row["id"] for row in rows or []]
 
-    @staticmethod
-    async def _reset_budget_common(
-        item: Union[LiteLLM_TeamTable, LiteLLM_UserTable, LiteLLM_VerificationToken],
-        current_time: datetime,
-        item_type: Literal["key", "team", "user"],
+    async def _reset_cached_budget_objects(
+        self,
+        entity_type: Literal["key", "team", "user"],
+        ids: List[str],
+        budget_reset_at: Optional[datetime],
     ):
         """
-        In-place, updates spend=0, and sets budget_reset_at to current_time + budget_duration
-
-        Common logic for resetting budget for a team, user, or key
+        Zero out spend on the cached key / team / user objects that were just reset,
+        so auth checks don't keep rejecting them until the cache entry expires.
         """
+        if self.user_api_key_cache is None or len(ids) == 0:
+            return
         try:
-            item.spend = 0.0
-            if hasattr(item, "budget_duration") and item.budget_duration is not None:
-                # Get standardized reset time based on budget duration
-                from litellm.proxy.common_utils.timezone_utils import (
-                    get_budget_reset_time,
-                )
+            if entity_type == "team":
+                cache_keys = ["team_id:{}".format(_id) for _id in ids]
+            else:
+                cache_keys = list(ids)
 
-                item.budget_reset_at = get_budget_reset_time(
-                    budget_duration=item.budget_duration
+            cached_objects = await self.user_api_key_cache.async_batch_get_cache(
+                keys=cache_keys
+            )
+            values_to_update_in_cache: List[Tuple[str, Any]] = []
+            for cache_key, cached_object in zip(cache_keys, cached_objects or []):
+                if cached_object is None:
+                    continue
+                if isinstance(cached_object, dict):
+                    cached_object["spend"] = 0.0
+                    if budget_reset_at is not None:
+                        cached_object["budget_reset_at"] = budget_reset_at
+                else:
+                    cached_object.spend = 0.0
+                    if budget_reset_at is not None and hasattr(
+                        cached_object, "budget_reset_at"
+                    ):
+                        cached_object.budget_reset_at = budget_reset_at
+                values_to_update_in_cache.append((cache_key, cached_object))
+
+            if len(values_to_update_in_cache) > 0:
+                await self.user_api_key_cache.async_set_cache_pipeline(
+                    cache_list=values_to_update_in_cache,
+                    ttl=DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL,
                 )
-            return item
         except Exception as e:
             verbose_proxy_logger.exception(
-                "Error resetting budget for %s: %s. Item: %s", item_type, e, item
+                "Failed to update cached %s objects after budget reset: %s",
+                entity_type,
+                e,
             )
-            raise e
-
-    @staticmethod
-    async def _reset_budget_for_team(
-        team: LiteLLM_TeamTable, current_time: datetime
-    ) -> Optional[LiteLLM_TeamTable]:
-        await ResetBudgetJob._reset_budget_common(
-            item=team, current_time=current_time, item_type="team"
-        )
-        return team
-
-    @staticmethod
-    async def _reset_budget_for_user(
-        user: LiteLLM_UserTable, current_time: datetime
-    ) -> Optional[LiteLLM_UserTable]:
-        await ResetBudgetJob._reset_budget_common(
-            item=user, current_time=current_time, item_type="user"
-        )
-        return user
 
     @staticmethod
     async def _reset_budget_for_enduser(
@@ -571,12 +504,3 @@ class ResetBudgetJob:
             )
             raise e
         return budget
-
-    @staticmethod
-    async def _reset_budget_for_key(
-        key: LiteLLM_VerificationToken, current_time: datetime
-    ) -> Optional[LiteLLM_VerificationToken]:
-        await ResetBudgetJob._reset_budget_common(
-            item=key, current_time=current_time, item_type="key"
-        )
-        return key
@@ -0,0 +1,243 @@
+"""
+Low-overhead sampling CPU profiler for the proxy event loop.
+
+A background thread periodically reads the event-loop thread's current Python
+stack via `sys._current_frames()` and aggregates it into collapsed stacks. The
+running asyncio task (if any) is recorded as the root frame, so time can be
+attributed per task name.
+
+Unlike `performance_utils.py` (cProfile / line_profiler), nothing is wired per
+function and the profiled thread is never instrumented - it only pays for the
+GIL hand-off while the sampler walks its frames.
+
+Output formats:
+- `collapsed`: Brendan Gregg's folded stacks (`root;child;leaf <count>`), for flamegraph.pl / speedscope / inferno
+- `speedscope`: speedscope.app "sampled" JSON profile
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+
+# (qualname, filename, first line number)
+_FrameKey = Tuple[str, str, int]
+_StackKey = Tuple[_FrameKey, ...]
+
+SamplerOutputFormat = Literal["collapsed", "speedscope"]
+
+_SAMPLER_THREAD_NAME = "litellm-stack-sampler"
+_MAX_STACK_DEPTH = 128
+
+
+class StackSampler:
+    """
+    Samples the stack of a single thread (by default the calling thread, i.e. the event loop)
+    at a fixed interval from a daemon thread.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.01,
+        target_thread_id: Optional[int] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_stack_depth: int = _MAX_STACK_DEPTH,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self.interval_seconds = interval_seconds
+        self.target_thread_id = (
+            target_thread_id if target_thread_id is not None else threading.get_ident()
+        )
+        self.loop = loop
+        self.max_stack_depth = max_stack_depth
+
+        self.stacks: Counter = Counter()
+        self.num_samples: int = 0
+        self.sampling_time_seconds: float = 0.0
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.start_time = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name=_SAMPLER_THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, self.interval_seconds * 10))
+        self.end_time = time.perf_counter()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            sample_start = time.perf_counter()
+            try:
+                self._take_sample()
+            except Exception as e:
+                verbose_proxy_logger.debug("StackSampler: failed to take sample: %s", e)
+            self.sampling_time_seconds += time.perf_counter() - sample_start
+
+    def _take_sample(self) -> None:
+        frame = sys._current_frames().get(self.target_thread_id)
+        if frame is None:
+            return
+        stack = self._walk_frame(frame)
+        task_name = self._current_task_name()
+        if task_name is not None:
+            stack = (("task:" + task_name, "", 0),) + stack
+        with self._lock:
+            self.stacks[stack] += 1
+            self.num_samples += 1
+
+    def _walk_frame(self, frame: Optional[FrameType]) -> _StackKey:
+        """Returns the stack root-first"""
+        frames: List[_FrameKey] = []
+        while frame is not None and len(frames) < self.max_stack_depth:
+            code = frame.f_code
+            frames.append(
+                (
+                    getattr(code, "co_qualname", code.co_name),
+                    code.co_filename,
+                    code.co_firstlineno,
+                )
+            )
+            frame = frame.f_back
+        frames.reverse()
+        return tuple(frames)
+
+    def _current_task_name(self) -> Optional[str]:
+        if self.loop is None:
+            return None
+        try:
+            task = asyncio.current_task(loop=self.loop)
+        except Exception:
+            return None
+        if task is None:
+            return None
+        return task.get_name()
+
+    @property
+    def overhead_ratio(self) -> float:
+        """Fraction of wall time spent taking samples"""
+        if self.start_time is None:
+            return 0.0
+        wall_time = (self.end_time or time.perf_counter()) - self.start_time
+        if wall_time <= 0:
+            return 0.0
+        return self.sampling_time_seconds / wall_time
+
+    def _snapshot(self) -> List[Tuple[_StackKey, int]]:
+        with self._lock:
+            return self.stacks.most_common()
+
+    @staticmethod
+    def _format_frame(frame: _FrameKey) -> str:
+        name, filename, lineno = frame
+        if not filename:
+            return name
+        return "{} ({}:{})".format(name, os.path.basename(filename), lineno)
+
+    def to_collapsed(self) -> str:
+        """Folded stacks, one `frame;frame;frame count` line per unique stack"""
+        lines = []
+        for stack, count in self._snapshot():
+            frames = ";".join(
+                self._format_frame(frame).replace(";", ":") for frame in stack
+            )
+            lines.append("{} {}".format(frames, count))
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, name: str = "litellm-proxy") -> Dict[str, Any]:
+        """speedscope.app file format, single 'sampled' profile"""
+        frame_index: Dict[_FrameKey, int] = {}
+        frames: List[Dict[str, Any]] = []
+        samples: List[List[int]] = []
+        weights: List[int] = []
+        for stack, count in self._snapshot():
+            sample = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frame_name, filename, lineno = frame
+                    speedscope_frame: Dict[str, Any] = {"name": frame_name}
+                    if filename:
+                        speedscope_frame["file"] = filename
+                        speedscope_frame["line"] = lineno
+                    frames.append(speedscope_frame)
+                sample.append(frame_index[frame])
+            samples.append(sample)
+            weights.append(count)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+            "name": name,
+            "activeProfileIndex": 0,
+            "exporter": "litellm",
+        }
+
+
+# Only one profile can run per process at a time
+_active_sampler_lock = asyncio.Lock()
+
+
+async def profile_event_loop(
+    duration_seconds: float,
+    interval_seconds: float = 0.01,
+) -> StackSampler:
+    """
+    Sample the running event loop for `duration_seconds`.
+
+    Must be awaited from the event loop being profiled. Raises RuntimeError if
+    another profile is already running.
+    """
+    if _active_sampler_lock.locked():
+        raise RuntimeError("A CPU profile is already running")
+    async with _active_sampler_lock:
+        sampler = StackSampler(
+            interval_seconds=interval_seconds,
+            target_thread_id=threading.get_ident(),
+            loop=asyncio.get_running_loop(),
+        )
+        sampler.start()
+        try:
+            await asyncio.sleep(duration_seconds)
+        finally:
+            sampler.stop()
+        verbose_proxy_logger.info(
+            "CPU profile finished: samples=%s, overhead=%.4f",
+            sampler.num_samples,
+            sampler.overhead_ratio,
+        )
+        return sampler
@@ -1,10 +1,11 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from litellm._logging import verbose_proxy_logger
 from litellm.caching import RedisCache
 from litellm.constants import (
+    SPEND_LOG_ARCHIVE_BATCH_SIZE,
     SPEND_LOG_CLEANUP_BATCH_SIZE,
     SPEND_LOG_CLEANUP_JOB_NAME,
     SPEND_LOG_RUN_LOOPS,
@@ -18,6 +19,9 @@ class SpendLogCleanup:
     Handles cleaning up old spend logs based on maximum retention period.
     Deletes logs in batches to prevent timeouts.
     Uses PodLockManager to ensure only one pod runs cleanup in multi-pod deployments.
+
+    If `spend_logs_archive` is configured, each batch is written to the archive
+    before it is deleted.
     """
 
     def __init__(self, general_settings=None, redis_cache: Optional[RedisCache] = None):
@@ -104,6 +108,64 @@ class SpendLogCleanup:
 
         return total_deleted
 
+    async def _archive_and_delete_old_logs(
+        self, prisma_client: PrismaClient, cutoff_date: datetime, archive: Any
+    ) -> int:
+        """
+        Stream logs older than the cutoff out in (startTime, request_id) keyset order,
+        archive each chunk, and only delete a chunk once its archive write succeeded.
+        Returns the total number of logs archived and deleted.
+        """
+        total_archived = 0
+        run_count = 0
+        last_start_time: Optional[datetime] = None
+        last_request_id: Optional[str] = None
+        while True:
+            if run_count > SPEND_LOG_RUN_LOOPS:
+                verbose_proxy_logger.info(
+                    "Max archive batches reached, rest of the logs will be archived in next run"
+                )
+                break
+
+            where: dict = {"startTime": {"lt": cutoff_date}}
+            if last_start_time is not None:
+                where["OR"] = [
+                    {"startTime": {"gt": last_start_time}},
+                    {
+                        "startTime": last_start_time,
+                        "request_id": {"gt": last_request_id},
+                    },
+                ]
+            logs_to_archive = await prisma_client.db.litellm_spendlogs.find_many(
+                where=where,  # type: ignore
+                order=[{"startTime": "asc"}, {"request_id": "asc"}],
+                take=SPEND_LOG_ARCHIVE_BATCH_SIZE,
+            )
+            if not logs_to_archive:
+                verbose_proxy_logger.info(
+                    f"No more logs to archive. Total archived: {total_archived}"
+                )
+                break
+
+            keys = await archive.archive_spend_logs(logs_to_archive)
+            verbose_proxy_logger.info(
+                f"Archived {len(logs_to_archive)} logs to {len(keys)} file(s)"
+            )
+
+            request_ids = [log.request_id for log in logs_to_archive]
+            await prisma_client.db.litellm_spendlogs.delete_many(
+                where={"request_id": {"in": request_ids}}
+            )
+
+            last_start_time = logs_to_archive[-1].startTime
+            last_request_id = logs_to_archive[-1].request_id
+            total_archived += len(logs_to_archive)
+            run_count += 1
+
+            await asyncio.sleep(0.1)
+
+        return total_archived
+
     async def cleanup_old_spend_logs(self, prisma_client: PrismaClient) -> None:
         """
         Main cleanup function. Deletes old spend logs in batches.
@@ -145,8 +207,18 @@ class SpendLogCleanup:
                 f"Deleting logs older than {cutoff_date.isoformat()}"
             )
 
-            # Perform the actual deletion
-            total_deleted = await self._delete_old_logs(prisma_client, cutoff_date)
+            from litellm.proxy.spend_tracking.spend_logs_archive import (
+                get_spend_logs_archive,
+            )
+
+            archive = get_spend_logs_archive(self.general_settings)
+            if archive is not None:
+                total_deleted = await self._archive_and_delete_old_logs(
+                    prisma_client, cutoff_date, archive
+                )
+            else:
+                # Perform the actual deletion
+                total_deleted = await self._delete_old_logs(prisma_client, cutoff_date)
             verbose_proxy_logger.info(f"Deleted {total_deleted} logs")
 
         except Exception as e:
@@ -3,12 +3,16 @@
 import asyncio
 import logging
 import random
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
 import litellm
 
 logger = logging.getLogger(__name__)
-from litellm.constants import HEALTH_CHECK_TIMEOUT_SECONDS, DEFAULT_HEALTH_CHECK_PROMPT
+from litellm.constants import (
+    DEFAULT_HEALTH_CHECK_PROMPT,
+    HEALTH_CHECK_MAX_CONCURRENCY,
+    HEALTH_CHECK_TIMEOUT_SECONDS,
+)
 
 ILLEGAL_DISPLAY_PARAMS = [
     "messages",
@@ -80,22 +84,22 @@ async def run_with_timeout(task, timeout):
         return {"error": "Timeout exceeded"}
 
 
-async def _perform_health_check(model_list: list, details: Optional[bool] = True):
-    """
-    Perform a health check for each model in the list.
+async def _run_model_health_check(model: dict) -> Union[dict, BaseException]:
     """
+    Run the health check for a single deployment, bounded by its health check timeout.
 
-    tasks = []
-    for model in model_list:
-        litellm_params = model["litellm_params"]
-        model_info = model.get("model_info", {})
-        mode = model_info.get("mode", None)
-        litellm_params = _update_litellm_params_for_health_check(
-            model_info, litellm_params
-        )
-        timeout = model_info.get("health_check_timeout") or HEALTH_CHECK_TIMEOUT_SECONDS
+    Returns the `litellm.ahealth_check` result, `{"error": "Timeout exceeded"}` on timeout,
+    or the raised exception.
+    """
+    litellm_params = model["litellm_params"]
+    model_info = model.get("model_info", {})
+    mode = model_info.get("mode", None)
+    litellm_params = _update_litellm_params_for_health_check(model_info, litellm_params)
+    timeout = model_info.get("health_check_timeout") or HEALTH_CHECK_TIMEOUT_SECONDS
 
-        task = run_with_timeout(
+    try:
+        # wait_for only cancels this check on timeout - other in-flight checks keep running
+        return await asyncio.wait_for(
             litellm.ahealth_check(
                 model["litellm_params"],
                 mode=mode,
@@ -104,27 +108,55 @@ async def _perform_health_check(model_list: list, details: Optional[bool] = True
             ),
             timeout,
         )
+    except asyncio.TimeoutError:
+        return {"error": "Timeout exceeded"}
+    except Exception as e:
+        return e
+
 
-        tasks.append(task)
+def _get_health_check_endpoint_data(
+    model: dict, result: Union[dict, BaseException], details: Optional[bool] = True
+) -> Tuple[bool, dict]:
+    """
+    Returns (is_healthy, endpoint data to display) for a deployment's health check result.
+    """
+    litellm_params = model["litellm_params"]
+    if isinstance(result, dict) and "error" not in result:
+        return True, _clean_endpoint_data({**litellm_params, **result}, details)
+    elif isinstance(result, dict):
+        return False, _clean_endpoint_data({**litellm_params, **result}, details)
+    return False, _clean_endpoint_data(litellm_params, details)
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _perform_health_check(model_list: list, details: Optional[bool] = True):
+    """
+    Perform a health check for each model in the list.
+
+    At most `HEALTH_CHECK_MAX_CONCURRENCY` checks run at once, so large model lists don't open
+    a connection to every deployment in the same instant.
+    """
+    semaphore = asyncio.Semaphore(HEALTH_CHECK_MAX_CONCURRENCY)
+
+    async def _bounded_health_check(model: dict) -> Union[dict, BaseException]:
+        async with semaphore:
+            return await _run_model_health_check(model)
+
+    results = await asyncio.gather(
+        *[_bounded_health_check(model) for model in model_list],
+        return_exceptions=True,
+    )
 
     healthy_endpoints = []
     unhealthy_endpoints = []
 
-    for is_healthy, model in zip(results, model_list):
-        litellm_params = model["litellm_params"]
-
-        if isinstance(is_healthy, dict) and "error" not in is_healthy:
-            healthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
-            )
-        elif isinstance(is_healthy, dict):
-            unhealthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
-            )
+    for result, model in zip(results, model_list):
+        is_healthy, endpoint_data = _get_health_check_endpoint_data(
+            model=model, result=result, details=details
+        )
+        if is_healthy:
+            healthy_endpoints.append(endpoint_data)
         else:
-            unhealthy_endpoints.append(_clean_endpoint_data(litellm_params, details))
+            unhealthy_endpoints.append(endpoint_data)
 
     return healthy_endpoints, unhealthy_endpoints
 
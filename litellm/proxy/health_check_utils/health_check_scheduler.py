@@ -0,0 +1,304 @@
+"""
+Background health check scheduler.
+
+Instead of health checking every deployment at once every `health_check_interval`, each
+deployment is checked on its own schedule:
+- the next check is `health_check_interval` +/- `HEALTH_CHECK_INTERVAL_JITTER` after the last one,
+  so checks spread out over the interval instead of running in one burst
+- deployments that keep failing are re-checked with exponential backoff, up to
+  `HEALTH_CHECK_MAX_BACKOFF_SECONDS`
+- each check runs as its own task, at most `HEALTH_CHECK_MAX_CONCURRENCY` at once and bounded by
+  the deployment's health check timeout, so a slow deployment doesn't hold up the others
+- optionally, a deployment that fails its health check is put in router cooldown until its next
+  check, so routing avoids it before live traffic hits it
+
+How late each check starts vs. when it was due is exported as `litellm_health_check_scheduler_lag_seconds`.
+"""
+
+import asyncio
+import copy
+import random
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+import litellm
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import (
+    HEALTH_CHECK_INTERVAL_JITTER,
+    HEALTH_CHECK_MAX_BACKOFF_SECONDS,
+    HEALTH_CHECK_MAX_CONCURRENCY,
+    HEALTH_CHECK_TIMEOUT_SECONDS,
+)
+from litellm.proxy.health_check import (
+    _get_health_check_endpoint_data,
+    _run_model_health_check,
+)
+
+if TYPE_CHECKING:
+    from litellm.router import Router as _Router
+
+    LitellmRouter = _Router
+else:
+    LitellmRouter = Any
+
+# upper bound on how long the scheduler sleeps, so newly added deployments are picked up quickly
+MAX_SCHEDULER_SLEEP_SECONDS = 10.0
+MIN_SCHEDULER_SLEEP_SECONDS = 0.5
+
+
+class _DeploymentHealthCheckState:
+    __slots__ = ("next_check_at", "consecutive_failures", "is_healthy", "endpoint_data")
+
+    def __init__(self, next_check_at: float):
+        self.next_check_at = next_check_at
+        self.consecutive_failures = 0
+        self.is_healthy: Optional[bool] = None
+        self.endpoint_data: Optional[dict] = None
+
+
+class HealthCheckScheduler:
+    def __init__(
+        self,
+        health_check_interval: float,
+        details: Optional[bool] = True,
+        llm_router: Optional[LitellmRouter] = None,
+        cooldown_unhealthy_deployments: bool = False,
+        max_concurrency: int = HEALTH_CHECK_MAX_CONCURRENCY,
+        jitter: float = HEALTH_CHECK_INTERVAL_JITTER,
+        max_backoff_seconds: float = HEALTH_CHECK_MAX_BACKOFF_SECONDS,
+    ):
+        self.health_check_interval = health_check_interval
+        self.details = details
+        self.llm_router = llm_router
+        self.cooldown_unhealthy_deployments = cooldown_unhealthy_deployments
+        self.max_concurrency = max(1, max_concurrency)
+        self.jitter = jitter
+        self.max_backoff_seconds = max(max_backoff_seconds, health_check_interval)
+        self._states: Dict[str, _DeploymentHealthCheckState] = {}
+        self._in_flight_checks: Dict[str, "asyncio.Task[None]"] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._deployments_without_id: Set[str] = set()
+        # number of finished checks - lets callers tell when results changed
+        self.completed_checks = 0
+
+    @staticmethod
+    def _get_model_id(model: dict) -> Optional[str]:
+        return (model.get("model_info") or {}).get("id")
+
+    def _get_next_check_delay(self, consecutive_failures: int) -> float:
+        """
+        Seconds until the next check - `health_check_interval`, doubled for every consecutive failure
+        after the first, +/- jitter.
+        """
+        delay = float(self.health_check_interval)
+        if consecutive_failures > 1:
+            delay = min(
+                delay * (2 ** (consecutive_failures - 1)), self.max_backoff_seconds
+            )
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def get_due_deployments(
+        self, model_list: List[dict], now: Optional[float] = None
+    ) -> List[Tuple[dict, float]]:
+        """
+        Returns (deployment, scheduled check time) for every deployment due for a check.
+
+        New deployments are due immediately; deployments no longer in `model_list` are dropped.
+        Deployments still being checked are not due again.
+        """
+        now = now if now is not None else time.monotonic()
+        due_deployments: List[Tuple[dict, float]] = []
+        model_ids = set()
+        for model in model_list:
+            model_id = self._get_model_id(model)
+            if model_id is None:
+                self._warn_deployment_without_id(model)
+                continue
+            if model_id in model_ids:
+                continue
+            model_ids.add(model_id)
+            if model_id in self._in_flight_checks:
+                continue
+            state = self._states.get(model_id)
+            if state is None:
+                state = _DeploymentHealthCheckState(next_check_at=now)
+                self._states[model_id] = state
+            if state.next_check_at <= now:
+                due_deployments.append((model, state.next_check_at))
+
+        for model_id in list(self._states.keys()):
+            if model_id not in model_ids:
+                del self._states[model_id]
+        return due_deployments
+
+    def _warn_deployment_without_id(self, model: dict) -> None:
+        model_name = str(model.get("model_name"))
+        if model_name in self._deployments_without_id:
+            return
+        self._deployments_without_id.add(model_name)
+        verbose_proxy_logger.warning(
+            "HealthCheckScheduler: skipping background health checks for a deployment of model '%s' - it has no model_info.id",
+            model_name,
+        )
+
+    def schedule_due_checks(self, model_list: List[dict]) -> List[dict]:
+        """
+        Start a health check task for every deployment that is due, without waiting for them.
+
+        At most `max_concurrency` checks run at a time. Returns the deployments scheduled.
+        """
+        due_deployments = self.get_due_deployments(model_list)
+        if not due_deployments:
+            return []
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        for model, scheduled_at in due_deployments:
+            model_id = self._get_model_id(model)
+            if model_id is None:
+                continue
+            task = asyncio.create_task(
+                self._check_deployment(
+                    model=model, scheduled_at=scheduled_at, semaphore=self._semaphore
+                )
+            )
+            self._in_flight_checks[model_id] = task
+            task.add_done_callback(
+                lambda _task, model_id=model_id: self._on_check_done(model_id, _task)
+            )
+        return [model for model, _ in due_deployments]
+
+    async def run_due_checks(self, model_list: List[dict]) -> List[dict]:
+        """
+        Health check every deployment that is due and wait for those checks.
+
+        Returns the deployments that were checked.
+        """
+        checked_models = self.schedule_due_checks(model_list)
+        tasks = [
+            self._in_flight_checks[model_id]
+            for model_id in (self._get_model_id(model) for model in checked_models)
+            if model_id is not None and model_id in self._in_flight_checks
+        ]
+        if tasks:
+            await asyncio.wait(tasks)
+        return checked_models
+
+    def _on_check_done(self, model_id: str, task: "asyncio.Task[None]") -> None:
+        if self._in_flight_checks.get(model_id) is task:
+            del self._in_flight_checks[model_id]
+        self.completed_checks += 1
+        if not task.cancelled() and task.exception() is not None:
+            verbose_proxy_logger.debug(
+                "HealthCheckScheduler: health check for deployment %s failed: %s",
+                model_id,
+                str(task.exception()),
+            )
+
+    async def _check_deployment(
+        self, model: dict, scheduled_at: float, semaphore: asyncio.Semaphore
+    ) -> None:
+        async with semaphore:
+            _record_health_check_scheduler_lag(
+                max(0.0, time.monotonic() - scheduled_at)
+            )
+            # health checks rewrite litellm_params - don't touch the router's copy
+            model = copy.deepcopy(model)
+            timeout = (model.get("model_info") or {}).get(
+                "health_check_timeout"
+            ) or HEALTH_CHECK_TIMEOUT_SECONDS
+            try:
+                result: Any = await asyncio.wait_for(
+                    _run_model_health_check(model), timeout
+                )
+            except asyncio.TimeoutError:
+                result = {"error": "Timeout exceeded"}
+
+        model_id = self._get_model_id(model)
+        state = self._states.get(model_id) if model_id is not None else None
+        if model_id is None or state is None:
+            return  # deployment was removed while being checked
+
+        is_healthy, endpoint_data = _get_health_check_endpoint_data(
+            model=model, result=result, details=self.details
+        )
+        state.is_healthy = is_healthy
+        state.endpoint_data = endpoint_data
+        state.consecutive_failures = 0 if is_healthy else state.consecutive_failures + 1
+        next_check_delay = self._get_next_check_delay(state.consecutive_failures)
+        state.next_check_at = time.monotonic() + next_check_delay
+
+        if not is_healthy:
+            self._cooldown_unhealthy_deployment(
+                model_id=model_id,
+                result=result,
+                cooldown_time=next_check_delay,
+            )
+
+    def _cooldown_unhealthy_deployment(
+        self, model_id: str, result: Any, cooldown_time: float
+    ) -> None:
+        if not self.cooldown_unhealthy_deployments or self.llm_router is None:
+            return
+        from litellm.router_utils.cooldown_handlers import (
+            _set_cooldown_deployment_from_health_check,
+        )
+
+        error = result.get("error") if isinstance(result, dict) else result
+        try:
+            _set_cooldown_deployment_from_health_check(
+                litellm_router_instance=self.llm_router,
+                deployment=model_id,
+                health_check_error=str(error),
+                time_to_cooldown=cooldown_time,
+            )
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                "HealthCheckScheduler: failed to cooldown deployment %s: %s",
+                model_id,
+                str(e),
+            )
+
+    def get_health_check_results(self) -> Tuple[List[dict], List[dict]]:
+        """
+        Latest (healthy_endpoints, unhealthy_endpoints) across all checked deployments.
+        """
+        healthy_endpoints: List[dict] = []
+        unhealthy_endpoints: List[dict] = []
+        for state in self._states.values():
+            if state.endpoint_data is None:
+                continue
+            if state.is_healthy:
+                healthy_endpoints.append(state.endpoint_data)
+            else:
+                unhealthy_endpoints.append(state.endpoint_data)
+        return healthy_endpoints, unhealthy_endpoints
+
+    def seconds_until_next_check(self, now: Optional[float] = None) -> float:
+        now = now if now is not None else time.monotonic()
+        next_check_times = [
+            state.next_check_at
+            for model_id, state in self._states.items()
+            if model_id not in self._in_flight_checks
+        ]
+        if not next_check_times:
+            return MAX_SCHEDULER_SLEEP_SECONDS
+        next_check_at = min(next_check_times)
+        return min(
+            max(next_check_at - now, MIN_SCHEDULER_SLEEP_SECONDS),
+            MAX_SCHEDULER_SLEEP_SECONDS,
+        )
+
+
+def _record_health_check_scheduler_lag(lag_seconds: float) -> None:
+    try:
+        from litellm.integrations.prometheus import PrometheusLogger
+
+        for callback in litellm.callbacks:
+            if isinstance(callback, PrometheusLogger):
+                callback._record_health_check_scheduler_lag(lag_seconds)
+                break
+    except Exception as e:
+        verbose_proxy_logger.debug(
+            "HealthCheckScheduler: failed to record scheduler lag: %s", str(e)
+        )
@@ -25,8 +25,8 @@ from pydantic import BaseModel
 import litellm
 from litellm._logging import verbose_proxy_logger
 from litellm.batches.batch_utils import (
-    _get_batch_job_input_file_usage,
-    _get_file_content_as_dictionary,
+    _get_batch_job_input_file_usage_and_request_count,
+    _iter_file_content_as_dictionary,
 )
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.proxy._types import UserAPIKeyAuth
@@ -262,15 +262,18 @@ class _PROXY_BatchRateLimiter(CustomLogger):
                 user_api_key_dict=user_api_key_dict,
             )
 
-            file_content_as_dict = _get_file_content_as_dictionary(
+            # parse and count one line at a time
+            file_content_as_dict = _iter_file_content_as_dictionary(
                 file_content.content
             )
 
-            input_file_usage = _get_batch_job_input_file_usage(
+            (
+                input_file_usage,
+                request_count,
+            ) = _get_batch_job_input_file_usage_and_request_count(
                 file_content_dictionary=file_content_as_dict,
                 custom_llm_provider=custom_llm_provider,
             )
-            request_count = len(file_content_as_dict)
             return BatchFileUsage(
                 total_tokens=input_file_usage.total_tokens,
                 request_count=request_count,
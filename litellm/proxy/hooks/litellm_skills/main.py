@@ -55,6 +55,8 @@ class SkillsInjectionHook(CustomLogger):
     This hook is called automatically by litellm during completion calls.
     """
 
+    streaming_logging_fields = frozenset()  # no success logging
+
     def __init__(self, **kwargs):
         from litellm.llms.litellm_proxy.skills.constants import (
             DEFAULT_MAX_ITERATIONS,
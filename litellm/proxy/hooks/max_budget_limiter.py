@@ -9,6 +9,8 @@ from litellm.proxy._types import UserAPIKeyAuth
 
 class _PROXY_MaxBudgetLimiter(CustomLogger):
     # Class variables or attributes
+    streaming_logging_fields = frozenset()  # no success logging
+
     def __init__(self):
         pass
 
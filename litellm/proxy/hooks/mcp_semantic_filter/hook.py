@@ -325,6 +325,7 @@ class SemanticToolFilterHook(CustomLogger):
                 top_k=top_k,
                 similarity_threshold=similarity_threshold,
                 enabled=True,
+                batch_embeddings=config.get("batch_embeddings", False),
             )
             
             # Build router from MCP registry on startup
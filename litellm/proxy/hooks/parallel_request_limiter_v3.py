@@ -144,6 +144,9 @@ class RateLimitResponseWithDescriptors(TypedDict):
 
 
 class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
+    # tpm counters only read usage
+    streaming_logging_fields = frozenset({"usage"})
+
     def __init__(
         self,
         internal_usage_cache: InternalUsageCache,
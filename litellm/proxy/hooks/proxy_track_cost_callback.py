@@ -1,11 +1,14 @@
 import asyncio
 import traceback
 from datetime import datetime
-from typing import Any, List, Optional, Union, cast
+from typing import Any, FrozenSet, List, Optional, Union, cast
 
 import litellm
 from litellm._logging import verbose_proxy_logger
-from litellm.integrations.custom_logger import CustomLogger
+from litellm.integrations.custom_logger import (
+    ALL_STREAMING_LOGGING_FIELDS,
+    CustomLogger,
+)
 from litellm.litellm_core_utils.core_helpers import (
     _get_parent_otel_span_from_kwargs,
     get_litellm_metadata_from_kwargs,
@@ -18,11 +21,22 @@ from litellm.proxy.utils import ProxyUpdateSpend
 from litellm.types.utils import (
     StandardLoggingPayload,
     StandardLoggingUserAPIKeyMetadata,
+    StreamingLoggingField,
 )
 from litellm.utils import get_end_user_id_for_cost_tracking
 
 
 class _ProxyDBLogger(CustomLogger):
+    def get_streaming_logging_fields(self) -> FrozenSet[StreamingLoggingField]:
+        from litellm.proxy.spend_tracking.spend_tracking_utils import (
+            _should_store_prompts_and_responses_in_spend_logs,
+        )
+
+        # the response is only written to spend logs when `store_prompts_in_spend_logs` is on
+        if _should_store_prompts_and_responses_in_spend_logs():
+            return ALL_STREAMING_LOGGING_FIELDS
+        return frozenset({"usage", "response_cost"})
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         await self._PROXY_track_cost_callback(
             kwargs, response_obj, start_time, end_time
@@ -28,6 +28,8 @@ if TYPE_CHECKING:
 
 
 class ResponsesIDSecurity(CustomLogger):
+    streaming_logging_fields = frozenset()  # no success logging
+
     def __init__(self):
         pass
 
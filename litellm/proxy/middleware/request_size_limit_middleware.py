@@ -0,0 +1,129 @@
+"""
+Request Size Limit Middleware
+"""
+from typing import Optional
+
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Enforce `general_settings.max_request_size_mb` while the request body is received.
+
+    Multipart uploads (/v1/files, /audio/transcriptions, batch input files) are
+    parsed by FastAPI before the route runs, so a check in the route only sees
+    the body once all of it has been read and spooled. This middleware rejects a
+    request as soon as its Content-Length, or the bytes received so far, go
+    over the limit - the rest of the upload is never read.
+
+    ```yaml
+    general_settings:
+        max_request_size_mb: 200
+    ```
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_request_size_bytes = self._get_max_request_size_bytes()
+        if max_request_size_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = self._get_content_length(scope)
+        if content_length is not None and content_length > max_request_size_bytes:
+            await self._send_request_too_large(send, max_request_size_bytes)
+            return
+
+        received_bytes = 0
+        limit_exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received_bytes, limit_exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received_bytes += len(message.get("body", b""))
+                if received_bytes > max_request_size_bytes:
+                    limit_exceeded = True
+                    raise HTTPException(
+                        status_code=413,
+                        detail=self._error_message(max_request_size_bytes),
+                    )
+            return message
+
+        async def limited_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                if limit_exceeded:
+                    # the route swallowed the error - answer 413 instead
+                    response_started = True
+                    await self._send_request_too_large(send, max_request_size_bytes)
+                    return
+                response_started = True
+            elif limit_exceeded and response_started:
+                # drop the body of the replaced response
+                return
+            await send(message)
+
+        await self.app(scope, limited_receive, limited_send)
+
+    @staticmethod
+    def _get_max_request_size_bytes() -> Optional[int]:
+        from litellm.proxy.proxy_server import general_settings, premium_user
+
+        max_request_size_mb = general_settings.get("max_request_size_mb", None)
+        # enterprise only - see `check_if_request_size_is_safe`
+        if max_request_size_mb is None or premium_user is not True:
+            return None
+        return int(max_request_size_mb * 1024 * 1024)
+
+    @staticmethod
+    def _get_content_length(scope: Scope) -> Optional[int]:
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    @staticmethod
+    def _error_message(max_request_size_bytes: int) -> str:
+        return (
+            "Request size is too large. Max size is "
+            f"{max_request_size_bytes / (1024 * 1024)} MB"
+        )
+
+    async def _send_request_too_large(
+        self, send: Send, max_request_size_bytes: int
+    ) -> None:
+        body = safe_dumps(
+            {
+                "error": {
+                    "message": self._error_message(max_request_size_bytes),
+                    "type": "bad_request_error",
+                    "param": "content-length",
+                    "code": "413",
+                }
+            }
+        ).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
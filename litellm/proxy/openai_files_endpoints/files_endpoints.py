@@ -30,6 +30,7 @@ from litellm.proxy._types import *
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 from litellm.proxy.common_request_processing import ProxyBaseLLMRequestProcessing
 from litellm.proxy.common_utils.http_parsing_utils import (
+    UploadFileStream,
     _read_request_body,
     extract_nested_form_metadata,
 )
@@ -320,9 +321,9 @@ async def create_file(  # noqa: PLR0915
 
     data: Dict = {}
     try:
-        # Use orjson to parse JSON data, orjson speeds up requests significantly
-        # Read the file content
-        file_content = await file.read()
+        # Forward the spooled upload as a file object - it is streamed to the
+        # provider instead of being read into memory
+        file_content = UploadFileStream(file)
         custom_llm_provider = (
             provider
             or get_custom_llm_provider_from_request_headers(request=request)
@@ -447,7 +448,8 @@ async def create_file(  # noqa: PLR0915
         router_model: Optional[str] = None
         is_router_model = False
         if litellm.enable_loadbalancing_on_batch_endpoints is True:
-            json_obj = get_first_json_object(file_content_bytes=file_content)
+            json_obj = get_first_json_object(file_content_bytes=file_content.readline())
+            file_content.seek(0)
             if json_obj:
                 router_model = get_model_from_json_obj(json_object=json_obj)
                 is_router_model = is_known_model(
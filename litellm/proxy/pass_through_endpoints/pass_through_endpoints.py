@@ -50,7 +50,10 @@ from litellm.proxy._types import (
 )
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 from litellm.proxy.common_request_processing import ProxyBaseLLMRequestProcessing
-from litellm.proxy.common_utils.http_parsing_utils import _read_request_body
+from litellm.proxy.common_utils.http_parsing_utils import (
+    UploadFileStream,
+    _read_request_body,
+)
 from litellm.proxy.utils import get_server_root_path
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.llms.custom_http import httpxSpecialProvider
@@ -426,9 +429,10 @@ class HttpPassThroughEndpointHelpers(BasePassthroughUtils):
     @staticmethod
     async def _build_request_files_from_upload_file(
         upload_file: Union[UploadFile, StarletteUploadFile],
-    ) -> Tuple[Optional[str], bytes, Optional[str]]:
+    ) -> Tuple[Optional[str], UploadFileStream, Optional[str]]:
         """Build a request files dict from an UploadFile object"""
-        file_content = await upload_file.read()
+        # httpx reads the spooled upload in chunks while sending the request
+        file_content = UploadFileStream(upload_file)
         return (upload_file.filename, file_content, upload_file.content_type)
 
     @staticmethod
@@ -2,7 +2,6 @@ import asyncio
 import copy
 import enum
 import inspect
-import io
 import os
 import random
 import secrets
@@ -275,6 +274,9 @@ from litellm.proxy.auth.user_api_key_auth import (
     user_api_key_auth_websocket,
 )
 from litellm.proxy.batches_endpoints.endpoints import router as batches_router
+from litellm.proxy.batches_endpoints.local_batch_endpoints import (
+    router as local_batches_router,
+)
 
 ## Import All Misc routes here ##
 from litellm.proxy.caching_routes import router as caching_router
@@ -285,12 +287,14 @@ from litellm.proxy.common_request_processing import (
 from litellm.proxy.common_utils.callback_utils import initialize_callbacks_on_proxy
 from litellm.proxy.common_utils.debug_utils import init_verbose_loggers
 from litellm.proxy.common_utils.debug_utils import router as debugging_endpoints_router
+from litellm.proxy.common_utils.event_loop_lag_monitor import event_loop_lag_monitor
 from litellm.proxy.common_utils.encrypt_decrypt_utils import (
     decrypt_value_helper,
     encrypt_value_helper,
 )
 from litellm.proxy.common_utils.html_forms.ui_login import build_ui_login_form
 from litellm.proxy.common_utils.http_parsing_utils import (
+    UploadFileStream,
     _read_request_body,
     check_file_size_under_limit,
     get_form_data,
@@ -410,6 +414,9 @@ from litellm.proxy.management_endpoints.user_agent_analytics_endpoints import (
 )
 from litellm.proxy.management_helpers.audit_logs import create_audit_log_for_update
 from litellm.proxy.middleware.prometheus_auth_middleware import PrometheusAuthMiddleware
+from litellm.proxy.middleware.request_size_limit_middleware import (
+    RequestSizeLimitMiddleware,
+)
 from litellm.proxy.ocr_endpoints.endpoints import router as ocr_router
 from litellm.proxy.openai_files_endpoints.files_endpoints import (
     router as openai_files_router,
@@ -867,12 +874,17 @@ async def proxy_startup_event(app: FastAPI):  # noqa: PLR0915
     ## [Optional] Initialize dd tracer
     ProxyStartupEvent._init_dd_tracer()
 
+    ## Measure event loop lag (exported via prometheus + x-litellm-event-loop-lag-ms)
+    event_loop_lag_monitor.start()
+
     ## Initialize shared aiohttp session for connection reuse
     shared_aiohttp_session = await _initialize_shared_aiohttp_session()
 
     # End of startup event
     yield
 
+    await event_loop_lag_monitor.stop()
+
     # Shutdown event - close shared aiohttp session
     if shared_aiohttp_session is not None:
         try:
@@ -1374,6 +1386,7 @@ app.add_middleware(
 )
 
 app.add_middleware(PrometheusAuthMiddleware)
+app.add_middleware(RequestSizeLimitMiddleware)
 
 
 def mount_swagger_ui():
@@ -1449,6 +1462,7 @@ redis_usage_cache: Optional[
 polling_via_cache_enabled: Union[Literal["all"], List[str], bool] = False
 native_background_mode: List[str] = []  # Models that should use native provider background mode instead of polling
 polling_cache_ttl: int = 3600  # Default 1 hour TTL for polling cache
+polling_state_backend: Literal["json", "redis_stream"] = "json"  # How background response output is written to Redis
 user_custom_auth = None
 user_custom_key_generate = None
 user_custom_sso = None
@@ -1458,6 +1472,7 @@ use_shared_health_check = None
 use_queue = False
 health_check_interval = None
 health_check_details = None
+health_check_cooldown = None
 health_check_results: Dict[str, Union[int, List[Dict[str, Any]]]] = {}
 queue: List = []
 litellm_proxy_budget_name = "litellm-proxy-budget"
@@ -1933,6 +1948,10 @@ async def _run_background_health_check():
         )
         verbose_proxy_logger.info("Initialized shared health check manager")
 
+    if shared_health_manager is None:
+        await _run_scheduled_background_health_check()
+        return
+
     while True:
         # make 1 deep copy of llm_model_list on every health check iteration
         _llm_model_list = copy.deepcopy(llm_model_list) or []
@@ -2008,6 +2027,80 @@ async def _run_background_health_check():
         await asyncio.sleep(health_check_interval)
 
 
+async def _run_scheduled_background_health_check():
+    """
+    Background health checks without shared health check state.
+
+    Each deployment is checked on its own jittered schedule by `HealthCheckScheduler` (bounded
+    concurrency, backoff for failing deployments) instead of every deployment at once, every
+    `health_check_interval`. Results are saved to the DB at most once per `health_check_interval`.
+    """
+    global health_check_results, llm_model_list, llm_router, health_check_interval, health_check_details, health_check_cooldown, prisma_client
+    import time as time_module
+
+    from litellm.proxy.health_check_utils.health_check_scheduler import (
+        HealthCheckScheduler,
+    )
+
+    scheduler = HealthCheckScheduler(
+        health_check_interval=health_check_interval,  # type: ignore[arg-type]
+        details=health_check_details,
+        llm_router=llm_router,
+        cooldown_unhealthy_deployments=health_check_cooldown is True,
+    )
+    last_saved_to_db_at: Optional[float] = None
+    last_completed_checks = 0
+    while True:
+        try:
+            # the router may be replaced on config reload
+            scheduler.llm_router = llm_router
+            _llm_model_list = [
+                m
+                for m in (llm_model_list or [])
+                if not m.get("model_info", {}).get(
+                    "disable_background_health_check", False
+                )
+            ]
+            # checks run as their own tasks - publish whatever finished since the last pass
+            scheduler.schedule_due_checks(_llm_model_list)
+            if scheduler.completed_checks != last_completed_checks:
+                last_completed_checks = scheduler.completed_checks
+                (
+                    healthy_endpoints,
+                    unhealthy_endpoints,
+                ) = scheduler.get_health_check_results()
+                health_check_results["healthy_endpoints"] = healthy_endpoints
+                health_check_results["unhealthy_endpoints"] = unhealthy_endpoints
+                health_check_results["healthy_count"] = len(healthy_endpoints)
+                health_check_results["unhealthy_count"] = len(unhealthy_endpoints)
+
+                now = time_module.time()
+                if prisma_client is not None and (
+                    last_saved_to_db_at is None
+                    or now - last_saved_to_db_at >= health_check_interval  # type: ignore[operator]
+                ):
+                    from litellm.proxy.health_endpoints._health_endpoints import (
+                        _save_background_health_checks_to_db,
+                    )
+
+                    last_saved_to_db_at = now
+                    asyncio.create_task(
+                        _save_background_health_checks_to_db(
+                            prisma_client,
+                            _llm_model_list,
+                            healthy_endpoints,
+                            unhealthy_endpoints,
+                            now,
+                            checked_by="background_health_check",
+                        )
+                    )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "Error in scheduled background health check: %s", str(e)
+            )
+        await asyncio.sleep(scheduler.seconds_until_next_check())
+
+
 class StreamingCallbackError(Exception):
     pass
 
@@ -2456,7 +2549,7 @@ class ProxyConfig:
         """
         Load config values into proxy global state
         """
-        global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, user_custom_ui_sso_sign_in_handler, use_background_health_checks, use_shared_health_check, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, proxy_batch_polling_interval, config_passthrough_endpoints
+        global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, user_custom_ui_sso_sign_in_handler, use_background_health_checks, use_shared_health_check, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, health_check_cooldown, proxy_batch_polling_interval, config_passthrough_endpoints
 
         config: dict = await self.get_config(config_file_path=config_file_path)
 
@@ -2687,7 +2780,7 @@ class ProxyConfig:
                     pass
                 elif key == "responses":
                     # Initialize global polling via cache settings
-                    global polling_via_cache_enabled, native_background_mode, polling_cache_ttl
+                    global polling_via_cache_enabled, native_background_mode, polling_cache_ttl, polling_state_backend
                     background_mode = value.get("background_mode", {})
                     polling_via_cache_enabled = background_mode.get(
                         "polling_via_cache", False
@@ -2696,8 +2789,11 @@ class ProxyConfig:
                         "native_background_mode", []
                     )
                     polling_cache_ttl = background_mode.get("ttl", 3600)
+                    polling_state_backend = background_mode.get(
+                        "state_backend", "json"
+                    )
                     verbose_proxy_logger.debug(
-                        f"{blue_color_code} Initialized polling via cache: enabled={polling_via_cache_enabled}, native_background_mode={native_background_mode}, ttl={polling_cache_ttl}{reset_color_code}"
+                        f"{blue_color_code} Initialized polling via cache: enabled={polling_via_cache_enabled}, native_background_mode={native_background_mode}, ttl={polling_cache_ttl}, state_backend={polling_state_backend}{reset_color_code}"
                     )
                 elif key == "default_team_settings":
                     for idx, team_setting in enumerate(
@@ -2881,6 +2977,8 @@ class ProxyConfig:
                 "health_check_interval", DEFAULT_HEALTH_CHECK_INTERVAL
             )
             health_check_details = general_settings.get("health_check_details", True)
+            # Put deployments that fail their background health check in router cooldown
+            health_check_cooldown = general_settings.get("health_check_cooldown", False)
 
             ### RBAC ###
             rbac_role_permissions = general_settings.get("role_permissions", None)
@@ -5276,6 +5374,7 @@ class ProxyStartupEvent:
             budget_reset_job = ResetBudgetJob(
                 proxy_logging_obj=proxy_logging_obj,
                 prisma_client=prisma_client,
+                user_api_key_cache=user_api_key_cache,
             )
 
             scheduler.add_job(
@@ -6746,9 +6845,8 @@ async def audio_transcriptions(
             router_model_names=router_model_names,
         )
 
-        file_content = await file.read()
-        file_object = io.BytesIO(file_content)
-        file_object.name = file.filename
+        # Forward the spooled upload as a file object instead of reading it into memory
+        file_object = UploadFileStream(file)
         data["file"] = file_object
 
         try:
@@ -11944,6 +12042,7 @@ async def get_routes():
 app.include_router(router)
 app.include_router(response_router)
 app.include_router(batches_router)
+app.include_router(local_batches_router)
 app.include_router(public_endpoints_router)
 app.include_router(rerank_router)
 app.include_router(ocr_router)
@@ -1,9 +1,11 @@
 import asyncio
+import json
 import time
 from typing import Any, AsyncIterator, Optional, cast
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
 from litellm._logging import verbose_proxy_logger
 from litellm.integrations.custom_guardrail import ModifyResponseException
@@ -70,6 +72,7 @@ async def responses_api(
         llm_router,
         native_background_mode,
         polling_cache_ttl,
+        polling_state_backend,
         polling_via_cache_enabled,
         proxy_config,
         proxy_logging_obj,
@@ -115,7 +118,8 @@ async def responses_api(
         # Initialize polling handler with configured TTL (from global config)
         polling_handler = ResponsePollingHandler(
             redis_cache=redis_usage_cache,
-            ttl=polling_cache_ttl  # Global var set at startup
+            ttl=polling_cache_ttl,  # Global var set at startup
+            state_backend=polling_state_backend,
         )
         
         # Generate polling ID
@@ -400,6 +404,16 @@ async def cursor_chat_completions(
         )
 
 
+async def _polling_event_stream(
+    polling_handler: Any, polling_id: str, last_event_id: Optional[str]
+) -> AsyncIterator[str]:
+    """SSE with the stream entry id as event id, so clients resume via Last-Event-ID"""
+    async for event_id, event in polling_handler.stream_events(
+        polling_id=polling_id, last_event_id=last_event_id
+    ):
+        yield f"id: {event_id}\nevent: {event.get('type', '')}\ndata: {json.dumps(event)}\n\n"
+
+
 @router.get(
     "/v1/responses/{response_id}",
     dependencies=[Depends(user_api_key_auth)],
@@ -435,6 +449,12 @@ async def get_response(
     curl -X GET http://localhost:4000/v1/responses/litellm_poll_abc123 \
     -H "Authorization: Bearer sk-1234"
     
+    # Stream polling response events (state_backend: redis_stream), resuming
+    # after the last received SSE event id
+    curl -N -X GET "http://localhost:4000/v1/responses/litellm_poll_abc123?stream=true" \
+    -H "Authorization: Bearer sk-1234" \
+    -H "Last-Event-ID: 1718000000000-3"
+    
     # Get provider response
     curl -X GET http://localhost:4000/v1/responses/resp_abc123 \
     -H "Authorization: Bearer sk-1234"
@@ -444,6 +464,7 @@ async def get_response(
         _read_request_body,
         general_settings,
         llm_router,
+        polling_state_backend,
         proxy_config,
         proxy_logging_obj,
         redis_usage_cache,
@@ -477,6 +498,22 @@ async def get_response(
                 detail=f"Polling response {response_id} not found or expired"
             )
         
+        if request.query_params.get("stream") in ("true", "True", "1"):
+            # Replay the event stream from the client's last received event
+            if polling_state_backend != "redis_stream":
+                raise HTTPException(
+                    status_code=400,
+                    detail="stream=true requires responses.background_mode.state_backend: redis_stream",
+                )
+            return StreamingResponse(
+                _polling_event_stream(
+                    polling_handler=polling_handler,
+                    polling_id=response_id,
+                    last_event_id=request.headers.get("last-event-id"),
+                ),
+                media_type="text/event-stream",
+            )
+        
         # Return the whole state directly (OpenAI Response object format)
         # https://platform.openai.com/docs/api-reference/responses/object
         return state
@@ -552,6 +589,7 @@ async def delete_response(
         _read_request_body,
         general_settings,
         llm_router,
+        polling_state_backend,
         proxy_config,
         proxy_logging_obj,
         redis_usage_cache,
@@ -574,7 +612,9 @@ async def delete_response(
                 detail="Redis cache not configured."
             )
         
-        polling_handler = ResponsePollingHandler(redis_cache=redis_usage_cache)
+        polling_handler = ResponsePollingHandler(
+            redis_cache=redis_usage_cache, state_backend=polling_state_backend
+        )
         
         # Get state to verify access
         state = await polling_handler.get_state(response_id)
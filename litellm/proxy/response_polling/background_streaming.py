@@ -2,7 +2,8 @@
 Background Streaming Task for Polling Via Cache Feature
 
 Handles streaming responses from LLM providers and updates Redis cache
-with partial results for polling.
+with partial results for polling - the full output every flush, or only the
+new events with `state_backend: redis_stream`.
 
 Follows OpenAI Response Streaming format:
 https://platform.openai.com/docs/api-reference/responses-streaming
@@ -16,7 +17,11 @@ from fastapi import Request, Response
 from litellm._logging import verbose_proxy_logger
 from litellm.proxy.auth.user_api_key_auth import UserAPIKeyAuth
 from litellm.proxy.common_request_processing import ProxyBaseLLMRequestProcessing
-from litellm.proxy.response_polling.polling_handler import ResponsePollingHandler
+from litellm.proxy.response_polling.polling_handler import (
+    STREAM_CHECKPOINT_EVENT_TYPES,
+    ResponsePollingHandler,
+    apply_response_stream_event,
+)
 
 
 async def background_streaming_task(  # noqa: PLR0915
@@ -87,7 +92,9 @@ async def background_streaming_task(  # noqa: PLR0915
         # Process streaming response following OpenAI events format
         # https://platform.openai.com/docs/api-reference/responses-streaming
         output_items: dict[str, dict[str, Any]] = {}  # Track output items by ID
-        accumulated_text = {}  # Track accumulated text deltas by (item_id, content_index)
+        # state_backend: redis_stream - raw events not yet appended to the event stream
+        pending_events: list[str] = []
+        checkpoint_needed = False
         
         # ResponsesAPIResponse fields to extract from response.completed
         usage_data = None
@@ -113,10 +120,25 @@ async def background_streaming_task(  # noqa: PLR0915
         
         async def flush_state_if_needed(force: bool = False) -> None:
             """Flush accumulated state to Redis if interval elapsed or forced"""
-            nonlocal state_dirty, last_update_time
+            nonlocal state_dirty, last_update_time, checkpoint_needed
             
             current_time = asyncio.get_event_loop().time()
-            if state_dirty and (force or (current_time - last_update_time) >= UPDATE_INTERVAL):
+            if polling_handler.use_event_stream:
+                # Append only the new events - the header gets the output at checkpoints
+                if (pending_events or force) and (
+                    force or (current_time - last_update_time) >= UPDATE_INTERVAL
+                ):
+                    await polling_handler.append_events(
+                        polling_id=polling_id,
+                        events=pending_events,
+                        output_items=output_items,
+                        checkpoint=force or checkpoint_needed,
+                    )
+                    pending_events.clear()
+                    state_dirty = False
+                    checkpoint_needed = False
+                    last_update_time = current_time
+            elif state_dirty and (force or (current_time - last_update_time) >= UPDATE_INTERVAL):
                 # Convert output_items dict to list for update
                 output_list = list(output_items.values())
                 await polling_handler.update_state(
@@ -142,73 +164,16 @@ async def background_streaming_task(  # noqa: PLR0915
                         event = json.loads(chunk_data)
                         event_type = event.get("type", "")
                         
-                        # Process different event types based on OpenAI streaming spec
-                        if event_type == "response.output_item.added":
-                            # New output item added
-                            item = event.get("item", {})
-                            item_id = item.get("id")
-                            if item_id:
-                                output_items[item_id] = item
-                                state_dirty = True
+                        # Apply output events (output_item / content_part / output_text)
+                        # based on OpenAI streaming spec
+                        if apply_response_stream_event(output_items, event):
+                            state_dirty = True
+                        if polling_handler.use_event_stream:
+                            pending_events.append(chunk_data)
+                            if event_type in STREAM_CHECKPOINT_EVENT_TYPES:
+                                checkpoint_needed = True
                         
-                        elif event_type == "response.content_part.added":
-                            # Content part added to an output item
-                            item_id = event.get("item_id")
-                            content_part = event.get("part", {})
-                            
-                            if item_id and item_id in output_items:
-                                # Update the output item with new content
-                                if "content" not in output_items[item_id]:
-                                    output_items[item_id]["content"] = []
-                                output_items[item_id]["content"].append(content_part)
-                                state_dirty = True
-                        
-                        elif event_type == "response.output_text.delta":
-                            # Text delta - accumulate text content
-                            # https://platform.openai.com/docs/api-reference/responses-streaming/response-text-delta
-                            item_id = event.get("item_id")
-                            content_index = event.get("content_index", 0)
-                            delta = event.get("delta", "")
-                            
-                            if item_id and item_id in output_items:
-                                # Accumulate text delta
-                                key = (item_id, content_index)
-                                if key not in accumulated_text:
-                                    accumulated_text[key] = ""
-                                accumulated_text[key] += delta
-                                
-                                # Update the content in output_items
-                                if "content" in output_items[item_id]:
-                                    content_list = output_items[item_id]["content"]
-                                    if content_index < len(content_list):
-                                        # Update existing content part with accumulated text
-                                        if isinstance(content_list[content_index], dict):
-                                            content_list[content_index]["text"] = accumulated_text[key]
-                                state_dirty = True
-                        
-                        elif event_type == "response.content_part.done":
-                            # Content part completed
-                            item_id = event.get("item_id")
-                            content_part = event.get("part", {})
-                            content_index = event.get("content_index", 0)
-                            
-                            if item_id and item_id in output_items:
-                                # Update with final content from event
-                                if "content" in output_items[item_id]:
-                                    content_list = output_items[item_id]["content"]
-                                    if content_index < len(content_list):
-                                        content_list[content_index] = content_part
-                                state_dirty = True
-                        
-                        elif event_type == "response.output_item.done":
-                            # Output item completed - use final item data
-                            item = event.get("item", {})
-                            item_id = item.get("id")
-                            if item_id:
-                                output_items[item_id] = item
-                                state_dirty = True
-                        
-                        elif event_type == "response.in_progress":
+                        if event_type == "response.in_progress":
                             # Response is now in progress
                             # https://platform.openai.com/docs/api-reference/responses-streaming/response-in-progress
                             await polling_handler.update_state(
@@ -240,15 +205,6 @@ async def background_streaming_task(  # noqa: PLR0915
                             user_data = response_data.get("user")
                             store_data = response_data.get("store")
                             incomplete_details_data = response_data.get("incomplete_details")
-                            
-                            # Also update output from final response if available
-                            if "output" in response_data:
-                                final_output = response_data.get("output", [])
-                                for item in final_output:
-                                    item_id = item.get("id")
-                                    if item_id:
-                                        output_items[item_id] = item
-                                state_dirty = True
                         
                         # Flush state to Redis if interval elapsed
                         await flush_state_if_needed()
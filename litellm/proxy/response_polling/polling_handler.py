@@ -1,15 +1,112 @@
 """
 Response Polling Handler for Background Responses with Cache
+
+State backends:
+- "json" (default): the whole ResponsesAPIResponse is one JSON value, rewritten
+  with the full output on every flush.
+- "redis_stream": streaming events are appended to a Redis Stream
+  (`<cache key>:events`). The response key stays a compact header (status, usage,
+  ...) and only gets an output snapshot at checkpoints - when an output item or
+  the response completes, or after `stream_checkpoint_events` events. Readers
+  rebuild the output from the snapshot + the events after it, and the stream is
+  trimmed up to the previous checkpoint.
 """
+import asyncio
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
 from litellm._logging import verbose_proxy_logger
 from litellm._uuid import uuid4
 from litellm.caching.redis_cache import RedisCache
+from litellm.constants import (
+    RESPONSE_POLLING_STREAM_CHECKPOINT_EVENTS,
+    RESPONSE_POLLING_STREAM_POLL_INTERVAL,
+)
 from litellm.types.llms.openai import ResponsesAPIResponse, ResponsesAPIStatus
 
+PollingStateBackend = Literal["json", "redis_stream"]
+
+# header field with the event stream position of the output snapshot
+STREAM_STATE_FIELD = "_litellm_stream"
+# events that end an output item / the response - the header gets a snapshot
+STREAM_CHECKPOINT_EVENT_TYPES = ("response.output_item.done", "response.completed")
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled", "incomplete")
+
+
+def apply_response_stream_event(
+    output_items: Dict[str, Dict[str, Any]], event: Dict[str, Any]
+) -> bool:
+    """
+    Apply a Responses API streaming event to `output_items` (output items by id).
+
+    https://platform.openai.com/docs/api-reference/responses-streaming
+
+    Returns:
+        True if the event changed the output
+    """
+    event_type = event.get("type", "")
+
+    if event_type in ("response.output_item.added", "response.output_item.done"):
+        item = event.get("item", {})
+        item_id = item.get("id")
+        if item_id:
+            output_items[item_id] = item
+            return True
+
+    elif event_type == "response.content_part.added":
+        item_id = event.get("item_id")
+        if item_id and item_id in output_items:
+            output_items[item_id].setdefault("content", []).append(
+                event.get("part", {})
+            )
+            return True
+
+    elif event_type == "response.output_text.delta":
+        item_id = event.get("item_id")
+        if item_id and item_id in output_items:
+            content_index = event.get("content_index", 0)
+            content_list = output_items[item_id].get("content", [])
+            if content_index < len(content_list) and isinstance(
+                content_list[content_index], dict
+            ):
+                content_part = content_list[content_index]
+                content_part["text"] = content_part.get("text", "") + event.get(
+                    "delta", ""
+                )
+            return True
+
+    elif event_type == "response.content_part.done":
+        item_id = event.get("item_id")
+        if item_id and item_id in output_items:
+            content_index = event.get("content_index", 0)
+            content_list = output_items[item_id].get("content", [])
+            if content_index < len(content_list):
+                content_list[content_index] = event.get("part", {})
+            return True
+
+    elif event_type == "response.completed":
+        response_data = event.get("response", {})
+        if "output" in response_data:
+            for item in response_data.get("output", []):
+                item_id = item.get("id")
+                if item_id:
+                    output_items[item_id] = item
+            return True
+
+    return False
+
+
+def _output_items_by_id(output: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {
+        item.get("id") or f"_output_{index}": item for index, item in enumerate(output)
+    }
+
+
+def _parse_stream_id(stream_id: str) -> Tuple[int, int]:
+    milliseconds, _, sequence = stream_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
 
 class ResponsePollingHandler:
     """Handles polling-based responses with Redis cache"""
@@ -17,9 +114,28 @@ class ResponsePollingHandler:
     CACHE_KEY_PREFIX = "litellm:polling:response:"
     POLLING_ID_PREFIX = "litellm_poll_"  # Clear prefix to identify polling IDs
     
-    def __init__(self, redis_cache: Optional[RedisCache] = None, ttl: int = 3600):
+    def __init__(
+        self,
+        redis_cache: Optional[RedisCache] = None,
+        ttl: int = 3600,
+        state_backend: PollingStateBackend = "json",
+        stream_checkpoint_events: int = RESPONSE_POLLING_STREAM_CHECKPOINT_EVENTS,
+    ):
+        if state_backend not in ("json", "redis_stream"):
+            raise ValueError(
+                f"Unsupported polling state_backend: {state_backend}. Use 'json' or 'redis_stream'."
+            )
         self.redis_cache = redis_cache
         self.ttl = ttl  # Time-to-live for cache entries (default: 1 hour)
+        self.state_backend = state_backend
+        self.stream_checkpoint_events = stream_checkpoint_events
+        # writer position per polling id - {"last_event_id", "events", "events_at_checkpoint"}
+        self._stream_writers: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def use_event_stream(self) -> bool:
+        """True if output is written as appended events (`state_backend: redis_stream`)"""
+        return self.state_backend == "redis_stream" and self.redis_cache is not None
     
     @classmethod
     def generate_polling_id(cls) -> str:
@@ -35,6 +151,11 @@ class ResponsePollingHandler:
     def get_cache_key(cls, polling_id: str) -> str:
         """Get Redis cache key for a polling ID"""
         return f"{cls.CACHE_KEY_PREFIX}{polling_id}"
+
+    @classmethod
+    def get_events_key(cls, polling_id: str) -> str:
+        """Get Redis Stream key for the streaming events of a polling ID"""
+        return f"{cls.CACHE_KEY_PREFIX}{polling_id}:events"
     
     async def create_initial_state(
         self,
@@ -70,10 +191,19 @@ class ResponsePollingHandler:
         cache_key = self.get_cache_key(polling_id)
         
         if self.redis_cache:
+            value = response.model_dump_json()  # Pydantic v2 method
+            if self.use_event_stream:
+                # mark the header - readers rebuild the output from the events
+                value = json.dumps(
+                    {
+                        **json.loads(value),
+                        STREAM_STATE_FIELD: {"checkpoint": None, "trimmed_before": None},
+                    }
+                )
             # Store ResponsesAPIResponse directly in Redis
             await self.redis_cache.async_set_cache(
                 key=cache_key,
-                value=response.model_dump_json(),  # Pydantic v2 method
+                value=value,
                 ttl=self.ttl,
             )
             verbose_proxy_logger.debug(
@@ -223,10 +353,180 @@ class ResponsePollingHandler:
         cache_key = self.get_cache_key(polling_id)
         cached_state = await self.redis_cache.async_get_cache(cache_key)
         
-        if cached_state:
-            return json.loads(cached_state)
-        
-        return None
+        if not cached_state:
+            return None
+
+        state = json.loads(cached_state)
+        stream_state = state.pop(STREAM_STATE_FIELD, None)
+        if stream_state is not None:
+            # redis_stream backend - output snapshot + the events appended after it
+            output_items = _output_items_by_id(state.get("output") or [])
+            for _, event in await self._read_events(
+                polling_id, after_id=stream_state.get("checkpoint")
+            ):
+                apply_response_stream_event(output_items, event)
+            state["output"] = list(output_items.values())
+        return state
+
+    # ==================== Event stream (state_backend: redis_stream) ====================
+
+    async def append_events(
+        self,
+        polling_id: str,
+        events: List[str],
+        output_items: Dict[str, Dict[str, Any]],
+        checkpoint: bool = False,
+    ) -> None:
+        """
+        Append JSON-encoded streaming events to the response's event stream.
+
+        Writes an output snapshot (`output_items`) to the header if `checkpoint` is
+        set, or once `stream_checkpoint_events` events (and at least as many as
+        the previous snapshot covered) were appended since the last one.
+        `output_items` must include the effect of `events`.
+        """
+        if not self.redis_cache:
+            return
+
+        writer = self._stream_writers.setdefault(
+            polling_id,
+            {"last_event_id": None, "events": 0, "events_at_checkpoint": 0},
+        )
+        if events:
+            event_ids = await self.redis_cache.async_stream_append(
+                key=self.get_events_key(polling_id),
+                values=events,
+                ttl=self.ttl,
+            )
+            writer["last_event_id"] = event_ids[-1]
+            writer["events"] += len(events)
+
+        # periodic checkpoints are spaced by at least the events already covered,
+        # so snapshot writes stay linear in the output size
+        events_since_checkpoint = writer["events"] - writer["events_at_checkpoint"]
+        if checkpoint or events_since_checkpoint >= max(
+            self.stream_checkpoint_events, writer["events_at_checkpoint"]
+        ):
+            await self._write_checkpoint(
+                polling_id=polling_id,
+                output=list(output_items.values()),
+                checkpoint_id=writer["last_event_id"],
+            )
+            writer["events_at_checkpoint"] = writer["events"]
+
+    async def _write_checkpoint(
+        self,
+        polling_id: str,
+        output: List[Dict[str, Any]],
+        checkpoint_id: Optional[str],
+    ) -> None:
+        """
+        Store the output as of `checkpoint_id` in the header, then trim the events
+        before the previous checkpoint - readers that loaded the previous header
+        still find every event they need.
+        """
+        if not self.redis_cache:
+            return
+
+        cache_key = self.get_cache_key(polling_id)
+        cached_state = await self.redis_cache.async_get_cache(cache_key)
+        if not cached_state:
+            verbose_proxy_logger.warning(
+                f"No cached state found for polling_id: {polling_id}"
+            )
+            return
+
+        state = json.loads(cached_state)
+        stream_state = state.get(STREAM_STATE_FIELD) or {}
+        previous_checkpoint = stream_state.get("checkpoint")
+        trimmed_before = (
+            previous_checkpoint
+            if previous_checkpoint is not None and previous_checkpoint != checkpoint_id
+            else stream_state.get("trimmed_before")
+        )
+        state["output"] = output
+        state[STREAM_STATE_FIELD] = {
+            "checkpoint": checkpoint_id,
+            "trimmed_before": trimmed_before,
+        }
+        await self.redis_cache.async_set_cache(
+            key=cache_key,
+            value=json.dumps(state),
+            ttl=self.ttl,
+        )
+        if trimmed_before is not None:
+            await self.redis_cache.async_stream_trim(
+                key=self.get_events_key(polling_id), min_id=trimmed_before
+            )
+
+    async def _read_events(
+        self, polling_id: str, after_id: Optional[str]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        if not self.redis_cache:
+            return []
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        for event_id, raw_event in await self.redis_cache.async_stream_range(
+            key=self.get_events_key(polling_id), after_id=after_id
+        ):
+            try:
+                events.append((event_id, json.loads(raw_event)))
+            except (TypeError, ValueError):
+                verbose_proxy_logger.warning(
+                    f"Skipping unreadable event {event_id} for polling_id: {polling_id}"
+                )
+        return events
+
+    async def stream_events(
+        self,
+        polling_id: str,
+        last_event_id: Optional[str] = None,
+        poll_interval: float = RESPONSE_POLLING_STREAM_POLL_INTERVAL,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (event id, event) for the events after `last_event_id`, until the
+        response reaches a terminal status.
+
+        If some of those events were already trimmed, first yields a
+        `response.<status>` event with the response as of the last checkpoint.
+        Yields nothing for responses stored with the "json" backend.
+        """
+        if not self.redis_cache:
+            return
+
+        cache_key = self.get_cache_key(polling_id)
+        cursor = last_event_id
+        while True:
+            cached_state = await self.redis_cache.async_get_cache(cache_key)
+            if not cached_state:
+                return
+            state = json.loads(cached_state)
+            stream_state = state.pop(STREAM_STATE_FIELD, None)
+            if stream_state is None:
+                return
+
+            trimmed_before = stream_state.get("trimmed_before")
+            if trimmed_before is not None and (
+                cursor is None
+                or _parse_stream_id(cursor) < _parse_stream_id(trimmed_before)
+            ):
+                cursor = stream_state.get("checkpoint")
+                status = state.get("status")
+                snapshot_type = (
+                    f"response.{status}"
+                    if status in ("queued", "in_progress", "completed", "failed", "incomplete")
+                    else "response.in_progress"
+                )
+                yield cursor or "0-0", {"type": snapshot_type, "response": state}
+
+            events = await self._read_events(polling_id, after_id=cursor)
+            for event_id, event in events:
+                cursor = event_id
+                yield event_id, event
+
+            if not events:
+                if state.get("status") in _TERMINAL_STATUSES:
+                    return
+                await asyncio.sleep(poll_interval)
     
     async def cancel_polling(self, polling_id: str) -> bool:
         """
@@ -248,6 +548,9 @@ class ResponsePollingHandler:
         cache_key = self.get_cache_key(polling_id)
         # Use RedisCache's async_delete_cache method which handles Redis/RedisCluster
         await self.redis_cache.async_delete_cache(cache_key)
+        if self.use_event_stream:
+            await self.redis_cache.async_delete_cache(self.get_events_key(polling_id))
+        self._stream_writers.pop(polling_id, None)
         return True
 
 
@@ -0,0 +1,496 @@
+"""
+Archive aged `LiteLLM_SpendLogs` rows to partitioned, compressed files and
+read them back for date-range queries.
+
+Rows are written as Parquet (when `pyarrow` is installed) or NDJSON compressed
+with zstd (falling back to gzip when no zstd codec is available), under
+`<prefix>/date=YYYY-MM-DD/` partitions keyed on `startTime`.
+
+Enable it in the proxy config:
+
+```yaml
+general_settings:
+  maximum_spend_logs_retention_period: "30d"
+  spend_logs_archive:
+    storage: s3            # or "local"
+    bucket_name: my-bucket # s3 only
+    path: /var/lib/litellm/spend_logs_archive  # local only
+    prefix: litellm/spend_logs
+    format: parquet        # or "ndjson"; defaults to parquet when pyarrow is installed
+```
+"""
+
+import asyncio
+import gzip
+import io
+import json
+import os
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+)
+
+from litellm._logging import verbose_proxy_logger
+
+SpendLogsArchiveFormat = Literal["parquet", "ndjson"]
+
+SPEND_LOGS_JSON_COLUMNS = (
+    "metadata",
+    "request_tags",
+    "messages",
+    "response",
+    "proxy_server_request",
+)
+SPEND_LOGS_DATETIME_COLUMNS = ("startTime", "endTime", "completionStartTime")
+
+PARQUET_EXTENSION = ".parquet"
+NDJSON_ZSTD_EXTENSION = ".ndjson.zst"
+NDJSON_GZIP_EXTENSION = ".ndjson.gz"
+
+
+def _get_zstd_module() -> Optional[Any]:
+    try:
+        import zstandard  # type: ignore
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _is_pyarrow_available() -> bool:
+    try:
+        import pyarrow  # type: ignore  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def _to_utc_datetime(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+    return None
+
+
+def _row_to_dict(row: Any) -> Dict[str, Any]:
+    if isinstance(row, dict):
+        return dict(row)
+    if hasattr(row, "model_dump"):
+        return row.model_dump()
+    return dict(vars(row))
+
+
+def _to_archive_record(row: Any) -> Dict[str, Any]:
+    """
+    Normalize a spend log row so every file has the same column types:
+    datetimes in UTC, JSON columns as JSON-encoded strings.
+    """
+    record = _row_to_dict(row)
+    for column in SPEND_LOGS_DATETIME_COLUMNS:
+        if column in record:
+            record[column] = _to_utc_datetime(record[column])
+    for column in SPEND_LOGS_JSON_COLUMNS:
+        value = record.get(column)
+        if value is not None and not isinstance(value, str):
+            record[column] = json.dumps(value, default=str)
+    return record
+
+
+def _from_archive_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    for column in SPEND_LOGS_DATETIME_COLUMNS:
+        if column in record:
+            record[column] = _to_utc_datetime(record[column])
+    for column in SPEND_LOGS_JSON_COLUMNS:
+        value = record.get(column)
+        if isinstance(value, str):
+            try:
+                record[column] = json.loads(value)
+            except json.JSONDecodeError:
+                pass
+    return record
+
+
+def get_archive_file_extension(archive_format: SpendLogsArchiveFormat) -> str:
+    if archive_format == "parquet":
+        return PARQUET_EXTENSION
+    if _get_zstd_module() is not None:
+        return NDJSON_ZSTD_EXTENSION
+    return NDJSON_GZIP_EXTENSION
+
+
+def serialize_spend_logs(records: List[Dict[str, Any]], extension: str) -> bytes:
+    """Serialize normalized archive records for the given file extension."""
+    if extension == PARQUET_EXTENSION:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        buffer = io.BytesIO()
+        pq.write_table(pa.Table.from_pylist(records), buffer, compression="zstd")
+        return buffer.getvalue()
+
+    ndjson = b"".join(
+        json.dumps(
+            record,
+            default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v),
+        ).encode("utf-8")
+        + b"\n"
+        for record in records
+    )
+    if extension == NDJSON_ZSTD_EXTENSION:
+        zstd = _get_zstd_module()
+        if zstd is None:
+            raise ValueError("zstandard is required to write .ndjson.zst archives")
+        return zstd.ZstdCompressor().compress(ndjson)
+    if extension == NDJSON_GZIP_EXTENSION:
+        return gzip.compress(ndjson)
+    raise ValueError(f"Unsupported spend logs archive extension: {extension}")
+
+
+def deserialize_spend_logs(content: bytes, key: str) -> List[Dict[str, Any]]:
+    """Read an archive file back into spend log dicts, based on its key's extension."""
+    if key.endswith(PARQUET_EXTENSION):
+        import pyarrow.parquet as pq  # type: ignore
+
+        records = pq.read_table(io.BytesIO(content)).to_pylist()
+    else:
+        if key.endswith(NDJSON_ZSTD_EXTENSION):
+            zstd = _get_zstd_module()
+            if zstd is None:
+                raise ValueError("zstandard is required to read .ndjson.zst archives")
+            raw = zstd.ZstdDecompressor().stream_reader(io.BytesIO(content)).read()
+        elif key.endswith(NDJSON_GZIP_EXTENSION):
+            raw = gzip.decompress(content)
+        else:
+            raise ValueError(f"Unsupported spend logs archive file: {key}")
+        records = [json.loads(line) for line in raw.splitlines() if line.strip()]
+    return [_from_archive_record(record) for record in records]
+
+
+class SpendLogsArchiveStorage(Protocol):
+    """Where archive files are written to and read from."""
+
+    async def write(self, key: str, content: bytes) -> None:
+        ...
+
+    async def read(self, key: str) -> bytes:
+        ...
+
+    async def list_keys(self, prefix: str) -> List[str]:
+        ...
+
+
+class LocalSpendLogsArchiveStorage:
+    """Stores archive files under a directory on the local filesystem."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _full_path(self, key: str) -> str:
+        return os.path.join(self.path, *key.split("/"))
+
+    async def write(self, key: str, content: bytes) -> None:
+        await asyncio.to_thread(self._write, key, content)
+
+    def _write(self, key: str, content: bytes) -> None:
+        full_path = self._full_path(key)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, full_path)
+
+    async def read(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._read, key)
+
+    def _read(self, key: str) -> bytes:
+        with open(self._full_path(key), "rb") as f:
+            return f.read()
+
+    async def list_keys(self, prefix: str) -> List[str]:
+        return await asyncio.to_thread(self._list_keys, prefix)
+
+    def _list_keys(self, prefix: str) -> List[str]:
+        directory = self._full_path(prefix)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            f"{prefix.rstrip('/')}/{name}"
+            for name in os.listdir(directory)
+            if not name.endswith(".tmp")
+        )
+
+
+class S3SpendLogsArchiveStorage:
+    """Stores archive files in an S3 bucket."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        bucket_name = config.get("bucket_name")
+        if not bucket_name:
+            raise ValueError("bucket_name must be provided for s3 spend logs archive")
+        self.bucket_name = bucket_name
+        self.config = config
+        self._client: Optional[Any] = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            import boto3
+
+            client_kwargs: Dict[str, Any] = {}
+            for key in (
+                "region_name",
+                "endpoint_url",
+                "aws_access_key_id",
+                "aws_secret_access_key",
+                "aws_session_token",
+            ):
+                if self.config.get(key):
+                    client_kwargs[key] = self.config[key]
+            self._client = boto3.client("s3", **client_kwargs)
+        return self._client
+
+    async def write(self, key: str, content: bytes) -> None:
+        await asyncio.to_thread(
+            self._get_client().put_object,
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=content,
+            ContentType="application/octet-stream",
+        )
+
+    async def read(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._read, key)
+
+    def _read(self, key: str) -> bytes:
+        response = self._get_client().get_object(Bucket=self.bucket_name, Key=key)
+        return response["Body"].read()
+
+    async def list_keys(self, prefix: str) -> List[str]:
+        return await asyncio.to_thread(self._list_keys, prefix)
+
+    def _list_keys(self, prefix: str) -> List[str]:
+        keys: List[str] = []
+        paginator = self._get_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=prefix.rstrip("/") + "/"
+        ):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        return sorted(keys)
+
+
+class SpendLogsArchive:
+    """
+    Writes spend log rows to date-partitioned archive files, and reads them back
+    for a date range.
+    """
+
+    def __init__(
+        self,
+        storage: SpendLogsArchiveStorage,
+        prefix: str = "spend_logs",
+        archive_format: Optional[SpendLogsArchiveFormat] = None,
+    ) -> None:
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+        if archive_format is None:
+            archive_format = "parquet" if _is_pyarrow_available() else "ndjson"
+        if archive_format not in ("parquet", "ndjson"):
+            raise ValueError(
+                f"Unsupported spend logs archive format: {archive_format}. Expected 'parquet' or 'ndjson'."
+            )
+        if archive_format == "parquet" and not _is_pyarrow_available():
+            raise ValueError(
+                "pyarrow is required for the parquet spend logs archive format. Run `pip install pyarrow`."
+            )
+        self.archive_format: SpendLogsArchiveFormat = archive_format
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SpendLogsArchive":
+        storage_type = config.get("storage", "local")
+        storage: SpendLogsArchiveStorage
+        if storage_type == "local":
+            path = config.get("path")
+            if not path:
+                raise ValueError("path must be provided for local spend logs archive")
+            storage = LocalSpendLogsArchiveStorage(path=path)
+        elif storage_type == "s3":
+            storage = S3SpendLogsArchiveStorage(config=config)
+        else:
+            raise ValueError(
+                f"Unsupported spend logs archive storage: {storage_type}. Expected 'local' or 's3'."
+            )
+        return cls(
+            storage=storage,
+            prefix=config.get("prefix", "spend_logs"),
+            archive_format=config.get("format"),
+        )
+
+    def _partition_prefix(self, day: date) -> str:
+        return "/".join(filter(None, [self.prefix, f"date={day.isoformat()}"]))
+
+    async def archive_spend_logs(self, rows: Iterable[Any]) -> List[str]:
+        """
+        Write rows to one file per `startTime` day. Returns the written keys.
+
+        Raises if any write fails, so callers can keep the rows in the database.
+        """
+        records_by_day: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            record = _to_archive_record(row)
+            start_time = record.get("startTime")
+            if start_time is None:
+                continue
+            records_by_day[start_time.date()].append(record)
+
+        extension = get_archive_file_extension(self.archive_format)
+        keys: List[str] = []
+        for day, records in sorted(records_by_day.items()):
+            first_start_time = min(record["startTime"] for record in records)
+            filename = f"spend_logs_{first_start_time.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:12]}{extension}"
+            key = f"{self._partition_prefix(day)}/{filename}"
+            await self.storage.write(key, serialize_spend_logs(records, extension))
+            keys.append(key)
+        return keys
+
+    async def iter_spend_logs(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield archived spend logs with `start_time <= startTime <= end_time`,
+        matching every `column == value` pair in `filters`, sorted by `startTime`
+        descending like `/spend/logs`.
+
+        Reads one `date=` partition at a time, so memory is bounded by the largest
+        day rather than the whole range. Rows archived more than once (e.g. when a
+        delete failed after upload) land in the same partition and are yielded once.
+        """
+        start_time = _to_utc_datetime(start_time) or start_time
+        end_time = _to_utc_datetime(end_time) or end_time
+        filters = {k: v for k, v in (filters or {}).items() if v is not None}
+
+        day = end_time.date()
+        while day >= start_time.date():
+            partition: Dict[str, Dict[str, Any]] = {}
+            for key in await self.storage.list_keys(self._partition_prefix(day)):
+                try:
+                    records = deserialize_spend_logs(await self.storage.read(key), key)
+                except ValueError as e:
+                    verbose_proxy_logger.warning(
+                        f"Skipping unreadable spend logs archive file {key}: {str(e)}"
+                    )
+                    continue
+                for record in records:
+                    record_start_time = record.get("startTime")
+                    if record_start_time is None or not (
+                        start_time <= record_start_time <= end_time
+                    ):
+                        continue
+                    if any(record.get(k) != v for k, v in filters.items()):
+                        continue
+                    partition[record["request_id"]] = record
+            for record in sorted(
+                partition.values(),
+                key=lambda record: record["startTime"],
+                reverse=True,
+            ):
+                yield record
+            day -= timedelta(days=1)
+
+    async def read_spend_logs(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """All rows of `iter_spend_logs`, for callers that return a list anyway."""
+        return [
+            record
+            async for record in self.iter_spend_logs(
+                start_time=start_time, end_time=end_time, filters=filters
+            )
+        ]
+
+
+def get_spend_logs_archive(
+    general_settings: Optional[Dict[str, Any]] = None,
+) -> Optional[SpendLogsArchive]:
+    """Build the archive from `general_settings["spend_logs_archive"]`, if configured."""
+    if general_settings is None:
+        from litellm.proxy.proxy_server import general_settings
+
+    archive_config = (general_settings or {}).get("spend_logs_archive")
+    if not archive_config:
+        return None
+    return SpendLogsArchive.from_config(dict(archive_config))
+
+
+async def iter_archived_spend_logs(
+    start_time: datetime,
+    end_time: datetime,
+    filters: Optional[Dict[str, Any]] = None,
+    general_settings: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Archived spend logs for a date range, for merging into `/spend/logs` results.
+
+    Yields nothing when no archive is configured, or when the range starts inside
+    the retention period (those rows are still in `LiteLLM_SpendLogs`).
+    """
+    if general_settings is None:
+        from litellm.proxy.proxy_server import general_settings
+
+    archive = get_spend_logs_archive(general_settings)
+    if archive is None:
+        return
+
+    retention_setting = (general_settings or {}).get(
+        "maximum_spend_logs_retention_period"
+    )
+    if retention_setting is not None:
+        from litellm.litellm_core_utils.duration_parser import duration_in_seconds
+
+        cutoff_date = datetime.now(timezone.utc) - timedelta(
+            seconds=duration_in_seconds(str(retention_setting))
+        )
+        if (_to_utc_datetime(start_time) or start_time) >= cutoff_date:
+            return
+
+    async for record in archive.iter_spend_logs(
+        start_time=start_time, end_time=end_time, filters=filters
+    ):
+        yield record
+
+
+async def get_archived_spend_logs(
+    start_time: datetime,
+    end_time: datetime,
+    filters: Optional[Dict[str, Any]] = None,
+    general_settings: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """All rows of `iter_archived_spend_logs`, as a list."""
+    return [
+        record
+        async for record in iter_archived_spend_logs(
+            start_time=start_time,
+            end_time=end_time,
+            filters=filters,
+            general_settings=general_settings,
+        )
+    ]
@@ -0,0 +1,163 @@
+"""
+Keyset pagination and NDJSON streaming over `LiteLLM_SpendLogs`.
+
+Rows are ordered by (`startTime`, `request_id`), so a page boundary is just the
+last row's pair. Each next page is an index range scan on `startTime` instead of an
+OFFSET scan, and a stream only holds one batch of rows in memory at a time.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from fastapi import HTTPException, status
+
+from litellm.constants import SPEND_LOGS_STREAM_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from litellm.proxy.utils import PrismaClient
+else:
+    PrismaClient = Any
+
+SortOrder = Literal["asc", "desc"]
+
+
+def _get_row_value(row: Any, key: str) -> Any:
+    if isinstance(row, dict):
+        return row.get(key)
+    return getattr(row, key, None)
+
+
+def encode_spend_logs_cursor(row: Any) -> str:
+    """Opaque cursor pointing just past `row` in (startTime, request_id) order."""
+    start_time = _get_row_value(row, "startTime")
+    if isinstance(start_time, datetime):
+        start_time = start_time.isoformat()
+    payload = json.dumps([start_time, _get_row_value(row, "request_id")])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_spend_logs_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        start_time, request_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        )
+        return (
+            datetime.fromisoformat(start_time.replace("Z", "+00:00")),
+            str(request_id),
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {cursor}",
+        )
+
+
+def get_spend_logs_keyset_order(sort_order: SortOrder) -> List[Dict[str, str]]:
+    return [{"startTime": sort_order}, {"request_id": sort_order}]
+
+
+def add_spend_logs_keyset_condition(
+    where: Dict[str, Any], cursor: Optional[str], sort_order: SortOrder
+) -> Dict[str, Any]:
+    """Restrict `where` to rows strictly after `cursor` in the given sort order."""
+    if not cursor:
+        return where
+    start_time, request_id = decode_spend_logs_cursor(cursor)
+    op = "lt" if sort_order == "desc" else "gt"
+    return {
+        "AND": [
+            where,
+            {
+                "OR": [
+                    {"startTime": {op: start_time}},
+                    {"startTime": start_time, "request_id": {op: request_id}},
+                ]
+            },
+        ]
+    }
+
+
+async def get_spend_logs_keyset_page(
+    prisma_client: PrismaClient,
+    where: Dict[str, Any],
+    page_size: int,
+    sort_order: SortOrder = "desc",
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Returns one page of spend logs after `cursor`, and the cursor for the next page
+    (None on the last page).
+    """
+    rows = await prisma_client.db.litellm_spendlogs.find_many(
+        where=add_spend_logs_keyset_condition(where, cursor, sort_order),  # type: ignore
+        order=get_spend_logs_keyset_order(sort_order),  # type: ignore
+        take=page_size + 1,
+    )
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        return rows, encode_spend_logs_cursor(rows[-1])
+    return rows, None
+
+
+async def iter_spend_logs(
+    prisma_client: PrismaClient,
+    where: Dict[str, Any],
+    sort_order: SortOrder = "desc",
+    cursor: Optional[str] = None,
+    batch_size: int = SPEND_LOGS_STREAM_BATCH_SIZE,
+) -> AsyncIterator[Any]:
+    """Yield every matching spend log, fetching `batch_size` rows at a time."""
+    while True:
+        rows, cursor = await get_spend_logs_keyset_page(
+            prisma_client=prisma_client,
+            where=where,
+            page_size=batch_size,
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+        for row in rows:
+            yield row
+        if cursor is None:
+            return
+
+
+def spend_log_to_json(row: Any) -> str:
+    if hasattr(row, "model_dump_json"):
+        return row.model_dump_json()
+    return json.dumps(row, default=str)
+
+
+async def stream_spend_logs_ndjson(
+    prisma_client: PrismaClient,
+    where: Dict[str, Any],
+    sort_order: SortOrder = "desc",
+    cursor: Optional[str] = None,
+    extra_rows: Optional[AsyncIterable[Any]] = None,
+) -> AsyncIterator[bytes]:
+    """
+    NDJSON body for a `StreamingResponse`: one spend log per line, followed by
+    `extra_rows` (e.g. archived logs older than everything in the table), which
+    are only read once the table rows are exhausted.
+    """
+    async for row in iter_spend_logs(
+        prisma_client=prisma_client,
+        where=where,
+        sort_order=sort_order,
+        cursor=cursor,
+    ):
+        yield (spend_log_to_json(row) + "\n").encode("utf-8")
+    if extra_rows is not None:
+        async for row in extra_rows:
+            yield (spend_log_to_json(row) + "\n").encode("utf-8")
@@ -0,0 +1,789 @@
+"""
+Hourly / daily rollups of LiteLLM_SpendLogs.
+
+The /global/activity* and /global/spend/* analytics endpoints aggregate LiteLLM_SpendLogs over the
+requested date range on every call - a scan of every request in the range.
+
+With `general_settings.use_spend_logs_rollups: true`:
+- `update_spend_logs` writes each batch of spend logs and the matching rollup increments
+  (`LiteLLM_SpendLogsRollup`, `LiteLLM_SpendLogsTagRollup`) in one transaction
+- the analytics endpoints read the daily rollups instead of LiteLLM_SpendLogs
+- `backfill_spend_logs_rollups` (`POST /global/spend/rollups/backfill`) rebuilds the rollups for a
+  date range from LiteLLM_SpendLogs - run it for spend logs written before rollups were enabled
+
+Rollups are keyed by (team, key, user, end user, model, model group, deployment, provider, status),
+tag rollups by (tag, team, key, model, deployment, status).
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.proxy._types import (
+    SpendLogsRollupTransaction,
+    SpendLogsTagRollupTransaction,
+)
+
+if TYPE_CHECKING:
+    from litellm.proxy.utils import PrismaClient
+else:
+    PrismaClient = Any
+
+SpendLogsRollupGranularity = Literal["hour", "day"]
+SPEND_LOGS_ROLLUP_GRANULARITIES: Tuple[SpendLogsRollupGranularity, ...] = (
+    "hour",
+    "day",
+)
+
+SPEND_LOGS_ROLLUP_UNIQUE_CONSTRAINT = "granularity_period_start_team_id_api_key_user_end_user_model_model_group_model_id_custom_llm_provider_status"
+SPEND_LOGS_TAG_ROLLUP_UNIQUE_CONSTRAINT = (
+    "granularity_period_start_tag_team_id_api_key_model_model_id_status"
+)
+
+_ROLLUP_DIMENSIONS = (
+    "team_id",
+    "api_key",
+    "user",
+    "end_user",
+    "model",
+    "model_group",
+    "model_id",
+    "custom_llm_provider",
+    "status",
+)
+_TAG_ROLLUP_DIMENSIONS = (
+    "team_id",
+    "api_key",
+    "model",
+    "model_id",
+    "status",
+)
+
+
+def use_spend_logs_rollups() -> bool:
+    """
+    True if spend logs rollups should be maintained and used by the spend analytics endpoints.
+
+    Not supported when spend logs are written by a separate service (`SPEND_LOGS_URL`).
+    """
+    from litellm.proxy.proxy_server import general_settings
+
+    if general_settings.get("use_spend_logs_rollups") is not True:
+        return False
+    return os.getenv("SPEND_LOGS_URL") is None
+
+
+def _get_period_start(
+    start_time: Any, granularity: SpendLogsRollupGranularity
+) -> datetime:
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time)
+    if start_time.tzinfo is not None:
+        start_time = start_time.astimezone(timezone.utc)
+    else:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    if granularity == "hour":
+        return start_time.replace(minute=0, second=0, microsecond=0)
+    return start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _get_request_tags(request_tags: Any) -> List[str]:
+    if isinstance(request_tags, str):
+        try:
+            request_tags = json.loads(request_tags)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(request_tags, list):
+        return []
+    return [str(tag) for tag in request_tags if tag is not None]
+
+
+def get_spend_logs_rollup_transactions(
+    spend_logs: List[dict],
+) -> Tuple[List[SpendLogsRollupTransaction], List[SpendLogsTagRollupTransaction]]:
+    """
+    Aggregate spend logs into hourly and daily rollup increments.
+
+    Returned sorted by key, so concurrent writers lock rollup rows in the same order.
+    """
+    rollups: Dict[tuple, SpendLogsRollupTransaction] = {}
+    tag_rollups: Dict[tuple, SpendLogsTagRollupTransaction] = {}
+
+    for spend_log in spend_logs:
+        dimensions = {
+            dimension: str(spend_log.get(dimension) or "")
+            for dimension in _ROLLUP_DIMENSIONS
+        }
+        prompt_tokens = int(spend_log.get("prompt_tokens") or 0)
+        completion_tokens = int(spend_log.get("completion_tokens") or 0)
+        total_tokens = int(spend_log.get("total_tokens") or 0)
+        spend = float(spend_log.get("spend") or 0.0)
+        request_tags = _get_request_tags(spend_log.get("request_tags"))
+
+        for granularity in SPEND_LOGS_ROLLUP_GRANULARITIES:
+            period_start = _get_period_start(spend_log["startTime"], granularity)
+
+            key = (granularity, period_start) + tuple(
+                dimensions[dimension] for dimension in _ROLLUP_DIMENSIONS
+            )
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = SpendLogsRollupTransaction(
+                    granularity=granularity,
+                    period_start=period_start,
+                    team_id=dimensions["team_id"],
+                    api_key=dimensions["api_key"],
+                    user=dimensions["user"],
+                    end_user=dimensions["end_user"],
+                    model=dimensions["model"],
+                    model_group=dimensions["model_group"],
+                    model_id=dimensions["model_id"],
+                    custom_llm_provider=dimensions["custom_llm_provider"],
+                    status=dimensions["status"],
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    total_tokens=0,
+                    spend=0.0,
+                    api_requests=0,
+                )
+                rollups[key] = rollup
+            rollup["prompt_tokens"] += prompt_tokens
+            rollup["completion_tokens"] += completion_tokens
+            rollup["total_tokens"] += total_tokens
+            rollup["spend"] += spend
+            rollup["api_requests"] += 1
+
+            for tag in request_tags:
+                tag_key = (granularity, period_start, tag) + tuple(
+                    dimensions[dimension] for dimension in _TAG_ROLLUP_DIMENSIONS
+                )
+                tag_rollup = tag_rollups.get(tag_key)
+                if tag_rollup is None:
+                    tag_rollup = SpendLogsTagRollupTransaction(
+                        granularity=granularity,
+                        period_start=period_start,
+                        tag=tag,
+                        team_id=dimensions["team_id"],
+                        api_key=dimensions["api_key"],
+                        model=dimensions["model"],
+                        model_id=dimensions["model_id"],
+                        status=dimensions["status"],
+                        prompt_tokens=0,
+                        completion_tokens=0,
+                        total_tokens=0,
+                        spend=0.0,
+                        api_requests=0,
+                    )
+                    tag_rollups[tag_key] = tag_rollup
+                tag_rollup["prompt_tokens"] += prompt_tokens
+                tag_rollup["completion_tokens"] += completion_tokens
+                tag_rollup["total_tokens"] += total_tokens
+                tag_rollup["spend"] += spend
+                tag_rollup["api_requests"] += 1
+
+    return (
+        [rollups[key] for key in sorted(rollups)],
+        [tag_rollups[key] for key in sorted(tag_rollups)],
+    )
+
+
+def _get_rollup_upsert_data(
+    rollup: dict, dimensions: Tuple[str, ...]
+) -> Tuple[dict, dict]:
+    """Returns (create, update) data for a rollup upsert - updates increment the counters."""
+    counters = {
+        "prompt_tokens": rollup["prompt_tokens"],
+        "completion_tokens": rollup["completion_tokens"],
+        "total_tokens": rollup["total_tokens"],
+        "spend": rollup["spend"],
+        "api_requests": rollup["api_requests"],
+    }
+    create_data = {
+        "id": str(uuid.uuid4()),
+        "granularity": rollup["granularity"],
+        "period_start": rollup["period_start"],
+        **{dimension: rollup[dimension] for dimension in dimensions},
+        **counters,
+    }
+    update_data = {
+        counter: {"increment": value} for counter, value in counters.items()
+    }
+    return create_data, update_data
+
+
+async def write_spend_logs_with_rollups(
+    prisma_client: PrismaClient, spend_logs: List[dict]
+) -> None:
+    """
+    Insert a batch of spend logs and add them to the rollups, in one transaction.
+
+    Spend logs already in the DB (e.g. re-sent after a failed flush) are skipped by the insert,
+    and are not added to the rollups again.
+    """
+    request_ids = [spend_log["request_id"] for spend_log in spend_logs]
+    async with prisma_client.db.tx(timeout=timedelta(seconds=60)) as transaction:
+        existing_rows = await transaction.query_raw(
+            'SELECT request_id FROM "LiteLLM_SpendLogs" WHERE request_id = ANY($1::text[])',
+            request_ids,
+        )
+        await transaction.litellm_spendlogs.create_many(
+            data=spend_logs, skip_duplicates=True
+        )
+
+        seen_request_ids = {row["request_id"] for row in existing_rows or []}
+        new_spend_logs = []
+        for spend_log in spend_logs:
+            if spend_log["request_id"] in seen_request_ids:
+                continue
+            seen_request_ids.add(spend_log["request_id"])
+            new_spend_logs.append(spend_log)
+
+        rollups, tag_rollups = get_spend_logs_rollup_transactions(new_spend_logs)
+        if not rollups:
+            return
+        async with transaction.batch_() as batcher:
+            for rollup in rollups:
+                create_data, update_data = _get_rollup_upsert_data(
+                    dict(rollup), _ROLLUP_DIMENSIONS
+                )
+                batcher.litellm_spendlogsrollup.upsert(
+                    where={
+                        SPEND_LOGS_ROLLUP_UNIQUE_CONSTRAINT: {
+                            "granularity": rollup["granularity"],
+                            "period_start": rollup["period_start"],
+                            **{
+                                dimension: rollup[dimension]  # type: ignore[literal-required]
+                                for dimension in _ROLLUP_DIMENSIONS
+                            },
+                        }
+                    },
+                    data={"create": create_data, "update": update_data},
+                )
+            for tag_rollup in tag_rollups:
+                create_data, update_data = _get_rollup_upsert_data(
+                    dict(tag_rollup), ("tag",) + _TAG_ROLLUP_DIMENSIONS
+                )
+                batcher.litellm_spendlogstagrollup.upsert(
+                    where={
+                        SPEND_LOGS_TAG_ROLLUP_UNIQUE_CONSTRAINT: {
+                            "granularity": tag_rollup["granularity"],
+                            "period_start": tag_rollup["period_start"],
+                            "tag": tag_rollup["tag"],
+                            **{
+                                dimension: tag_rollup[dimension]  # type: ignore[literal-required]
+                                for dimension in _TAG_ROLLUP_DIMENSIONS
+                            },
+                        }
+                    },
+                    data={"create": create_data, "update": update_data},
+                )
+
+    verbose_proxy_logger.debug(
+        "Added %s spend logs to %s rollups, %s tag rollups",
+        len(new_spend_logs),
+        len(rollups),
+        len(tag_rollups),
+    )
+
+
+############################
+# Backfill from spend logs #
+############################
+
+_BACKFILL_HOURLY_ROLLUPS_QUERY = """
+INSERT INTO "LiteLLM_SpendLogsRollup" (
+    id, granularity, period_start, team_id, api_key, "user", end_user, model, model_group,
+    model_id, custom_llm_provider, status, prompt_tokens, completion_tokens, total_tokens,
+    spend, api_requests, updated_at
+)
+SELECT
+    md5(concat_ws('|', 'hour', period_start, team_id, api_key, "user", end_user, model, model_group, model_id, custom_llm_provider, status)),
+    'hour', period_start, team_id, api_key, "user", end_user, model, model_group,
+    model_id, custom_llm_provider, status, prompt_tokens, completion_tokens, total_tokens,
+    spend, api_requests, NOW()
+FROM (
+    SELECT
+        date_trunc('hour', "startTime") AS period_start,
+        COALESCE(team_id, '') AS team_id,
+        COALESCE(api_key, '') AS api_key,
+        COALESCE("user", '') AS "user",
+        COALESCE(end_user, '') AS end_user,
+        COALESCE(model, '') AS model,
+        COALESCE(model_group, '') AS model_group,
+        COALESCE(model_id, '') AS model_id,
+        COALESCE(custom_llm_provider, '') AS custom_llm_provider,
+        COALESCE(status, '') AS status,
+        SUM(prompt_tokens) AS prompt_tokens,
+        SUM(completion_tokens) AS completion_tokens,
+        SUM(total_tokens) AS total_tokens,
+        SUM(spend) AS spend,
+        COUNT(*) AS api_requests
+    FROM "LiteLLM_SpendLogs"
+    WHERE "startTime" >= $1::timestamptz AND "startTime" < $2::timestamptz
+    GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10
+) AS hourly
+"""
+
+_BACKFILL_HOURLY_TAG_ROLLUPS_QUERY = """
+INSERT INTO "LiteLLM_SpendLogsTagRollup" (
+    id, granularity, period_start, tag, team_id, api_key, model, model_id, status,
+    prompt_tokens, completion_tokens, total_tokens, spend, api_requests, updated_at
+)
+SELECT
+    md5(concat_ws('|', 'hour', period_start, tag, team_id, api_key, model, model_id, status)),
+    'hour', period_start, tag, team_id, api_key, model, model_id, status,
+    prompt_tokens, completion_tokens, total_tokens, spend, api_requests, NOW()
+FROM (
+    SELECT
+        date_trunc('hour', sl."startTime") AS period_start,
+        request_tag.tag AS tag,
+        COALESCE(sl.team_id, '') AS team_id,
+        COALESCE(sl.api_key, '') AS api_key,
+        COALESCE(sl.model, '') AS model,
+        COALESCE(sl.model_id, '') AS model_id,
+        COALESCE(sl.status, '') AS status,
+        SUM(sl.prompt_tokens) AS prompt_tokens,
+        SUM(sl.completion_tokens) AS completion_tokens,
+        SUM(sl.total_tokens) AS total_tokens,
+        SUM(sl.spend) AS spend,
+        COUNT(*) AS api_requests
+    FROM "LiteLLM_SpendLogs" sl
+    CROSS JOIN LATERAL jsonb_array_elements_text(sl.request_tags) AS request_tag(tag)
+    WHERE sl."startTime" >= $1::timestamptz AND sl."startTime" < $2::timestamptz
+    AND jsonb_typeof(sl.request_tags) = 'array'
+    GROUP BY 1, 2, 3, 4, 5, 6, 7
+) AS hourly
+"""
+
+_BACKFILL_DAILY_ROLLUPS_QUERY = """
+INSERT INTO "LiteLLM_SpendLogsRollup" (
+    id, granularity, period_start, team_id, api_key, "user", end_user, model, model_group,
+    model_id, custom_llm_provider, status, prompt_tokens, completion_tokens, total_tokens,
+    spend, api_requests, updated_at
+)
+SELECT
+    md5(concat_ws('|', 'day', date_trunc('day', period_start), team_id, api_key, "user", end_user, model, model_group, model_id, custom_llm_provider, status)),
+    'day', date_trunc('day', period_start), team_id, api_key, "user", end_user, model, model_group,
+    model_id, custom_llm_provider, status, SUM(prompt_tokens), SUM(completion_tokens),
+    SUM(total_tokens), SUM(spend), SUM(api_requests), NOW()
+FROM "LiteLLM_SpendLogsRollup"
+WHERE granularity = 'hour' AND period_start >= $1::timestamptz AND period_start < $2::timestamptz
+GROUP BY date_trunc('day', period_start), team_id, api_key, "user", end_user, model, model_group, model_id, custom_llm_provider, status
+"""
+
+_BACKFILL_DAILY_TAG_ROLLUPS_QUERY = """
+INSERT INTO "LiteLLM_SpendLogsTagRollup" (
+    id, granularity, period_start, tag, team_id, api_key, model, model_id, status,
+    prompt_tokens, completion_tokens, total_tokens, spend, api_requests, updated_at
+)
+SELECT
+    md5(concat_ws('|', 'day', date_trunc('day', period_start), tag, team_id, api_key, model, model_id, status)),
+    'day', date_trunc('day', period_start), tag, team_id, api_key, model, model_id, status,
+    SUM(prompt_tokens), SUM(completion_tokens), SUM(total_tokens), SUM(spend),
+    SUM(api_requests), NOW()
+FROM "LiteLLM_SpendLogsTagRollup"
+WHERE granularity = 'hour' AND period_start >= $1::timestamptz AND period_start < $2::timestamptz
+GROUP BY date_trunc('day', period_start), tag, team_id, api_key, model, model_id, status
+"""
+
+
+async def backfill_spend_logs_rollups(
+    prisma_client: PrismaClient, start_date: datetime, end_date: datetime
+) -> int:
+    """
+    Rebuild the hourly and daily rollups for every day from `start_date` to `end_date` (inclusive)
+    from LiteLLM_SpendLogs.
+
+    Each day is rebuilt in its own transaction, holding a lock that makes concurrent spend log
+    flushes wait - so the rebuilt day is exact even while the proxy keeps writing spend logs.
+
+    Returns the number of days rebuilt.
+    """
+    day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    days_rebuilt = 0
+    while day <= end_date:
+        next_day = day + timedelta(days=1)
+        async with prisma_client.db.tx(timeout=timedelta(minutes=10)) as transaction:
+            await transaction.execute_raw(
+                'LOCK TABLE "LiteLLM_SpendLogsRollup", "LiteLLM_SpendLogsTagRollup" IN SHARE ROW EXCLUSIVE MODE'
+            )
+            for table_name in ("LiteLLM_SpendLogsRollup", "LiteLLM_SpendLogsTagRollup"):
+                await transaction.execute_raw(
+                    f'DELETE FROM "{table_name}" WHERE period_start >= $1::timestamptz AND period_start < $2::timestamptz',
+                    day,
+                    next_day,
+                )
+            for sql_query in (
+                _BACKFILL_HOURLY_ROLLUPS_QUERY,
+                _BACKFILL_HOURLY_TAG_ROLLUPS_QUERY,
+                _BACKFILL_DAILY_ROLLUPS_QUERY,
+                _BACKFILL_DAILY_TAG_ROLLUPS_QUERY,
+            ):
+                await transaction.execute_raw(sql_query, day, next_day)
+        days_rebuilt += 1
+        verbose_proxy_logger.debug(
+            "Rebuilt spend logs rollups for %s", day.strftime("%Y-%m-%d")
+        )
+        day = next_day
+    return days_rebuilt
+
+
+##########################################
+# Spend analytics queries on the rollups #
+##########################################
+# Each returns the same rows as the matching LiteLLM_SpendLogs query in spend_management_endpoints.py.
+# Sums of BigInt rollup columns are cast back to bigint, the type the same sum has over LiteLLM_SpendLogs.
+
+
+async def get_daily_activity_from_rollups(
+    prisma_client: PrismaClient,
+    start_date: datetime,
+    end_date: datetime,
+    user_id: Optional[str] = None,
+    group_by_model_group: bool = False,
+) -> List[dict]:
+    """
+    Requests and total tokens per day (and model group) - rows of `date`, `api_requests`, `total_tokens`
+    """
+    group_by_columns = "model_group, " if group_by_model_group else ""
+    user_filter = 'AND "user" = $3' if user_id is not None else ""
+    sql_query = f"""
+    SELECT
+        {group_by_columns}period_start AS date,
+        SUM(api_requests)::bigint AS api_requests,
+        SUM(total_tokens)::bigint AS total_tokens
+    FROM "LiteLLM_SpendLogsRollup"
+    WHERE granularity = 'day'
+    AND period_start >= $1::timestamptz AND period_start < ($2::timestamptz + INTERVAL '1 day')
+    {user_filter}
+    GROUP BY {group_by_columns}period_start
+    """
+    args: List[Any] = [start_date, end_date]
+    if user_id is not None:
+        args.append(user_id)
+    return await prisma_client.db.query_raw(sql_query, *args)
+
+
+async def get_spend_per_deployment_from_rollups(
+    prisma_client: PrismaClient,
+    start_date: datetime,
+    end_date: datetime,
+    user_id: Optional[str] = None,
+) -> List[dict]:
+    """
+    Spend per deployment - rows of `model_id`, `spend`
+    """
+    user_filter = 'AND "user" = $3' if user_id is not None else ""
+    sql_query = f"""
+    SELECT
+        model_id,
+        SUM(spend) AS spend
+    FROM "LiteLLM_SpendLogsRollup"
+    WHERE granularity = 'day'
+    AND period_start >= $1::timestamptz AND period_start < ($2::timestamptz + INTERVAL '1 day')
+    AND length(model_id) > 0
+    {user_filter}
+    GROUP BY model_id
+    """
+    args: List[Any] = [start_date, end_date]
+    if user_id is not None:
+        args.append(user_id)
+    return await prisma_client.db.query_raw(sql_query, *args)
+
+
+_SPEND_REPORT_BY_API_KEY_QUERY = """
+WITH SpendByModelApiKey AS (
+    SELECT
+        r.api_key,
+        r.model,
+        SUM(r.spend) AS model_cost,
+        SUM(r.prompt_tokens)::bigint AS model_input_tokens,
+        SUM(r.completion_tokens)::bigint AS model_output_tokens
+    FROM
+        "LiteLLM_SpendLogsRollup" r
+    WHERE
+        r.granularity = 'day'
+        AND r.period_start >= $1::timestamptz AND r.period_start < ($2::timestamptz + INTERVAL '1 day')
+        {filter}
+    GROUP BY
+        r.api_key,
+        r.model
+)
+SELECT
+    api_key,
+    SUM(model_cost) AS total_cost,
+    SUM(model_input_tokens) AS total_input_tokens,
+    SUM(model_output_tokens) AS total_output_tokens,
+    jsonb_agg(jsonb_build_object(
+        'model', model,
+        'total_cost', model_cost,
+        'total_input_tokens', model_input_tokens,
+        'total_output_tokens', model_output_tokens
+    )) AS model_details
+FROM
+    SpendByModelApiKey
+GROUP BY
+    api_key
+ORDER BY
+    total_cost DESC;
+"""
+
+_SPEND_REPORT_BY_TEAM_QUERY = """
+WITH SpendByModelApiKey AS (
+    SELECT
+        r.period_start AS group_by_day,
+        COALESCE(tt.team_alias, 'Unassigned Team') AS team_name,
+        r.model,
+        r.api_key,
+        SUM(r.spend) AS model_api_spend,
+        SUM(r.total_tokens)::bigint AS model_api_tokens
+    FROM
+        "LiteLLM_SpendLogsRollup" r
+    LEFT JOIN
+        "LiteLLM_TeamTable" tt
+    ON
+        r.team_id = tt.team_id
+    WHERE
+        r.granularity = 'day'
+        AND r.period_start >= $1::timestamptz AND r.period_start < ($2::timestamptz + INTERVAL '1 day')
+    GROUP BY
+        r.period_start,
+        tt.team_alias,
+        r.model,
+        r.api_key
+)
+SELECT
+    group_by_day,
+    jsonb_agg(jsonb_build_object(
+        'team_name', team_name,
+        'total_spend', total_spend,
+        'metadata', metadata
+    )) AS teams
+FROM (
+    SELECT
+        group_by_day,
+        team_name,
+        SUM(model_api_spend) AS total_spend,
+        jsonb_agg(jsonb_build_object(
+            'model', model,
+            'api_key', api_key,
+            'spend', model_api_spend,
+            'total_tokens', model_api_tokens
+        )) AS metadata
+    FROM
+        SpendByModelApiKey
+    GROUP BY
+        group_by_day,
+        team_name
+) AS aggregated
+GROUP BY
+    group_by_day
+ORDER BY
+    group_by_day;
+"""
+
+_SPEND_REPORT_BY_CUSTOMER_QUERY = """
+WITH SpendByModelApiKey AS (
+    SELECT
+        r.period_start AS group_by_day,
+        r.end_user AS customer,
+        r.model,
+        r.api_key,
+        SUM(r.spend) AS model_api_spend,
+        SUM(r.total_tokens)::bigint AS model_api_tokens
+    FROM
+        "LiteLLM_SpendLogsRollup" r
+    WHERE
+        r.granularity = 'day'
+        AND r.period_start >= $1::timestamptz AND r.period_start < ($2::timestamptz + INTERVAL '1 day')
+    GROUP BY
+        r.period_start,
+        r.end_user,
+        r.model,
+        r.api_key
+)
+SELECT
+    group_by_day,
+    jsonb_agg(jsonb_build_object(
+        'customer', customer,
+        'total_spend', total_spend,
+        'metadata', metadata
+    )) AS customers
+FROM (
+    SELECT
+        group_by_day,
+        customer,
+        SUM(model_api_spend) AS total_spend,
+        jsonb_agg(jsonb_build_object(
+            'model', model,
+            'api_key', api_key,
+            'spend', model_api_spend,
+            'total_tokens', model_api_tokens
+        )) AS metadata
+    FROM
+        SpendByModelApiKey
+    GROUP BY
+        group_by_day,
+        customer
+) AS aggregated
+GROUP BY
+    group_by_day
+ORDER BY
+    group_by_day;
+"""
+
+_SPEND_REPORT_BY_TEAM_AND_CUSTOMER_QUERY = """
+WITH SpendByModelApiKey AS (
+    SELECT
+        r.period_start AS group_by_day,
+        COALESCE(tt.team_alias, 'Unassigned Team') AS team_name,
+        r.end_user AS customer,
+        r.model,
+        r.api_key,
+        SUM(r.spend) AS model_api_spend,
+        SUM(r.total_tokens)::bigint AS model_api_tokens
+    FROM
+        "LiteLLM_SpendLogsRollup" r
+    LEFT JOIN
+        "LiteLLM_TeamTable" tt
+    ON
+        r.team_id = tt.team_id
+    WHERE
+        r.granularity = 'day'
+        AND r.period_start >= $1::timestamptz AND r.period_start < ($2::timestamptz + INTERVAL '1 day')
+        AND r.team_id = $3
+        AND r.end_user = $4
+    GROUP BY
+        r.period_start,
+        tt.team_alias,
+        r.end_user,
+        r.model,
+        r.api_key
+)
+SELECT
+    group_by_day,
+    jsonb_agg(jsonb_build_object(
+        'team_name', team_name,
+        'customer', customer,
+        'total_spend', total_spend,
+        'metadata', metadata
+    )) AS teams_customers
+FROM (
+    SELECT
+        group_by_day,
+        team_name,
+        customer,
+        SUM(model_api_spend) AS total_spend,
+        jsonb_agg(jsonb_build_object(
+            'model', model,
+            'api_key', api_key,
+            'spend', model_api_spend,
+            'total_tokens', model_api_tokens
+        )) AS metadata
+    FROM
+        SpendByModelApiKey
+    GROUP BY
+        group_by_day,
+        team_name,
+        customer
+) AS aggregated
+GROUP BY
+    group_by_day
+ORDER BY
+    group_by_day;
+"""
+
+
+async def get_spend_report_from_rollups(
+    prisma_client: PrismaClient,
+    start_date: datetime,
+    end_date: datetime,
+    group_by: Optional[Literal["team", "customer", "api_key"]],
+    api_key: Optional[str] = None,
+    internal_user_id: Optional[str] = None,
+    team_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+) -> Optional[List[dict]]:
+    """
+    /global/spend/report - `api_key` must already be hashed.
+
+    Filters take precedence over `group_by` in the same order as the spend logs queries.
+    """
+    if api_key is not None:
+        return await prisma_client.db.query_raw(
+            _SPEND_REPORT_BY_API_KEY_QUERY.format(filter="AND r.api_key = $3"),
+            start_date,
+            end_date,
+            api_key,
+        )
+    elif internal_user_id is not None:
+        return await prisma_client.db.query_raw(
+            _SPEND_REPORT_BY_API_KEY_QUERY.format(filter='AND r."user" = $3'),
+            start_date,
+            end_date,
+            internal_user_id,
+        )
+    elif team_id is not None and customer_id is not None:
+        return await prisma_client.db.query_raw(
+            _SPEND_REPORT_BY_TEAM_AND_CUSTOMER_QUERY,
+            start_date,
+            end_date,
+            team_id,
+            customer_id,
+        )
+    elif group_by == "team":
+        return await prisma_client.db.query_raw(
+            _SPEND_REPORT_BY_TEAM_QUERY, start_date, end_date
+        )
+    elif group_by == "customer":
+        return await prisma_client.db.query_raw(
+            _SPEND_REPORT_BY_CUSTOMER_QUERY, start_date, end_date
+        )
+    elif group_by == "api_key":
+        return await prisma_client.db.query_raw(
+            _SPEND_REPORT_BY_API_KEY_QUERY.format(filter=""), start_date, end_date
+        )
+    return None
+
+
+async def get_daily_tag_spend_from_rollups(
+    prisma_client: PrismaClient,
+    start_date: str,
+    end_date: str,
+    tags_list: Optional[List[str]] = None,
+) -> List[dict]:
+    """
+    Same rows as the "DailyTagSpend" view queries - `individual_request_tag`, `log_count`,
+    `total_spend` (+ `spend_date` when not filtering by tags)
+    """
+    if tags_list is None:
+        sql_query = """
+        SELECT
+            tag AS individual_request_tag,
+            period_start::date AS spend_date,
+            SUM(api_requests)::bigint AS log_count,
+            SUM(spend) AS total_spend
+        FROM "LiteLLM_SpendLogsTagRollup"
+        WHERE granularity = 'day'
+        AND period_start >= $1::date AND period_start < ($2::date + INTERVAL '1 day')
+        GROUP BY tag, period_start
+        ORDER BY total_spend DESC;
+        """
+        return await prisma_client.db.query_raw(sql_query, start_date, end_date)
+
+    sql_query = """
+    SELECT
+        tag AS individual_request_tag,
+        SUM(api_requests)::bigint AS log_count,
+        SUM(spend) AS total_spend
+    FROM "LiteLLM_SpendLogsTagRollup"
+    WHERE granularity = 'day'
+    AND period_start >= $1::date AND period_start < ($2::date + INTERVAL '1 day')
+    AND tag = ANY($3::text[])
+    GROUP BY tag
+    ORDER BY total_spend DESC;
+    """
+    return await prisma_client.db.query_raw(sql_query, start_date, end_date, tags_list)
@@ -4,10 +4,11 @@ import json
 import os
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Literal, Optional
 
 import fastapi
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 
 import litellm
 from litellm._logging import verbose_proxy_logger
@@ -18,6 +19,18 @@ from litellm.proxy.management_endpoints.common_utils import (
     _is_user_team_admin,
     _user_has_admin_view,
 )
+from litellm.proxy.spend_tracking.spend_logs_keyset import (
+    get_spend_logs_keyset_page,
+    stream_spend_logs_ndjson,
+)
+from litellm.proxy.spend_tracking.spend_logs_rollups import (
+    backfill_spend_logs_rollups,
+    get_daily_activity_from_rollups,
+    get_daily_tag_spend_from_rollups,
+    get_spend_per_deployment_from_rollups,
+    get_spend_report_from_rollups,
+    use_spend_logs_rollups,
+)
 from litellm.proxy.spend_tracking.spend_tracking_utils import (
     get_spend_by_team_and_customer,
 )
@@ -207,6 +220,11 @@ async def get_global_activity_internal_user(
     if user_id is None:
         raise HTTPException(status_code=500, detail={"error": "No user_id found"})
 
+    if use_spend_logs_rollups():
+        return await get_daily_activity_from_rollups(
+            prisma_client, start_date, end_date, user_id=user_id
+        )
+
     sql_query = """
     SELECT
         date_trunc('day', "startTime") AS date,
@@ -290,6 +308,10 @@ async def get_global_activity(
             db_response = await get_global_activity_internal_user(
                 user_api_key_dict, start_date_obj, end_date_obj
             )
+        elif use_spend_logs_rollups():
+            db_response = await get_daily_activity_from_rollups(
+                prisma_client, start_date_obj, end_date_obj
+            )
         else:
             sql_query = """
             SELECT
@@ -349,6 +371,15 @@ async def get_global_activity_model_internal_user(
     if user_id is None:
         raise HTTPException(status_code=500, detail={"error": "No user_id found"})
 
+    if use_spend_logs_rollups():
+        return await get_daily_activity_from_rollups(
+            prisma_client,
+            start_date,
+            end_date,
+            user_id=user_id,
+            group_by_model_group=True,
+        )
+
     sql_query = """
     SELECT
         model_group,
@@ -456,6 +487,13 @@ async def get_global_activity_model(
             db_response = await get_global_activity_model_internal_user(
                 user_api_key_dict, start_date_obj, end_date_obj
             )
+        elif use_spend_logs_rollups():
+            db_response = await get_daily_activity_from_rollups(
+                prisma_client,
+                start_date_obj,
+                end_date_obj,
+                group_by_model_group=True,
+            )
         else:
             sql_query = """
             SELECT
@@ -838,7 +876,22 @@ async def get_global_spend_provider(
                 "Database not connected. Connect a database to your proxy - https://docs.litellm.ai/docs/simple_proxy#managing-auth---virtual-keys"
             )
 
-        if (
+        if use_spend_logs_rollups():
+            user_id: Optional[str] = None
+            if (
+                user_api_key_dict.user_role == LitellmUserRoles.INTERNAL_USER
+                or user_api_key_dict.user_role
+                == LitellmUserRoles.INTERNAL_USER_VIEW_ONLY
+            ):
+                user_id = user_api_key_dict.user_id
+                if user_id is None:
+                    raise HTTPException(
+                        status_code=400, detail={"error": "No user_id found"}
+                    )
+            db_response = await get_spend_per_deployment_from_rollups(
+                prisma_client, start_date_obj, end_date_obj, user_id=user_id
+            )
+        elif (
             user_api_key_dict.user_role == LitellmUserRoles.INTERNAL_USER
             or user_api_key_dict.user_role == LitellmUserRoles.INTERNAL_USER_VIEW_ONLY
         ):
@@ -1002,6 +1055,23 @@ async def get_global_spend_report(
             raise ValueError(
                 "/spend/report endpoint " + CommonProxyErrors.not_premium_user.value
             )
+        if use_spend_logs_rollups():
+            if api_key is not None and api_key.startswith("sk-"):
+                api_key = hash_token(token=api_key)
+            db_response = await get_spend_report_from_rollups(
+                prisma_client,
+                start_date_obj,
+                end_date_obj,
+                group_by=group_by,
+                api_key=api_key,
+                internal_user_id=internal_user_id,
+                team_id=team_id,
+                customer_id=customer_id,
+            )
+            if db_response is None:
+                return []
+
+            return db_response
         if api_key is not None:
             verbose_proxy_logger.debug("Getting /spend for api_key: %s", api_key)
             if api_key.startswith("sk-"):
@@ -1695,6 +1765,18 @@ async def ui_view_spend_logs(  # noqa: PLR0915
         default="desc",
         description="Sort order: asc or desc",
     ),
+    pagination: Literal["offset", "cursor"] = fastapi.Query(
+        default="offset",
+        description="'offset' pages with page/page_size. 'cursor' pages by (startTime, request_id) - pass the response's next_cursor as cursor to get the next page. Requires sort_by=startTime.",
+    ),
+    cursor: Optional[str] = fastapi.Query(
+        default=None,
+        description="next_cursor from a previous response. Implies pagination=cursor.",
+    ),
+    stream: bool = fastapi.Query(
+        default=False,
+        description="Stream all matching logs as NDJSON (one log per line) instead of a page. Requires sort_by=startTime.",
+    ),
 ):
     """
     View spend logs with pagination support.
@@ -1702,11 +1784,24 @@ async def ui_view_spend_logs(  # noqa: PLR0915
 
     Returns paginated response with data, total, page, page_size, and total_pages.
 
+    With `pagination=cursor` (or a `cursor`), returns data, page_size and next_cursor
+    instead - no total count is computed and each page is a keyset scan, so deep pages
+    cost the same as the first one.
+
+    With `stream=true`, returns every matching log as `application/x-ndjson`, read from
+    the DB in keyset-paginated batches so memory stays bounded for large date ranges.
+
     Example:
     ```
     curl -X GET "http://0.0.0.0:8000/spend/logs/v2?start_date=2025-11-25%2000:00:00&end_date=2025-11-26%2023:59:59&page=1&page_size=50" \
 -H "Authorization: Bearer sk-1234"
     ```
+
+    Example cursor pagination
+    ```
+    curl -X GET "http://0.0.0.0:8000/spend/logs/v2?start_date=2025-11-25&end_date=2025-11-26&pagination=cursor&page_size=100" \
+-H "Authorization: Bearer sk-1234"
+    ```
     """
     from litellm.proxy.proxy_server import prisma_client
 
@@ -1742,6 +1837,14 @@ async def ui_view_spend_logs(  # noqa: PLR0915
             param="sort_order",
             code=status.HTTP_400_BAD_REQUEST,
         )
+    use_cursor = pagination == "cursor" or cursor is not None
+    if (use_cursor or stream) and sort_by != "startTime":
+        raise ProxyException(
+            message="Cursor pagination and streaming require sort_by=startTime",
+            type="bad_request",
+            param="sort_by",
+            code=status.HTTP_400_BAD_REQUEST,
+        )
 
     try:
         is_v2 = "/spend/logs/v2" in request.url.path
@@ -1852,6 +1955,36 @@ async def ui_view_spend_logs(  # noqa: PLR0915
                 if _can_user_view_spend_log(user_api_key_dict=user_api_key_dict):
                     where_conditions["user"] = user_api_key_dict.user_id
                     where_conditions.pop("team_id", None)
+
+        keyset_sort_order: Literal["asc", "desc"] = (
+            "asc" if (sort_order or "desc").lower() == "asc" else "desc"
+        )
+        if stream:
+            return StreamingResponse(
+                stream_spend_logs_ndjson(
+                    prisma_client=prisma_client,
+                    where=where_conditions,
+                    sort_order=keyset_sort_order,
+                    cursor=cursor,
+                ),
+                media_type="application/x-ndjson",
+            )
+        if use_cursor:
+            data, next_cursor = await get_spend_logs_keyset_page(
+                prisma_client=prisma_client,
+                where=where_conditions,
+                page_size=page_size,
+                sort_order=keyset_sort_order,
+                cursor=cursor,
+            )
+            return {
+                "data": await _serialize_ui_spend_logs_rows(
+                    prisma_client, data, enrich_session_counts=not is_v2
+                ),
+                "page_size": page_size,
+                "next_cursor": next_cursor,
+            }
+
         # Calculate skip value for pagination
         skip = (page - 1) * page_size
 
@@ -1942,6 +2075,65 @@ async def ui_view_request_response_for_request_id(
     return None
 
 
+async def _stream_spend_logs(
+    prisma_client: "PrismaClient",
+    api_key: Optional[str],
+    user_id: Optional[str],
+    request_id: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> StreamingResponse:
+    """
+    NDJSON `/spend/logs` response. Rows are read in keyset-paginated batches, so
+    memory is bounded by the batch size rather than the size of the date range.
+    """
+    from litellm.proxy.spend_tracking.spend_logs_archive import (
+        iter_archived_spend_logs,
+    )
+
+    where: Dict[str, Any] = {}
+    if api_key is not None:
+        where["api_key"] = (
+            prisma_client.hash_token(token=api_key)
+            if api_key.startswith("sk-")
+            else api_key
+        )
+    if request_id is not None:
+        where["request_id"] = request_id
+    if user_id is not None:
+        where["user"] = user_id
+
+    archived_spend_logs: Optional[AsyncIterator[Dict[str, Any]]] = None
+    if start_date is not None and end_date is not None:
+        start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").replace(
+            tzinfo=timezone.utc
+        )
+        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").replace(
+            tzinfo=timezone.utc
+        )
+        where["startTime"] = {
+            "gte": start_date_obj.isoformat(),
+            "lte": end_date_obj.isoformat(),
+        }
+        # archived rows are older than anything left in the table, so they go
+        # last - streamed as they are read, one archive partition at a time
+        archived_spend_logs = iter_archived_spend_logs(
+            start_time=start_date_obj,
+            end_time=end_date_obj,
+            filters={k: v for k, v in where.items() if k != "startTime"},
+        )
+
+    return StreamingResponse(
+        stream_spend_logs_ndjson(
+            prisma_client=prisma_client,
+            where=where,
+            sort_order="desc",
+            extra_rows=archived_spend_logs,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/spend/logs",
     tags=["Budget & Spend Tracking"],
@@ -1975,6 +2167,10 @@ async def view_spend_logs(  # noqa: PLR0915
         default=True,
         description="When start_date and end_date are provided, summarize=true returns aggregated data by date (legacy behavior), summarize=false returns filtered individual logs",
     ),
+    stream: bool = fastapi.Query(
+        default=False,
+        description="Stream matching individual logs as NDJSON (one log per line), newest first. summarize is ignored.",
+    ),
     user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
 ):
     """
@@ -2016,6 +2212,12 @@ async def view_spend_logs(  # noqa: PLR0915
     curl -X GET "http://0.0.0.0:8000/spend/logs?start_date=2024-01-01&end_date=2024-01-02&summarize=false" \
 -H "Authorization: Bearer sk-1234"
     ```
+
+    Example Request streaming individual logs as NDJSON, with bounded server memory
+    ```
+    curl -X GET "http://0.0.0.0:8000/spend/logs?start_date=2024-01-01&end_date=2024-02-01&stream=true" \
+-H "Authorization: Bearer sk-1234"
+    ```
     """
     from litellm.proxy.proxy_server import prisma_client
 
@@ -2032,6 +2234,15 @@ async def view_spend_logs(  # noqa: PLR0915
                 "Database not connected. Connect a database to your proxy - https://docs.litellm.ai/docs/simple_proxy#managing-auth---virtual-keys"
             )
         spend_logs = []
+        if stream:
+            return await _stream_spend_logs(
+                prisma_client=prisma_client,
+                api_key=api_key,
+                user_id=user_id,
+                request_id=request_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
         if (
             start_date is not None
             and isinstance(start_date, str)
@@ -2064,6 +2275,17 @@ async def view_spend_logs(  # noqa: PLR0915
             elif user_id is not None and isinstance(user_id, str):
                 filter_query["user"] = user_id  # type: ignore
 
+            # Rows past the retention period live in the spend logs archive, if configured
+            from litellm.proxy.spend_tracking.spend_logs_archive import (
+                get_archived_spend_logs,
+            )
+
+            archived_spend_logs = await get_archived_spend_logs(
+                start_time=start_date_obj,
+                end_time=end_date_obj,
+                filters={k: v for k, v in filter_query.items() if k != "startTime"},
+            )
+
             # Check if user wants unsummarized data
             if not summarize:
                 # Return filtered individual log entries (similar to UI endpoint)
@@ -2073,6 +2295,19 @@ async def view_spend_logs(  # noqa: PLR0915
                         "startTime": "desc",
                     },
                 )
+                if archived_spend_logs:
+                    archived_request_ids = {
+                        log["request_id"] for log in archived_spend_logs
+                    }
+                    data = [
+                        log for log in data if log.request_id not in archived_request_ids
+                    ] + archived_spend_logs  # type: ignore
+                    data.sort(
+                        key=lambda log: (
+                            log["startTime"] if isinstance(log, dict) else log.startTime
+                        ),
+                        reverse=True,
+                    )
                 return data
 
             # Legacy behavior: return summarized data (when summarize=true)
@@ -2084,6 +2319,17 @@ async def view_spend_logs(  # noqa: PLR0915
                     "spend": True,
                 },
             )
+            if archived_spend_logs:
+                response = list(response) + [
+                    {
+                        "api_key": log.get("api_key"),
+                        "user": log.get("user"),
+                        "model": log.get("model"),
+                        "startTime": log["startTime"].strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+                        "_sum": {"spend": log.get("spend") or 0},
+                    }
+                    for log in archived_spend_logs
+                ]
 
             if (
                 isinstance(response, list)
@@ -2237,6 +2483,68 @@ async def global_spend_reset():
     }
 
 
+@router.post(
+    "/global/spend/rollups/backfill",
+    tags=["Budget & Spend Tracking"],
+    dependencies=[Depends(user_api_key_auth)],
+    include_in_schema=False,
+)
+async def global_spend_rollups_backfill(
+    start_date: str = fastapi.Query(
+        description="First day to rebuild the spend logs rollups for. Example start_date='2024-05-01'",
+    ),
+    end_date: str = fastapi.Query(
+        description="Last day to rebuild the spend logs rollups for. Example end_date='2024-05-31'",
+    ),
+):
+    """
+    ADMIN ONLY Endpoint
+
+    Rebuild the hourly / daily spend logs rollups (used when `use_spend_logs_rollups` is enabled) from LiteLLM_SpendLogs,
+    for every day from start_date to end_date.
+
+    Run this for the days before `use_spend_logs_rollups` was enabled.
+
+    Example Request:
+    ```
+    curl -X POST "http://0.0.0.0:4000/global/spend/rollups/backfill?start_date=2024-05-01&end_date=2024-05-31" \
+-H "Authorization: Bearer sk-1234"
+    ```
+    """
+    from litellm.proxy.proxy_server import prisma_client
+
+    if prisma_client is None:
+        raise HTTPException(
+            status_code=500,
+            detail={"error": CommonProxyErrors.db_not_connected_error.value},
+        )
+
+    try:
+        start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
+        end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "start_date and end_date must be in YYYY-MM-DD format"},
+        )
+    if end_date_obj < start_date_obj:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "end_date must not be before start_date"},
+        )
+
+    days_rebuilt = await backfill_spend_logs_rollups(
+        prisma_client=prisma_client,
+        start_date=start_date_obj,
+        end_date=end_date_obj,
+    )
+    return {
+        "message": f"Rebuilt spend logs rollups for {days_rebuilt} days",
+        "status": "success",
+        "days_rebuilt": days_rebuilt,
+    }
+
+
 @router.post(
     "/global/spend/refresh",
     tags=["Budget & Spend Tracking"],
@@ -2979,7 +3287,18 @@ async def ui_get_spend_by_tags(
         raise HTTPException(status_code=500, detail={"error": "No db connected"})
 
     response = None
-    if tags_list is None or (isinstance(tags_list, list) and "all-tags" in tags_list):
+    if use_spend_logs_rollups():
+        response = await get_daily_tag_spend_from_rollups(
+            prisma_client,
+            start_date,
+            end_date,
+            tags_list=(
+                None if tags_list is None or "all-tags" in tags_list else tags_list
+            ),
+        )
+    elif tags_list is None or (
+        isinstance(tags_list, list) and "all-tags" in tags_list
+    ):
         # Get spend for all tags
         sql_query = """
         SELECT
@@ -3168,6 +3487,26 @@ async def _build_ui_spend_logs_response(
         A dict with ``data`` (enriched rows), ``total``, ``page``,
         ``page_size``, and ``total_pages``.
     """
+    return {
+        "data": await _serialize_ui_spend_logs_rows(
+            prisma_client, data, enrich_session_counts=enrich_session_counts
+        ),
+        "total": total_records,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+    }
+
+
+async def _serialize_ui_spend_logs_rows(
+    prisma_client: "PrismaClient",
+    data: list,
+    enrich_session_counts: bool = True,
+) -> list:
+    """
+    Rows for a spend-logs page, with ``session_total_count`` added when
+    ``enrich_session_counts`` is ``True``. See ``_build_ui_spend_logs_response``.
+    """
     count_map: dict[str, int] = {}
     if enrich_session_counts:
         session_ids = list(
@@ -3207,13 +3546,7 @@ async def _build_ui_spend_logs_response(
         # serializers, etc.).
         response_data = data  # type: ignore[assignment]
 
-    return {
-        "data": response_data,
-        "total": total_records,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages,
-    }
+    return response_data
 
 
 def _build_status_filter_condition(status_filter: Optional[str]) -> Dict[str, Any]:
@@ -3749,15 +3749,27 @@ class ProxyUpdateSpend:
                             # Items already removed from queue at start of function
                             pass
                     else:
+                        from litellm.proxy.spend_tracking.spend_logs_rollups import (
+                            use_spend_logs_rollups,
+                            write_spend_logs_with_rollups,
+                        )
+
+                        _use_spend_logs_rollups = use_spend_logs_rollups()
                         for j in range(0, len(logs_to_process), BATCH_SIZE):
                             batch = logs_to_process[j : j + BATCH_SIZE]
                             batch_with_dates = [
                                 prisma_client.jsonify_object({**entry})
                                 for entry in batch
                             ]
-                            await prisma_client.db.litellm_spendlogs.create_many(
-                                data=batch_with_dates, skip_duplicates=True
-                            )
+                            if _use_spend_logs_rollups:
+                                await write_spend_logs_with_rollups(
+                                    prisma_client=prisma_client,
+                                    spend_logs=batch_with_dates,
+                                )
+                            else:
+                                await prisma_client.db.litellm_spendlogs.create_many(
+                                    data=batch_with_dates, skip_duplicates=True
+                                )
                             verbose_proxy_logger.debug(
                                 f"Flushed {len(batch)} logs to the DB."
                             )
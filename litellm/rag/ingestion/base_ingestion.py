@@ -8,18 +8,48 @@ Provides abstract methods for:
 - Vector Store operations
 
 Providers can inherit and override methods as needed.
+
+Text extraction and splitting run in a worker thread, off the event loop.
+Embeddings are requested in batches bounded by chunk count and estimated
+tokens, with a limited number of requests in flight. Providers that store
+vectors themselves can override `embed_and_store` to store each batch as soon
+as it is embedded.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import itertools
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import litellm
 from litellm._logging import verbose_logger
 from litellm._uuid import uuid4
-from litellm.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
+from litellm.constants import (
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_CHUNK_SIZE,
+    RAG_INGEST_EMBEDDING_BATCH_SIZE,
+    RAG_INGEST_EMBEDDING_MAX_CONCURRENT_REQUESTS,
+    RAG_INGEST_EMBEDDING_MAX_TOKENS_PER_BATCH,
+)
 from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
@@ -31,6 +61,83 @@ from litellm.types.rag import RAGIngestOptions, RAGIngestResponse
 if TYPE_CHECKING:
     from litellm import Router
 
+T = TypeVar("T")
+
+
+def get_chunk_content_hash(chunk: str) -> str:
+    """Stable hash of a chunk's text - used to skip unchanged chunks on re-ingest."""
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+
+def estimate_chunk_tokens(chunk: str) -> int:
+    """Rough token count (~4 characters per token) for sizing embedding batches."""
+    return len(chunk) // 4 + 1
+
+
+class _ChunkBatcher:
+    """
+    Groups chunks into (start_index, batch) pairs with at most `max_batch_size`
+    chunks and `max_batch_tokens` estimated tokens each, as they are added.
+    """
+
+    def __init__(self, max_batch_size: int, max_batch_tokens: int):
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.current: List[str] = []
+        self.current_tokens = 0
+        self.start_index = 0
+        self.next_index = 0
+
+    def add(self, chunk: str) -> Optional[Tuple[int, List[str]]]:
+        """Add a chunk. Returns the previous batch if `chunk` did not fit in it."""
+        completed: Optional[Tuple[int, List[str]]] = None
+        chunk_tokens = estimate_chunk_tokens(chunk)
+        if self.current and (
+            len(self.current) >= self.max_batch_size
+            or self.current_tokens + chunk_tokens > self.max_batch_tokens
+        ):
+            completed = self.flush()
+        if not self.current:
+            self.start_index = self.next_index
+        self.current.append(chunk)
+        self.current_tokens += chunk_tokens
+        self.next_index += 1
+        return completed
+
+    def flush(self) -> Optional[Tuple[int, List[str]]]:
+        if not self.current:
+            return None
+        completed = (self.start_index, self.current)
+        self.current, self.current_tokens = [], 0
+        return completed
+
+
+def batch_chunks(
+    chunks: List[str],
+    max_batch_size: int = RAG_INGEST_EMBEDDING_BATCH_SIZE,
+    max_batch_tokens: int = RAG_INGEST_EMBEDDING_MAX_TOKENS_PER_BATCH,
+) -> List[Tuple[int, List[str]]]:
+    """
+    Split chunks into (start_index, batch) pairs with at most `max_batch_size`
+    chunks and `max_batch_tokens` estimated tokens each. A chunk larger than
+    `max_batch_tokens` gets a batch of its own.
+    """
+    batcher = _ChunkBatcher(max_batch_size, max_batch_tokens)
+    batches = [batch for batch in map(batcher.add, chunks) if batch is not None]
+    last = batcher.flush()
+    if last is not None:
+        batches.append(last)
+    return batches
+
+
+async def _aiter_list(items: List[str]) -> AsyncIterator[str]:
+    for item in items:
+        yield item
+
+
+def _take(iterator: Iterator[str], count: int) -> List[str]:
+    return list(itertools.islice(iterator, count))
+
 
 class BaseRAGIngestion(ABC):
     """
@@ -39,8 +146,13 @@ class BaseRAGIngestion(ABC):
     Providers should inherit from this class and override methods as needed.
     For example, OpenAI handles embedding internally when attaching files to
     vector stores, so it overrides the embedding step to be a no-op.
+
+    Providers that upload the file and chunk it themselves set
+    `uses_local_chunks = False`, which skips the local chunking step.
     """
 
+    uses_local_chunks: bool = True
+
     def __init__(
         self,
         ingest_options: RAGIngestOptions,
@@ -57,6 +169,18 @@ class BaseRAGIngestion(ABC):
             ingest_options.get("chunking_strategy") or {"type": "auto"},
         )
         self.embedding_config = ingest_options.get("embedding")
+        _embedding_config: Dict[str, Any] = cast(
+            Dict[str, Any], self.embedding_config or {}
+        )
+        self.embedding_batch_size: int = _embedding_config.get(
+            "batch_size", RAG_INGEST_EMBEDDING_BATCH_SIZE
+        )
+        self.embedding_max_tokens_per_batch: int = _embedding_config.get(
+            "max_tokens_per_batch", RAG_INGEST_EMBEDDING_MAX_TOKENS_PER_BATCH
+        )
+        self.embedding_max_concurrent_requests: int = _embedding_config.get(
+            "max_concurrent_requests", RAG_INGEST_EMBEDDING_MAX_CONCURRENT_REQUESTS
+        )
         self.vector_store_config: Dict[str, Any] = cast(
             Dict[str, Any], ingest_options.get("vector_store") or {}
         )
@@ -189,6 +313,22 @@ class BaseRAGIngestion(ABC):
         Returns:
             List of text chunks
         """
+        return list(
+            self.iter_chunks(
+                text=text, file_content=file_content, ocr_was_used=ocr_was_used
+            )
+        )
+
+    def iter_chunks(
+        self,
+        text: Optional[str],
+        file_content: Optional[bytes],
+        ocr_was_used: bool,
+    ) -> Iterator[str]:
+        """
+        Lazy `chunk` - text is extracted on the first `next()` and each chunk is
+        yielded as soon as the splitter completes it.
+        """
         # Get text to chunk
         text_to_chunk: Optional[str] = None
         if text:
@@ -207,19 +347,20 @@ class BaseRAGIngestion(ABC):
                             "PDF text extraction failed. Install 'pypdf' or 'PyPDF2' for PDF support, "
                             "or enable OCR with a vision model."
                         )
-                        return []
+                        return
                 else:
                     verbose_logger.debug("Binary file detected, skipping text chunking")
-                    return []
+                    return
 
         if not text_to_chunk:
-            return []
+            return
 
         # Extract RecursiveCharacterTextSplitter args
         splitter_args = self.chunking_strategy or {}
         chunk_size = splitter_args.get("chunk_size", DEFAULT_CHUNK_SIZE)
         chunk_overlap = splitter_args.get("chunk_overlap", DEFAULT_CHUNK_OVERLAP)
         separators = splitter_args.get("separators", None)
+        tokenizer_model = splitter_args.get("tokenizer_model", None)
 
         # Build splitter kwargs
         splitter_kwargs: Dict[str, Any] = {
@@ -228,9 +369,123 @@ class BaseRAGIngestion(ABC):
         }
         if separators:
             splitter_kwargs["separators"] = separators
+        if tokenizer_model:
+            splitter_kwargs["tokenizer_model"] = tokenizer_model
 
         text_splitter = RecursiveCharacterTextSplitter(**splitter_kwargs)
-        return text_splitter.split_text(text_to_chunk)
+        yield from text_splitter.iter_split_text(text_to_chunk)
+
+    async def aiter_chunks(
+        self,
+        text: Optional[str],
+        file_content: Optional[bytes],
+        ocr_was_used: bool,
+    ) -> AsyncIterator[str]:
+        """
+        `iter_chunks`, advanced in a worker thread one embedding batch worth of
+        chunks at a time - PDF text extraction and splitting are CPU-bound and
+        would otherwise block the event loop. Chunks reach the embedding step
+        while the rest of the file is still being split.
+        """
+        if not self.uses_local_chunks:
+            return
+        chunks = self.iter_chunks(
+            text=text, file_content=file_content, ocr_was_used=ocr_was_used
+        )
+        while True:
+            batch = await asyncio.to_thread(
+                _take, chunks, max(1, self.embedding_batch_size)
+            )
+            if not batch:
+                return
+            for chunk in batch:
+                yield chunk
+
+    async def achunk(
+        self,
+        text: Optional[str],
+        file_content: Optional[bytes],
+        ocr_was_used: bool,
+    ) -> List[str]:
+        """All chunks of `aiter_chunks`."""
+        return [
+            chunk
+            async for chunk in self.aiter_chunks(
+                text=text, file_content=file_content, ocr_was_used=ocr_was_used
+            )
+        ]
+
+    def get_chunk_batches(self, chunks: List[str]) -> List[Tuple[int, List[str]]]:
+        """(start_index, chunks) batches sized for one embedding request each."""
+        return batch_chunks(
+            chunks,
+            max_batch_size=self.embedding_batch_size,
+            max_batch_tokens=self.embedding_max_tokens_per_batch,
+        )
+
+    async def map_chunk_batches(
+        self,
+        chunks: Union[List[str], AsyncIterable[str]],
+        process_batch: Callable[[int, List[str]], Awaitable[T]],
+    ) -> List[T]:
+        """
+        Run `process_batch(start_index, batch)` over the chunk batches (see
+        `get_chunk_batches`), at most `embedding_max_concurrent_requests` at a
+        time. Results are in batch order.
+
+        `chunks` may be an async iterable (see `aiter_chunks`) - each batch starts
+        as soon as it is complete, and no more than the in-flight batches are
+        read ahead.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.embedding_max_concurrent_requests))
+        tasks: List["asyncio.Task[T]"] = []
+
+        async def _process(start_index: int, batch: List[str]) -> T:
+            try:
+                return await process_batch(start_index, batch)
+            finally:
+                semaphore.release()
+
+        async def _start(batch: Optional[Tuple[int, List[str]]]) -> bool:
+            """Start a batch. False once a started batch has failed."""
+            if batch is None:
+                return True
+            await semaphore.acquire()
+            if any(t.done() and not t.cancelled() and t.exception() for t in tasks):
+                semaphore.release()
+                return False
+            tasks.append(asyncio.ensure_future(_process(*batch)))
+            return True
+
+        batcher = _ChunkBatcher(
+            max_batch_size=self.embedding_batch_size,
+            max_batch_tokens=self.embedding_max_tokens_per_batch,
+        )
+        try:
+            async for chunk in (
+                _aiter_list(chunks) if isinstance(chunks, list) else chunks
+            ):
+                if not await _start(batcher.add(chunk)):
+                    break
+            else:
+                await _start(batcher.flush())
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _aembedding(self, chunks: List[str]) -> List[List[float]]:
+        """One embedding request for `chunks`."""
+        embedding_model = cast(Dict[str, Any], self.embedding_config or {}).get(
+            "model", "text-embedding-3-small"
+        )
+
+        if self.router is not None:
+            response = await self.router.aembedding(model=embedding_model, input=chunks)
+        else:
+            response = await litellm.aembedding(model=embedding_model, input=chunks)
+
+        return [item["embedding"] for item in response.data]
 
     async def embed(
         self,
@@ -239,6 +494,9 @@ class BaseRAGIngestion(ABC):
         """
         Generate embeddings for text chunks.
 
+        Chunks are sent in batches (see `get_chunk_batches`), with at most
+        `embedding_max_concurrent_requests` requests in flight.
+
         Args:
             chunks: List of text chunks
 
@@ -248,14 +506,10 @@ class BaseRAGIngestion(ABC):
         if not self.embedding_config or not chunks:
             return None
 
-        embedding_model = self.embedding_config.get("model", "text-embedding-3-small")
-
-        if self.router is not None:
-            response = await self.router.aembedding(model=embedding_model, input=chunks)
-        else:
-            response = await litellm.aembedding(model=embedding_model, input=chunks)
-
-        return [item["embedding"] for item in response.data]
+        batch_embeddings = await self.map_chunk_batches(
+            chunks, lambda _start_index, batch: self._aembedding(batch)
+        )
+        return [embedding for batch in batch_embeddings for embedding in batch]
 
     @abstractmethod
     async def store(
@@ -283,6 +537,35 @@ class BaseRAGIngestion(ABC):
         """
         pass
 
+    async def embed_and_store(
+        self,
+        file_content: Optional[bytes],
+        filename: Optional[str],
+        content_type: Optional[str],
+        chunks: Union[List[str], AsyncIterable[str]],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Embed the chunks and store them - `embed` then `store`.
+
+        Providers that write vectors themselves can override this to store each
+        batch as soon as it is embedded (see `map_chunk_batches`), while the
+        rest of the file is still being chunked.
+
+        Returns:
+            Tuple of (vector_store_id, file_id)
+        """
+        if not isinstance(chunks, list):
+            chunks = [chunk async for chunk in chunks]
+        # Embedding is optional - some providers handle this internally
+        embeddings = await self.embed(chunks=chunks)
+        return await self.store(
+            file_content=file_content,
+            filename=filename,
+            content_type=content_type,
+            chunks=chunks,
+            embeddings=embeddings,
+        )
+
     async def ingest(
         self,
         file_data: Optional[Tuple[str, bytes, str]] = None,
@@ -317,23 +600,19 @@ class BaseRAGIngestion(ABC):
                 content_type=content_type,
             )
 
-            # Step 3: Chunking
-            chunks = self.chunk(
+            # Step 3: Chunking (lazily, in a worker thread)
+            chunks = self.aiter_chunks(
                 text=extracted_text,
                 file_content=file_content,
                 ocr_was_used=self.ocr_config is not None,
             )
 
-            # Step 4: Embedding (optional - some providers handle this internally)
-            embeddings = await self.embed(chunks=chunks)
-
-            # Step 5: Store in vector store
-            vector_store_id, result_file_id = await self.store(
+            # Step 4 + 5: Embedding (batched) and store in vector store
+            vector_store_id, result_file_id = await self.embed_and_store(
                 file_content=file_content,
                 filename=filename,
                 content_type=content_type,
                 chunks=chunks,
-                embeddings=embeddings,
             )
 
             return RAGIngestResponse(
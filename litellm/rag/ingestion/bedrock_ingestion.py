@@ -83,6 +83,8 @@ class BedrockRAGIngestion(BaseRAGIngestion, BaseAWSLLM):
     - aws_web_identity_token, aws_sts_endpoint, aws_external_id
     """
 
+    uses_local_chunks = False
+
     def __init__(
         self,
         ingest_options: "RAGIngestOptions",
@@ -33,6 +33,8 @@ class GeminiRAGIngestion(BaseRAGIngestion):
     - Supports custom metadata attachment
     """
 
+    uses_local_chunks = False
+
     def __init__(
         self,
         ingest_options: "RAGIngestOptions",
@@ -29,6 +29,8 @@ class OpenAIRAGIngestion(BaseRAGIngestion):
     - Chunking is done by OpenAI's vector store (uses 'auto' strategy)
     """
 
+    uses_local_chunks = False
+
     def __init__(
         self,
         ingest_options: "RAGIngestOptions",
@@ -10,14 +10,27 @@ This implementation:
 1. Auto-creates vector buckets and indexes if not provided
 2. Uses LiteLLM's embedding API (supports any provider)
 3. Uses httpx + AWS SigV4 signing (no boto3 dependency for S3 Vectors APIs)
-4. Stores vectors with metadata using PutVectors API
+4. Stores vectors with metadata using PutVectors API, one call per embedded batch
+5. Keys vectors by the content hash of their chunk - on re-ingest, chunks that
+   are already stored are skipped, and vectors of the file whose chunk is gone
+   are deleted
 """
 
 from __future__ import annotations
 
 import hashlib
 import uuid
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import litellm
 from litellm._logging import verbose_logger
@@ -25,6 +38,7 @@ from litellm.constants import (
     S3_VECTORS_DEFAULT_DIMENSION,
     S3_VECTORS_DEFAULT_DISTANCE_METRIC,
     S3_VECTORS_DEFAULT_NON_FILTERABLE_METADATA_KEYS,
+    S3_VECTORS_MAX_VECTORS_PER_PUT,
 )
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.llms.bedrock.base_aws_llm import BaseAWSLLM
@@ -32,7 +46,10 @@ from litellm.llms.custom_httpx.http_handler import (
     get_async_httpx_client,
     httpxSpecialProvider,
 )
-from litellm.rag.ingestion.base_ingestion import BaseRAGIngestion
+from litellm.rag.ingestion.base_ingestion import (
+    BaseRAGIngestion,
+    get_chunk_content_hash,
+)
 
 if TYPE_CHECKING:
     from litellm import Router
@@ -55,6 +72,9 @@ class S3VectorsRAGIngestion(BaseRAGIngestion, BaseAWSLLM):
     - dimension: Vector dimension (default: S3_VECTORS_DEFAULT_DIMENSION)
     - distance_metric: "cosine" or "euclidean" (default: S3_VECTORS_DEFAULT_DISTANCE_METRIC)
     - non_filterable_metadata_keys: List of metadata keys to exclude from filtering
+    - skip_unchanged_chunks: Skip chunks already stored with the same content hash (default: True)
+    - delete_orphaned_vectors: On re-ingest, delete the file's vectors whose chunk is gone (default: False).
+      Lists every vector of the index, so each ingest costs O(index size)
     """
 
     def __init__(
@@ -75,6 +95,13 @@ class S3VectorsRAGIngestion(BaseRAGIngestion, BaseAWSLLM):
             "non_filterable_metadata_keys",
             S3_VECTORS_DEFAULT_NON_FILTERABLE_METADATA_KEYS,
         )
+        skip_unchanged_chunks = self.vector_store_config.get("skip_unchanged_chunks")
+        self.skip_unchanged_chunks = (
+            True if skip_unchanged_chunks is None else bool(skip_unchanged_chunks)
+        )
+        self.delete_orphaned_vectors = bool(
+            self.vector_store_config.get("delete_orphaned_vectors", False)
+        )
         
         # Get dimension from config (will be auto-detected on first use if not provided)
         self.dimension = self._get_dimension_from_config()
@@ -422,21 +449,223 @@ class S3VectorsRAGIngestion(BaseRAGIngestion, BaseAWSLLM):
             )
             self.embedding_config = {"model": "text-embedding-3-small"}
 
-        embedding_model = self.embedding_config.get("model", "text-embedding-3-small")
-
         verbose_logger.debug(
-            f"Generating embeddings for {len(chunks)} chunks using {embedding_model}"
+            f"Generating embeddings for {len(chunks)} chunks using {self.embedding_config.get('model')}"
         )
+        return await super().embed(chunks=list(chunks))
 
-        # Convert to list to ensure type compatibility
-        input_chunks: List[str] = list(chunks)
-        
-        if self.router:
-            response = await self.router.aembedding(model=embedding_model, input=input_chunks)
+    def _get_vector_key(self, filename: Optional[str], chunk: str) -> str:
+        """
+        Keyed by content rather than position, so inserting or removing a chunk
+        does not change the keys of the chunks after it.
+        """
+        content_hash = get_chunk_content_hash(chunk)
+        return f"{filename}_{content_hash}" if filename else f"chunk_{content_hash}"
+
+    def _build_vector(
+        self,
+        filename: Optional[str],
+        index: int,
+        chunk: str,
+        embedding: List[float],
+    ) -> Dict[str, Any]:
+        # Build metadata dict
+        metadata: Dict[str, str] = {
+            "source_text": chunk,  # Non-filterable (for reference)
+            "chunk_index": str(index),  # Filterable
+            "content_hash": get_chunk_content_hash(chunk),
+        }
+
+        if filename:
+            metadata["filename"] = filename  # Filterable
+
+        return {
+            "key": self._get_vector_key(filename, chunk),
+            "data": {"float32": embedding},
+            "metadata": metadata,
+        }
+
+    async def _get_stored_vector_keys(self, keys: List[str]) -> Set[str]:
+        """
+        The keys among `keys` that are already stored (GetVectors API).
+
+        Returns an empty set if the lookup fails - every chunk is then re-embedded.
+        """
+        url = f"https://s3vectors.{self.aws_region_name}.api.aws/GetVectors"
+        request_body = {
+            "vectorBucketName": self.vector_bucket_name,
+            "indexName": self.index_name,
+            "keys": keys,
+            "returnData": False,
+            "returnMetadata": False,
+        }
+        try:
+            response = await self._sign_and_execute_request(
+                "POST", url, data=safe_dumps(request_body)
+            )
+            if response.status_code != 200:
+                verbose_logger.debug(
+                    f"GetVectors failed with status {response.status_code}: {response.text}"
+                )
+                return set()
+            return {vector["key"] for vector in response.json().get("vectors", [])}
+        except Exception as e:
+            verbose_logger.debug(f"Error reading stored vectors: {e}")
+            return set()
+
+    async def _list_file_vector_keys(self, filename: str) -> List[str]:
+        """
+        Keys of every stored vector of `filename` (ListVectors API).
+
+        ListVectors can't filter by metadata, so this pages through the whole index.
+        """
+        url = f"https://s3vectors.{self.aws_region_name}.api.aws/ListVectors"
+        keys: List[str] = []
+        next_token: Optional[str] = None
+        while True:
+            request_body: Dict[str, Any] = {
+                "vectorBucketName": self.vector_bucket_name,
+                "indexName": self.index_name,
+                "returnData": False,
+                "returnMetadata": True,
+            }
+            if next_token:
+                request_body["nextToken"] = next_token
+            response = await self._sign_and_execute_request(
+                "POST", url, data=safe_dumps(request_body)
+            )
+            response.raise_for_status()
+            response_json = response.json()
+            keys.extend(
+                vector["key"]
+                for vector in response_json.get("vectors", [])
+                if (vector.get("metadata") or {}).get("filename") == filename
+            )
+            next_token = response_json.get("nextToken")
+            if not next_token:
+                return keys
+
+    async def _delete_vectors(self, keys: List[str]) -> None:
+        """DeleteVectors API, in groups of S3_VECTORS_MAX_VECTORS_PER_PUT keys."""
+        url = f"https://s3vectors.{self.aws_region_name}.api.aws/DeleteVectors"
+        for i in range(0, len(keys), S3_VECTORS_MAX_VECTORS_PER_PUT):
+            request_body = {
+                "vectorBucketName": self.vector_bucket_name,
+                "indexName": self.index_name,
+                "keys": keys[i : i + S3_VECTORS_MAX_VECTORS_PER_PUT],
+            }
+            response = await self._sign_and_execute_request(
+                "POST", url, data=safe_dumps(request_body)
+            )
+            response.raise_for_status()
+
+    async def _delete_orphaned_vectors(
+        self, filename: str, current_keys: Set[str]
+    ) -> None:
+        """
+        Delete the vectors of `filename` whose chunk is no longer in the file. A
+        failure is logged - the new vectors are already stored.
+        """
+        try:
+            orphaned_keys = [
+                key
+                for key in await self._list_file_vector_keys(filename)
+                if key not in current_keys
+            ]
+            if orphaned_keys:
+                await self._delete_vectors(orphaned_keys)
+                verbose_logger.debug(
+                    f"Deleted {len(orphaned_keys)} orphaned vectors of {filename}"
+                )
+        except Exception as e:
+            verbose_logger.warning(
+                f"Failed to delete orphaned vectors of {filename}: {e}"
+            )
+
+    async def _embed_and_store_batch(
+        self,
+        filename: Optional[str],
+        start_index: int,
+        batch: List[str],
+        current_keys: Set[str],
+    ) -> int:
+        """
+        Embed and store one batch of chunks, adding their keys to `current_keys`.
+        Returns the number of vectors written.
+        """
+        # a chunk repeated in the file is stored once
+        keyed_chunks: Dict[str, Tuple[int, str]] = {}
+        for index, chunk in enumerate(batch, start=start_index):
+            keyed_chunks.setdefault(
+                self._get_vector_key(filename, chunk), (index, chunk)
+            )
+        current_keys.update(keyed_chunks)
+
+        if self.skip_unchanged_chunks:
+            stored_keys = await self._get_stored_vector_keys(list(keyed_chunks))
+            changed = [
+                indexed_chunk
+                for key, indexed_chunk in keyed_chunks.items()
+                if key not in stored_keys
+            ]
         else:
-            response = await litellm.aembedding(model=embedding_model, input=input_chunks)
+            changed = list(keyed_chunks.values())
+        if not changed:
+            return 0
+
+        embeddings = await self.embed([chunk for _, chunk in changed]) or []
+        vectors = [
+            self._build_vector(filename, index, chunk, embedding)
+            for (index, chunk), embedding in zip(changed, embeddings)
+        ]
+        for i in range(0, len(vectors), S3_VECTORS_MAX_VECTORS_PER_PUT):
+            await self._put_vectors(vectors[i : i + S3_VECTORS_MAX_VECTORS_PER_PUT])
+        return len(vectors)
+
+    async def embed_and_store(
+        self,
+        file_content: Optional[bytes],
+        filename: Optional[str],
+        content_type: Optional[str],
+        chunks: Union[List[str], AsyncIterable[str]],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Embed and store the chunks batch by batch - each batch is written with
+        PutVectors as soon as it is embedded, and chunks already stored by a
+        previous ingest are skipped. With `delete_orphaned_vectors`, once every
+        batch is stored, vectors of the file whose chunk is gone are deleted.
+
+        Returns:
+            Tuple of (index_name, filename)
+        """
+        # Ensure infrastructure exists
+        await self._ensure_config_initialized()
+
+        current_keys: Set[str] = set()
+        written = await self.map_chunk_batches(
+            chunks,
+            lambda start_index, batch: self._embed_and_store_batch(
+                filename, start_index, batch, current_keys
+            ),
+        )
+        if not current_keys:
+            # raises the "no text content" error
+            return await self.store(
+                file_content=file_content,
+                filename=filename,
+                content_type=content_type,
+                chunks=[],
+                embeddings=None,
+            )
+        verbose_logger.debug(
+            f"Stored {sum(written)} of {len(current_keys)} chunks, the rest were unchanged"
+        )
+        if filename and self.delete_orphaned_vectors:
+            await self._delete_orphaned_vectors(filename, current_keys)
 
-        return [item["embedding"] for item in response.data]
+        # Return vector_store_id in format bucket_name:index_name for S3 Vectors search compatibility
+        vector_store_id = f"{self.vector_bucket_name}:{self.index_name}"
+        return vector_store_id, filename
 
     async def store(
         self,
@@ -481,27 +710,14 @@ class S3VectorsRAGIngestion(BaseRAGIngestion, BaseAWSLLM):
             raise ValueError(error_msg)
 
         # Prepare vectors for PutVectors API
-        vectors = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            # Build metadata dict
-            metadata: Dict[str, str] = {
-                "source_text": chunk,  # Non-filterable (for reference)
-                "chunk_index": str(i),  # Filterable
-            }
-            
-            if filename:
-                metadata["filename"] = filename  # Filterable
-            
-            vector_obj = {
-                "key": f"{filename}_{i}" if filename else f"chunk_{i}",
-                "data": {"float32": embedding},
-                "metadata": metadata,
-            }
-
-            vectors.append(vector_obj)
+        vectors = [
+            self._build_vector(filename, i, chunk, embedding)
+            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+        ]
 
         # Call PutVectors API
-        await self._put_vectors(vectors)
+        for i in range(0, len(vectors), S3_VECTORS_MAX_VECTORS_PER_PUT):
+            await self._put_vectors(vectors[i : i + S3_VECTORS_MAX_VECTORS_PER_PUT])
 
         # Return vector_store_id in format bucket_name:index_name for S3 Vectors search compatibility
         vector_store_id = f"{self.vector_bucket_name}:{self.index_name}"
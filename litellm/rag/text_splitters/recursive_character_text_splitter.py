@@ -2,11 +2,24 @@
 RecursiveCharacterTextSplitter for RAG ingestion.
 
 A simple implementation that splits text recursively by different separators.
+
+Splits are tracked as (start, end) offsets into the original text: a chunk is a
+run of contiguous splits, so it is cut out with a single slice instead of being
+re-joined, the overlap window moves by index, and character-level splitting is
+plain index arithmetic. Chunk sizes are measured in characters by default, or
+in tokens with `tokenizer_model` / `length_function`.
 """
 
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, repeat
+from operator import add
+from typing import Callable, Iterator, List, Optional, Tuple
 
-from litellm.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
+from litellm.constants import (
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_RECURSE_DEPTH,
+)
 
 
 class RecursiveCharacterTextSplitter:
@@ -15,6 +28,15 @@ class RecursiveCharacterTextSplitter:
 
     Tries to split by the first separator, then recursively splits
     by subsequent separators if chunks are still too large.
+
+    Args:
+        chunk_size: Maximum size of a chunk
+        chunk_overlap: Overlap between consecutive chunks
+        separators: Separators to try, coarsest first
+        length_function: Measures a piece of text (default: `len`)
+        tokenizer_model: Measure sizes in this model's tokens, using the
+            tokenizers of `litellm.token_counter`. Ignored if
+            `length_function` is set.
     """
 
     def __init__(
@@ -22,24 +44,40 @@ class RecursiveCharacterTextSplitter:
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
         separators: Optional[List[str]] = None,
+        length_function: Optional[Callable[[str], int]] = None,
+        tokenizer_model: Optional[str] = None,
     ):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.separators = separators or ["\n\n", "\n", " ", ""]
+        if length_function is None and tokenizer_model is not None:
+            from litellm.litellm_core_utils.token_counter import _get_count_function
+
+            length_function = _get_count_function(model=tokenizer_model)
+        self.length_function = length_function
 
     def split_text(self, text: str) -> List[str]:
         """Split text into chunks."""
-        return self._split_text(text, self.separators)
+        return list(self.iter_split_text(text))
 
-    def _split_text(self, text: str, separators: List[str], depth: int = 0) -> List[str]:
-        """Recursively split text using separators."""
-        from litellm.constants import DEFAULT_MAX_RECURSE_DEPTH
+    def iter_split_text(self, text: str) -> Iterator[str]:
+        """Split text into chunks, yielding each chunk as soon as it is complete."""
+        return self._split_text(text, 0, len(text), self.separators)
 
+    def _split_text(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        separators: List[str],
+        depth: int = 0,
+    ) -> Iterator[str]:
+        """Recursively split text[start:end] using separators."""
         if depth > DEFAULT_MAX_RECURSE_DEPTH:
             # Max depth reached, return text as-is split into chunk_size pieces
-            return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
-
-        final_chunks: List[str] = []
+            for i in range(start, end, self.chunk_size):
+                yield text[i : min(i + self.chunk_size, end)]
+            return
 
         # Get the appropriate separator
         separator = separators[-1]
@@ -49,87 +87,189 @@ class RecursiveCharacterTextSplitter:
             if sep == "":
                 separator = sep
                 break
-            if sep in text:
+            if text.find(sep, start, end) != -1:
                 separator = sep
                 new_separators = separators[i + 1 :]
                 break
 
-        # Split by the chosen separator
-        if separator:
-            splits = text.split(separator)
-        else:
-            splits = list(text)
+        if separator == "" and self.length_function is None and self.chunk_size > 1:
+            # every split is a single character - merge by index arithmetic
+            yield from self._merge_characters(text, start, end)
+            return
+
+        # Merge runs of splits smaller than chunk_size into chunks
+        chunk_size = self.chunk_size
+        starts, ends, lengths = self._get_split_offsets(text, start, end, separator)
+        if not lengths or max(lengths) < chunk_size:
+            if lengths:
+                yield from self._merge_splits(text, starts, ends, lengths, separator)
+            return
+
+        good_from = 0
+        for i, split_len in enumerate(lengths):
+            if split_len < chunk_size:
+                continue
+
+            # Chunk is too big, merge what we have and recurse
+            if good_from < i:
+                yield from self._merge_splits(
+                    text,
+                    starts[good_from:i],
+                    ends[good_from:i],
+                    lengths[good_from:i],
+                    separator,
+                )
+            good_from = i + 1
 
-        # Merge splits into chunks
-        good_splits: List[str] = []
-        for split in splits:
-            if len(split) < self.chunk_size:
-                good_splits.append(split)
+            if new_separators:
+                # Recursively split with finer separators
+                yield from self._split_text(
+                    text, starts[i], ends[i], new_separators, depth + 1
+                )
             else:
-                # Chunk is too big, merge what we have and recurse
-                if good_splits:
-                    merged = self._merge_splits(good_splits, separator)
-                    final_chunks.extend(merged)
-                    good_splits = []
-
-                if new_separators:
-                    # Recursively split with finer separators
-                    other_chunks = self._split_text(split, new_separators, depth + 1)
-                    final_chunks.extend(other_chunks)
-                else:
-                    # No more separators, force split
-                    final_chunks.extend(self._force_split(split))
+                # No more separators, force split
+                yield from self._force_split(text, starts[i], ends[i])
 
         # Merge remaining good splits
-        if good_splits:
-            merged = self._merge_splits(good_splits, separator)
-            final_chunks.extend(merged)
+        if good_from < len(lengths):
+            yield from self._merge_splits(
+                text,
+                starts[good_from:],
+                ends[good_from:],
+                lengths[good_from:],
+                separator,
+            )
 
-        return final_chunks
+    def _get_split_offsets(
+        self, text: str, start: int, end: int, separator: str
+    ) -> Tuple[List[int], List[int], List[int]]:
+        """
+        (starts, ends, lengths) of the pieces of `text[start:end].split(separator)`,
+        or of each character for an empty separator.
+        """
+        if not separator:
+            starts = list(range(start, end))
+            ends = list(range(start + 1, end + 1))
+            if self.length_function is None:
+                return starts, ends, [1] * (end - start)
+            return starts, ends, [self.length_function(c) for c in text[start:end]]
 
-    def _merge_splits(self, splits: List[str], separator: str) -> List[str]:
-        """Merge splits into chunks respecting chunk_size and chunk_overlap."""
-        chunks: List[str] = []
-        current_chunk: List[str] = []
-        current_length = 0
+        # str.split + len runs in C; the pieces are only measured, never re-joined
+        segment = text if start == 0 and end == len(text) else text[start:end]
+        piece_lengths = list(map(len, segment.split(separator)))
+        del segment
+        separator_len = len(separator)
+        starts = list(
+            accumulate(
+                map(add, piece_lengths[:-1], repeat(separator_len)),
+                initial=start,
+            )
+        )
+        ends = list(map(add, starts, piece_lengths))
+        if self.length_function is None:
+            return starts, ends, piece_lengths
+        return (
+            starts,
+            ends,
+            [
+                self.length_function(text[split_start:split_end])
+                for split_start, split_end in zip(starts, ends)
+            ],
+        )
 
-        for split in splits:
-            split_len = len(split)
-            sep_len = len(separator) if current_chunk else 0
+    def _merge_splits(
+        self,
+        text: str,
+        starts: List[int],
+        ends: List[int],
+        lengths: List[int],
+        separator: str,
+    ) -> Iterator[str]:
+        """
+        Merge contiguous splits into chunks respecting chunk_size and chunk_overlap.
 
-            if current_length + split_len + sep_len > self.chunk_size:
-                if current_chunk:
-                    chunk_text = separator.join(current_chunk).strip()
-                    if chunk_text:
-                        chunks.append(chunk_text)
+        The splits come from one separator split, so the chunk made of splits
+        lo..i is text[starts[lo]:ends[i]].
+        """
+        if self.length_function is None:
+            separator_length = len(separator)
+        else:
+            separator_length = self.length_function(separator) if separator else 0
 
-                    # Handle overlap
-                    while current_length > self.chunk_overlap and len(current_chunk) > 1:
-                        removed = current_chunk.pop(0)
-                        current_length -= len(removed) + len(separator)
+        # The current chunk is splits lo..i-1 and measures
+        # prefix[i] - prefix[lo] - separator_length. Both the "split i does not
+        # fit" test and the overlap trimming are monotone in the prefix sums, so
+        # the next chunk boundary is found by bisection, not split by split.
+        prefix = list(
+            accumulate(map(add, lengths, repeat(separator_length)), initial=0)
+        )
+        split_count = len(lengths)
+        lo = 0
+        i = 1
+        while i < split_count:
+            # first split that does not fit in the current chunk
+            i = (
+                bisect_right(
+                    prefix,
+                    self.chunk_size + separator_length + prefix[lo],
+                    i + 1,
+                )
+                - 1
+            )
+            if i >= split_count:
+                break
+            chunk_text = text[starts[lo] : ends[i - 1]].strip()
+            if chunk_text:
+                yield chunk_text
 
-            current_chunk.append(split)
-            current_length += split_len + sep_len
+            # Handle overlap - drop splits while the chunk exceeds chunk_overlap
+            lo = bisect_left(
+                prefix,
+                prefix[i] - separator_length - self.chunk_overlap,
+                lo,
+                i - 1,
+            )
+            i += 1
 
         # Add remaining
-        if current_chunk:
-            chunk_text = separator.join(current_chunk).strip()
-            if chunk_text:
-                chunks.append(chunk_text)
+        chunk_text = text[starts[lo] : ends[-1]].strip()
+        if chunk_text:
+            yield chunk_text
 
-        return chunks
+    def _merge_characters(self, text: str, start: int, end: int) -> Iterator[str]:
+        """
+        `_merge_splits` for single-character splits with an empty separator:
+        chunks are chunk_size-character windows, each starting
+        max(chunk_overlap, 1) characters before the previous one ended.
+        """
+        if self.chunk_overlap >= self.chunk_size:
+            yield from self._merge_splits(
+                text, *self._get_split_offsets(text, start, end, ""), ""
+            )
+            return
+        step = self.chunk_size - max(self.chunk_overlap, 1)
+        chunk_start = start
+        while end - chunk_start > self.chunk_size:
+            chunk_text = text[chunk_start : chunk_start + self.chunk_size].strip()
+            if chunk_text:
+                yield chunk_text
+            chunk_start += step
+        if chunk_start < end:
+            chunk_text = text[chunk_start:end].strip()
+            if chunk_text:
+                yield chunk_text
 
-    def _force_split(self, text: str) -> List[str]:
-        """Force split text by chunk_size when no separator works."""
-        chunks: List[str] = []
-        start = 0
+    def _force_split(self, text: str, start: int, end: int) -> Iterator[str]:
+        """Force split text[start:end] by chunk_size when no separator works."""
+        position = start
 
-        while start < len(text):
-            end = start + self.chunk_size
-            chunk = text[start:end].strip()
+        while position < end:
+            chunk_end = position + self.chunk_size
+            chunk = text[position : min(chunk_end, end)].strip()
             if chunk:
-                chunks.append(chunk)
-            start = end - self.chunk_overlap if end < len(text) else len(text)
-
-        return chunks
-
+                yield chunk
+            position = (
+                max(chunk_end - self.chunk_overlap, position + 1)
+                if chunk_end < end
+                else end
+            )
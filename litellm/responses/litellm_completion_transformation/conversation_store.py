@@ -0,0 +1,406 @@
+"""
+Write-through store of Responses API conversation turns, for `previous_response_id` chaining.
+
+Without it, `ResponsesSessionHandler` rebuilds the history for `previous_response_id`
+from `LiteLLM_SpendLogs` - a query per turn that grows with the session and only
+sees a turn once the batched spend log write has landed.
+
+With the store enabled, each completed response writes one entry, keyed by its
+response id:
+
+    {"session_id": ..., "previous_response_id": ..., "depth": N, "messages": [...]}
+
+`messages` holds the turn's input + output chat completion messages. Loading a
+history walks the `previous_response_id` links back to the first turn. Every
+`compaction_interval` turns an entry stores the full history instead (and no
+link), so a lookup never reads more than `compaction_interval` entries.
+
+Entries live in an in-memory cache, backed by Redis when configured, so other
+pods can continue the conversation. On a miss the session handler falls back to
+the spend logs.
+
+```yaml
+litellm_settings:
+  responses_conversation_store:
+    redis: true                # use REDIS_HOST / REDIS_PORT / REDIS_PASSWORD, or a dict of RedisCache params
+    ttl: 86400
+    max_in_memory_entries: 1000
+    compaction_interval: 20
+```
+"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.redis_cache import RedisCache
+from litellm.constants import (
+    RESPONSES_CONVERSATION_STORE_COMPACTION_INTERVAL,
+    RESPONSES_CONVERSATION_STORE_MAX_IN_MEMORY_ENTRIES,
+    RESPONSES_CONVERSATION_STORE_TTL,
+)
+from litellm.responses.utils import ResponsesAPIRequestUtils
+
+if TYPE_CHECKING:
+    from litellm.responses.litellm_completion_transformation.transformation import (
+        ChatCompletionSession,
+    )
+else:
+    ChatCompletionSession = Any
+
+_KEY_PREFIX = "litellm_responses_conversation:"
+
+
+def _to_jsonable_message(message: Any) -> Dict[str, Any]:
+    if hasattr(message, "model_dump"):
+        return message.model_dump(exclude_none=True)
+    return dict(message)
+
+
+def get_inner_response_id(response_id: str) -> str:
+    """Response id without the litellm provider / model id encoding."""
+    decoded = ResponsesAPIRequestUtils._decode_responses_api_response_id(response_id)
+    return decoded.get("response_id") or response_id
+
+
+class ResponsesConversationStore:
+    def __init__(
+        self,
+        redis_cache: Optional[RedisCache] = None,
+        ttl: int = RESPONSES_CONVERSATION_STORE_TTL,
+        max_in_memory_entries: int = RESPONSES_CONVERSATION_STORE_MAX_IN_MEMORY_ENTRIES,
+        compaction_interval: int = RESPONSES_CONVERSATION_STORE_COMPACTION_INTERVAL,
+    ):
+        if compaction_interval < 1:
+            raise ValueError("compaction_interval must be >= 1")
+        self.ttl = ttl
+        self.compaction_interval = compaction_interval
+        self.cache = DualCache(
+            in_memory_cache=InMemoryCache(
+                max_size_in_memory=max_in_memory_entries, default_ttl=ttl
+            ),
+            redis_cache=redis_cache,
+        )
+        self._background_writes: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> "ResponsesConversationStore":
+        settings = dict(settings)
+        redis_settings = settings.pop("redis", None)
+        redis_cache: Optional[RedisCache] = None
+        if redis_settings is True:
+            redis_cache = RedisCache()
+        elif isinstance(redis_settings, dict):
+            redis_cache = RedisCache(**redis_settings)
+        return cls(redis_cache=redis_cache, **settings)
+
+    ########################################################
+    # Reads
+    ########################################################
+    async def async_get_session(
+        self, previous_response_id: str
+    ) -> Optional[ChatCompletionSession]:
+        """
+        Full chat completion history ending with `previous_response_id`, or None if
+        any turn of it is missing from the store.
+        """
+        entries: List[Dict[str, Any]] = []
+        response_id: Optional[str] = get_inner_response_id(previous_response_id)
+        while response_id is not None:
+            entry = await self._async_get_entry(response_id)
+            if entry is None:
+                return None
+            entries.append(entry)
+            if len(entries) > self.compaction_interval:
+                # a broken chain (e.g. a cycle) - let the caller fall back
+                return None
+            response_id = entry.get("previous_response_id")
+        return self._entries_to_session(entries)
+
+    def get_session(self, previous_response_id: str) -> Optional[ChatCompletionSession]:
+        """Sync version of `async_get_session`."""
+        entries: List[Dict[str, Any]] = []
+        response_id: Optional[str] = get_inner_response_id(previous_response_id)
+        while response_id is not None:
+            entry = self._get_entry(response_id)
+            if entry is None:
+                return None
+            entries.append(entry)
+            if len(entries) > self.compaction_interval:
+                return None
+            response_id = entry.get("previous_response_id")
+        return self._entries_to_session(entries)
+
+    @staticmethod
+    def _entries_to_session(entries: List[Dict[str, Any]]) -> ChatCompletionSession:
+        from litellm.responses.litellm_completion_transformation.transformation import (
+            ChatCompletionSession,
+        )
+
+        messages: List[Any] = []
+        for entry in reversed(entries):
+            messages.extend(entry.get("messages") or [])
+        return ChatCompletionSession(
+            messages=messages,
+            litellm_session_id=entries[0].get("session_id"),
+        )
+
+    async def _async_get_entry(self, response_id: str) -> Optional[Dict[str, Any]]:
+        cached = await self.cache.async_get_cache(key=_KEY_PREFIX + response_id)
+        return self._parse_entry(cached)
+
+    def _get_entry(self, response_id: str) -> Optional[Dict[str, Any]]:
+        return self._parse_entry(self.cache.get_cache(key=_KEY_PREFIX + response_id))
+
+    @staticmethod
+    def _parse_entry(cached: Any) -> Optional[Dict[str, Any]]:
+        if cached is None:
+            return None
+        if isinstance(cached, dict):
+            return cached
+        try:
+            return json.loads(cached)
+        except (TypeError, ValueError):
+            return None
+
+    ########################################################
+    # Writes
+    ########################################################
+    def _build_entry(
+        self,
+        parent: Optional[Dict[str, Any]],
+        previous_response_id: Optional[str],
+        session_id: Optional[str],
+        turn_messages: List[Any],
+        full_input_messages: List[Any],
+        output_messages: List[Any],
+        history_loaded: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        The entry to store for a turn, or None if it can't be stored - a compacted
+        entry needs the full history, which is missing when `previous_response_id`
+        was neither in the store nor in the spend logs.
+        """
+        if previous_response_id is not None and (
+            parent is None or parent.get("depth", 1) >= self.compaction_interval
+        ):
+            # compact - store the whole history so lookups stop here. Also used
+            # when the previous turn is not in the store (e.g. it was loaded from
+            # the spend logs).
+            if not history_loaded:
+                verbose_logger.debug(
+                    "ResponsesConversationStore: history of %s not loaded, not storing the turn",
+                    previous_response_id,
+                )
+                return None
+            return {
+                "session_id": session_id,
+                "previous_response_id": None,
+                "depth": 1,
+                "messages": [
+                    _to_jsonable_message(m)
+                    for m in list(full_input_messages) + list(output_messages)
+                ],
+            }
+        return {
+            "session_id": session_id,
+            "previous_response_id": previous_response_id,
+            "depth": (parent.get("depth", 1) + 1) if parent is not None else 1,
+            "messages": [
+                _to_jsonable_message(m)
+                for m in list(turn_messages) + list(output_messages)
+            ],
+        }
+
+    async def async_add_turn(
+        self,
+        response_id: str,
+        previous_response_id: Optional[str],
+        session_id: Optional[str],
+        turn_messages: List[Any],
+        full_input_messages: List[Any],
+        output_messages: List[Any],
+        history_loaded: bool = True,
+    ) -> None:
+        """
+        Record a completed turn.
+
+        turn_messages: this request's own input messages
+        full_input_messages: the messages sent to the model (history + this turn)
+        output_messages: the assistant message(s) returned
+        history_loaded: whether `full_input_messages` includes the history of
+            `previous_response_id`
+        """
+        try:
+            previous_response_id = (
+                get_inner_response_id(previous_response_id)
+                if previous_response_id
+                else None
+            )
+            parent = (
+                await self._async_get_entry(previous_response_id)
+                if previous_response_id is not None
+                else None
+            )
+            entry = self._build_entry(
+                parent=parent,
+                previous_response_id=previous_response_id,
+                session_id=session_id,
+                turn_messages=turn_messages,
+                full_input_messages=full_input_messages,
+                output_messages=output_messages,
+                history_loaded=history_loaded,
+            )
+            if entry is None:
+                return
+            await self.cache.async_set_cache(
+                key=_KEY_PREFIX + get_inner_response_id(response_id),
+                value=json.dumps(entry, default=str),
+                ttl=self.ttl,
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "ResponsesConversationStore: failed to store turn - %s", str(e)
+            )
+
+    def add_turn(
+        self,
+        response_id: str,
+        previous_response_id: Optional[str],
+        session_id: Optional[str],
+        turn_messages: List[Any],
+        full_input_messages: List[Any],
+        output_messages: List[Any],
+        history_loaded: bool = True,
+    ) -> None:
+        """
+        Sync version of `async_add_turn`. Inside a running event loop the write is
+        scheduled on the loop instead of blocking it.
+        """
+        kwargs = dict(
+            response_id=response_id,
+            previous_response_id=previous_response_id,
+            session_id=session_id,
+            turn_messages=turn_messages,
+            full_input_messages=full_input_messages,
+            output_messages=output_messages,
+            history_loaded=history_loaded,
+        )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            task = loop.create_task(self.async_add_turn(**kwargs))
+            self._background_writes.add(task)
+            task.add_done_callback(self._background_writes.discard)
+            return
+
+        try:
+            inner_previous_id = (
+                get_inner_response_id(previous_response_id)
+                if previous_response_id
+                else None
+            )
+            entry = self._build_entry(
+                parent=(
+                    self._get_entry(inner_previous_id)
+                    if inner_previous_id is not None
+                    else None
+                ),
+                previous_response_id=inner_previous_id,
+                session_id=session_id,
+                turn_messages=turn_messages,
+                full_input_messages=full_input_messages,
+                output_messages=output_messages,
+                history_loaded=history_loaded,
+            )
+            if entry is None:
+                return
+            self.cache.set_cache(
+                key=_KEY_PREFIX + get_inner_response_id(response_id),
+                value=json.dumps(entry, default=str),
+                ttl=self.ttl,
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "ResponsesConversationStore: failed to store turn - %s", str(e)
+            )
+
+
+_store: Optional[ResponsesConversationStore] = None
+_store_settings: Optional[Union[Dict[str, Any], ResponsesConversationStore]] = None
+
+
+def get_responses_conversation_store() -> Optional[ResponsesConversationStore]:
+    """The store configured via `litellm.responses_conversation_store`, or None."""
+    global _store, _store_settings
+    settings = litellm.responses_conversation_store
+    if settings is None:
+        return None
+    if isinstance(settings, ResponsesConversationStore):
+        return settings
+    if _store is None or _store_settings is not settings:
+        _store = ResponsesConversationStore.from_settings(settings)
+        _store_settings = settings
+    return _store
+
+
+def get_conversation_turn(
+    previous_response_id: Optional[str],
+    turn_messages: List[Any],
+    litellm_completion_request: dict,
+    completion_kwargs: dict,
+    history_loaded: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Everything `add_turn` needs except the response - None if the store is disabled.
+
+    `history_loaded` is False when the history of `previous_response_id` could not
+    be loaded, so `litellm_completion_request` only holds this turn.
+
+    The session id follows the spend log `session_id` so turns recorded here and
+    turns loaded from the spend logs continue the same session.
+    """
+    if get_responses_conversation_store() is None:
+        return None
+    logging_obj = completion_kwargs.get("litellm_logging_obj")
+    session_id = (
+        completion_kwargs.get("litellm_session_id")
+        or litellm_completion_request.get("litellm_trace_id")
+        or completion_kwargs.get("litellm_trace_id")
+        or getattr(logging_obj, "litellm_trace_id", None)
+    )
+    return {
+        "previous_response_id": previous_response_id,
+        "session_id": session_id,
+        "turn_messages": list(turn_messages),
+        "full_input_messages": list(litellm_completion_request.get("messages") or []),
+        "history_loaded": history_loaded,
+    }
+
+
+def get_output_messages(model_response: Any) -> List[Any]:
+    return [
+        choice.message
+        for choice in getattr(model_response, "choices", None) or []
+        if getattr(choice, "message", None) is not None
+    ]
+
+
+def store_conversation_turn(
+    conversation_turn: Optional[Dict[str, Any]], model_response: Any
+) -> None:
+    """Record a completed sync or streamed response - see `get_conversation_turn`."""
+    conversation_store = get_responses_conversation_store()
+    if conversation_store is None or conversation_turn is None:
+        return
+    conversation_store.add_turn(
+        response_id=model_response.id,
+        output_messages=get_output_messages(model_response),
+        **conversation_turn,
+    )
@@ -5,6 +5,12 @@ Handler for transforming responses api requests to litellm.completion requests
 from typing import Any, Coroutine, Dict, Optional, Union
 
 import litellm
+from litellm.responses.litellm_completion_transformation.conversation_store import (
+    get_conversation_turn,
+    get_output_messages,
+    get_responses_conversation_store,
+    store_conversation_turn,
+)
 from litellm.responses.litellm_completion_transformation.streaming_iterator import (
     LiteLLMCompletionStreamingIterator,
 )
@@ -59,9 +65,30 @@ class LiteLLMCompletionTransformationHandler:
                 **kwargs,
             )
 
+        previous_response_id: Optional[str] = responses_api_request.get(
+            "previous_response_id"
+        )
+        turn_messages = list(litellm_completion_request.get("messages") or [])
+        history_loaded = True
+        if previous_response_id:
+            (
+                litellm_completion_request,
+                history_loaded,
+            ) = LiteLLMCompletionResponsesConfig.responses_api_session_handler(
+                previous_response_id=previous_response_id,
+                litellm_completion_request=litellm_completion_request,
+            )
+
         completion_args = {}
         completion_args.update(kwargs)
         completion_args.update(litellm_completion_request)
+        conversation_turn = get_conversation_turn(
+            previous_response_id=previous_response_id,
+            turn_messages=turn_messages,
+            litellm_completion_request=litellm_completion_request,
+            completion_kwargs=completion_args,
+            history_loaded=history_loaded,
+        )
 
         litellm_completion_response: Union[
             ModelResponse, litellm.CustomStreamWrapper
@@ -71,6 +98,10 @@ class LiteLLMCompletionTransformationHandler:
         )
 
         if isinstance(litellm_completion_response, ModelResponse):
+            store_conversation_turn(
+                conversation_turn=conversation_turn,
+                model_response=litellm_completion_response,
+            )
             responses_api_response: ResponsesAPIResponse = (
                 LiteLLMCompletionResponsesConfig.transform_chat_completion_response_to_responses_api_response(
                     chat_completion_response=litellm_completion_response,
@@ -89,6 +120,7 @@ class LiteLLMCompletionTransformationHandler:
                 responses_api_request=responses_api_request,
                 custom_llm_provider=custom_llm_provider,
                 litellm_metadata=kwargs.get("litellm_metadata", {}),
+                conversation_turn=conversation_turn,
             )
         raise ValueError(f"Unexpected response type: {type(litellm_completion_response)}")
 
@@ -103,15 +135,29 @@ class LiteLLMCompletionTransformationHandler:
         previous_response_id: Optional[str] = responses_api_request.get(
             "previous_response_id"
         )
+        turn_messages = list(litellm_completion_request.get("messages") or [])
+        history_loaded = True
         if previous_response_id:
-            litellm_completion_request = await LiteLLMCompletionResponsesConfig.async_responses_api_session_handler(
+            session_result = await LiteLLMCompletionResponsesConfig.async_responses_api_session_handler(
                 previous_response_id=previous_response_id,
                 litellm_completion_request=litellm_completion_request,
             )
+            # overrides of the session handler may still return just the request
+            if isinstance(session_result, tuple):
+                litellm_completion_request, history_loaded = session_result
+            else:
+                litellm_completion_request = session_result
 
         acompletion_args = {}
         acompletion_args.update(kwargs)
         acompletion_args.update(litellm_completion_request)
+        conversation_turn = get_conversation_turn(
+            previous_response_id=previous_response_id,
+            turn_messages=turn_messages,
+            litellm_completion_request=litellm_completion_request,
+            completion_kwargs=acompletion_args,
+            history_loaded=history_loaded,
+        )
 
         litellm_completion_response: Union[
             ModelResponse, litellm.CustomStreamWrapper
@@ -120,6 +166,13 @@ class LiteLLMCompletionTransformationHandler:
         )
 
         if isinstance(litellm_completion_response, ModelResponse):
+            conversation_store = get_responses_conversation_store()
+            if conversation_store is not None and conversation_turn is not None:
+                await conversation_store.async_add_turn(
+                    response_id=litellm_completion_response.id,
+                    output_messages=get_output_messages(litellm_completion_response),
+                    **conversation_turn,
+                )
             responses_api_response: ResponsesAPIResponse = (
                 LiteLLMCompletionResponsesConfig.transform_chat_completion_response_to_responses_api_response(
                     chat_completion_response=litellm_completion_response,
@@ -140,5 +193,6 @@ class LiteLLMCompletionTransformationHandler:
                     "custom_llm_provider"
                 ),
                 litellm_metadata=kwargs.get("litellm_metadata", {}),
+                conversation_turn=conversation_turn,
             )
         raise ValueError(f"Unexpected response type: {type(litellm_completion_response)}")
@@ -39,9 +39,24 @@ class ResponsesSessionHandler:
             ChatCompletionSession,
         )
 
+        from litellm.responses.litellm_completion_transformation.conversation_store import (
+            get_responses_conversation_store,
+        )
+
         verbose_proxy_logger.debug(
             "inside get_chat_completion_message_history_for_previous_response_id"
         )
+        conversation_store = get_responses_conversation_store()
+        if conversation_store is not None:
+            stored_session = await conversation_store.async_get_session(
+                previous_response_id=previous_response_id
+            )
+            if stored_session is not None:
+                return stored_session
+            verbose_proxy_logger.debug(
+                "previous response id not in conversation store, checking spend logs"
+            )
+
         all_spend_logs: List[
             SpendLogsPayload
         ] = await ResponsesSessionHandler.get_all_spend_logs_for_previous_response_id(
@@ -4,6 +4,9 @@ from typing import List, Optional, Union, cast
 
 import litellm
 from litellm.main import stream_chunk_builder
+from litellm.responses.litellm_completion_transformation.conversation_store import (
+    store_conversation_turn,
+)
 from litellm.responses.litellm_completion_transformation.transformation import (
     LiteLLMCompletionResponsesConfig,
 )
@@ -57,6 +60,7 @@ class LiteLLMCompletionStreamingIterator(ResponsesAPIStreamingIterator):
         responses_api_request: ResponsesAPIOptionalRequestParams,
         custom_llm_provider: Optional[str] = None,
         litellm_metadata: Optional[dict] = None,
+        conversation_turn: Optional[dict] = None,
     ):
         self.model: str = model
         self.litellm_custom_stream_wrapper: litellm.CustomStreamWrapper = (
@@ -68,6 +72,8 @@ class LiteLLMCompletionStreamingIterator(ResponsesAPIStreamingIterator):
         )
         self.custom_llm_provider: Optional[str] = custom_llm_provider
         self.litellm_metadata: Optional[dict] = litellm_metadata or {}
+        # recorded in the responses conversation store once the stream completes
+        self.conversation_turn: Optional[dict] = conversation_turn
         self.collected_chat_completion_chunks: List[ModelResponseStream] = []
         self.finished: bool = False
         self.litellm_logging_obj = litellm_custom_stream_wrapper.logging_obj
@@ -1046,6 +1052,13 @@ class LiteLLMCompletionStreamingIterator(ResponsesAPIStreamingIterator):
                         ),
                     )
 
+            if self.conversation_turn is not None:
+                store_conversation_turn(
+                    conversation_turn=self.conversation_turn,
+                    model_response=litellm_model_response,
+                )
+                self.conversation_turn = None
+
             # Transform the response
             responses_api_response = LiteLLMCompletionResponsesConfig.transform_chat_completion_response_to_responses_api_response(
                 request_input=self.request_input,
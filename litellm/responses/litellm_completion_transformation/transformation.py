@@ -279,17 +279,71 @@ class LiteLLMCompletionResponsesConfig:
     async def async_responses_api_session_handler(
         previous_response_id: str,
         litellm_completion_request: dict,
-    ) -> dict:
+    ) -> Tuple[dict, bool]:
         """
         Async hook to get the chain of previous input and output pairs and return a list of Chat Completion messages
+
+        Returns the request and whether the history of `previous_response_id` was found
+        in the conversation store or the spend logs.
         """
         chat_completion_session = ChatCompletionSession(
             messages=[], litellm_session_id=None
         )
+        history_loaded = True
         if previous_response_id:
             chat_completion_session = await ResponsesSessionHandler.get_chat_completion_message_history_for_previous_response_id(
                 previous_response_id=previous_response_id
             )
+            history_loaded = bool(chat_completion_session.get("messages"))
+        return (
+            LiteLLMCompletionResponsesConfig.apply_chat_completion_session(
+                chat_completion_session=chat_completion_session,
+                previous_response_id=previous_response_id,
+                litellm_completion_request=litellm_completion_request,
+            ),
+            history_loaded,
+        )
+
+    @staticmethod
+    def responses_api_session_handler(
+        previous_response_id: str,
+        litellm_completion_request: dict,
+    ) -> Tuple[dict, bool]:
+        """
+        Sync version of `async_responses_api_session_handler`. Only the conversation
+        store is read - the spend logs need the async DB client.
+
+        Returns the request and whether the history of `previous_response_id` was found.
+        """
+        from litellm.responses.litellm_completion_transformation.conversation_store import (
+            get_responses_conversation_store,
+        )
+
+        conversation_store = get_responses_conversation_store()
+        chat_completion_session: Optional[ChatCompletionSession] = None
+        if previous_response_id and conversation_store is not None:
+            chat_completion_session = conversation_store.get_session(
+                previous_response_id=previous_response_id
+            )
+        return (
+            LiteLLMCompletionResponsesConfig.apply_chat_completion_session(
+                chat_completion_session=chat_completion_session
+                or ChatCompletionSession(messages=[], litellm_session_id=None),
+                previous_response_id=previous_response_id,
+                litellm_completion_request=litellm_completion_request,
+            ),
+            chat_completion_session is not None,
+        )
+
+    @staticmethod
+    def apply_chat_completion_session(
+        chat_completion_session: ChatCompletionSession,
+        previous_response_id: str,
+        litellm_completion_request: dict,
+    ) -> dict:
+        """
+        Prepend the session history to the request messages
+        """
         _messages = litellm_completion_request.get("messages") or []
         session_messages = chat_completion_session.get("messages") or []
         
@@ -28,6 +28,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -62,6 +63,10 @@ from litellm.litellm_core_utils.coroutine_checker import coroutine_checker
 from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
 from litellm.litellm_core_utils.dd_tracing import tracer
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
+from litellm.litellm_core_utils.request_stage_timer import (
+    RequestStage,
+    record_request_stage,
+)
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
 from litellm.llms.openai_like.json_loader import JSONProviderRegistry
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
@@ -390,6 +395,8 @@ class Router:
             []
         )  # names of models under litellm_params. ex. azure/chatgpt-v-2
         self.deployment_latency_map = {}
+        # pre-warm tasks of `http2: true` deployments - held so they aren't garbage collected
+        self._http2_prewarm_tasks: Set[asyncio.Task] = set()
         ### CACHING ###
         cache_type: Literal[
             "local", "redis", "redis-semantic", "s3", "disk"
@@ -1657,6 +1664,7 @@ class Router:
             _timeout_debug_deployment_dict = deployment
             end_time = time.time()
             _duration = end_time - start_time
+            record_request_stage(RequestStage.ROUTING, _duration)
             asyncio.create_task(
                 self.service_logger_obj.async_service_success_hook(
                     service=ServiceTypes.ROUTER,
@@ -6251,6 +6259,17 @@ class Router:
                 custom_llm_provider=custom_llm_provider,
                 model=deployment.litellm_params.model,
             )
+            self._warm_deployment_pricing(
+                deployment=deployment,
+                model=_model,
+                custom_llm_provider=custom_llm_provider,
+            )
+            if deployment.litellm_params.get("http2", False) is True:
+                self._init_deployment_http2(
+                    deployment=deployment,
+                    custom_llm_provider=custom_llm_provider,
+                    api_base=api_base,
+                )
 
         #########################################################
         # Check if this is an auto-router deployment
@@ -6260,6 +6279,66 @@ class Router:
 
         return deployment
 
+    def _warm_deployment_pricing(
+        self, deployment: Deployment, model: str, custom_llm_provider: str
+    ) -> None:
+        """
+        Compile the deployment's pricing now, so the first request doesn't pay for it.
+
+        Custom pricing is registered under the deployment id, shared pricing under the model name.
+        """
+        from litellm.litellm_core_utils.llm_cost_calc.utils import (
+            warm_compiled_model_pricing,
+        )
+
+        for cost_map_key in (deployment.model_info.id, model):
+            if cost_map_key is None:
+                continue
+            if (
+                cost_map_key in litellm.model_cost
+                or f"{custom_llm_provider}/{cost_map_key}" in litellm.model_cost
+            ):
+                warm_compiled_model_pricing(
+                    model=cost_map_key, custom_llm_provider=custom_llm_provider
+                )
+
+    def _init_deployment_http2(
+        self,
+        deployment: Deployment,
+        custom_llm_provider: str,
+        api_base: Optional[str],
+    ) -> None:
+        """
+        `http2: true` in litellm_params - send the deployment's requests over the
+        shared HTTP/2 connection pool, and open the connection now if an event loop is running.
+        """
+        from litellm.llms.custom_httpx.http2_transport import (
+            _PROVIDER_DEFAULT_API_BASES,
+            prewarm_http2_connections,
+            register_http2_host,
+        )
+
+        _api_base = (
+            deployment.litellm_params.api_base
+            or api_base
+            or _PROVIDER_DEFAULT_API_BASES.get(custom_llm_provider)
+        )
+        if _api_base is None:
+            verbose_router_logger.warning(
+                f"http2=True ignored for deployment {deployment.model_name} - no api_base for provider {custom_llm_provider}"
+            )
+            return
+        register_http2_host(_api_base)
+        try:
+            task = asyncio.get_running_loop().create_task(
+                prewarm_http2_connections(api_bases=[_api_base])
+            )
+            self._http2_prewarm_tasks.add(task)
+            task.add_done_callback(self._http2_prewarm_tasks.discard)
+        except RuntimeError:
+            # no running event loop - the connection opens on the first request
+            pass
+
     def _initialize_deployment_for_pass_through(
         self, deployment: Deployment, custom_llm_provider: str, model: str
     ):
@@ -1,20 +1,74 @@
 import io
 import json
+import tempfile
 from os import PathLike
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from litellm._logging import verbose_logger
+from litellm.constants import BATCH_JSONL_SPOOL_MAX_SIZE_BYTES
+from litellm.litellm_core_utils.jsonl_utils import iter_jsonl_objects, write_jsonl
 from litellm.types.llms.openai import FileTypes, OpenAIFilesPurpose
 
 
-class InMemoryFile(io.BytesIO):
+class InMemoryFile(io.RawIOBase):
+    """
+    Named, seekable file object for rewritten batch files.
+
+    Content is kept in memory up to `max_size` bytes and rolled over to a
+    temporary file on disk beyond that, so rewriting a large batch input file
+    does not hold a second copy of it in memory.
+    """
+
     def __init__(
-        self, content: bytes, name: str, content_type: str = "application/jsonl"
+        self,
+        content: bytes,
+        name: str,
+        content_type: str = "application/jsonl",
+        max_size: Optional[int] = None,
     ):
-        super().__init__(content)
+        super().__init__()
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=max_size or BATCH_JSONL_SPOOL_MAX_SIZE_BYTES
+        )
+        if content:
+            self._file.write(content)
+            self._file.seek(0)
         self.name = name
         self.content_type = content_type
 
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._file.read(-1 if size is None else size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        return self._file.readline(-1 if size is None else size)
+
+    def write(self, data: Any) -> int:
+        return self._file.write(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
 
 def parse_jsonl_with_embedded_newlines(content: str) -> List[dict]:
     """
@@ -34,33 +88,11 @@ def parse_jsonl_with_embedded_newlines(content: str) -> List[dict]:
         >>> parse_jsonl_with_embedded_newlines(content)
         [{"id":1,"msg":"Line 1\\nLine 2"}, {"id":2,"msg":"test"}]
     """
-    json_objects = []
-    buffer = ""
-
-    for char in content:
-        buffer += char
-        if char == "\n":
-            # Try to parse what we have so far
-            try:
-                json_object = json.loads(buffer.strip())
-                json_objects.append(json_object)
-                buffer = ""  # Reset buffer for next JSON object
-            except json.JSONDecodeError:
-                # Not a complete JSON object yet, keep accumulating
-                continue
-
-    # Handle any remaining content in buffer
-    if buffer.strip():
-        try:
-            json_object = json.loads(buffer.strip())
-            json_objects.append(json_object)
-        except json.JSONDecodeError as e:
-            verbose_logger.error(
-                f"error parsing final buffer: {buffer[:100]}..., error: {e}"
-            )
-            raise e
-
-    return json_objects
+    try:
+        return list(iter_jsonl_objects(content, allow_multiline_objects=True))
+    except json.JSONDecodeError as e:
+        verbose_logger.error(f"error parsing jsonl content: {content[-100:]}, error: {e}")
+        raise e
 
 
 def should_replace_model_in_jsonl(
@@ -76,54 +108,59 @@ def should_replace_model_in_jsonl(
     return False
 
 
-def replace_model_in_jsonl(file_content: FileTypes, new_model_name: str) -> FileTypes:
-    try:
-        ## if pathlike, return the original file content
-        if isinstance(file_content, PathLike):
-            return file_content
-
-        # Decode the bytes to a string and split into lines
-        # If file_content is a file-like object, read the bytes
-        if hasattr(file_content, "read"):
-            file_content_bytes = file_content.read()  # type: ignore
-        elif isinstance(file_content, tuple):
-            file_content_bytes = file_content[1]
-        else:
-            file_content_bytes = file_content
-
-        # Decode the bytes to a string and split into lines
-        if isinstance(file_content_bytes, bytes):
-            file_content_str = file_content_bytes.decode("utf-8")
-        elif isinstance(file_content_bytes, str):
-            file_content_str = file_content_bytes
-        else:
+def _replace_model_in_json_object(json_object: Any, new_model_name: str) -> Any:
+    # Replace the model name if it exists
+    if "body" in json_object:
+        json_object["body"]["model"] = new_model_name
+    return json_object
 
-            return file_content
 
-        # Parse JSONL properly, handling potential multiline JSON objects
-        json_objects = parse_jsonl_with_embedded_newlines(file_content_str)
-
-        # If no valid JSON objects were found, return the original content
-        if len(json_objects) == 0:
-            return file_content
-
-        modified_lines = []
-        for json_object in json_objects:
-            # Replace the model name if it exists
-            if "body" in json_object:
-                json_object["body"]["model"] = new_model_name
-
-            # Convert the modified JSON object back to a string
-            modified_lines.append(json.dumps(json_object))
+def replace_model_in_jsonl(file_content: FileTypes, new_model_name: str) -> FileTypes:
+    """
+    Return a copy of a batch JSONL file with `body.model` set to `new_model_name`.
 
-        # Reassemble the modified lines and return as bytes
-        modified_file_content = "\n".join(modified_lines).encode("utf-8")
+    The input is parsed and rewritten one line at a time into an `InMemoryFile`,
+    so neither the parsed objects nor the rewritten file are held in memory as
+    a whole. The original is returned if it isn't JSONL.
+    """
+    ## if pathlike, return the original file content
+    if isinstance(file_content, PathLike):
+        return file_content
 
-        return InMemoryFile(modified_file_content, name="modified_file.jsonl", content_type="application/jsonl")  # type: ignore
+    # tuple content is (filename, content, ...) - content may be bytes or a file object
+    source: Any = file_content[1] if isinstance(file_content, tuple) else file_content
+    if not isinstance(source, (bytes, str)) and not hasattr(source, "read"):
+        return file_content
 
+    modified_file = InMemoryFile(
+        b"", name="modified_file.jsonl", content_type="application/jsonl"
+    )
+    try:
+        line_count = write_jsonl(
+            (
+                _replace_model_in_json_object(json_object, new_model_name)
+                for json_object in iter_jsonl_objects(
+                    source, allow_multiline_objects=True
+                )
+            ),
+            modified_file,
+        )
     except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
         # return the original file content if there is an error replacing the model name
+        modified_file.close()
         return file_content
+    finally:
+        if hasattr(source, "seek"):
+            # the original is read again if the file is sent to another deployment
+            source.seek(0)
+
+    # If no valid JSON objects were found, return the original content
+    if line_count == 0:
+        modified_file.close()
+        return file_content
+
+    modified_file.seek(0)
+    return modified_file  # type: ignore
 
 
 def _get_router_metadata_variable_name(function_name: Optional[str]) -> str:
@@ -1,6 +1,7 @@
 """
 Router cooldown handlers
 - _set_cooldown_deployments: puts a deployment in the cooldown list
+- _set_cooldown_deployment_from_health_check: puts a deployment that failed its background health check in the cooldown list
 - get_cooldown_deployments: returns the list of deployments in the cooldown list
 - async_get_cooldown_deployments: ASYNC: returns the list of deployments in the cooldown list
 
@@ -320,6 +321,50 @@ def _set_cooldown_deployments(
     return False
 
 
+def _set_cooldown_deployment_from_health_check(
+    litellm_router_instance: LitellmRouter,
+    deployment: str,
+    health_check_error: str,
+    time_to_cooldown: float,
+) -> bool:
+    """
+    Put a deployment that failed its background health check in cooldown for `time_to_cooldown` seconds.
+
+    A failed health check is not live traffic, so the allowed fails / failure rate policy does not apply.
+    Skipped when cooldowns are disabled, for provider default deployments and for single deployment
+    model groups (cooling those down would fail every request for the model group).
+
+    Returns:
+    - True if the deployment was put in cooldown
+    """
+    if litellm_router_instance.disable_cooldowns:
+        return False
+    if deployment in litellm_router_instance.provider_default_deployment_ids:
+        return False
+    model_group = litellm_router_instance.get_model_group(id=deployment)
+    if model_group is None or len(model_group) <= 1:
+        return False
+
+    exception_status = 503
+    litellm_router_instance.cooldown_cache.add_deployment_to_cooldown(
+        model_id=deployment,
+        original_exception=Exception(
+            "Background health check failed: {}".format(health_check_error)
+        ),
+        exception_status=exception_status,
+        cooldown_time=time_to_cooldown,
+    )
+    asyncio.create_task(
+        router_cooldown_event_callback(
+            litellm_router_instance=litellm_router_instance,
+            deployment_id=deployment,
+            exception_status=exception_status,
+            cooldown_time=time_to_cooldown,
+        )
+    )
+    return True
+
+
 async def _async_get_cooldown_deployments(
     litellm_router_instance: LitellmRouter,
     parent_otel_span: Optional[Span],
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from typing_extensions import TypedDict
+
+LocalBatchEndpoint = Literal[
+    "/v1/chat/completions", "/v1/completions", "/v1/embeddings", "/v1/responses"
+]
+
+LocalBatchStatus = Literal[
+    "validating", "in_progress", "completed", "failed", "cancelling", "cancelled"
+]
+
+
+class LocalBatchRequestCounts(TypedDict):
+    total: int
+    completed: int
+    failed: int
+
+
+class LocalBatchState(TypedDict, total=False):
+    """
+    Persisted state of a batch run by `LocalBatchExecutor`, written to
+    `<batch_dir>/state.json` at every checkpoint.
+    """
+
+    id: str
+    model: Optional[str]
+    # every model group the batch sends requests to
+    models: List[str]
+    endpoint: LocalBatchEndpoint
+    status: LocalBatchStatus
+    created_at: int
+    in_progress_at: Optional[int]
+    completed_at: Optional[int]
+    failed_at: Optional[int]
+    cancelled_at: Optional[int]
+    errors: List[str]
+    request_counts: LocalBatchRequestCounts
+    # litellm metadata sent with every request, e.g. the proxy key for spend tracking
+    request_metadata: Dict[str, Any]
+
+    max_concurrent_requests: int
+    max_requests_per_minute: Optional[int]
+
+    # checkpoint - input lines [0, next_line) have a result in the output or
+    # error file, which are valid up to these byte offsets
+    next_line: int
+    output_file_offset: int
+    error_file_offset: int
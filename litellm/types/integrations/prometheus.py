@@ -160,6 +160,27 @@ LATENCY_BUCKETS = (
     float("inf"),
 )
 
+# Finer-grained buckets for proxy-internal stages (auth, hooks, routing) and event loop lag
+PROXY_STAGE_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    float("inf"),
+)
+
 
 class UserAPIKeyLabelNames(Enum):
     END_USER = "end_user"
@@ -227,6 +248,12 @@ DEFINED_PROMETHEUS_METRICS = Literal[
     "litellm_guardrail_latency_seconds",
     "litellm_guardrail_errors_total",
     "litellm_guardrail_requests_total",
+    "litellm_proxy_request_stage_latency_seconds",
+    "litellm_event_loop_lag_seconds",
+    "litellm_health_check_scheduler_lag_seconds",
+    "litellm_aws_credential_refresh_latency_seconds",
+    "litellm_aws_credential_refresh_failures_total",
+    "litellm_semantic_cache_tier_requests_total",
     # Cache metrics
     "litellm_cache_hits_metric",
     "litellm_cache_misses_metric",
@@ -295,6 +322,14 @@ class PrometheusMetricLabels:
     litellm_guardrail_errors_total: List[str] = []
     litellm_guardrail_requests_total: List[str] = []
 
+    # Proxy-internal timing metrics - labelled by stage only, to keep cardinality low
+    litellm_proxy_request_stage_latency_seconds: List[str] = []
+    litellm_event_loop_lag_seconds: List[str] = []
+    litellm_health_check_scheduler_lag_seconds: List[str] = []
+    litellm_aws_credential_refresh_latency_seconds: List[str] = []
+    litellm_aws_credential_refresh_failures_total: List[str] = []
+    litellm_semantic_cache_tier_requests_total: List[str] = []
+
     litellm_proxy_total_requests_metric = [
         UserAPIKeyLabelNames.END_USER.value,
         UserAPIKeyLabelNames.API_KEY_HASH.value,
@@ -1,6 +1,8 @@
 import ssl
 from enum import Enum
-from typing import Union
+from typing import Dict, Optional, Union
+
+from typing_extensions import TypedDict
 
 
 class httpxSpecialProvider(str, Enum):
@@ -30,3 +32,35 @@ class httpxSpecialProvider(str, Enum):
 
 
 VerifyTypes = Union[str, bool, ssl.SSLContext]
+
+
+class HTTP2HostStats(TypedDict):
+    """Connection pool usage of one host on the shared HTTP/2 pool"""
+
+    host: str
+    # None when the httpcore version does not expose its open connections
+    open_connections: Optional[int]
+    idle_connections: Optional[int]
+    requests_in_flight: int
+    peak_requests_in_flight: int
+    requests_total: int
+    connections_opened: int
+    # connections_opened / requests_total - close to 0 when requests are multiplexed
+    new_connection_rate: float
+    # requests_in_flight / max_concurrent_streams_per_host, when a limit is set
+    stream_utilization: Optional[float]
+
+
+class HTTPTransportPoolStats(TypedDict):
+    """Usage of one shared connection pool of get_async_httpx_client clients"""
+
+    transport: str
+    http_version: str
+    ssl_verify: str
+    # clients currently using the pool
+    references: int
+    age_seconds: float
+    requests_total: int
+    # requests waiting for response headers
+    requests_in_flight: int
+    requests_per_host: Dict[str, int]
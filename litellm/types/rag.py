@@ -20,6 +20,7 @@ class RAGChunkingStrategy(TypedDict, total=False):
     chunk_size: int  # Maximum size of chunks (default: 1000)
     chunk_overlap: int  # Overlap between chunks (default: 200)
     separators: Optional[List[str]]  # Custom separators for splitting
+    tokenizer_model: Optional[str]  # Measure chunk_size / chunk_overlap in this model's tokens (default: characters)
 
 
 class RAGIngestOCROptions(TypedDict, total=False):
@@ -32,6 +33,9 @@ class RAGIngestEmbeddingOptions(TypedDict, total=False):
     """Embedding configuration for RAG ingest pipeline."""
 
     model: str  # e.g., "text-embedding-3-small"
+    batch_size: int  # Max chunks per embedding request (default: 96)
+    max_tokens_per_batch: int  # Max estimated tokens per embedding request (default: 16000)
+    max_concurrent_requests: int  # Embedding requests in flight (default: 4)
 
 
 class OpenAIVectorStoreOptions(TypedDict, total=False):
@@ -156,6 +160,8 @@ class S3VectorsVectorStoreOptions(TypedDict, total=False):
     dimension: Optional[int]  # Vector dimension (auto-detected from embedding model, or default: 1024)
     distance_metric: Optional[Literal["cosine", "euclidean"]]  # Default: cosine
     non_filterable_metadata_keys: Optional[List[str]]  # Keys excluded from filtering (e.g., ["source_text"])
+    skip_unchanged_chunks: Optional[bool]  # Re-ingest: skip chunks stored with the same content hash (default: True)
+    delete_orphaned_vectors: Optional[bool]  # Re-ingest: delete the file's vectors whose chunk is gone, lists the whole index (default: False)
 
     # Credentials (loaded from litellm.credential_list if litellm_credential_name is provided)
     litellm_credential_name: Optional[str]  # Credential name to load from litellm.credential_list
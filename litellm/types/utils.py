@@ -2665,6 +2665,15 @@ class StandardLoggingPayloadStatusFields(TypedDict, total=False):
     """
 
 
+StreamingLoggingField = Literal["usage", "response_cost", "response"]
+"""
+Fields of a finished streaming call that a logger reads:
+- 'usage': token usage
+- 'response_cost': cost of the call
+- 'response': the response content (choices / message / tool calls) assembled from the streamed chunks
+"""
+
+
 class StandardLoggingPayload(TypedDict):
     id: str
     trace_id: str  # Trace multiple LLM calls belonging to same overall request (e.g. fallbacks/retries)
@@ -2930,6 +2939,7 @@ all_litellm_params = (
         "max_budget",
         "budget_duration",
         "use_in_pass_through",
+        "http2",
         "merge_reasoning_content_in_choices",
         "litellm_credential_name",
         "allowed_openai_params",
@@ -71,6 +71,10 @@ from litellm.constants import (
     OPENAI_EMBEDDING_PARAMS,
     TOOL_CHOICE_OBJECT_TOKEN_COUNT,
 )
+from litellm.litellm_core_utils.request_stage_timer import (
+    RequestStage,
+    record_request_stage,
+)
 
 _CachingHandlerResponse = None
 _LLMCachingHandler = None
@@ -1912,6 +1916,7 @@ def client(original_function):  # noqa: PLR0915
             )
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object
+            _logging_enqueue_start = time.perf_counter()
             asyncio.create_task(
                 _client_async_logging_helper(
                     logging_obj=logging_obj,
@@ -1926,6 +1931,10 @@ def client(original_function):  # noqa: PLR0915
                 start_time=start_time,
                 end_time=end_time,
             )
+            record_request_stage(
+                RequestStage.LOGGING_ENQUEUE,
+                time.perf_counter() - _logging_enqueue_start,
+            )
             # REBUILD EMBEDDING CACHING
             if (
                 isinstance(result, EmbeddingResponse)
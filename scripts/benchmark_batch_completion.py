@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark `litellm.batch_completion` (thread pool) against `litellm.abatch_completion`
+(event loop, adaptive concurrency) on mocked completions.
+
+No network calls - every request is a `mock_response` with `mock_delay`
+seconds of latency. Reports wall time and the peak number of threads.
+
+USAGE:
+   python scripts/benchmark_batch_completion.py
+   python scripts/benchmark_batch_completion.py --prompts 5000 --delay 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import litellm  # noqa: E402
+
+
+class _PeakThreads:
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def _poll(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=2000)
+    parser.add_argument("--delay", type=float, default=0.1)
+    parser.add_argument("--max-concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    litellm.suppress_debug_info = True
+    messages = [
+        [{"role": "user", "content": f"prompt {i}"}] for i in range(args.prompts)
+    ]
+    params = dict(model="gpt-4o-mini", mock_response="hi", mock_delay=args.delay)
+
+    with _PeakThreads() as threads:
+        start = time.perf_counter()
+        litellm.batch_completion(
+            messages=messages, max_workers=args.max_concurrency, **params
+        )
+        elapsed = time.perf_counter() - start
+    print(f"batch_completion   {elapsed:>7.2f}s   peak threads {threads.peak}")
+
+    with _PeakThreads() as threads:
+        start = time.perf_counter()
+        asyncio.run(
+            litellm.abatch_completion(
+                messages=messages, max_concurrency=args.max_concurrency, **params
+            )
+        )
+        elapsed = time.perf_counter() - start
+    print(f"abatch_completion  {elapsed:>7.2f}s   peak threads {threads.peak}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch output cost / usage aggregation and batch input model rewriting
+on a synthetic JSONL file, comparing the streaming implementation with the
+previous parse-everything-into-a-list one.
+
+No network calls - the batch output file is synthetic OpenAI batch results.
+`litellm.completion_cost` is replaced with a constant so the numbers measure
+reading, parsing and aggregation; its per-line cost is the same either way.
+Each run happens in a fresh subprocess so peak RSS is reported per mode.
+
+USAGE:
+   python scripts/benchmark_batch_jsonl.py                  # 1GB output file
+   python scripts/benchmark_batch_jsonl.py --megabytes 256
+   python scripts/benchmark_batch_jsonl.py --megabytes 64 --modes streaming-file,legacy
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+MODES = ["streaming-file", "streaming-bytes", "legacy", "rewrite-streaming", "rewrite-legacy"]
+
+
+def _write_batch_output_file(path: str, megabytes: float) -> int:
+    target = int(megabytes * 1024 * 1024)
+    size = 0
+    line_count = 0
+    with open(path, "wb") as f:
+        while size < target:
+            line = json.dumps(
+                {
+                    "id": f"batch_req_{line_count}",
+                    "custom_id": f"request-{line_count}",
+                    "response": {
+                        "status_code": 200,
+                        "request_id": f"req_{line_count}",
+                        "body": {
+                            "id": f"chatcmpl-{line_count}",
+                            "object": "chat.completion",
+                            "created": 1734986202,
+                            "model": "gpt-4o-mini-2024-07-18",
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {
+                                        "role": "assistant",
+                                        "content": "Batch results are aggregated line by line. " * 8,
+                                    },
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                            "usage": {
+                                "prompt_tokens": 20,
+                                "completion_tokens": 10,
+                                "total_tokens": 30,
+                            },
+                        },
+                    },
+                    "error": None,
+                }
+            ).encode("utf-8") + b"\n"
+            f.write(line)
+            size += len(line)
+            line_count += 1
+    return line_count
+
+
+def _legacy_get_file_content_as_dictionary(file_content: bytes) -> list:
+    # previous implementation, including its eagerly formatted debug log
+    _file_content_str = file_content.decode("utf-8")
+    json_objects = []
+    for line in _file_content_str.strip().split("\n"):
+        if line:
+            json_objects.append(json.loads(line))
+    json.dumps(json_objects, indent=4)
+    return json_objects
+
+
+def _legacy_replace_model_in_jsonl(file_content: bytes, new_model_name: str) -> bytes:
+    # previous implementation with the line-based parse of the current one, so
+    # the comparison is not dominated by its character-by-character parser
+    json_objects = [json.loads(line) for line in file_content.decode("utf-8").splitlines() if line]
+    modified_lines = []
+    for json_object in json_objects:
+        if "body" in json_object:
+            json_object["body"]["model"] = new_model_name
+        modified_lines.append(json.dumps(json_object))
+    return "\n".join(modified_lines).encode("utf-8")
+
+
+def _run_mode(mode: str, path: str) -> None:
+    import litellm
+    from litellm.batches import batch_utils
+    from litellm.router_utils.batch_utils import replace_model_in_jsonl
+
+    litellm.completion_cost = lambda *args, **kwargs: 0.0001  # type: ignore
+
+    start = time.perf_counter()
+    if mode == "streaming-file":
+        with open(path, "rb") as f:
+            result = asyncio.run(
+                batch_utils.calculate_batch_cost_and_usage(
+                    batch_utils._iter_file_content_as_dictionary(f), "openai"
+                )
+            )
+        summary = f"cost={result[0]:.2f} tokens={result[1].total_tokens}"
+    elif mode == "streaming-bytes":
+        with open(path, "rb") as f:
+            content = f.read()
+        result = asyncio.run(
+            batch_utils.calculate_batch_cost_and_usage(
+                batch_utils._iter_file_content_as_dictionary(content), "openai"
+            )
+        )
+        summary = f"cost={result[0]:.2f} tokens={result[1].total_tokens}"
+    elif mode == "legacy":
+        with open(path, "rb") as f:
+            content = f.read()
+        file_content_dictionary = _legacy_get_file_content_as_dictionary(content)
+        batch_cost = batch_utils._batch_cost_calculator(file_content_dictionary, "openai")
+        batch_usage = batch_utils._get_batch_job_total_usage_from_file_content(
+            file_content_dictionary, "openai"
+        )
+        batch_utils._get_batch_models_from_file_content(file_content_dictionary)
+        summary = f"cost={batch_cost:.2f} tokens={batch_usage.total_tokens}"
+    elif mode == "rewrite-streaming":
+        with open(path, "rb") as f:
+            modified_file = replace_model_in_jsonl(f, "claude-3")
+        summary = f"rewritten={modified_file.seek(0, os.SEEK_END)} bytes"  # type: ignore
+    else:
+        with open(path, "rb") as f:
+            content = f.read()
+        summary = f"rewritten={len(_legacy_replace_model_in_jsonl(content, 'claude-3'))} bytes"
+    elapsed = time.perf_counter() - start
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if sys.platform == "darwin":
+        peak_rss_mb /= 1024
+    print(f"{mode:<18} {elapsed:>8.2f}s   peak RSS {peak_rss_mb:>8.0f} MB   {summary}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", type=float, default=1024)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--run-mode", help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode:
+        _run_mode(args.run_mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "batch_output.jsonl")
+        line_count = _write_batch_output_file(path, args.megabytes)
+        print(
+            f"{os.path.getsize(path) / (1024 * 1024):.0f} MB batch output file, {line_count} lines\n"
+        )
+        for mode in args.modes.split(","):
+            subprocess.run(
+                [sys.executable, __file__, "--run-mode", mode, "--path", path],
+                check=False,
+            )
+
+
+if __name__ == "__main__":
+    main()
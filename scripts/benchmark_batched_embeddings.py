@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark semantic-cache embedding lookups per second with and without batching.
+
+No network calls - `litellm.aembedding` is replaced by a simulated provider with a
+fixed per-request latency, a small per-input cost and a cap on concurrent requests
+(the provider's rate limit / connection pool). Each lookup embeds one prompt, either
+with its own `aembedding` call or through `BatchedEmbedder`.
+
+USAGE:
+   python scripts/benchmark_batched_embeddings.py
+   python scripts/benchmark_batched_embeddings.py --lookups 5000 --concurrency 256
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import litellm
+from litellm.caching.batched_embedder import BatchedEmbedder
+
+MODEL = "text-embedding-3-small"
+
+
+def _simulated_provider(
+    request_latency_ms: float, per_input_ms: float, max_concurrent_requests: int
+):
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    async def aembedding(model, input, **kwargs):
+        inputs = input if isinstance(input, list) else [input]
+        async with semaphore:
+            await asyncio.sleep(
+                (request_latency_ms + per_input_ms * len(inputs)) / 1000
+            )
+        return {
+            "data": [
+                {"embedding": [float(len(text))], "index": i}
+                for i, text in enumerate(inputs)
+            ]
+        }
+
+    return aembedding
+
+
+async def _run(args, batched: bool) -> float:
+    embedder = BatchedEmbedder(
+        max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+    )
+    prompts = iter(f"prompt number {i}" for i in range(args.lookups))
+    provider = _simulated_provider(
+        args.request_latency_ms, args.per_input_ms, args.max_concurrent_requests
+    )
+
+    async def lookup(prompt: str) -> None:
+        if batched:
+            await embedder.aembed(model=MODEL, input=prompt)
+        else:
+            await litellm.aembedding(model=MODEL, input=prompt)
+
+    async def worker() -> None:
+        for prompt in prompts:
+            await lookup(prompt)
+
+    with patch("litellm.aembedding", side_effect=provider):
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+
+    if batched:
+        stats = embedder.get_stats()
+        print(
+            f"  batches={stats['batches']} avg_batch_size={stats['avg_batch_size']:.1f}"
+        )
+    return args.lookups / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--request-latency-ms", type=float, default=20)
+    parser.add_argument("--per-input-ms", type=float, default=0.05)
+    parser.add_argument("--max-concurrent-requests", type=int, default=16)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    print("unbatched:")
+    unbatched = asyncio.run(_run(args, batched=False))
+    print(f"  {unbatched:,.0f} lookups/s")
+    print("batched:")
+    batched = asyncio.run(_run(args, batched=True))
+    print(f"  {batched:,.0f} lookups/s")
+    print(f"speedup: {batched / unbatched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
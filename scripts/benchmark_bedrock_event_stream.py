@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark Bedrock event stream decoding: native decoder vs botocore's EventStreamBuffer +
+EventStreamJSONParser.
+
+No network calls - the recorded event-stream fixtures in
+tests/test_litellm/llms/bedrock/event_stream_fixtures are split into network-sized
+chunks and replayed through `AWSEventStreamDecoder._parse_message_from_event`, i.e.
+everything up to (not including) the provider chunk parser.
+
+USAGE:
+   python scripts/benchmark_bedrock_event_stream.py
+   python scripts/benchmark_bedrock_event_stream.py --rounds 50 --chunk-size 1024
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from botocore.eventstream import EventStreamBuffer
+
+from litellm.llms.bedrock.chat.invoke_handler import AWSEventStreamDecoder
+from litellm.llms.bedrock.event_stream import EventStreamDecoder
+
+FIXTURES_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "tests/test_litellm/llms/bedrock/event_stream_fixtures",
+    )
+)
+FIXTURES = ["anthropic_claude_invoke_stream.bin", "converse_stream.bin"]
+
+
+def _split(data: bytes, chunk_size: int) -> List[bytes]:
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def _decode(buffer_factory: Callable, chunks: List[bytes]) -> int:
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    event_stream_buffer = buffer_factory()
+    num_events = 0
+    for chunk in chunks:
+        event_stream_buffer.add_data(chunk)
+        for event in event_stream_buffer:
+            if decoder._parse_message_from_event(event) is not None:
+                num_events += 1
+    return num_events
+
+
+def _run(buffer_factory: Callable, chunks: List[bytes], rounds: int):
+    num_events = _decode(buffer_factory, chunks)  # warmup
+    start = time.perf_counter()
+    for _ in range(rounds):
+        _decode(buffer_factory, chunks)
+    elapsed = time.perf_counter() - start
+    return num_events, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=4096,
+        help="bytes per network read replayed into the decoder",
+    )
+    args = parser.parse_args()
+
+    print(
+        "{:<40} {:>10} {:>8} {:>12} {:>12} {:>8}".format(
+            "fixture", "decoder", "events", "MB/s", "events/s", "speedup"
+        )
+    )
+    for fixture in FIXTURES:
+        with open(os.path.join(FIXTURES_DIR, fixture), "rb") as f:
+            data = f.read()
+        chunks = _split(data, args.chunk_size)
+        total_bytes = len(data) * args.rounds
+
+        results = {}
+        for name, buffer_factory in (
+            ("botocore", EventStreamBuffer),
+            ("native", EventStreamDecoder),
+        ):
+            results[name] = _run(buffer_factory, chunks, args.rounds)
+
+        baseline_elapsed = results["botocore"][1]
+        for name, (num_events, elapsed) in results.items():
+            print(
+                "{:<40} {:>10} {:>8} {:>12.1f} {:>12.0f} {:>7.2f}x".format(
+                    fixture,
+                    name,
+                    num_events,
+                    total_bytes / elapsed / 1e6,
+                    num_events * args.rounds / elapsed,
+                    baseline_elapsed / elapsed,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
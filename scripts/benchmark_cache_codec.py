@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark stored bytes and decode time per cache entry: plain JSON (the default
+RedisCache / S3Cache format) vs the CacheCodec variants available in this
+environment.
+
+No network calls - entries are built from synthetic embedding and chat completion
+responses in the `{"timestamp": ..., "response": "<json>"}` shape `Cache` stores.
+Decode time includes parsing the nested `response` JSON, which `Cache` does on
+every hit for plain JSON entries.
+
+USAGE:
+   python scripts/benchmark_cache_codec.py
+   python scripts/benchmark_cache_codec.py --dimensions 1536 --iterations 500
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.caching.cache_codec import CacheCodec, decode_cache_value
+from litellm.types.utils import Embedding, EmbeddingResponse
+
+
+def _embedding_entry(dimensions: int) -> dict:
+    rng = random.Random(0)
+    response = EmbeddingResponse(
+        model="text-embedding-3-large",
+        data=[
+            Embedding(
+                embedding=[rng.uniform(-1, 1) for _ in range(dimensions)],
+                index=0,
+                object="embedding",
+            )
+        ],
+    )
+    return {"timestamp": time.time(), "response": response.model_dump_json()}
+
+
+def _completion_entry(words: int) -> dict:
+    rng = random.Random(0)
+    vocabulary = ["the", "model", "cache", "response", "token", "latency", "redis"]
+    response = {
+        "id": "chatcmpl-benchmark",
+        "object": "chat.completion",
+        "created": 1742056047,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": " ".join(rng.choice(vocabulary) for _ in range(words)),
+                },
+            }
+        ],
+        "usage": {"prompt_tokens": 20, "completion_tokens": words, "total_tokens": words + 20},
+    }
+    return {"timestamp": time.time(), "response": json.dumps(response)}
+
+
+def _decode_plain_json(raw: bytes) -> dict:
+    value = json.loads(raw.decode("utf-8"))
+    value["response"] = json.loads(value["response"])
+    return value
+
+
+def _available_codecs() -> dict:
+    candidates = {
+        "json": {"serializer": "json"},
+        "json+zlib": {"serializer": "json", "compression": "zlib"},
+        "msgpack": {"serializer": "msgpack"},
+        "msgpack+zstd": {"serializer": "msgpack", "compression": "zstd"},
+        "msgpack+lz4": {"serializer": "msgpack", "compression": "lz4"},
+    }
+    codecs = {}
+    for name, config in candidates.items():
+        try:
+            codecs[name] = CacheCodec(**config)
+        except ImportError as e:
+            print(f"skipping {name}: {e}")
+    return codecs
+
+
+def _benchmark(entry: dict, iterations: int, codecs: dict) -> None:
+    plain = json.dumps(entry).encode("utf-8")
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _decode_plain_json(plain)
+    plain_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"  {'plain json':<14} {len(plain):>9,} bytes  {plain_us:>9.1f} us/decode")
+
+    for name, codec in codecs.items():
+        encoded = codec.encode(entry)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            decode_cache_value(encoded)
+        decode_us = (time.perf_counter() - start) / iterations * 1e6
+        print(
+            f"  {name:<14} {len(encoded):>9,} bytes  {decode_us:>9.1f} us/decode"
+            f"  ({len(plain) / len(encoded):.1f}x smaller)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dimensions", type=int, default=3072)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    codecs = _available_codecs()
+    print(f"embedding response ({args.dimensions} dims):")
+    _benchmark(_embedding_entry(args.dimensions), args.iterations, codecs)
+    print(f"chat completion ({args.words} words):")
+    _benchmark(_completion_entry(args.words), args.iterations, codecs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Benchmark the default HTTP/1.1 transport against the shared HTTP/2 connection
+pool (`litellm.http2_providers`) on concurrent streaming requests.
+
+Runs a local TLS mock server speaking HTTP/2 and HTTP/1.1 (picked via ALPN)
+that streams `--chunks` SSE chunks per request after `--ttfb` seconds. No
+network calls. Reports the TCP connections the server accepted and the p50 /
+p99 time to first byte. Requires `h2` (`pip install httpx[http2]`).
+
+USAGE:
+   python scripts/benchmark_http2.py
+   python scripts/benchmark_http2.py --concurrency 500 --waves 5 --max-streams 250
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import multiprocessing
+import os
+import ssl
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.events  # noqa: E402
+import h2.settings  # noqa: E402
+from cryptography import x509  # noqa: E402
+from cryptography.hazmat.primitives import hashes, serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec  # noqa: E402
+from cryptography.x509.oid import NameOID  # noqa: E402
+
+import litellm  # noqa: E402
+from litellm.llms.custom_httpx.http2_transport import (  # noqa: E402
+    get_http2_connection_stats,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler  # noqa: E402
+
+CHUNK = b'data: {"choices":[{"delta":{"content":"hello"}}]}\n\n'
+
+
+def _write_self_signed_cert(directory: str):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
+
+
+class _MockLLMServerProtocol(asyncio.Protocol):
+    """Streams an SSE response to every request, over HTTP/2 or HTTP/1.1."""
+
+    def __init__(self, connections_opened, args: argparse.Namespace):
+        self.connections_opened = connections_opened
+        self.args = args
+        self.closed = False
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        with self.connections_opened.get_lock():
+            self.connections_opened.value += 1
+        ssl_object = transport.get_extra_info("ssl_object")
+        self.http2 = ssl_object.selected_alpn_protocol() == "h2"
+        if self.http2:
+            self.conn = h2.connection.H2Connection(
+                config=h2.config.H2Configuration(client_side=False)
+            )
+            self.conn.local_settings = h2.settings.Settings(
+                client=False,
+                initial_values={
+                    h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.args.max_streams
+                },
+            )
+            self.conn.initiate_connection()
+            self.transport.write(self.conn.data_to_send())
+
+    def connection_lost(self, exc):
+        self.closed = True
+
+    def data_received(self, data: bytes):
+        if self.http2:
+            for event in self.conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    self.conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    asyncio.ensure_future(self._respond_http2(event.stream_id))
+            self._flush()
+            return
+
+        self.buffer += data
+        while b"\r\n\r\n" in self.buffer:
+            head, rest = self.buffer.split(b"\r\n\r\n", 1)
+            content_length = 0
+            for line in head.split(b"\r\n")[1:]:
+                key, _, value = line.partition(b":")
+                if key.strip().lower() == b"content-length":
+                    content_length = int(value.strip())
+            if len(rest) < content_length:
+                return
+            self.buffer = rest[content_length:]
+            asyncio.ensure_future(self._respond_http1())
+
+    def _flush(self):
+        if not self.closed:
+            self.transport.write(self.conn.data_to_send())
+
+    async def _respond_http2(self, stream_id: int):
+        await asyncio.sleep(self.args.ttfb)
+        if self.closed:
+            return
+        self.conn.send_headers(
+            stream_id, [(":status", "200"), ("content-type", "text/event-stream")]
+        )
+        for _ in range(self.args.chunks):
+            self.conn.send_data(stream_id, CHUNK)
+            self._flush()
+            await asyncio.sleep(self.args.chunk_delay)
+            if self.closed:
+                return
+        self.conn.end_stream(stream_id)
+        self._flush()
+
+    async def _respond_http1(self):
+        await asyncio.sleep(self.args.ttfb)
+        if self.closed:
+            return
+        self.transport.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+            b"transfer-encoding: chunked\r\n\r\n"
+        )
+        for _ in range(self.args.chunks):
+            self.transport.write(b"%x\r\n%s\r\n" % (len(CHUNK), CHUNK))
+            await asyncio.sleep(self.args.chunk_delay)
+            if self.closed:
+                return
+        self.transport.write(b"0\r\n\r\n")
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percentile), len(values) - 1)]
+
+
+async def _run_client(
+    name: str, client: AsyncHTTPHandler, url: str, connections_opened, args
+) -> None:
+    connections_before = connections_opened.value
+    ttfbs: List[float] = []
+
+    async def _request():
+        start = time.perf_counter()
+        response = await client.post(url, json={"stream": True}, stream=True)
+        first_chunk = True
+        async for _ in response.aiter_bytes():
+            if first_chunk:
+                ttfbs.append(time.perf_counter() - start)
+                first_chunk = False
+        await response.aclose()
+
+    start = time.perf_counter()
+    for _ in range(args.waves):
+        await asyncio.gather(*[_request() for _ in range(args.concurrency)])
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<10} {elapsed:>7.2f}s   connections opened {connections_opened.value - connections_before:>5}"
+        f"   TTFB p50 {_percentile(ttfbs, 0.5) * 1000:>7.1f}ms   p99 {_percentile(ttfbs, 0.99) * 1000:>7.1f}ms"
+    )
+
+
+async def _serve(connections_opened, port_queue, args) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = _write_self_signed_cert(directory)
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(cert_path, key_path)
+    ssl_context.set_alpn_protocols(["h2", "http/1.1"])
+    server = await asyncio.get_running_loop().create_server(
+        lambda: _MockLLMServerProtocol(connections_opened, args),
+        "127.0.0.1",
+        0,
+        ssl=ssl_context,
+        backlog=4096,
+    )
+    port_queue.put(server.sockets[0].getsockname()[1])
+    await server.serve_forever()
+
+
+def _run_server(connections_opened, port_queue, args) -> None:
+    # separate process, so the server's CPU time does not skew the client's TTFB
+    asyncio.run(_serve(connections_opened, port_queue, args))
+
+
+async def _main(args, url: str, connections_opened) -> None:
+    http1_client = AsyncHTTPHandler(ssl_verify=False)
+    await _run_client("HTTP/1.1", http1_client, url, connections_opened, args)
+    await http1_client.close()
+
+    litellm.http2_providers = ["openai"]
+    http2_client = AsyncHTTPHandler(ssl_verify=False, llm_provider="openai")
+    await _run_client("HTTP/2", http2_client, url, connections_opened, args)
+    for host_stats in get_http2_connection_stats():
+        print(f"  {host_stats}")
+    await http2_client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--waves", type=int, default=3)
+    parser.add_argument("--ttfb", type=float, default=0.05)
+    parser.add_argument("--chunks", type=int, default=10)
+    parser.add_argument("--chunk-delay", type=float, default=0.01)
+    parser.add_argument(
+        "--max-streams",
+        type=int,
+        default=100,
+        help="SETTINGS_MAX_CONCURRENT_STREAMS of the mock server",
+    )
+    args = parser.parse_args()
+
+    litellm.suppress_debug_info = True
+    connections_opened = multiprocessing.Value("i", 0)
+    port_queue: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_run_server, args=(connections_opened, port_queue, args), daemon=True
+    )
+    server.start()
+    try:
+        url = f"https://127.0.0.1:{port_queue.get(timeout=30)}/v1/chat/completions"
+        asyncio.run(_main(args, url, connections_opened))
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
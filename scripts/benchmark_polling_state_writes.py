@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark Redis bytes written per output token for background response polling:
+the "json" state backend (full response rewritten every flush) vs "redis_stream"
+(events appended, output snapshot only at checkpoints).
+
+No network calls - ResponsePollingHandler runs against an in-memory store that
+counts the bytes of every SET / XADD, fed a synthetic Responses API event stream
+flushed like background_streaming_task does (every `--events-per-flush` events).
+
+USAGE:
+   python scripts/benchmark_polling_state_writes.py
+   python scripts/benchmark_polling_state_writes.py --tokens 8000 --items 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.proxy.response_polling.polling_handler import (
+    STREAM_CHECKPOINT_EVENT_TYPES,
+    ResponsePollingHandler,
+    apply_response_stream_event,
+)
+
+
+class CountingStore:
+    """The RedisCache methods ResponsePollingHandler uses, counting bytes written."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.streams: Dict[str, List[Tuple[str, str]]] = {}
+        self.bytes_written = 0
+        self._sequence = 0
+
+    async def async_set_cache(self, key, value, ttl=None, **kwargs):
+        self.bytes_written += len(value)
+        self.values[key] = value
+
+    async def async_get_cache(self, key, **kwargs):
+        return self.values.get(key)
+
+    async def async_stream_append(self, key, values, ttl=None, **kwargs):
+        ids = []
+        for value in values:
+            self._sequence += 1
+            self.bytes_written += len(value)
+            ids.append(f"0-{self._sequence}")
+            self.streams.setdefault(key, []).append((ids[-1], value))
+        return ids
+
+    async def async_stream_range(self, key, after_id=None, count=None, **kwargs):
+        after = int(after_id.split("-")[1]) if after_id else 0
+        return [e for e in self.streams.get(key, []) if int(e[0].split("-")[1]) > after]
+
+    async def async_stream_trim(self, key, min_id):
+        minimum = int(min_id.split("-")[1])
+        self.streams[key] = [
+            e for e in self.streams.get(key, []) if int(e[0].split("-")[1]) >= minimum
+        ]
+
+
+def _events(tokens: int, items: int) -> List[dict]:
+    vocabulary = ["the", " model", " streams", " tokens", " to", " redis", "."]
+    events: List[dict] = [{"type": "response.created", "response": {"status": "in_progress"}}]
+    for item_index in range(items):
+        item_id = f"msg_{item_index}"
+        events.append(
+            {
+                "type": "response.output_item.added",
+                "item": {"id": item_id, "type": "message", "role": "assistant", "content": []},
+            }
+        )
+        events.append(
+            {
+                "type": "response.content_part.added",
+                "item_id": item_id,
+                "content_index": 0,
+                "part": {"type": "output_text", "text": "", "annotations": []},
+            }
+        )
+        text = ""
+        for i in range(tokens // items):
+            delta = vocabulary[i % len(vocabulary)]
+            text += delta
+            events.append(
+                {
+                    "type": "response.output_text.delta",
+                    "item_id": item_id,
+                    "content_index": 0,
+                    "delta": delta,
+                }
+            )
+        events.append(
+            {
+                "type": "response.output_item.done",
+                "item": {
+                    "id": item_id,
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "output_text", "text": text, "annotations": []}],
+                },
+            }
+        )
+    return events
+
+
+async def _run(state_backend: str, events: List[dict], events_per_flush: int) -> Tuple[int, dict]:
+    store = CountingStore()
+    handler = ResponsePollingHandler(redis_cache=store, state_backend=state_backend)  # type: ignore[arg-type]
+    polling_id = handler.generate_polling_id()
+    await handler.create_initial_state(polling_id=polling_id, request_data={})
+    store.bytes_written = 0
+
+    output_items: Dict[str, dict] = {}
+    pending: List[str] = []
+    checkpoint = False
+    for index, event in enumerate(events):
+        raw = json.dumps(event)
+        apply_response_stream_event(output_items, event)
+        pending.append(raw)
+        checkpoint = checkpoint or event["type"] in STREAM_CHECKPOINT_EVENT_TYPES
+        if (index + 1) % events_per_flush == 0 or index == len(events) - 1:
+            if handler.use_event_stream:
+                await handler.append_events(
+                    polling_id=polling_id,
+                    events=pending,
+                    output_items=output_items,
+                    checkpoint=checkpoint or index == len(events) - 1,
+                )
+            else:
+                await handler.update_state(
+                    polling_id=polling_id, output=list(output_items.values())
+                )
+            pending = []
+            checkpoint = False
+
+    state = await handler.get_state(polling_id)
+    return store.bytes_written, state or {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=4000)
+    parser.add_argument("--items", type=int, default=2)
+    parser.add_argument("--events-per-flush", type=int, default=10)
+    args = parser.parse_args()
+
+    events = _events(args.tokens, args.items)
+    tokens = args.tokens // args.items * args.items
+    results = {}
+    for state_backend in ("json", "redis_stream"):
+        bytes_written, state = asyncio.run(
+            _run(state_backend, events, args.events_per_flush)
+        )
+        results[state_backend] = (bytes_written, state["output"])
+        print(
+            f"  {state_backend:<13} {bytes_written:>13,} bytes written"
+            f"  {bytes_written / tokens:>10.1f} bytes/token"
+        )
+    assert results["json"][1] == results["redis_stream"][1], "outputs differ"
+    print(
+        f"redis_stream writes {results['json'][0] / results['redis_stream'][0]:.1f}x"
+        f" fewer bytes for {tokens} tokens in {args.items} output items"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark logging CPU per streamed request: full response assembly vs the usage-only
+fast path (used when no success callback reads the response content).
+
+No network calls - a synthetic stream is replayed through CustomStreamWrapper. Reports
+event-loop thread CPU (`time.thread_time()`) per request: chunk processing plus the
+end-of-stream logging, which is where the two modes differ.
+
+USAGE:
+   python scripts/benchmark_streaming_logging.py
+   python scripts/benchmark_streaming_logging.py --requests 500 --chunks 400
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices, Usage
+from litellm.utils import ModelResponseListIterator
+
+MODEL = "gpt-4o-mini"
+
+
+class FullResponseLogger(CustomLogger):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        pass
+
+
+class UsageOnlyLogger(CustomLogger):
+    streaming_logging_fields = frozenset({"usage", "response_cost"})
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        pass
+
+
+def _make_chunks(num_chunks: int):
+    chunks = [
+        ModelResponseStream(
+            id="chatcmpl-benchmark",
+            created=1742056047,
+            model=MODEL,
+            choices=[
+                StreamingChoices(
+                    index=0, delta=Delta(content="token{} ".format(i), role="assistant")
+                )
+            ],
+        )
+        for i in range(num_chunks)
+    ]
+    chunks.append(
+        ModelResponseStream(
+            id="chatcmpl-benchmark",
+            created=1742056047,
+            model=MODEL,
+            choices=[
+                StreamingChoices(
+                    index=0, finish_reason="stop", delta=Delta(content="")
+                )
+            ],
+            usage=Usage(
+                prompt_tokens=120,
+                completion_tokens=num_chunks,
+                total_tokens=120 + num_chunks,
+            ),
+        )
+    )
+    return chunks
+
+
+async def _run_request(num_chunks: int) -> float:
+    logging_obj = Logging(
+        model=MODEL,
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="benchmark",
+        function_id="benchmark",
+    )
+    stream = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(
+            model_responses=_make_chunks(num_chunks)
+        ),
+        model=MODEL,
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+        stream_options={"include_usage": True},
+    )
+    cpu_start = time.thread_time()
+    async for _ in stream:
+        pass
+    # wait for the end-of-stream logging task(s) scheduled by the stream wrapper
+    pending = [
+        task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+    ]
+    await asyncio.gather(*pending)
+    return time.thread_time() - cpu_start
+
+
+async def _benchmark(logger: CustomLogger, requests: int, num_chunks: int):
+    litellm.success_callback = []
+    litellm._async_success_callback = [logger]
+    litellm.callbacks = []
+    samples = [await _run_request(num_chunks) for _ in range(requests)]
+    return statistics.mean(samples), statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=200)
+    args = parser.parse_args()
+
+    for name, logger in [
+        ("full assembly", FullResponseLogger()),
+        ("usage-only fast path", UsageOnlyLogger()),
+    ]:
+        mean, median = asyncio.run(_benchmark(logger, args.requests, args.chunks))
+        print(
+            "{:<22} mean={:.3f}ms median={:.3f}ms per request ({} chunks)".format(
+                name, mean * 1000, median * 1000, args.chunks
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark RecursiveCharacterTextSplitter on multi-MB text against the previous
+string-joining implementation (kept as `ReferenceSplitter` in the parity tests).
+
+No network calls - the input is synthetic text, either long paragraphs of
+prose (merged word by word) or prose mixed with long runs without spaces
+(which fall through to the "" separator and are merged character by character).
+
+USAGE:
+   python scripts/benchmark_text_splitter.py
+   python scripts/benchmark_text_splitter.py --megabytes 8 --chunk-size 1000 --chunk-overlap 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from litellm.rag.text_splitters import RecursiveCharacterTextSplitter
+from tests.test_litellm.rag.text_splitters.test_recursive_character_text_splitter import (
+    ReferenceSplitter,
+)
+
+
+def _text(megabytes: float, long_runs: bool, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = ["litellm", "splits", "documents", "into", "chunks", "for", "embedding", "a", "the"]
+    pieces = []
+    size = 0
+    target = int(megabytes * 1024 * 1024)
+    while size < target:
+        roll = rng.random()
+        if roll < 0.001:
+            piece = "\n\n"
+        elif long_runs and roll < 0.003:
+            piece = "x" * rng.randint(1000, 20000)
+        else:
+            piece = rng.choice(words) + " "
+        pieces.append(piece)
+        size += len(piece)
+    return "".join(pieces)
+
+
+def _time(splitter, text: str):
+    start = time.perf_counter()
+    chunks = splitter.split_text(text)
+    return time.perf_counter() - start, chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", type=float, default=4)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    args = parser.parse_args()
+
+    kwargs = {"chunk_size": args.chunk_size, "chunk_overlap": args.chunk_overlap}
+    for name, long_runs in (("prose", False), ("prose + long runs", True)):
+        text = _text(args.megabytes, long_runs=long_runs)
+        reference_seconds, reference_chunks = _time(ReferenceSplitter(**kwargs), text)
+        seconds, chunks = _time(RecursiveCharacterTextSplitter(**kwargs), text)
+        assert chunks == reference_chunks, "chunks differ from the reference splitter"
+
+        print(f"{name}: {len(text) / 1024 / 1024:.1f} MB -> {len(chunks)} chunks")
+        print(f"  reference  {reference_seconds:>8.3f}s")
+        print(f"  offsets    {seconds:>8.3f}s  ({reference_seconds / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,8 @@ from litellm._logging import verbose_logger
 from litellm.batches.batch_utils import (
     _batch_cost_calculator,
     _get_file_content_as_dictionary,
+    _iter_file_content_as_dictionary,
+    calculate_batch_cost_and_usage,
     _get_batch_job_cost_from_file_content,
     _get_batch_job_total_usage_from_file_content,
     _get_batch_job_usage_from_response_body,
@@ -164,6 +166,27 @@ async def test_batch_cost_calculator(sample_file_content_dict):
         assert cost == 1.0  # 0.5 * 2 successful responses
 
 
+@pytest.mark.asyncio
+async def test_calculate_batch_cost_and_usage_single_pass(sample_file_content):
+    """
+    cost, usage and models are aggregated in one pass over a lazily parsed file
+    """
+    file_content_as_dict = _iter_file_content_as_dictionary(sample_file_content)
+    with patch("litellm.completion_cost", return_value=0.5):
+        batch_cost, batch_usage, batch_models = await calculate_batch_cost_and_usage(
+            file_content_dictionary=file_content_as_dict,
+            custom_llm_provider="openai",
+        )
+
+    assert batch_cost == 1.0
+    assert batch_usage.total_tokens == 62
+    assert batch_usage.prompt_tokens == 42
+    assert batch_usage.completion_tokens == 20
+    assert batch_models == ["gpt-4o-mini-2024-07-18", "gpt-4o-mini-2024-07-18"]
+    # the generator was consumed once, not materialized
+    assert next(file_content_as_dict, None) is None
+
+
 def test_get_response_from_batch_job_output_file(sample_file_content_dict):
     result = _get_response_from_batch_job_output_file(sample_file_content_dict[0])
     assert result["id"] == "chatcmpl-AhjSMl7oZ79yIPHLRYgmgXSixTJr7"
@@ -0,0 +1,364 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm import Router
+from litellm.batches import local_batch_executor
+from litellm.batches.local_batch_executor import LocalBatchExecutor
+
+
+def _batch_input(num_requests: int, url: str = "/v1/chat/completions") -> bytes:
+    lines = [
+        json.dumps(
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": url,
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": f"hello {i}"}],
+                },
+            }
+        )
+        for i in range(num_requests)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _read_jsonl(path: str) -> list:
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture
+def router() -> Router:
+    return Router(
+        model_list=[
+            {
+                "model_name": "batch-model",
+                "litellm_params": {
+                    "model": "openai/gpt-4o-mini",
+                    "api_key": "fake-key",
+                    "mock_response": "hi",
+                },
+            }
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_batch_writes_results_in_input_order(router, tmp_path):
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(30),
+        model="batch-model",
+        max_concurrent_requests=4,
+        request_metadata={"user_api_key": "hashed-key"},
+    )
+    assert executor.state["status"] == "validating"
+
+    state = await executor.arun()
+
+    assert state["status"] == "completed"
+    assert state["request_counts"] == {"total": 30, "completed": 30, "failed": 0}
+    results = _read_jsonl(executor.output_file_path)
+    assert [r["custom_id"] for r in results] == [f"request-{i}" for i in range(30)]
+    assert results[0]["response"]["status_code"] == 200
+    assert results[0]["response"]["body"]["choices"][0]["message"]["content"] == "hi"
+    assert _read_jsonl(executor.error_file_path) == []
+    assert LocalBatchExecutor.load_state(str(tmp_path))["status"] == "completed"
+
+
+@pytest.mark.parametrize(
+    "input_file, error",
+    [
+        (b'{"custom_id": "a", "body": {"model": "m"}}\nnot json\n', "Line 2"),
+        (b'{"body": {"model": "m"}}\n', "custom_id"),
+        (
+            b'{"custom_id": "a", "url": "/v1/embeddings", "body": {"model": "m"}}\n',
+            "expected /v1/chat/completions",
+        ),
+        (b"\n\n", "no requests"),
+    ],
+)
+def test_local_batch_create_validates_input(router, tmp_path, input_file, error):
+    with pytest.raises(ValueError, match=error):
+        LocalBatchExecutor.create(
+            router=router,
+            batch_dir=str(tmp_path),
+            input_file=input_file,
+            model="batch-model",
+        )
+
+
+def test_local_batch_create_requires_model(router, tmp_path):
+    with pytest.raises(ValueError, match="body.model"):
+        LocalBatchExecutor.create(
+            router=router,
+            batch_dir=str(tmp_path),
+            input_file=b'{"custom_id": "a", "body": {"messages": []}}\n',
+        )
+    with pytest.raises(ValueError, match="Unsupported batch endpoint"):
+        LocalBatchExecutor.create(
+            router=router,
+            batch_dir=str(tmp_path),
+            input_file=_batch_input(1),
+            endpoint="/v1/images/generations",  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.asyncio
+async def test_local_batch_request_metadata_overrides_file_metadata(router, tmp_path):
+    """The batch file cannot bill its requests to another key or team"""
+    input_file = json.dumps(
+        {
+            "custom_id": "request-0",
+            "body": {
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "user", "content": "hi"}],
+                "metadata": {"user_api_key": "other-key", "tags": ["nightly"]},
+            },
+        }
+    ).encode("utf-8")
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=input_file,
+        model="batch-model",
+        request_metadata={"user_api_key": "hashed-key", "user_api_key_team_id": "t1"},
+    )
+    assert executor.state["models"] == ["batch-model"]
+
+    with patch.object(router, "acompletion", wraps=router.acompletion) as mock:
+        await executor.arun()
+
+    metadata = mock.call_args.kwargs["metadata"]
+    assert metadata["user_api_key"] == "hashed-key"
+    assert metadata["user_api_key_team_id"] == "t1"
+    assert metadata["tags"] == ["nightly"]
+
+
+@pytest.mark.asyncio
+async def test_local_batch_failed_requests_go_to_error_file(router, tmp_path):
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(4),
+        model="batch-model",
+    )
+    original_acompletion = router.acompletion
+
+    async def _acompletion(**kwargs):
+        if kwargs["messages"][0]["content"] == "hello 2":
+            raise litellm.BadRequestError(
+                message="bad request", model="batch-model", llm_provider="openai"
+            )
+        return await original_acompletion(**kwargs)
+
+    with patch.object(router, "acompletion", side_effect=_acompletion):
+        state = await executor.arun()
+
+    assert state["request_counts"] == {"total": 4, "completed": 3, "failed": 1}
+    assert [r["custom_id"] for r in _read_jsonl(executor.output_file_path)] == [
+        "request-0",
+        "request-1",
+        "request-3",
+    ]
+    errors = _read_jsonl(executor.error_file_path)
+    assert errors[0]["custom_id"] == "request-2"
+    assert errors[0]["response"]["status_code"] == 400
+    assert errors[0]["response"]["body"]["error"]["type"] == "BadRequestError"
+
+
+@pytest.mark.asyncio
+async def test_local_batch_resumes_from_checkpoint(router, tmp_path, monkeypatch):
+    """
+    A batch interrupted after its last checkpoint resumes from it - results
+    written after the checkpoint are dropped and every line gets one result.
+    """
+    monkeypatch.setattr(local_batch_executor, "LOCAL_BATCH_CHECKPOINT_INTERVAL", 5)
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(20),
+        model="batch-model",
+        max_concurrent_requests=1,
+    )
+    original_write_jsonl = local_batch_executor.write_jsonl
+
+    def _write_jsonl(objects, file):
+        if objects[0]["custom_id"] == "request-12":
+            raise OSError("disk full")
+        return original_write_jsonl(objects, file)
+
+    with patch.object(local_batch_executor, "write_jsonl", side_effect=_write_jsonl):
+        with pytest.raises(OSError, match="disk full"):
+            await executor.arun()
+
+    state = LocalBatchExecutor.load_state(str(tmp_path))
+    assert state["status"] == "failed"
+    assert state["next_line"] == 10
+    assert state["request_counts"]["completed"] == 10
+    assert len(_read_jsonl(executor.output_file_path)) == 12
+
+    resumed_executor = LocalBatchExecutor(router=router, batch_dir=str(tmp_path))
+    state = await resumed_executor.arun()
+
+    assert state["status"] == "completed"
+    assert state["request_counts"] == {"total": 20, "completed": 20, "failed": 0}
+    assert [r["custom_id"] for r in _read_jsonl(executor.output_file_path)] == [
+        f"request-{i}" for i in range(20)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_local_batch_cancel(router, tmp_path):
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(50),
+        model="batch-model",
+        max_concurrent_requests=1,
+    )
+    original_acompletion = router.acompletion
+
+    async def _acompletion(**kwargs):
+        if kwargs["messages"][0]["content"] == "hello 5":
+            executor.cancel()
+        return await original_acompletion(**kwargs)
+
+    with patch.object(router, "acompletion", side_effect=_acompletion):
+        state = await executor.arun()
+
+    assert state["status"] == "cancelled"
+    assert 6 <= state["request_counts"]["completed"] < 50
+    assert (
+        len(_read_jsonl(executor.output_file_path))
+        == state["request_counts"]["completed"]
+    )
+    # a cancelled batch is not resumed
+    assert (await executor.arun())["status"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_local_batch_retries_rate_limited_requests_after_backoff(
+    router, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        local_batch_executor, "LOCAL_BATCH_RATE_LIMIT_BACKOFF_SECONDS", 0.01
+    )
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(3),
+        model="batch-model",
+    )
+    original_acompletion = router.acompletion
+    calls = []
+
+    async def _acompletion(**kwargs):
+        calls.append(kwargs["messages"][0]["content"])
+        if calls.count("hello 1") < 3 and kwargs["messages"][0]["content"] == "hello 1":
+            raise litellm.RateLimitError(
+                message="rate limited", model="batch-model", llm_provider="openai"
+            )
+        return await original_acompletion(**kwargs)
+
+    with patch.object(router, "acompletion", side_effect=_acompletion):
+        state = await executor.arun()
+
+    assert calls.count("hello 1") == 3
+    assert state["request_counts"] == {"total": 3, "completed": 3, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_local_batch_paces_to_model_group_rpm_headroom(tmp_path):
+    """Without an explicit cap, requests are paced to the group's rpm minus the headroom"""
+    router = Router(
+        model_list=[
+            {
+                "model_name": "batch-model",
+                "litellm_params": {
+                    "model": "openai/gpt-4o-mini",
+                    "api_key": "fake-key",
+                    "mock_response": "hi",
+                    "rpm": 6000,
+                },
+            }
+        ]
+    )
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(5),
+        model="batch-model",
+    )
+    # 6000 rpm, 20% headroom -> 4800 rpm
+    assert executor._get_request_interval() == pytest.approx(60 / 4800)
+
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path / "explicit"),
+        input_file=_batch_input(5),
+        model="batch-model",
+        max_requests_per_minute=600,
+    )
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    state = await executor.arun()
+
+    assert state["status"] == "completed"
+    # 5 requests at 10 per second - the last one starts 0.4s after the first
+    assert loop.time() - start >= 0.4
+
+
+@pytest.mark.asyncio
+async def test_local_batch_waits_for_model_group_headroom(
+    router, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(local_batch_executor, "_CAPACITY_POLL_INTERVAL_SECONDS", 0.01)
+    executor = LocalBatchExecutor.create(
+        router=router,
+        batch_dir=str(tmp_path),
+        input_file=_batch_input(2),
+        model="batch-model",
+    )
+    remaining_usage = [
+        {"x-ratelimit-remaining-requests": 10, "x-ratelimit-limit-requests": 100},
+        {"x-ratelimit-remaining-requests": 90, "x-ratelimit-limit-requests": 100},
+    ]
+    events = []
+    original_acompletion = router.acompletion
+
+    async def _get_remaining_model_group_usage(model_group):
+        events.append("usage")
+        return (
+            remaining_usage.pop(0) if len(remaining_usage) > 1 else remaining_usage[0]
+        )
+
+    async def _acompletion(**kwargs):
+        events.append("request")
+        return await original_acompletion(**kwargs)
+
+    with patch.object(
+        router,
+        "get_remaining_model_group_usage",
+        side_effect=_get_remaining_model_group_usage,
+    ), patch.object(router, "acompletion", side_effect=_acompletion):
+        state = await executor.arun()
+
+    assert state["status"] == "completed"
+    # the first poll had only 10% of the requests left - below the 20% headroom
+    assert events[:2] == ["usage", "usage"]
+    assert events.index("request") >= 2
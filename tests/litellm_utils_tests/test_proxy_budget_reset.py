@@ -22,152 +22,98 @@ from litellm.proxy.common_utils.reset_budget_job import ResetBudgetJob
 # In a real-world scenario, these would be instances of LiteLLM_VerificationToken, LiteLLM_UserTable, etc.
 
 
-@pytest.mark.asyncio
-async def test_reset_budget_keys_partial_failure():
+def _make_set_based_prisma_client(page_results):
     """
-    Test that if one key fails to reset, the failure for that key does not block processing of the other keys.
-    We simulate two keys where the first fails and the second succeeds.
+    query_raw returns one distinct budget duration, then `page_results` for each UPDATE page
     """
-    # Arrange
-    key1 = {
-        "id": "key1",
-        "spend": 10.0,
-        "budget_duration": 60,
-    }  # Will trigger simulated failure
-    key2 = {"id": "key2", "spend": 15.0, "budget_duration": 60}  # Should be updated
-    key3 = {"id": "key3", "spend": 20.0, "budget_duration": 60}  # Should be updated
-    key4 = {"id": "key4", "spend": 25.0, "budget_duration": 60}  # Should be updated
-    key5 = {"id": "key5", "spend": 30.0, "budget_duration": 60}  # Should be updated
-    key6 = {"id": "key6", "spend": 35.0, "budget_duration": 60}  # Should be updated
-
     prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(
-        return_value=[key1, key2, key3, key4, key5, key6]
+    prisma_client.db.query_raw = AsyncMock(
+        side_effect=[[{"budget_duration": "30d"}]] + page_results
     )
-    prisma_client.update_data = AsyncMock()
+    return prisma_client
+
 
-    # Using a dummy logging object with async hooks mocked out.
+def _make_proxy_logging_obj():
     proxy_logging_obj = MagicMock()
     proxy_logging_obj.service_logging_obj = MagicMock()
     proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
     proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
+    return proxy_logging_obj
 
-    job = ResetBudgetJob(proxy_logging_obj, prisma_client)
 
-    now = datetime.utcnow()
-
-    async def fake_reset_key(key, current_time):
-        if key["id"] == "key1":
-            # Simulate a failure on key1 (for example, this might be due to an invariant check)
-            raise Exception("Simulated failure for key1")
-        else:
-            # Simulate successful reset modification
-            key["spend"] = 0.0
-            # Compute a new reset time based on the budget duration
-            key["budget_reset_at"] = (
-                current_time + timedelta(seconds=key["budget_duration"])
-            ).isoformat()
-            return key
+@pytest.mark.asyncio
+async def test_reset_budget_keys_partial_failure():
+    """
+    Test that if a page of keys fails to reset, the pages already committed are reported
+    and the failure hook is called with summary counts only.
+    """
+    prisma_client = _make_set_based_prisma_client(
+        page_results=[
+            [{"id": "key1"}, {"id": "key2"}],
+            Exception("Simulated failure for page 2"),
+        ]
+    )
+    proxy_logging_obj = _make_proxy_logging_obj()
 
-    with patch.object(
-        ResetBudgetJob, "_reset_budget_for_key", side_effect=fake_reset_key
-    ) as mock_reset_key:
-        # Call the method; even though one key fails, the loop should process both
-        await job.reset_budget_for_litellm_keys()
-        # Allow any created tasks (logging hooks) to schedule
-        await asyncio.sleep(0.1)
+    job = ResetBudgetJob(proxy_logging_obj, prisma_client, page_size=2)
+    await job.reset_budget_for_litellm_keys()
+    # Allow any created tasks (logging hooks) to schedule
+    await asyncio.sleep(0.1)
 
-    # Assert that the helper was called for 6 keys
-    assert mock_reset_key.call_count == 6
+    # distinct durations + 2 UPDATE pages
+    assert prisma_client.db.query_raw.await_count == 3
+    update_sql = prisma_client.db.query_raw.call_args_list[1].args[0]
+    assert '"LiteLLM_VerificationToken"' in update_sql
+    assert "RETURNING" in update_sql
 
-    # Assert that update_data was called once with a list containing all 6 keys
-    prisma_client.update_data.assert_awaited_once()
-    update_call = prisma_client.update_data.call_args
-    assert update_call.kwargs.get("table_name") == "key"
-    updated_keys = update_call.kwargs.get("data_list", [])
-    assert len(updated_keys) == 5
-    assert updated_keys[0]["id"] == "key2"
-    assert updated_keys[1]["id"] == "key3"
-    assert updated_keys[2]["id"] == "key4"
-    assert updated_keys[3]["id"] == "key5"
-    assert updated_keys[4]["id"] == "key6"
-
-    # Verify that the failure logging hook was scheduled (due to the failure for key1)
     failure_hook_calls = (
         proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args_list
     )
-    # There should be one failure hook call for keys (with call_type "reset_budget_keys")
-    assert any(
-        call.kwargs.get("call_type") == "reset_budget_keys"
+    key_failures = [
+        call
         for call in failure_hook_calls
-    )
+        if call.kwargs.get("call_type") == "reset_budget_keys"
+    ]
+    assert len(key_failures) == 1
+    assert key_failures[0].kwargs["event_metadata"] == {
+        "num_budget_durations": 1,
+        "num_keys_updated": 2,
+    }
 
 
 @pytest.mark.asyncio
-async def test_reset_budget_users_partial_failure():
+async def test_reset_budget_users_set_based():
     """
-    Test that if one user fails to reset, the reset loop still processes the other users.
-    We simulate two users where the first fails and the second is updated.
+    Test that users are reset page by page until a short page is returned, without loading rows.
     """
-    user1 = {
-        "id": "user1",
-        "spend": 20.0,
-        "budget_duration": 120,
-    }  # Will trigger simulated failure
-    user2 = {"id": "user2", "spend": 25.0, "budget_duration": 120}  # Should be updated
-    user3 = {"id": "user3", "spend": 30.0, "budget_duration": 120}  # Should be updated
-    user4 = {"id": "user4", "spend": 35.0, "budget_duration": 120}  # Should be updated
-    user5 = {"id": "user5", "spend": 40.0, "budget_duration": 120}  # Should be updated
-    user6 = {"id": "user6", "spend": 45.0, "budget_duration": 120}  # Should be updated
-
-    prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(
-        return_value=[user1, user2, user3, user4, user5, user6]
+    prisma_client = _make_set_based_prisma_client(
+        page_results=[
+            [{"id": "user1"}, {"id": "user2"}],
+            [{"id": "user3"}],
+        ]
     )
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
-    job = ResetBudgetJob(proxy_logging_obj, prisma_client)
-
-    async def fake_reset_user(user, current_time):
-        if user["id"] == "user1":
-            raise Exception("Simulated failure for user1")
-        else:
-            user["spend"] = 0.0
-            user["budget_reset_at"] = (
-                current_time + timedelta(seconds=user["budget_duration"])
-            ).isoformat()
-            return user
+    prisma_client.get_data = AsyncMock()
+    proxy_logging_obj = _make_proxy_logging_obj()
 
-    with patch.object(
-        ResetBudgetJob, "_reset_budget_for_user", side_effect=fake_reset_user
-    ) as mock_reset_user:
-        await job.reset_budget_for_litellm_users()
-        await asyncio.sleep(0.1)
+    job = ResetBudgetJob(proxy_logging_obj, prisma_client, page_size=2)
+    await job.reset_budget_for_litellm_users()
+    await asyncio.sleep(0.1)
 
-    assert mock_reset_user.call_count == 6
-    prisma_client.update_data.assert_awaited_once()
-    update_call = prisma_client.update_data.call_args
-    assert update_call.kwargs.get("table_name") == "user"
-    updated_users = update_call.kwargs.get("data_list", [])
-    assert len(updated_users) == 5
-    assert updated_users[0]["id"] == "user2"
-    assert updated_users[1]["id"] == "user3"
-    assert updated_users[2]["id"] == "user4"
-    assert updated_users[3]["id"] == "user5"
-    assert updated_users[4]["id"] == "user6"
+    prisma_client.get_data.assert_not_awaited()
+    assert prisma_client.db.query_raw.await_count == 3
+    update_sql = prisma_client.db.query_raw.call_args_list[1].args[0]
+    assert '"LiteLLM_UserTable"' in update_sql
 
-    failure_hook_calls = (
-        proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args_list
-    )
-    assert any(
-        call.kwargs.get("call_type") == "reset_budget_users"
-        for call in failure_hook_calls
+    success_hook_calls = (
+        proxy_logging_obj.service_logging_obj.async_service_success_hook.call_args_list
     )
+    user_successes = [
+        call
+        for call in success_hook_calls
+        if call.kwargs.get("call_type") == "reset_budget_users"
+    ]
+    assert len(user_successes) == 1
+    assert user_successes[0].kwargs["event_metadata"]["num_users_updated"] == 3
 
 
 @pytest.mark.asyncio
@@ -282,50 +228,20 @@ async def test_reset_budget_endusers_partial_failure():
 @pytest.mark.asyncio
 async def test_reset_budget_teams_partial_failure():
     """
-    Test that if one team fails to reset, the loop processes both teams and only updates the ones that succeeded.
-    We simulate two teams where the first fails and the second is updated.
+    Test that a team budget duration that fails to reset does not block the other durations.
     """
-    team1 = {
-        "id": "team1",
-        "spend": 30.0,
-        "budget_duration": 180,
-    }  # Will trigger simulated failure
-    team2 = {"id": "team2", "spend": 35.0, "budget_duration": 180}  # Should be updated
-
     prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=[team1, team2])
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
+    prisma_client.db.query_raw = AsyncMock(
+        side_effect=[
+            [{"budget_duration": "1d"}, {"budget_duration": "30d"}],
+            Exception("Simulated failure for 1d teams"),
+        ]
+    )
+    proxy_logging_obj = _make_proxy_logging_obj()
 
     job = ResetBudgetJob(proxy_logging_obj, prisma_client)
-
-    async def fake_reset_team(team, current_time):
-        if team["id"] == "team1":
-            raise Exception("Simulated failure for team1")
-        else:
-            team["spend"] = 0.0
-            team["budget_reset_at"] = (
-                current_time + timedelta(seconds=team["budget_duration"])
-            ).isoformat()
-            return team
-
-    with patch.object(
-        ResetBudgetJob, "_reset_budget_for_team", side_effect=fake_reset_team
-    ) as mock_reset_team:
-        await job.reset_budget_for_litellm_teams()
-        await asyncio.sleep(0.1)
-
-    assert mock_reset_team.call_count == 2
-    prisma_client.update_data.assert_awaited_once()
-    update_call = prisma_client.update_data.call_args
-    assert update_call.kwargs.get("table_name") == "team"
-    updated_teams = update_call.kwargs.get("data_list", [])
-    assert len(updated_teams) == 1
-    assert updated_teams[0]["id"] == "team2"
+    await job.reset_budget_for_litellm_teams()
+    await asyncio.sleep(0.1)
 
     failure_hook_calls = (
         proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args_list
@@ -340,28 +256,12 @@ async def test_reset_budget_teams_partial_failure():
 async def test_reset_budget_continues_other_categories_on_failure():
     """
     Test that executing the overall reset_budget() method continues to process keys, users, and teams,
-    even if one of the sub-categories (here, users) experiences a partial failure.
-
-    In this simulation:
-      - All keys are processed successfully.
-      - One of the two users fails.
-      - All teams are processed successfully.
+    even if one of the sub-categories (here, users) fails.
 
     We then assert that:
-      - update_data is called for each category with the correctly updated items.
-      - Each get_data call is made (indicating that one failing category did not abort the others).
+      - an UPDATE page is issued for keys and teams.
+      - the budget table / end users are still processed.
     """
-    # Arrange dummy items for each table
-    key1 = {"id": "key1", "spend": 10.0, "budget_duration": 60}
-    key2 = {"id": "key2", "spend": 15.0, "budget_duration": 60}
-    user1 = {
-        "id": "user1",
-        "spend": 20.0,
-        "budget_duration": 120,
-    }  # Will fail in user reset
-    user2 = {"id": "user2", "spend": 25.0, "budget_duration": 120}  # Succeeds
-    team1 = {"id": "team1", "spend": 30.0, "budget_duration": 180}
-    team2 = {"id": "team2", "spend": 35.0, "budget_duration": 180}
     enduser1 = {"user_id": "user1", "spend": 25.0, "budget_id": "budget1"}
     budget1 = LiteLLM_BudgetTableFull(
         **{
@@ -374,52 +274,29 @@ async def test_reset_budget_continues_other_categories_on_failure():
 
     prisma_client = MagicMock()
 
+    async def fake_query_raw(sql, *params):
+        if '"LiteLLM_UserTable"' in sql:
+            raise Exception("Simulated failure for users")
+        if "SELECT DISTINCT" in sql:
+            return [{"budget_duration": "30d"}]
+        if '"LiteLLM_VerificationToken"' in sql:
+            return [{"id": "key1"}, {"id": "key2"}]
+        return [{"id": "team1"}]
+
     async def fake_get_data(*, table_name, query_type, **kwargs):
-        if table_name == "key":
-            return [key1, key2]
-        elif table_name == "user":
-            return [user1, user2]
-        elif table_name == "team":
-            return [team1, team2]
-        elif table_name == "budget":
+        if table_name == "budget":
             return [budget1]
         elif table_name == "enduser":
             return [enduser1]
         return []
 
+    prisma_client.db.query_raw = AsyncMock(side_effect=fake_query_raw)
     prisma_client.get_data = AsyncMock(side_effect=fake_get_data)
     prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
+    proxy_logging_obj = _make_proxy_logging_obj()
 
     job = ResetBudgetJob(proxy_logging_obj, prisma_client)
 
-    async def fake_reset_key(key, current_time):
-        key["spend"] = 0.0
-        key["budget_reset_at"] = (
-            current_time + timedelta(seconds=key["budget_duration"])
-        ).isoformat()
-        return key
-
-    async def fake_reset_user(user, current_time):
-        if user["id"] == "user1":
-            raise Exception("Simulated failure for user1")
-        user["spend"] = 0.0
-        user["budget_reset_at"] = (
-            current_time + timedelta(seconds=user["budget_duration"])
-        ).isoformat()
-        return user
-
-    async def fake_reset_team(team, current_time):
-        team["spend"] = 0.0
-        team["budget_reset_at"] = (
-            current_time + timedelta(seconds=team["budget_duration"])
-        ).isoformat()
-        return team
-
     async def fake_reset_enduser(enduser):
         enduser["spend"] = 0.0
         return enduser
@@ -428,63 +305,41 @@ async def test_reset_budget_continues_other_categories_on_failure():
         return 1
 
     with patch.object(
-        ResetBudgetJob, "_reset_budget_for_key", side_effect=fake_reset_key
-    ) as mock_reset_key, patch.object(
-        ResetBudgetJob, "_reset_budget_for_user", side_effect=fake_reset_user
-    ) as mock_reset_user, patch.object(
-        ResetBudgetJob, "_reset_budget_for_team", side_effect=fake_reset_team
-    ) as mock_reset_team, patch.object(
         ResetBudgetJob, "_reset_budget_for_enduser", side_effect=fake_reset_enduser
-    ) as mock_reset_enduser, patch.object(
+    ), patch.object(
         ResetBudgetJob,
         "reset_budget_for_litellm_team_members",
         side_effect=fake_reset_team_members,
     ) as mock_reset_team_members:
-        # Call the overall reset_budget method.
         await job.reset_budget()
         await asyncio.sleep(0.1)
 
-    # Verify that get_data was called for each table. We can check the table names across calls.
-    called_tables = {
-        call.kwargs.get("table_name") for call in prisma_client.get_data.await_args_list
-    }
-    if mock_reset_team_members.call_count > 0:
-        called_tables.add("team_membership")
-    assert called_tables == {
-        "key",
-        "user",
-        "team",
-        "budget",
-        "enduser",
-        "team_membership",
-    }
+    update_sqls = [
+        call.args[0]
+        for call in prisma_client.db.query_raw.await_args_list
+        if "UPDATE" in call.args[0]
+    ]
+    assert any('"LiteLLM_VerificationToken"' in sql for sql in update_sqls)
+    assert any('"LiteLLM_TeamTable"' in sql for sql in update_sqls)
+    assert mock_reset_team_members.call_count == 1
 
-    # Verify that update_data was called three times (one per category, enduser update includes two)
-    assert prisma_client.update_data.await_count == 5
-    calls = prisma_client.update_data.await_args_list
-
-    # Check keys update: both keys succeed.
-    keys_call = calls[0]
-    assert keys_call.kwargs.get("table_name") == "key"
-    assert len(keys_call.kwargs.get("data_list", [])) == 2
-
-    # Check users update: only user2 succeeded.
-    users_call = calls[1]
-    assert users_call.kwargs.get("table_name") == "user"
-    users_updated = users_call.kwargs.get("data_list", [])
-    assert len(users_updated) == 1
-    assert users_updated[0]["id"] == "user2"
-
-    # Check teams update: both teams succeed.
-    teams_call = calls[2]
-    assert teams_call.kwargs.get("table_name") == "team"
-    assert len(teams_call.kwargs.get("data_list", [])) == 2
-
-    # Check enduser update: enduser succeed.
-    enduser_call = calls[4]
+    # budget table + enduser updates still run
+    assert prisma_client.update_data.await_count == 2
+    enduser_call = prisma_client.update_data.await_args_list[1]
     assert enduser_call.kwargs.get("table_name") == "enduser"
     assert len(enduser_call.kwargs.get("data_list", [])) == 1
 
+    success_call_types = {
+        call.kwargs.get("call_type")
+        for call in proxy_logging_obj.service_logging_obj.async_service_success_hook.call_args_list
+    }
+    failure_call_types = {
+        call.kwargs.get("call_type")
+        for call in proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args_list
+    }
+    assert {"reset_budget_keys", "reset_budget_teams"} <= success_call_types
+    assert failure_call_types == {"reset_budget_users"}
+
 
 # ---------------------------------------------------------------------------
 # Additional tests for service logger behavior (keys, users, teams, endusers)
@@ -492,343 +347,71 @@ async def test_reset_budget_continues_other_categories_on_failure():
 
 
 @pytest.mark.asyncio
-async def test_service_logger_keys_success():
-    """
-    Test that when resetting keys succeeds (all keys are updated) the service
-    logger success hook is called with the correct event metadata and no exception is logged.
-    """
-    keys = [
-        {"id": "key1", "spend": 10.0, "budget_duration": 60},
-        {"id": "key2", "spend": 15.0, "budget_duration": 60},
-    ]
-    prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=keys)
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
-    job = ResetBudgetJob(proxy_logging_obj, prisma_client)
-
-    async def fake_reset_key(key, current_time):
-        key["spend"] = 0.0
-        key["budget_reset_at"] = (
-            current_time + timedelta(seconds=key["budget_duration"])
-        ).isoformat()
-        return key
-
-    with patch.object(
-        ResetBudgetJob,
-        "_reset_budget_for_key",
-        side_effect=fake_reset_key,
-    ):
-        with patch(
-            "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
-        ) as mock_verbose_exc:
-            await job.reset_budget_for_litellm_keys()
-            # Allow async logging task to complete
-            await asyncio.sleep(0.1)
-            mock_verbose_exc.assert_not_called()
-
-    # Verify success hook call
-    proxy_logging_obj.service_logging_obj.async_service_success_hook.assert_called_once()
-    (
-        args,
-        kwargs,
-    ) = proxy_logging_obj.service_logging_obj.async_service_success_hook.call_args
-    event_metadata = kwargs.get("event_metadata", {})
-    assert event_metadata.get("num_keys_found") == len(keys)
-    assert event_metadata.get("num_keys_updated") == len(keys)
-    assert event_metadata.get("num_keys_failed") == 0
-    # Failure hook should not be executed.
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_service_logger_keys_failure():
-    """
-    Test that when a key reset fails the service logger failure hook is called,
-    the event metadata reflects the number of keys processed, and that the verbose
-    logger exception is called.
-    """
-    keys = [
-        {"id": "key1", "spend": 10.0, "budget_duration": 60},
-        {"id": "key2", "spend": 15.0, "budget_duration": 60},
-    ]
-    prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=keys)
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
-    job = ResetBudgetJob(proxy_logging_obj, prisma_client)
-
-    async def fake_reset_key(key, current_time):
-        if key["id"] == "key1":
-            raise Exception("Simulated failure for key1")
-        key["spend"] = 0.0
-        key["budget_reset_at"] = (
-            current_time + timedelta(seconds=key["budget_duration"])
-        ).isoformat()
-        return key
-
-    with patch.object(
-        ResetBudgetJob,
-        "_reset_budget_for_key",
-        side_effect=fake_reset_key,
-    ):
-        with patch(
-            "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
-        ) as mock_verbose_exc:
-            await job.reset_budget_for_litellm_keys()
-            await asyncio.sleep(0.1)
-            # Expect at least one exception logged (the inner error and the outer catch)
-            assert mock_verbose_exc.call_count >= 1
-            # Verify exception was logged with correct message
-            assert any(
-                "Failed to reset budget for key" in str(call.args)
-                for call in mock_verbose_exc.call_args_list
-            )
-
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook.assert_called_once()
-    (
-        args,
-        kwargs,
-    ) = proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args
-    event_metadata = kwargs.get("event_metadata", {})
-    assert event_metadata.get("num_keys_found") == len(keys)
-    keys_found_str = event_metadata.get("keys_found", "")
-    assert "key1" in keys_found_str
-    # Success hook should not be called.
-    proxy_logging_obj.service_logging_obj.async_service_success_hook.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_service_logger_users_success():
-    """
-    Test that when resetting users succeeds the service logger success hook is called with
-    the correct metadata and no exception is logged.
-    """
-    users = [
-        {"id": "user1", "spend": 20.0, "budget_duration": 120},
-        {"id": "user2", "spend": 25.0, "budget_duration": 120},
-    ]
-    prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=users)
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
-    job = ResetBudgetJob(proxy_logging_obj, prisma_client)
-
-    async def fake_reset_user(user, current_time):
-        user["spend"] = 0.0
-        user["budget_reset_at"] = (
-            current_time + timedelta(seconds=user["budget_duration"])
-        ).isoformat()
-        return user
-
-    with patch.object(
-        ResetBudgetJob,
-        "_reset_budget_for_user",
-        side_effect=fake_reset_user,
-    ):
-        with patch(
-            "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
-        ) as mock_verbose_exc:
-            await job.reset_budget_for_litellm_users()
-            await asyncio.sleep(0.1)
-            mock_verbose_exc.assert_not_called()
-
-    proxy_logging_obj.service_logging_obj.async_service_success_hook.assert_called_once()
-    (
-        args,
-        kwargs,
-    ) = proxy_logging_obj.service_logging_obj.async_service_success_hook.call_args
-    event_metadata = kwargs.get("event_metadata", {})
-    assert event_metadata.get("num_users_found") == len(users)
-    assert event_metadata.get("num_users_updated") == len(users)
-    assert event_metadata.get("num_users_failed") == 0
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_service_logger_users_failure():
-    """
-    Test that a failure during user reset calls the failure hook with appropriate metadata,
-    logs the exception, and does not call the success hook.
-    """
-    users = [
-        {"id": "user1", "spend": 20.0, "budget_duration": 120},
-        {"id": "user2", "spend": 25.0, "budget_duration": 120},
-    ]
-    prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=users)
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
-    job = ResetBudgetJob(proxy_logging_obj, prisma_client)
-
-    async def fake_reset_user(user, current_time):
-        if user["id"] == "user1":
-            raise Exception("Simulated failure for user1")
-        user["spend"] = 0.0
-        user["budget_reset_at"] = (
-            current_time + timedelta(seconds=user["budget_duration"])
-        ).isoformat()
-        return user
-
-    with patch.object(
-        ResetBudgetJob,
-        "_reset_budget_for_user",
-        side_effect=fake_reset_user,
-    ):
-        with patch(
-            "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
-        ) as mock_verbose_exc:
-            await job.reset_budget_for_litellm_users()
-            await asyncio.sleep(0.1)
-            # Verify exception logging
-            assert mock_verbose_exc.call_count >= 1
-            # Verify exception was logged with correct message
-            assert any(
-                "Failed to reset budget for user" in str(call.args)
-                for call in mock_verbose_exc.call_args_list
-            )
-
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook.assert_called_once()
-    (
-        args,
-        kwargs,
-    ) = proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args
-    event_metadata = kwargs.get("event_metadata", {})
-    assert event_metadata.get("num_users_found") == len(users)
-    users_found_str = event_metadata.get("users_found", "")
-    assert "user1" in users_found_str
-    proxy_logging_obj.service_logging_obj.async_service_success_hook.assert_not_called()
-
-
-@pytest.mark.asyncio
-async def test_service_logger_teams_success():
+@pytest.mark.parametrize("entity_type", ["key", "user", "team"])
+async def test_service_logger_success(entity_type):
     """
-    Test that when resetting teams is successful the service logger success hook is called with
-    the proper metadata and nothing is logged as an exception.
+    Test that when resetting keys / users / teams succeeds the service logger success hook
+    is called with summary counts only, and no exception is logged.
     """
-    teams = [
-        {"id": "team1", "spend": 30.0, "budget_duration": 180},
-        {"id": "team2", "spend": 35.0, "budget_duration": 180},
-    ]
-    prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=teams)
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
+    prisma_client = _make_set_based_prisma_client(
+        page_results=[[{"id": f"{entity_type}1"}, {"id": f"{entity_type}2"}]]
+    )
+    proxy_logging_obj = _make_proxy_logging_obj()
     job = ResetBudgetJob(proxy_logging_obj, prisma_client)
 
-    async def fake_reset_team(team, current_time):
-        team["spend"] = 0.0
-        team["budget_reset_at"] = (
-            current_time + timedelta(seconds=team["budget_duration"])
-        ).isoformat()
-        return team
-
-    with patch.object(
-        ResetBudgetJob,
-        "_reset_budget_for_team",
-        side_effect=fake_reset_team,
-    ):
-        with patch(
-            "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
-        ) as mock_verbose_exc:
-            await job.reset_budget_for_litellm_teams()
-            await asyncio.sleep(0.1)
-            mock_verbose_exc.assert_not_called()
+    with patch(
+        "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
+    ) as mock_verbose_exc:
+        await getattr(job, f"reset_budget_for_litellm_{entity_type}s")()
+        # Allow async logging task to complete
+        await asyncio.sleep(0.1)
+        mock_verbose_exc.assert_not_called()
 
     proxy_logging_obj.service_logging_obj.async_service_success_hook.assert_called_once()
     (
         args,
         kwargs,
     ) = proxy_logging_obj.service_logging_obj.async_service_success_hook.call_args
-    event_metadata = kwargs.get("event_metadata", {})
-    assert event_metadata.get("num_teams_found") == len(teams)
-    assert event_metadata.get("num_teams_updated") == len(teams)
-    assert event_metadata.get("num_teams_failed") == 0
+    assert kwargs.get("call_type") == f"reset_budget_{entity_type}s"
+    assert kwargs.get("event_metadata") == {
+        "num_budget_durations": 1,
+        f"num_{entity_type}s_updated": 2,
+    }
     proxy_logging_obj.service_logging_obj.async_service_failure_hook.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_service_logger_teams_failure():
+@pytest.mark.parametrize("entity_type", ["key", "user", "team"])
+async def test_service_logger_failure(entity_type):
     """
-    Test that a failure during team reset triggers the failure hook with proper metadata,
-    results in an exception log and no success hook call.
+    Test that a failed reset calls the failure hook, logs the exception, and does not
+    call the success hook.
     """
-    teams = [
-        {"id": "team1", "spend": 30.0, "budget_duration": 180},
-        {"id": "team2", "spend": 35.0, "budget_duration": 180},
-    ]
     prisma_client = MagicMock()
-    prisma_client.get_data = AsyncMock(return_value=teams)
-    prisma_client.update_data = AsyncMock()
-
-    proxy_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj = MagicMock()
-    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
-    proxy_logging_obj.service_logging_obj.async_service_failure_hook = AsyncMock()
-
+    prisma_client.db.query_raw = AsyncMock(side_effect=Exception("db down"))
+    proxy_logging_obj = _make_proxy_logging_obj()
     job = ResetBudgetJob(proxy_logging_obj, prisma_client)
 
-    async def fake_reset_team(team, current_time):
-        if team["id"] == "team1":
-            raise Exception("Simulated failure for team1")
-        team["spend"] = 0.0
-        team["budget_reset_at"] = (
-            current_time + timedelta(seconds=team["budget_duration"])
-        ).isoformat()
-        return team
-
-    with patch.object(
-        ResetBudgetJob,
-        "_reset_budget_for_team",
-        side_effect=fake_reset_team,
-    ):
-        with patch(
-            "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
-        ) as mock_verbose_exc:
-            await job.reset_budget_for_litellm_teams()
-            await asyncio.sleep(0.1)
-            # Verify exception logging
-            assert mock_verbose_exc.call_count >= 1
-            # Verify exception was logged with correct message
-            assert any(
-                "Failed to reset budget for team" in str(call.args)
-                for call in mock_verbose_exc.call_args_list
-            )
+    with patch(
+        "litellm.proxy.common_utils.reset_budget_job.verbose_proxy_logger.exception"
+    ) as mock_verbose_exc:
+        await getattr(job, f"reset_budget_for_litellm_{entity_type}s")()
+        await asyncio.sleep(0.1)
+        assert any(
+            "Failed to reset budget for %ss" in str(call.args)
+            and entity_type in call.args
+            for call in mock_verbose_exc.call_args_list
+        )
 
     proxy_logging_obj.service_logging_obj.async_service_failure_hook.assert_called_once()
     (
         args,
         kwargs,
     ) = proxy_logging_obj.service_logging_obj.async_service_failure_hook.call_args
-    event_metadata = kwargs.get("event_metadata", {})
-    assert event_metadata.get("num_teams_found") == len(teams)
-    teams_found_str = event_metadata.get("teams_found", "")
-    assert "team1" in teams_found_str
+    assert kwargs.get("event_metadata") == {
+        "num_budget_durations": 0,
+        f"num_{entity_type}s_updated": 0,
+    }
     proxy_logging_obj.service_logging_obj.async_service_success_hook.assert_not_called()
 
 
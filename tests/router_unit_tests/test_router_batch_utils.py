@@ -241,4 +241,32 @@ def test_replace_model_in_jsonl_with_embedded_newlines():
     # Verify the content with newlines is preserved
     assert result_json["body"]["messages"][0]["content"] == "This is a message\nwith multiple\nlines"
     assert result_json["custom_id"] == "test123"
-    
\ No newline at end of file
+    
+
+def test_replace_model_in_jsonl_file_object_in_tuple(sample_jsonl_bytes):
+    """File objects inside (filename, content, content_type) tuples are read line by line and rewound"""
+    source = BytesIO(sample_jsonl_bytes)
+    result = replace_model_in_jsonl(("batch.jsonl", source, "application/jsonl"), "claude-3")
+
+    assert isinstance(result, InMemoryFile)
+    models = [json.loads(line)["body"]["model"] for line in result.read().splitlines()]
+    assert models == ["claude-3", "claude-3"]
+    # the original can be read again for the next deployment
+    assert source.tell() == 0
+
+
+def test_replace_model_in_jsonl_spools_large_files(sample_jsonl_data):
+    """Rewritten files larger than BATCH_JSONL_SPOOL_MAX_SIZE_BYTES are rolled over to disk"""
+    jsonl_bytes = "\n".join(json.dumps(line) for line in sample_jsonl_data * 50).encode(
+        "utf-8"
+    )
+    with patch(
+        "litellm.router_utils.batch_utils.BATCH_JSONL_SPOOL_MAX_SIZE_BYTES", 1024
+    ):
+        result = replace_model_in_jsonl(jsonl_bytes, "claude-3")
+
+    assert isinstance(result, InMemoryFile)
+    assert result._file._rolled is True
+    lines = result.read().splitlines()
+    assert len(lines) == 100
+    assert all(json.loads(line)["body"]["model"] == "claude-3" for line in lines)
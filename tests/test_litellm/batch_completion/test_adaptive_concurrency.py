@@ -0,0 +1,94 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.batch_completion.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_limit_increases_on_success():
+    limiter = AdaptiveConcurrencyLimiter(
+        max_concurrency=10, initial_concurrency=2, latency_tolerance=None
+    )
+    # slow start - +1 per success until the first decrease
+    for _ in range(2):
+        await limiter.release(await limiter.acquire())
+    assert limiter.limit == 4
+
+    await limiter.release(await limiter.acquire(), rate_limited=True)
+    assert limiter.limit == 2
+    # then +1/limit per success - ~1 per `limit` successes
+    for _ in range(2):
+        await limiter.release(await limiter.acquire())
+    assert limiter.limit == pytest.approx(2 + 1 / 2 + 1 / 2.5)
+
+    for _ in range(200):
+        await limiter.release(await limiter.acquire())
+    assert limiter.limit == 10
+
+
+@pytest.mark.asyncio
+async def test_limit_halves_once_per_window_on_rate_limit():
+    limiter = AdaptiveConcurrencyLimiter(
+        max_concurrency=100, initial_concurrency=16, latency_tolerance=None
+    )
+    started = [await limiter.acquire() for _ in range(8)]
+    # every request of the window was rate limited - the limit halves once
+    for started_at in started:
+        await limiter.release(started_at, rate_limited=True)
+    assert limiter.limit == 8
+
+    # a request sent after the decrease halves it again
+    await limiter.release(await limiter.acquire(), rate_limited=True)
+    assert limiter.limit == 4
+
+    for _ in range(5):
+        await limiter.release(await limiter.acquire(), rate_limited=True)
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_limit_decreases_when_latency_rises(monkeypatch):
+    from litellm.batch_completion import adaptive_concurrency
+
+    now = [0.0]
+    monkeypatch.setattr(adaptive_concurrency.time, "monotonic", lambda: now[0])
+    limiter = AdaptiveConcurrencyLimiter(
+        max_concurrency=100, initial_concurrency=20, latency_tolerance=2.0
+    )
+
+    async def _request(latency: float) -> None:
+        started_at = await limiter.acquire()
+        now[0] += latency
+        await limiter.release(started_at)
+
+    for _ in range(5):
+        await _request(1.0)
+    limit = limiter.limit
+    assert limit == 25
+
+    # latency climbs - once the smoothed latency is 2x the baseline, the limit shrinks
+    for _ in range(10):
+        await _request(10.0)
+    assert limiter.limit < limit
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_free_slot():
+    limiter = AdaptiveConcurrencyLimiter(
+        max_concurrency=1, initial_concurrency=1, latency_tolerance=None
+    )
+    started_at = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await limiter.release(started_at)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
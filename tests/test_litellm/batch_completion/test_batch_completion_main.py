@@ -0,0 +1,143 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.batch_completion import main as batch_completion_main
+
+original_acompletion = litellm.acompletion
+
+
+def _messages(num_requests: int) -> list:
+    return [[{"role": "user", "content": f"hello {i}"}] for i in range(num_requests)]
+
+
+def _echo_response(model, messages, **kwargs) -> litellm.ModelResponse:
+    return litellm.ModelResponse(
+        model=model,
+        choices=[
+            {"message": {"role": "assistant", "content": messages[0]["content"]}}
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_returns_results_in_order():
+    with patch.object(
+        batch_completion_main.litellm,
+        "acompletion",
+        new=AsyncMock(side_effect=_echo_response),
+    ):
+        responses = await litellm.abatch_completion(
+            model="gpt-4o-mini",
+            messages=_messages(20),
+            max_concurrency=4,
+        )
+
+    assert [r.choices[0].message.content for r in responses] == [
+        f"hello {i}" for i in range(20)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_iter_yields_as_completed():
+    def _acompletion(model, messages, **kwargs):
+        if messages[0]["content"] == "hello 1":
+            raise litellm.BadRequestError(
+                message="bad request", model=model, llm_provider="openai"
+            )
+        return _echo_response(model, messages)
+
+    with patch.object(
+        batch_completion_main.litellm,
+        "acompletion",
+        new=AsyncMock(side_effect=_acompletion),
+    ):
+        results = {
+            index: result
+            async for index, result in litellm.abatch_completion_iter(
+                model="gpt-4o-mini", messages=_messages(5)
+            )
+        }
+
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert isinstance(results[1], litellm.BadRequestError)
+    assert results[3].choices[0].message.content == "hello 3"
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_retries_rate_limited_requests(monkeypatch):
+    monkeypatch.setattr(
+        batch_completion_main, "_calculate_retry_after", lambda **kwargs: 0
+    )
+    calls = []
+
+    async def _acompletion(model, messages, **kwargs):
+        calls.append(messages[0]["content"])
+        if messages[0]["content"] == "hello 2" and calls.count("hello 2") != 3:
+            raise litellm.RateLimitError(
+                message="rate limited", model=model, llm_provider="openai"
+            )
+        return litellm.ModelResponse()
+
+    with patch.object(batch_completion_main.litellm, "acompletion", side_effect=_acompletion):
+        responses = await litellm.abatch_completion(
+            model="gpt-4o-mini", messages=_messages(4), initial_concurrency=8
+        )
+        exhausted = await litellm.abatch_completion(
+            model="gpt-4o-mini",
+            messages=[[{"role": "user", "content": "hello 2"}]],
+            max_rate_limit_retries=0,
+        )
+
+    assert calls.count("hello 2") == 4
+    assert all(isinstance(r, litellm.ModelResponse) for r in responses)
+    assert isinstance(exhausted[0], litellm.RateLimitError)
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_bounds_in_flight_requests():
+    in_flight = [0]
+    max_in_flight = [0]
+
+    async def _acompletion(model, messages, **kwargs):
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return _echo_response(model, messages)
+
+    with patch.object(batch_completion_main.litellm, "acompletion", side_effect=_acompletion):
+        await litellm.abatch_completion(
+            model="gpt-4o-mini",
+            messages=_messages(50),
+            max_concurrency=5,
+            initial_concurrency=2,
+        )
+
+    assert 2 <= max_in_flight[0] <= 5
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_models_all_responses():
+    async def _acompletion(model, messages, **kwargs):
+        if model == "gpt-4o":
+            raise litellm.RateLimitError(
+                message="rate limited", model=model, llm_provider="openai"
+            )
+        return await original_acompletion(model=model, messages=messages, **kwargs)
+
+    with patch.object(batch_completion_main.litellm, "acompletion", side_effect=_acompletion):
+        responses = await litellm.abatch_completion_models_all_responses(
+            models=["gpt-4o-mini", "gpt-4o", "gpt-4.1-mini"],
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hi",
+        )
+    assert [r.model for r in responses] == ["gpt-4o-mini", "gpt-4.1-mini"]
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.batched_embedder import BatchedEmbedder
+
+
+def _embedding_response(inputs, reverse: bool = False):
+    data = [
+        {"embedding": [float(len(text))], "index": i} for i, text in enumerate(inputs)
+    ]
+    return {"data": data[::-1] if reverse else data}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_prompts_share_one_call():
+    embedder = BatchedEmbedder(max_batch_size=10, max_wait_ms=50)
+
+    async def _aembedding(model, input, **kwargs):
+        # providers may return data out of order - match by index
+        return _embedding_response(input, reverse=True)
+
+    with patch("litellm.aembedding", side_effect=_aembedding) as mock_aembedding:
+        results = await asyncio.gather(
+            embedder.aembed(model="text-embedding-3-small", input="a"),
+            embedder.aembed(model="text-embedding-3-small", input="bb"),
+            embedder.aembed(model="text-embedding-3-small", input="a"),
+        )
+
+    assert results == [[1.0], [2.0], [1.0]]
+    mock_aembedding.assert_called_once()
+    assert mock_aembedding.call_args.kwargs["input"] == ["a", "bb"]
+    assert embedder.get_stats()["batches"] == 1
+    assert embedder.get_stats()["requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full():
+    embedder = BatchedEmbedder(max_batch_size=2, max_wait_ms=10_000)
+
+    async def _aembedding(model, input, **kwargs):
+        return _embedding_response(input)
+
+    with patch("litellm.aembedding", side_effect=_aembedding) as mock_aembedding:
+        # would wait 10s if the size limit didn't trigger a flush
+        results = await asyncio.wait_for(
+            asyncio.gather(*(embedder.aembed(model="m", input=str(i)) for i in range(4))),
+            timeout=1,
+        )
+
+    assert results == [[1.0]] * 4
+    assert mock_aembedding.call_count == 2
+    assert all(len(c.kwargs["input"]) == 2 for c in mock_aembedding.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_model_and_user_api_key():
+    embedder = BatchedEmbedder(max_batch_size=10, max_wait_ms=10)
+
+    async def _aembedding(model, input, **kwargs):
+        return _embedding_response(input)
+
+    llm_router = MagicMock()
+    llm_router.aembedding = AsyncMock(side_effect=_aembedding)
+
+    with patch("litellm.aembedding", side_effect=_aembedding) as mock_aembedding:
+        await asyncio.gather(
+            embedder.aembed(model="model-a", input="x"),
+            embedder.aembed(model="model-b", input="y"),
+            embedder.aembed(model="model-a", input="z", llm_router=llm_router, user_api_key="key-1"),
+            embedder.aembed(model="model-a", input="w", llm_router=llm_router, user_api_key="key-2"),
+        )
+
+    assert mock_aembedding.call_count == 2
+    assert llm_router.aembedding.call_count == 2
+    user_api_keys = sorted(
+        c.kwargs["metadata"]["user_api_key"] for c in llm_router.aembedding.call_args_list
+    )
+    assert user_api_keys == ["key-1", "key-2"]
+
+
+@pytest.mark.asyncio
+async def test_batches_carry_the_callers_litellm_trace_id():
+    embedder = BatchedEmbedder(max_batch_size=10, max_wait_ms=10)
+
+    async def _aembedding(model, input, **kwargs):
+        return _embedding_response(input)
+
+    llm_router = MagicMock()
+    llm_router.aembedding = AsyncMock(side_effect=_aembedding)
+
+    # prompts of one request keep its trace id
+    await asyncio.gather(
+        embedder.aembed(model="m", input="a", llm_router=llm_router, litellm_trace_id="trace-1"),
+        embedder.aembed(model="m", input="b", llm_router=llm_router, litellm_trace_id="trace-1"),
+    )
+    call_kwargs = llm_router.aembedding.call_args.kwargs
+    assert call_kwargs["litellm_trace_id"] == "trace-1"
+    assert call_kwargs["metadata"]["batched_litellm_trace_ids"] == ["trace-1"]
+
+    # a batch shared by several requests lists all of their trace ids
+    await asyncio.gather(
+        embedder.aembed(model="m", input="a", llm_router=llm_router, litellm_trace_id="trace-1"),
+        embedder.aembed(model="m", input="b", llm_router=llm_router, litellm_trace_id="trace-2"),
+    )
+    call_kwargs = llm_router.aembedding.call_args.kwargs
+    assert "litellm_trace_id" not in call_kwargs
+    assert call_kwargs["metadata"]["batched_litellm_trace_ids"] == ["trace-1", "trace-2"]
+
+    with patch("litellm.aembedding", side_effect=_aembedding) as mock_aembedding:
+        await embedder.aembed(model="m", input="a", litellm_trace_id="trace-3")
+    assert mock_aembedding.call_args.kwargs["litellm_trace_id"] == "trace-3"
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_is_raised_to_every_caller():
+    embedder = BatchedEmbedder(max_batch_size=10, max_wait_ms=1)
+
+    with patch("litellm.aembedding", side_effect=RuntimeError("rate limited")):
+        results = await asyncio.gather(
+            embedder.aembed(model="m", input="a"),
+            embedder.aembed(model="m", input="b"),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def _aembedding(model, input, **kwargs):
+        return _embedding_response(input)
+
+    # the next batch is unaffected
+    with patch("litellm.aembedding", side_effect=_aembedding):
+        assert await embedder.aembed(model="m", input="abc") == [3.0]
+
+
+def test_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        BatchedEmbedder(max_batch_size=0)
+    with pytest.raises(ValueError):
+        BatchedEmbedder(max_wait_ms=-1)
@@ -0,0 +1,152 @@
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.cache_codec import (
+    CacheCodec,
+    decode_cache_value,
+    is_codec_encoded,
+)
+from litellm.types.utils import Embedding, EmbeddingResponse
+
+DIMENSIONS = 3072
+
+
+def _embedding_cache_value() -> dict:
+    response = EmbeddingResponse(
+        model="text-embedding-3-large",
+        data=[
+            Embedding(
+                embedding=[i / DIMENSIONS for i in range(DIMENSIONS)],
+                index=0,
+                object="embedding",
+            )
+        ],
+    )
+    return {"timestamp": 1700000000.0, "response": response.model_dump_json()}
+
+
+def _codecs():
+    codecs = [
+        CacheCodec(serializer="json"),
+        CacheCodec(serializer="json", compression="zlib"),
+        CacheCodec(serializer="json", pack_embeddings=False),
+    ]
+    try:
+        codecs.append(CacheCodec(serializer="msgpack", compression="zlib"))
+    except ImportError:
+        pass
+    for compression in ("zstd", "lz4"):
+        try:
+            codecs.append(CacheCodec(compression=compression))  # type: ignore
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize(
+    "codec", _codecs(), ids=lambda c: f"{c.serializer}-{c.compression}-{c.pack_embeddings}"
+)
+def test_round_trip_expands_response_and_packs_embeddings(codec):
+    value = _embedding_cache_value()
+    encoded = codec.encode(value)
+
+    assert is_codec_encoded(encoded)
+    assert len(encoded) < len(json.dumps(value))
+
+    decoded = decode_cache_value(encoded)
+    assert decoded["timestamp"] == value["timestamp"]
+    expected = json.loads(value["response"])
+    embedding = decoded["response"]["data"][0]["embedding"]
+    if codec.pack_embeddings:
+        assert embedding == pytest.approx(expected["data"][0]["embedding"], rel=1e-6)
+    else:
+        assert embedding == expected["data"][0]["embedding"]
+    assert decoded["response"]["model"] == "text-embedding-3-large"
+
+
+def test_compresses_only_above_threshold():
+    codec = CacheCodec(compression="zlib", compression_threshold=100)
+    small = codec.encode({"a": 1})
+    large = codec.encode({"text": "hello " * 100})
+    assert small[0] & 0x03 == 0
+    assert large[0] & 0x03 == 1
+    assert decode_cache_value(large) == {"text": "hello " * 100}
+
+
+def test_scalars_and_legacy_values_are_not_tagged():
+    codec = CacheCodec()
+    # counters stay plain JSON so Redis INCR keeps working
+    assert codec.encode(5) == "5"
+    assert codec.encode("text") == '"text"'
+    for legacy in (b'{"a": 1}', b"[1, 2]", b"5", b"\"text\"", b"None", b""):
+        assert not is_codec_encoded(legacy)
+
+
+def test_rejects_unknown_settings():
+    with pytest.raises(ValueError):
+        CacheCodec(serializer="pickle")  # type: ignore
+    with pytest.raises(ValueError):
+        CacheCodec(compression="brotli")  # type: ignore
+    assert CacheCodec.from_config(None) is None
+    assert CacheCodec.from_config({"compression": "zlib"}).compression == "zlib"
+
+
+@pytest.fixture
+def mock_redis_client():
+    with patch("litellm._redis.get_redis_client", return_value=MagicMock()):
+        yield
+
+
+def test_redis_cache_reads_codec_and_legacy_values(mock_redis_client):
+    from litellm.caching.redis_cache import RedisCache
+
+    redis_cache = RedisCache(host="localhost", cache_codec={"compression": "zlib"})
+
+    value = _embedding_cache_value()
+    encoded = redis_cache._serialize_value(value)
+    assert isinstance(encoded, bytes)
+    assert redis_cache._get_cache_logic(encoded)["response"]["object"] == "list"
+
+    # entries written before the codec was enabled
+    assert redis_cache._get_cache_logic(json.dumps(value).encode()) == value
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_async_set_cache_uses_codec(mock_redis_client):
+    from litellm.caching.redis_cache import RedisCache
+
+    redis_cache = RedisCache(host="localhost", cache_codec={"serializer": "json"})
+    mock_redis_instance = AsyncMock()
+
+    with patch.object(redis_cache, "init_async_client", return_value=mock_redis_instance):
+        await redis_cache.async_set_cache(key="k", value={"a": [1.5, 2.5]})
+
+    written = mock_redis_instance.set.call_args.kwargs["value"]
+    assert is_codec_encoded(written)
+    assert decode_cache_value(written) == {"a": [1.5, 2.5]}
+
+
+def test_s3_cache_uses_codec():
+    from litellm.caching.s3_cache import S3Cache
+
+    with patch("boto3.client", return_value=MagicMock()):
+        cache = S3Cache("test-bucket", cache_codec={"compression": "zlib"})
+
+    value = _embedding_cache_value()
+    cache.set_cache("test_key", value)
+    call_args = cache.s3_client.put_object.call_args[1]
+    assert call_args["ContentType"] == "application/octet-stream"
+
+    cache.s3_client.get_object.return_value = {
+        "Body": MagicMock(read=MagicMock(return_value=call_args["Body"]))
+    }
+    cached = cache.get_cache("test_key")
+    assert cached["response"]["data"][0]["index"] == 0
@@ -199,3 +199,33 @@ async def test_async_lpop_with_float_redis_version(
             
             # Verify the method completed without error
             assert result is not None
+
+
+@pytest.mark.asyncio
+async def test_async_stream_append_and_range(redis_no_ping):
+    with patch("litellm._redis.get_redis_client", return_value=MagicMock()):
+        redis_cache = RedisCache(host="my-test-host")
+
+    mock_pipeline = MagicMock()
+    mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+    mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+    mock_pipeline.execute = AsyncMock(return_value=[b"1-0", b"1-1", True])
+    mock_redis_instance = MagicMock()
+    mock_redis_instance.pipeline = MagicMock(return_value=mock_pipeline)
+    mock_redis_instance.xrange = AsyncMock(return_value=[(b"1-1", {b"data": b"b"})])
+
+    with patch.object(
+        redis_cache, "init_async_client", return_value=mock_redis_instance
+    ):
+        ids = await redis_cache.async_stream_append(
+            key="events", values=["a", "b"], ttl=60
+        )
+        entries = await redis_cache.async_stream_range(key="events", after_id="1-0")
+
+    assert ids == ["1-0", "1-1"]
+    assert mock_pipeline.xadd.call_count == 2
+    mock_pipeline.expire.assert_called_once_with("events", 60)
+    mock_redis_instance.xrange.assert_called_once_with(
+        "events", min="(1-0", max="+", count=None
+    )
+    assert entries == [("1-1", "b")]
@@ -0,0 +1,243 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm._redis import (
+    RedisInvalidationListener,
+    _non_overlapping_prefixes,
+    _read_resp3_frame,
+    _RespPush,
+)
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.redis_cache import RedisCache
+from litellm.constants import REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL
+
+
+class FakeResp3Server:
+    """Minimal RESP3 server: answers HELLO / CLIENT TRACKING / PING and sends pushes."""
+
+    def __init__(self):
+        self.commands = []
+        self.writers = []
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self.drop_clients()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.writers.append(writer)
+        try:
+            while True:
+                command = await _read_resp3_frame(reader)
+                command = [c.decode() for c in command]
+                self.commands.append(command)
+                if command[0] == "HELLO":
+                    writer.write(b"%1\r\n+server\r\n+redis\r\n")
+                elif command[0] == "PING":
+                    writer.write(b"+PONG\r\n")
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+    def push_invalidate(self, keys):
+        if keys is None:
+            frame = b">2\r\n$10\r\ninvalidate\r\n_\r\n"
+        else:
+            frame = b">2\r\n$10\r\ninvalidate\r\n*%d\r\n" % len(keys)
+            for key in keys:
+                frame += b"$%d\r\n%s\r\n" % (len(key), key.encode())
+        self.writers[-1].write(frame)
+
+    def drop_clients(self):
+        for writer in self.writers:
+            writer.close()
+        self.writers = []
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def fake_server():
+    server = FakeResp3Server()
+    await server.start()
+    yield server
+    await server.close()
+
+
+def _redis_cache(port, **kwargs) -> RedisCache:
+    with patch("litellm._redis.get_redis_client", return_value=MagicMock()):
+        return RedisCache(
+            host="127.0.0.1", port=port, client_side_caching=True, **kwargs
+        )
+
+
+@pytest.mark.asyncio
+async def test_read_resp3_push_and_map_frames():
+    reader = asyncio.StreamReader()
+    reader.feed_data(
+        b">2\r\n$10\r\ninvalidate\r\n*1\r\n$3\r\nfoo\r\n"
+        b"%1\r\n+proto\r\n:3\r\n"
+    )
+    push = await _read_resp3_frame(reader)
+    assert isinstance(push, _RespPush)
+    assert push == [b"invalidate", [b"foo"]]
+    assert await _read_resp3_frame(reader) == {"proto": 3}
+
+
+def test_non_overlapping_prefixes():
+    assert _non_overlapping_prefixes(["user:", "user:key:", "team:"]) == [
+        "user:",
+        "team:",
+    ]
+    assert _non_overlapping_prefixes(["user:", ""]) == []
+
+
+@pytest.mark.asyncio
+async def test_listener_subscribes_and_reports_invalidations(fake_server):
+    invalidated = []
+    listener = RedisInvalidationListener(
+        redis_kwargs={"host": "127.0.0.1", "port": fake_server.port},
+        prefixes=["litellm:", "litellm:user:"],
+        on_invalidate=invalidated.append,
+    )
+    listener.start()
+    try:
+        await _wait_for(lambda: listener.connected)
+        assert fake_server.commands[0] == ["HELLO", "3"]
+        assert fake_server.commands[1] == [
+            "CLIENT", "TRACKING", "ON", "BCAST", "PREFIX", "litellm:",
+        ]
+        assert invalidated == [None]  # flush on connect
+
+        epoch = listener.epoch
+        fake_server.push_invalidate(["litellm:a", "litellm:b"])
+        await _wait_for(lambda: len(invalidated) == 2)
+        assert invalidated[1] == ["litellm:a", "litellm:b"]
+        assert listener.epoch > epoch
+
+        fake_server.push_invalidate(None)
+        await _wait_for(lambda: len(invalidated) == 3)
+        assert invalidated[2] is None
+    finally:
+        await listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_listener_flushes_and_reconnects_on_disconnect(fake_server):
+    invalidated = []
+    listener = RedisInvalidationListener(
+        redis_kwargs={"host": "127.0.0.1", "port": fake_server.port},
+        prefixes=[],
+        on_invalidate=invalidated.append,
+    )
+    listener.start()
+    try:
+        await _wait_for(lambda: listener.connected)
+        invalidated.clear()
+
+        fake_server.drop_clients()
+        await _wait_for(lambda: not listener.connected)
+        assert invalidated == [None]
+
+        await _wait_for(lambda: listener.connected)
+        assert fake_server.commands.count(["HELLO", "3"]) == 2
+    finally:
+        await listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_keeps_tracked_keys_until_invalidated(fake_server):
+    redis_cache = _redis_cache(fake_server.port, namespace="litellm")
+    redis_cache.async_get_cache = AsyncMock(return_value="team-budget")
+    dual_cache = DualCache(redis_cache=redis_cache, default_in_memory_ttl=5)
+
+    dual_cache._get_client_side_caching_epoch()
+    await _wait_for(lambda: redis_cache._invalidation_listener.connected)
+
+    assert await dual_cache.async_get_cache("team:1") == "team-budget"
+    expires_in = dual_cache.in_memory_cache.ttl_dict["team:1"] - time.time()
+    assert expires_in > REDIS_CLIENT_SIDE_CACHING_IN_MEMORY_TTL - 60
+
+    # served from memory, Redis is not read again
+    assert await dual_cache.async_get_cache("team:1") == "team-budget"
+    assert redis_cache.async_get_cache.call_count == 1
+
+    # another pod writes the key - the local copy is dropped
+    fake_server.push_invalidate(["litellm:team:1"])
+    await _wait_for(lambda: "team:1" not in dual_cache.in_memory_cache.cache_dict)
+    await dual_cache.async_get_cache("team:1")
+    assert redis_cache.async_get_cache.call_count == 2
+
+    await redis_cache._invalidation_listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_uses_default_ttl_when_invalidated_during_read(
+    fake_server,
+):
+    redis_cache = _redis_cache(fake_server.port)
+    dual_cache = DualCache(redis_cache=redis_cache, default_in_memory_ttl=5)
+    dual_cache._get_client_side_caching_epoch()
+    await _wait_for(lambda: redis_cache._invalidation_listener.connected)
+
+    async def _slow_read(key, **kwargs):
+        fake_server.push_invalidate([key])
+        epoch = redis_cache._invalidation_listener.epoch
+        await _wait_for(lambda: redis_cache._invalidation_listener.epoch > epoch)
+        return "stale-value"
+
+    redis_cache.async_get_cache = _slow_read
+    assert await dual_cache.async_get_cache("key") == "stale-value"
+    assert "key" not in dual_cache._client_side_cached_keys
+
+    await redis_cache._invalidation_listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_only_tracks_configured_prefixes(fake_server):
+    redis_cache = _redis_cache(
+        fake_server.port, client_side_caching_prefixes=["user:"]
+    )
+    redis_cache.async_get_cache = AsyncMock(return_value="value")
+    dual_cache = DualCache(redis_cache=redis_cache)
+    dual_cache._get_client_side_caching_epoch()
+    await _wait_for(lambda: redis_cache._invalidation_listener.connected)
+
+    await dual_cache.async_get_cache("user:1")
+    await dual_cache.async_get_cache("rpm:1")
+    assert dual_cache._client_side_cached_keys == {"user:1"}
+
+    await redis_cache._invalidation_listener.stop()
+
+
+def test_dual_cache_ignores_redis_cache_without_client_side_caching():
+    redis_cache = MagicMock()
+    redis_cache.get_cache.return_value = "value"
+    dual_cache = DualCache(redis_cache=redis_cache)
+
+    assert dual_cache.get_cache("key") == "value"
+    redis_cache.register_invalidation_callback.assert_not_called()
+    assert dual_cache._client_side_cached_keys == set()
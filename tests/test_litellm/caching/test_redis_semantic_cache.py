@@ -144,3 +144,168 @@ async def test_redis_semantic_cache_async_get_cache(monkeypatch):
         # Verify methods were called
         redis_semantic_cache._get_async_embedding.assert_called_once()
         redis_semantic_cache.llmcache.acheck.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_redis_semantic_cache_local_tiers_skip_remote_lookups(monkeypatch):
+    semantic_cache_mock = MagicMock()
+    with patch.dict(
+        "sys.modules",
+        {
+            "redisvl.extensions.llmcache": MagicMock(SemanticCache=semantic_cache_mock),
+            "redisvl.utils.vectorize": MagicMock(CustomTextVectorizer=MagicMock()),
+        },
+    ):
+        from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_PASSWORD", "test_password")
+
+        redis_semantic_cache = RedisSemanticCache(
+            similarity_threshold=0.8, local_tiers={"similarity_threshold": 0.95}
+        )
+        redis_semantic_cache.llmcache.acheck = AsyncMock(
+            return_value=[
+                {
+                    "prompt": "What is the capital of France?",
+                    "response": '{"content": "Paris"}',
+                    "vector_distance": 0.1,
+                }
+            ]
+        )
+        embeddings = {
+            "What is the capital of France?": [1.0, 0.0, 0.0],
+            "What's the capital of France?": [0.99, 0.05, 0.0],
+        }
+
+        async def _aembedding(model, input, **kwargs):
+            return {"data": [{"embedding": embeddings[input]}]}
+
+        with patch("litellm.aembedding", side_effect=_aembedding) as mock_aembedding:
+            # L2 hit, stored locally
+            result = await redis_semantic_cache.async_get_cache(
+                key="k", messages=[{"content": "What is the capital of France?"}]
+            )
+            assert result == {"content": "Paris"}
+
+            # L0 hit - no embedding, no Redis
+            metadata: dict = {}
+            result = await redis_semantic_cache.async_get_cache(
+                key="k",
+                messages=[{"content": "What is the capital of  France?"}],
+                metadata=metadata,
+            )
+            assert result == {"content": "Paris"}
+            assert metadata["semantic-similarity"] == 1.0
+
+            # L1 hit - embedding, no Redis
+            result = await redis_semantic_cache.async_get_cache(
+                key="k", messages=[{"content": "What's the capital of France?"}]
+            )
+            assert result == {"content": "Paris"}
+
+        assert mock_aembedding.call_count == 2
+        redis_semantic_cache.llmcache.acheck.assert_called_once()
+        # a Redis hit without a ttl of its own expires locally after the local default
+        [entry] = redis_semantic_cache.local_tiers.entries.values()
+        assert entry.expires_at is not None
+        tiers = redis_semantic_cache.local_tiers.get_stats()["tiers"]
+        assert tiers["l0"]["hits"] == 1
+        assert tiers["l1"]["hits"] == 1
+        assert tiers["l2"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_semantic_cache_local_tiers_use_remote_ttl(monkeypatch):
+    semantic_cache_mock = MagicMock()
+    semantic_cache_mock.return_value.ttl = 120
+    with patch.dict(
+        "sys.modules",
+        {
+            "redisvl.extensions.llmcache": MagicMock(SemanticCache=semantic_cache_mock),
+            "redisvl.utils.vectorize": MagicMock(CustomTextVectorizer=MagicMock()),
+        },
+    ):
+        from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_PASSWORD", "test_password")
+
+        redis_semantic_cache = RedisSemanticCache(
+            similarity_threshold=0.8, local_tiers={"ttl": 3600}
+        )
+        redis_semantic_cache.llmcache.acheck = AsyncMock(
+            return_value=[
+                {
+                    "prompt": "hi",
+                    "response": '{"content": "hello"}',
+                    "vector_distance": 0.0,
+                }
+            ]
+        )
+
+        embeddings = {"hi": [1.0, 0.0], "bye": [0.0, 1.0]}
+
+        async def _aembedding(model, input, **kwargs):
+            return {"data": [{"embedding": embeddings[input]}]}
+
+        with patch("litellm.aembedding", side_effect=_aembedding), patch(
+            "litellm.caching.semantic_cache_local_tiers.time.time", return_value=1000.0
+        ):
+            await redis_semantic_cache.async_get_cache(
+                key="k", messages=[{"content": "hi"}]
+            )
+            await redis_semantic_cache.async_get_cache(
+                key="k", messages=[{"content": "bye"}], ttl=30
+            )
+
+        expires_at = [
+            entry.expires_at
+            for entry in redis_semantic_cache.local_tiers.entries.values()
+        ]
+        assert expires_at == [1120.0, 1030.0]
+
+
+@pytest.mark.asyncio
+async def test_redis_semantic_cache_batch_embeddings_pipeline(monkeypatch):
+    semantic_cache_mock = MagicMock()
+    with patch.dict(
+        "sys.modules",
+        {
+            "redisvl.extensions.llmcache": MagicMock(SemanticCache=semantic_cache_mock),
+            "redisvl.utils.vectorize": MagicMock(CustomTextVectorizer=MagicMock()),
+        },
+    ):
+        from litellm.caching.redis_semantic_cache import RedisSemanticCache
+
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        monkeypatch.setenv("REDIS_PORT", "6379")
+        monkeypatch.setenv("REDIS_PASSWORD", "test_password")
+
+        redis_semantic_cache = RedisSemanticCache(
+            similarity_threshold=0.8, batch_embeddings=True
+        )
+        redis_semantic_cache.llmcache.astore = AsyncMock()
+
+        async def _aembedding(model, input, **kwargs):
+            return {
+                "data": [
+                    {"embedding": [float(len(prompt))], "index": i}
+                    for i, prompt in enumerate(input)
+                ]
+            }
+
+        with patch("litellm.aembedding", side_effect=_aembedding) as mock_aembedding:
+            await redis_semantic_cache.async_set_cache_pipeline(
+                [("k1", "v1"), ("k2", "v2"), ("k3", "v3")],
+                messages=[{"content": "What is the capital of France?"}],
+            )
+
+        # three writes of the same prompt -> one embedding call, one input
+        mock_aembedding.assert_called_once()
+        assert mock_aembedding.call_args.kwargs["input"] == [
+            "What is the capital of France?"
+        ]
+        assert redis_semantic_cache.llmcache.astore.call_count == 3
@@ -0,0 +1,169 @@
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.semantic_cache_local_tiers import (
+    HNSWIndex,
+    SemanticCacheLocalTiers,
+    _to_unit_vector,
+    get_prompt_hash,
+)
+
+
+def _random_vector(rng: random.Random, dim: int = 16):
+    return [rng.uniform(-1, 1) for _ in range(dim)]
+
+
+def test_prompt_hash_ignores_whitespace_differences():
+    assert get_prompt_hash("What is  the\ncapital?") == get_prompt_hash(
+        " What is the capital? "
+    )
+    assert get_prompt_hash("hello", namespace="model-a") != get_prompt_hash(
+        "hello", namespace="model-b"
+    )
+
+
+def test_l0_exact_match_and_ttl(monkeypatch):
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.9, ttl=10)
+    tiers.add("What is the capital of France?", [1.0, 0.0], '{"content": "Paris"}')
+
+    assert tiers.get_exact("What is the capital   of France?") == '{"content": "Paris"}'
+    assert tiers.get_exact("What is the capital of Spain?") is None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert tiers.get_exact("What is the capital of France?") is None
+    assert tiers.get_stats()["entries"] == 0
+
+
+def test_entries_expire_by_default():
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.9)
+    tiers.add("prompt", [1.0, 0.0], "response")
+    [entry] = tiers.entries.values()
+    assert entry.expires_at is not None
+
+
+def test_brute_force_matrix_is_updated_in_place(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.99, max_entries=20)
+    vectors = {f"prompt-{i}": _random_vector(rng) for i in range(30)}
+
+    rebuilds = []
+    rebuild_matrix = tiers._rebuild_matrix
+    monkeypatch.setattr(
+        tiers, "_rebuild_matrix", lambda: rebuilds.append(1) or rebuild_matrix()
+    )
+    for prompt, vector in vectors.items():
+        tiers.add(prompt, vector, prompt)
+        # every entry, including the one just added, is still found
+        assert tiers.search(vector) == (prompt, pytest.approx(1.0, abs=1e-5))
+    for prompt in list(vectors)[-20:]:
+        assert tiers.search(vectors[prompt])[0] == prompt
+    # evicted entries are not returned
+    assert tiers.search(vectors["prompt-0"]) is None
+
+    assert len(rebuilds) == 1
+    assert tiers._matrix_size == len(tiers.entries) == 20
+
+
+def test_l1_respects_similarity_threshold():
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.95)
+    tiers.add("prompt-a", [1.0, 0.0, 0.0], "response-a")
+
+    match = tiers.search([0.99, 0.05, 0.0])
+    assert match is not None
+    assert match[0] == "response-a"
+    assert match[1] == pytest.approx(0.9987, abs=1e-3)
+
+    assert tiers.search([0.7, 0.7, 0.0]) is None
+
+
+def test_lru_eviction():
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.9, max_entries=2)
+    tiers.add("a", [1.0, 0.0, 0.0], "A")
+    tiers.add("b", [0.0, 1.0, 0.0], "B")
+    assert tiers.get_exact("a") == "A"  # "b" is now least recently used
+    tiers.add("c", [0.0, 0.0, 1.0], "C")
+
+    assert tiers.get_exact("b") is None
+    assert tiers.get_exact("a") == "A"
+    assert tiers.get_exact("c") == "C"
+    assert tiers.get_stats()["evictions"] == 1
+
+
+def test_embedding_memo_is_bounded():
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.9, embedding_memo_size=1)
+    assert tiers.get_embedding("model", "a") is None
+    tiers.set_embedding("model", "a", [1.0])
+    assert tiers.get_embedding("model", "a") == [1.0]
+    assert tiers.get_embedding("other-model", "a") is None
+
+    tiers.set_embedding("model", "b", [2.0])
+    assert tiers.get_embedding("model", "a") is None
+
+
+def test_stats_hit_rate_per_tier():
+    tiers = SemanticCacheLocalTiers(similarity_threshold=0.9)
+    tiers.add("a", [1.0, 0.0], "A")
+    tiers.get_exact("a")
+    tiers.get_exact("b")
+    tiers.record("l2", hit=False)
+
+    stats = tiers.get_stats()
+    assert stats["tiers"]["l0"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+    assert stats["tiers"]["l2"]["misses"] == 1
+    assert stats["index"] == "brute_force"
+
+
+def test_switches_to_hnsw_above_brute_force_size():
+    rng = random.Random(0)
+    tiers = SemanticCacheLocalTiers(
+        similarity_threshold=0.99, brute_force_max_size=20, max_entries=100
+    )
+    vectors = [_random_vector(rng) for _ in range(50)]
+    for i, vector in enumerate(vectors):
+        tiers.add(f"prompt-{i}", vector, f"response-{i}")
+
+    assert tiers.get_stats()["index"] == "hnsw"
+    for i in (0, 17, 49):
+        match = tiers.search(vectors[i])
+        assert match is not None
+        assert match[0] == f"response-{i}"
+
+
+def test_hnsw_recall_matches_brute_force():
+    rng = random.Random(42)
+    index = HNSWIndex(m=8, ef_construction=64, ef_search=32)
+    vectors = {f"id-{i}": _to_unit_vector(_random_vector(rng)) for i in range(300)}
+    for item_id, vector in vectors.items():
+        index.add(item_id, vector)
+
+    def brute_force(query):
+        return max(
+            vectors,
+            key=lambda item_id: sum(a * b for a, b in zip(vectors[item_id], query)),
+        )
+
+    queries = [_to_unit_vector(_random_vector(rng)) for _ in range(50)]
+    found = sum(index.search(q, k=1)[0][1] == brute_force(q) for q in queries)
+    assert found / len(queries) >= 0.9
+
+
+def test_hnsw_removed_ids_are_not_returned():
+    rng = random.Random(1)
+    index = HNSWIndex(m=4)
+    vectors = {f"id-{i}": _to_unit_vector(_random_vector(rng)) for i in range(20)}
+    for item_id, vector in vectors.items():
+        index.add(item_id, vector)
+
+    index.remove("id-3")
+    assert all(item_id != "id-3" for _, item_id in index.search(vectors["id-3"], k=5))
+    assert len(index) == 19
@@ -0,0 +1,44 @@
+"""
+Unit tests for prometheus per-stage proxy latency and event loop lag metrics
+"""
+import pytest
+from prometheus_client import REGISTRY
+
+from litellm.integrations.prometheus import PrometheusLogger
+
+
+@pytest.fixture(autouse=True)
+def cleanup_prometheus_registry():
+    collectors = list(REGISTRY._collector_to_names.keys())
+    for collector in collectors:
+        REGISTRY.unregister(collector)
+    yield
+    collectors = list(REGISTRY._collector_to_names.keys())
+    for collector in collectors:
+        REGISTRY.unregister(collector)
+
+
+def test_record_request_stage_metrics():
+    prometheus_logger = PrometheusLogger()
+    prometheus_logger._record_request_stage_metrics({"auth": 0.002, "routing": 0.0005})
+
+    assert (
+        REGISTRY.get_sample_value(
+            "litellm_proxy_request_stage_latency_seconds_count", {"stage": "auth"}
+        )
+        == 1
+    )
+    assert REGISTRY.get_sample_value(
+        "litellm_proxy_request_stage_latency_seconds_sum", {"stage": "routing"}
+    ) == pytest.approx(0.0005)
+
+
+def test_record_event_loop_lag():
+    prometheus_logger = PrometheusLogger()
+    prometheus_logger._record_event_loop_lag(0.25)
+    prometheus_logger._record_event_loop_lag(0.0)
+
+    assert REGISTRY.get_sample_value("litellm_event_loop_lag_seconds_count") == 2
+    assert REGISTRY.get_sample_value(
+        "litellm_event_loop_lag_seconds_sum"
+    ) == pytest.approx(0.25)
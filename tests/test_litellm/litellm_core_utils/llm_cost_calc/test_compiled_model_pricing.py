@@ -0,0 +1,233 @@
+import json
+import os
+import sys
+from typing import List
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.llm_cost_calc.utils import (
+    CompiledModelPricing,
+    _compiled_model_pricing,
+    _generic_cost_per_token_from_model_info,
+    generic_cost_per_token,
+    get_compiled_model_pricing,
+    warm_compiled_model_pricing,
+)
+from litellm.types.utils import (
+    CacheCreationTokenDetails,
+    CompletionTokensDetailsWrapper,
+    ModelInfo,
+    PromptTokensDetailsWrapper,
+    Usage,
+)
+
+_MODEL_PRICES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "../../../../model_prices_and_context_window.json",
+)
+
+
+def _load_model_prices() -> dict:
+    with open(_MODEL_PRICES_PATH) as f:
+        model_prices = json.load(f)
+    model_prices.pop("sample_spec", None)
+    return model_prices
+
+
+def _usage_variants() -> List[Usage]:
+    return [
+        Usage(prompt_tokens=1000, completion_tokens=500, total_tokens=1500),
+        # above every tier threshold in the cost map (128k / 200k / 256k / 272k)
+        Usage(prompt_tokens=300_000, completion_tokens=2_000, total_tokens=302_000),
+        Usage(
+            prompt_tokens=2_000,
+            completion_tokens=1_000,
+            total_tokens=3_000,
+            prompt_tokens_details=PromptTokensDetailsWrapper(
+                cached_tokens=500,
+                cache_creation_tokens=300,
+                audio_tokens=100,
+                image_tokens=50,
+            ),
+            completion_tokens_details=CompletionTokensDetailsWrapper(
+                reasoning_tokens=400, audio_tokens=100, image_tokens=50
+            ),
+        ),
+        Usage(
+            prompt_tokens=250_000,
+            completion_tokens=1_000,
+            total_tokens=251_000,
+            prompt_tokens_details=PromptTokensDetailsWrapper(
+                cached_tokens=100_000,
+                cache_creation_tokens=20_000,
+                cache_creation_token_details=CacheCreationTokenDetails(
+                    ephemeral_5m_input_tokens=5_000,
+                    ephemeral_1h_input_tokens=15_000,
+                ),
+            ),
+            completion_tokens_details=CompletionTokensDetailsWrapper(
+                text_tokens=600, reasoning_tokens=400
+            ),
+        ),
+        Usage(
+            prompt_tokens=100,
+            completion_tokens=10,
+            total_tokens=110,
+            prompt_tokens_details=PromptTokensDetailsWrapper(
+                text_tokens=100,
+                cached_tokens=40,
+                character_count=400,
+                image_count=2,
+                video_length_seconds=3.5,
+            ),
+        ),
+    ]
+
+
+@pytest.mark.parametrize("service_tier", [None, "flex", "priority"])
+def test_compiled_pricing_matches_uncompiled_for_every_model(service_tier):
+    """
+    Compiled pricing must be a pure speedup - for every model in the cost map and a range of
+    usage shapes (cache reads/writes, tiers, audio/image/reasoning tokens) it has to return
+    exactly what the dict-based calculator returns.
+    """
+    model_prices = _load_model_prices()
+    usage_variants = _usage_variants()
+    checked_models = 0
+    for model, model_info in model_prices.items():
+        model_info = ModelInfo(**model_info)  # type: ignore
+        compiled = CompiledModelPricing(model_info=model_info, service_tier=service_tier)
+        for usage in usage_variants:
+            expected = _generic_cost_per_token_from_model_info(
+                model_info=model_info, usage=usage, service_tier=service_tier
+            )
+            assert compiled.cost_per_token(usage) == expected, (model, usage)
+        checked_models += 1
+    assert checked_models == len(model_prices)
+
+
+def test_compiled_pricing_handles_string_rates_and_tiers():
+    model_info = ModelInfo(  # type: ignore
+        input_cost_per_token="1e-6",
+        output_cost_per_token="2e-6",
+        input_cost_per_token_above_200k_tokens=3e-6,
+        output_cost_per_token_above_200k_tokens=4e-6,
+        cache_read_input_token_cost_above_200k_tokens=5e-7,
+        input_cost_per_token_above_128k_tokens=None,
+    )
+    compiled = CompiledModelPricing(model_info=model_info)
+    assert compiled.input_cost_per_token == 1e-6
+    assert [tier[0] for tier in compiled.tiers] == [200_000]
+
+    below = Usage(prompt_tokens=1000, completion_tokens=10, total_tokens=1010)
+    above = Usage(prompt_tokens=300_000, completion_tokens=10, total_tokens=300_010)
+    assert compiled.cost_per_token(below) == pytest.approx((1000 * 1e-6, 10 * 2e-6))
+    assert compiled.cost_per_token(above) == pytest.approx((300_000 * 3e-6, 10 * 4e-6))
+
+
+def test_get_compiled_model_pricing_recompiles_when_prices_change():
+    _compiled_model_pricing.clear()
+    model_info = ModelInfo(input_cost_per_token=1e-6, output_cost_per_token=2e-6)  # type: ignore
+    compiled = get_compiled_model_pricing(
+        model="my-deployment-id", custom_llm_provider="openai", model_info=model_info
+    )
+    # same dict -> cached record
+    assert (
+        get_compiled_model_pricing(
+            model="my-deployment-id", custom_llm_provider="openai", model_info=model_info
+        )
+        is compiled
+    )
+    # equal prices in a new dict (get_model_info cache cleared) -> still cached
+    same_prices = ModelInfo(**model_info)  # type: ignore
+    assert (
+        get_compiled_model_pricing(
+            model="my-deployment-id", custom_llm_provider="openai", model_info=same_prices
+        )
+        is compiled
+    )
+    # cost map reloaded with new prices -> recompiled
+    new_prices = ModelInfo(input_cost_per_token=5e-6, output_cost_per_token=2e-6)  # type: ignore
+    recompiled = get_compiled_model_pricing(
+        model="my-deployment-id", custom_llm_provider="openai", model_info=new_prices
+    )
+    assert recompiled is not compiled
+    assert recompiled.input_cost_per_token == 5e-6
+    # service tiers are compiled separately
+    assert (
+        get_compiled_model_pricing(
+            model="my-deployment-id",
+            custom_llm_provider="openai",
+            model_info=new_prices,
+            service_tier="FLEX",
+        )
+        is not recompiled
+    )
+
+
+def test_generic_cost_per_token_uses_registered_custom_pricing():
+    os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+    litellm.register_model(
+        {
+            "compiled-pricing-test-model": {
+                "input_cost_per_token": 1e-6,
+                "output_cost_per_token": 2e-6,
+                "litellm_provider": "openai",
+                "mode": "chat",
+            }
+        }
+    )
+    usage = Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+    assert generic_cost_per_token(
+        model="compiled-pricing-test-model", usage=usage, custom_llm_provider="openai"
+    ) == pytest.approx((100 * 1e-6, 50 * 2e-6))
+
+    # re-registering new prices must not serve the old compiled record
+    litellm.register_model(
+        {"compiled-pricing-test-model": {"input_cost_per_token": 3e-6}}
+    )
+    assert generic_cost_per_token(
+        model="compiled-pricing-test-model", usage=usage, custom_llm_provider="openai"
+    ) == pytest.approx((100 * 3e-6, 50 * 2e-6))
+
+
+def test_router_warms_deployment_pricing():
+    _compiled_model_pricing.clear()
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "fake-key",
+                    "input_cost_per_token": 1e-6,
+                    "output_cost_per_token": 2e-6,
+                },
+                "model_info": {"id": "compiled-pricing-deployment"},
+            }
+        ]
+    )
+    assert router.get_deployment(model_id="compiled-pricing-deployment") is not None
+    assert ("compiled-pricing-deployment", "openai", None) in _compiled_model_pricing
+    assert ("gpt-4o", "openai", None) in _compiled_model_pricing
+    assert (
+        _compiled_model_pricing[
+            ("compiled-pricing-deployment", "openai", None)
+        ].input_cost_per_token
+        == 1e-6
+    )
+
+
+def test_warm_compiled_model_pricing_unknown_model():
+    assert (
+        warm_compiled_model_pricing(
+            model="this-model-does-not-exist-anywhere", custom_llm_provider="openai"
+        )
+        is None
+    )
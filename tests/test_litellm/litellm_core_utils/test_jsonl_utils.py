@@ -0,0 +1,84 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.jsonl_utils import (
+    iter_jsonl_lines,
+    iter_jsonl_objects,
+    write_jsonl,
+)
+
+OBJECTS = [
+    {"custom_id": "request-1", "body": {"model": "gpt-4o", "text": "a\nb"}},
+    {"custom_id": "request-2", "body": {"model": "gpt-4o", "text": "ü" * 50}},
+    {"custom_id": "request-3", "body": {}},
+]
+CONTENT = ("\n".join(json.dumps(obj) for obj in OBJECTS) + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1024 * 1024])
+def test_iter_jsonl_objects_chunk_boundaries(chunk_size):
+    """Lines (and multi-byte characters) split across chunks are reassembled"""
+    assert list(iter_jsonl_objects(CONTENT, chunk_size=chunk_size)) == OBJECTS
+    assert (
+        list(iter_jsonl_objects(io.BytesIO(CONTENT), chunk_size=chunk_size))
+        == OBJECTS
+    )
+
+
+def test_iter_jsonl_objects_sources():
+    chunks = [CONTENT[i : i + 5] for i in range(0, len(CONTENT), 5)]
+    assert list(iter_jsonl_objects(iter(chunks))) == OBJECTS
+    assert list(iter_jsonl_objects(CONTENT.decode("utf-8"))) == OBJECTS
+    assert list(iter_jsonl_objects(io.StringIO(CONTENT.decode("utf-8")))) == OBJECTS
+
+
+def test_iter_jsonl_objects_skips_blank_lines():
+    content = b'\n{"a": 1}\r\n   \n\n{"b": 2}'
+    assert list(iter_jsonl_objects(content)) == [{"a": 1}, {"b": 2}]
+    assert list(iter_jsonl_objects(b"")) == []
+    assert list(iter_jsonl_objects(b"  \n \n")) == []
+
+
+def test_iter_jsonl_objects_is_lazy():
+    """Objects are parsed as they are consumed - an invalid later line only raises when reached"""
+    objects = iter_jsonl_objects(b'{"a": 1}\nnot json\n')
+    assert next(objects) == {"a": 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(objects)
+
+
+def test_iter_jsonl_objects_multiline_objects():
+    content = b'{\n  "a": 1,\n  "b": "x"\n}\n{"c": 2}\n'
+    assert list(iter_jsonl_objects(content, allow_multiline_objects=True)) == [
+        {"a": 1, "b": "x"},
+        {"c": 2},
+    ]
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_jsonl_objects(content))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_jsonl_objects(b'{"a": 1}\n{"b":', allow_multiline_objects=True))
+
+
+def test_iter_jsonl_lines_long_line():
+    long_line = b"x" * 10_000
+    assert list(iter_jsonl_lines(long_line + b"\nshort", chunk_size=16)) == [
+        long_line,
+        b"short",
+    ]
+
+
+def test_write_jsonl_round_trip():
+    output = io.BytesIO()
+    line_count = write_jsonl(iter_jsonl_objects(CONTENT), output)
+
+    assert line_count == 3
+    assert output.getvalue().endswith(b"\n")
+    assert list(iter_jsonl_objects(output.getvalue())) == OBJECTS
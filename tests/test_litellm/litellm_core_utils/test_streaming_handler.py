@@ -1185,3 +1185,130 @@ def test_is_chunk_non_empty_with_valid_tool_calls(
         )
         is True
     )
+
+
+def _make_usage_streaming_wrapper(model: str) -> CustomStreamWrapper:
+    final_chunk = ModelResponseStream(
+        id="chatcmpl-87291500-d8c5-428e-b187-36fe5a4c97ab",
+        created=1742056047,
+        model=None,
+        object="chat.completion.chunk",
+        choices=[
+            StreamingChoices(
+                finish_reason=None,
+                index=0,
+                delta=Delta(content="", role="assistant"),
+            )
+        ],
+        usage=Usage(
+            completion_tokens=392,
+            prompt_tokens=1799,
+            total_tokens=2191,
+            prompt_tokens_details=PromptTokensDetailsWrapper(cached_tokens=1796),
+        ),
+    )
+    return CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(
+            model_responses=bedrock_chunks + [final_chunk]
+        ),
+        model=model,
+        custom_llm_provider="bedrock",
+        logging_obj=Logging(
+            model=model,
+            messages=[{"role": "user", "content": "Hey"}],
+            stream=True,
+            call_type="completion",
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+        ),
+        stream_options={"include_usage": True},
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_usage_fast_path_skips_response_assembly():
+    """
+    If no callback reads the response content, cost + usage come from the final usage
+    chunk and the chunks are only assembled on demand.
+    """
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class UsageOnlyCallback(CustomLogger):
+        streaming_logging_fields = frozenset({"usage", "response_cost"})
+
+    usage_only_callback = UsageOnlyCallback()
+    model = "bedrock/anthropic.claude-3-5-sonnet-20240620-v1:0"
+    response = _make_usage_streaming_wrapper(model=model)
+    response.logging_obj.update_environment_variables(
+        litellm_params={}, optional_params={}, model=model
+    )
+
+    with patch.object(litellm, "success_callback", []), patch.object(
+        litellm, "_async_success_callback", [usage_only_callback]
+    ), patch.object(litellm, "callbacks", []), patch.object(
+        litellm, "cache", None
+    ), patch.object(
+        usage_only_callback, "async_log_success_event"
+    ) as mock_async_log_success_event, patch.object(
+        litellm, "stream_chunk_builder", wraps=litellm.stream_chunk_builder
+    ) as mock_stream_chunk_builder:
+        async for _ in response:
+            pass
+        await asyncio.sleep(1)
+
+        mock_stream_chunk_builder.assert_not_called()
+        mock_async_log_success_event.assert_called_once()
+        logged_kwargs = mock_async_log_success_event.call_args.kwargs
+        assert logged_kwargs["response_obj"].usage.prompt_tokens == 1799
+        assert logged_kwargs["response_obj"].usage.completion_tokens == 392
+
+        # parity with pricing the fully assembled response
+        full_response = litellm.stream_chunk_builder(
+            chunks=response.chunks, messages=response.messages
+        )
+        expected_cost = response.logging_obj._response_cost_calculator(
+            result=full_response
+        )
+        assert expected_cost > 0
+        assert logged_kwargs["kwargs"]["response_cost"] == pytest.approx(
+            expected_cost
+        )
+        assert logged_kwargs["response_obj"].usage == full_response.usage
+
+        # full response is still available lazily
+        assembled = response.logging_obj.get_assembled_streaming_response()
+        assert (
+            assembled.choices[0].message.content
+            == full_response.choices[0].message.content
+        )
+
+
+def test_should_assemble_streaming_response(logging_obj: Logging):
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class UsageOnlyCallback(CustomLogger):
+        streaming_logging_fields = frozenset({"usage"})
+
+    with patch.object(litellm, "success_callback", []), patch.object(
+        litellm, "callbacks", []
+    ), patch.object(litellm, "cache", None):
+        with patch.object(litellm, "_async_success_callback", [UsageOnlyCallback()]):
+            assert logging_obj.should_assemble_streaming_response() is False
+        # loggers read the full response unless they opt out
+        with patch.object(litellm, "_async_success_callback", [CustomLogger()]):
+            assert logging_obj.should_assemble_streaming_response() is True
+        with patch.object(litellm, "_async_success_callback", ["langfuse"]):
+            assert logging_obj.should_assemble_streaming_response() is True
+        # caching stores the assembled response
+        with patch.object(
+            litellm, "_async_success_callback", [UsageOnlyCallback()]
+        ), patch.object(litellm, "cache", MagicMock()):
+            assert logging_obj.should_assemble_streaming_response() is True
+            assert (
+                logging_obj.should_assemble_streaming_response(cache_hit=True) is False
+            )
+
+
+def test_stream_chunk_usage_builder_requires_reported_usage():
+    assert litellm.stream_chunk_usage_builder(chunks=list(bedrock_chunks)) is None
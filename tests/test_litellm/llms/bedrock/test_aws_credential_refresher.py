@@ -0,0 +1,295 @@
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+
+from litellm.caching.dual_cache import DualCache
+from litellm.llms.bedrock import aws_credential_refresher
+from litellm.llms.bedrock.aws_credential_refresher import (
+    AWSCredentialRefresher,
+    get_sigv4_auth,
+    get_sigv4_signing_key,
+)
+from litellm.llms.bedrock.base_aws_llm import BaseAWSLLM
+
+
+def _credentials(n: int) -> Credentials:
+    return Credentials(
+        access_key=f"AKID{n}", secret_key=f"secret{n}", token=f"token{n}"
+    )
+
+
+def _wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def test_concurrent_cache_misses_fetch_once():
+    refresher = AWSCredentialRefresher()
+    iam_cache = DualCache()
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+    fetch_calls = []
+
+    def fetch():
+        fetch_calls.append(1)
+        fetch_started.set()
+        release_fetch.wait(timeout=5)
+        return _credentials(1), 3600
+
+    results = []
+
+    def get():
+        results.append(
+            refresher.fetch_credentials(
+                iam_cache=iam_cache, cache_key="role", fetch=fetch
+            )
+        )
+
+    threads = [threading.Thread(target=get) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    assert fetch_started.wait(timeout=5)
+    release_fetch.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(fetch_calls) == 1
+    assert len(results) == 10
+    assert all(result.access_key == "AKID1" for result in results)
+    assert iam_cache.get_cache("role").access_key == "AKID1"
+
+
+def test_expiring_credentials_refresh_in_background():
+    refresher = AWSCredentialRefresher(refresh_window_seconds=300)
+    iam_cache = DualCache()
+    release_refresh = threading.Event()
+    fetched = [_credentials(1)]
+
+    def fetch():
+        if len(fetched) > 1:
+            release_refresh.wait(timeout=5)
+        credentials = fetched[-1]
+        return credentials, 3600
+
+    refresher.fetch_credentials(iam_cache=iam_cache, cache_key="role", fetch=fetch)
+
+    # outside the refresh window - nothing to do
+    refresher.refresh_if_expiring("role")
+    assert refresher._entries["role"].is_refreshing is False
+
+    # within the refresh window - callers keep the cached credentials while STS is called
+    refresher._entries["role"].expires_at = time.monotonic() + 60
+    fetched.append(_credentials(2))
+    refresher.refresh_if_expiring("role")
+    assert refresher._entries["role"].is_refreshing is True
+    assert iam_cache.get_cache("role").access_key == "AKID1"
+
+    release_refresh.set()
+    _wait_until(lambda: refresher._entries["role"].is_refreshing is False)
+    assert iam_cache.get_cache("role").access_key == "AKID2"
+    assert refresher._entries["role"].expires_at > time.monotonic() + 3000
+
+
+def test_failed_background_refresh_keeps_credentials_and_backs_off():
+    refresher = AWSCredentialRefresher(refresh_window_seconds=300, retry_seconds=30)
+    iam_cache = DualCache()
+    fetch = MagicMock(return_value=(_credentials(1), 3600))
+    refresher.fetch_credentials(iam_cache=iam_cache, cache_key="role", fetch=fetch)
+
+    fetch.side_effect = Exception("sts unavailable")
+    entry = refresher._entries["role"]
+    entry.expires_at = time.monotonic() + 60
+    refresher.refresh_if_expiring("role")
+    _wait_until(lambda: entry.is_refreshing is False)
+
+    assert fetch.call_count == 2
+    assert iam_cache.get_cache("role").access_key == "AKID1"
+    assert entry.next_refresh_attempt_at > time.monotonic() + 20
+
+    # no retry until the back-off has passed
+    refresher.refresh_if_expiring("role")
+    assert entry.is_refreshing is False
+    assert fetch.call_count == 2
+
+
+def test_non_expiring_credentials_are_not_refreshed():
+    refresher = AWSCredentialRefresher()
+    iam_cache = DualCache()
+    refresher.fetch_credentials(
+        iam_cache=iam_cache,
+        cache_key="env",
+        fetch=lambda: (_credentials(1), None),
+    )
+    assert "env" not in refresher._entries
+
+
+def test_refresh_metrics_recorded():
+    refresher = AWSCredentialRefresher()
+    with patch(
+        "litellm.llms.bedrock.aws_credential_refresher._record_credential_refresh"
+    ) as mock_record:
+        refresher.fetch_credentials(
+            iam_cache=DualCache(),
+            cache_key="role",
+            fetch=lambda: (_credentials(1), 3600),
+        )
+        with pytest.raises(Exception, match="sts unavailable"):
+            refresher.fetch_credentials(
+                iam_cache=DualCache(),
+                cache_key="other-role",
+                fetch=MagicMock(side_effect=Exception("sts unavailable")),
+            )
+
+    assert [call.kwargs["success"] for call in mock_record.call_args_list] == [
+        True,
+        False,
+    ]
+    assert all(
+        call.kwargs["refresh_type"] == "blocking"
+        for call in mock_record.call_args_list
+    )
+
+
+def test_prometheus_records_credential_refresh():
+    from prometheus_client import REGISTRY
+
+    from litellm.integrations.prometheus import PrometheusLogger
+
+    for collector in list(REGISTRY._collector_to_names.keys()):
+        REGISTRY.unregister(collector)
+    prometheus_logger = PrometheusLogger()
+    prometheus_logger._record_aws_credential_refresh(
+        latency_seconds=0.2, refresh_type="background", success=False
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "litellm_aws_credential_refresh_failures_total",
+            {"refresh_type": "background"},
+        )
+        == 1
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "litellm_aws_credential_refresh_latency_seconds_count",
+            {"refresh_type": "background"},
+        )
+        == 1
+    )
+
+
+@pytest.mark.parametrize(
+    "service_name,region_name", [("bedrock", "us-west-2"), ("sagemaker", "eu-west-1")]
+)
+def test_cached_signing_key_matches_botocore_signature(service_name, region_name):
+    credentials = _credentials(1)
+
+    def _signed_headers(sigv4):
+        request = AWSRequest(
+            method="POST",
+            url=f"https://{service_name}-runtime.{region_name}.amazonaws.com/model/invoke",
+            data=b'{"prompt": "hi"}',
+            headers={"Content-Type": "application/json"},
+        )
+        with patch(
+            "botocore.auth.get_current_datetime",
+            return_value=datetime(2025, 1, 2, 3, 4, 5),
+        ):
+            sigv4.add_auth(request)
+        return dict(request.headers)
+
+    expected = _signed_headers(SigV4Auth(credentials, service_name, region_name))
+    # signed twice - the second signature uses the cached signing key
+    assert _signed_headers(get_sigv4_auth(credentials, service_name, region_name)) == expected
+    assert _signed_headers(get_sigv4_auth(credentials, service_name, region_name)) == expected
+
+
+def test_signing_key_cache_is_keyed_by_secret_hash(monkeypatch):
+    monkeypatch.setattr(
+        aws_credential_refresher,
+        "_sigv4_signing_keys",
+        aws_credential_refresher.LimitedSizeOrderedDict(max_size=2),
+    )
+    signing_key = get_sigv4_signing_key("secret1", "20250102", "us-west-2", "bedrock")
+    assert (
+        get_sigv4_signing_key("secret1", "20250102", "us-west-2", "bedrock")
+        == signing_key
+    )
+    assert (
+        get_sigv4_signing_key("secret2", "20250102", "us-west-2", "bedrock")
+        != signing_key
+    )
+    get_sigv4_signing_key("secret3", "20250102", "us-west-2", "bedrock")
+
+    cache = aws_credential_refresher._sigv4_signing_keys
+    assert len(cache) == 2
+    for key in cache:
+        assert "secret" not in repr(key)
+
+
+def test_key_locks_are_dropped_after_fetch():
+    refresher = AWSCredentialRefresher()
+    iam_cache = DualCache()
+    for n in range(10):
+        refresher.fetch_credentials(
+            iam_cache, f"key-{n}", lambda n=n: (_credentials(n), None)
+        )
+    assert len(refresher._key_locks) == 0
+
+
+def test_base_aws_llm_refreshes_cached_role_credentials_in_background():
+    base_aws_llm = BaseAWSLLM()
+    sts_responses = [
+        ("AKID1", "secret1", "token1"),
+        ("AKID2", "secret2", "token2"),
+    ]
+    calls = []
+
+    def _auth_with_aws_role(**kwargs):
+        calls.append(kwargs)
+        access_key, secret_key, token = sts_responses[len(calls) - 1]
+        return Credentials(access_key, secret_key, token), 3540
+
+    with patch.object(
+        base_aws_llm, "_auth_with_aws_role", side_effect=_auth_with_aws_role
+    ), patch.object(base_aws_llm, "_is_already_running_as_role", return_value=False):
+        credentials = base_aws_llm.get_credentials(
+            aws_role_name="arn:aws:iam::123456789012:role/bedrock",
+            aws_session_name="litellm",
+            aws_region_name="us-west-2",
+        )
+        assert credentials.access_key == "AKID1"
+
+        (entry,) = base_aws_llm._credential_refresher._entries.values()
+        entry.expires_at = time.monotonic() + 10
+        # still served from cache while the refresh runs
+        credentials = base_aws_llm.get_credentials(
+            aws_role_name="arn:aws:iam::123456789012:role/bedrock",
+            aws_session_name="litellm",
+            aws_region_name="us-west-2",
+        )
+        assert credentials.access_key == "AKID1"
+        _wait_until(lambda: len(calls) == 2 and entry.is_refreshing is False)
+
+        credentials = base_aws_llm.get_credentials(
+            aws_role_name="arn:aws:iam::123456789012:role/bedrock",
+            aws_session_name="litellm",
+            aws_region_name="us-west-2",
+        )
+        assert credentials.access_key == "AKID2"
+        assert len(calls) == 2
@@ -233,9 +233,9 @@ def test_sign_request_with_sigv4():
     api_base = "https://api.example.com"
 
     # Mock the necessary components
-    with patch("botocore.auth.SigV4Auth", return_value=mock_sigv4), patch(
-        "botocore.awsrequest.AWSRequest", return_value=mock_request
-    ), patch.object(
+    with patch(
+        "litellm.llms.bedrock.base_aws_llm.get_sigv4_auth", return_value=mock_sigv4
+    ), patch("botocore.awsrequest.AWSRequest", return_value=mock_request), patch.object(
         llm, "get_credentials", return_value=mock_credentials
     ), patch.object(
         llm, "_get_aws_region_name", return_value="us-west-2"
@@ -336,7 +336,7 @@ def test_get_request_headers_with_sigv4():
 
     # Test without bearer token (should use SigV4)
     with patch.dict(os.environ, {}, clear=True), patch(
-        "botocore.auth.SigV4Auth", return_value=mock_sigv4
+        "litellm.llms.bedrock.base_aws_llm.get_sigv4_auth", return_value=mock_sigv4
     ) as mock_sigv4_class, patch(
         "botocore.awsrequest.AWSRequest", return_value=mock_request
     ):
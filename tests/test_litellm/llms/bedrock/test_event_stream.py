@@ -0,0 +1,245 @@
+import base64
+import json
+import os
+import random
+import struct
+import sys
+import uuid
+import zlib
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from botocore.eventstream import EventStreamBuffer
+
+from litellm.llms.bedrock.chat.invoke_handler import (
+    AmazonAnthropicClaudeStreamDecoder,
+    AWSEventStreamDecoder,
+)
+from litellm.llms.bedrock.common_utils import BedrockError
+from litellm.llms.bedrock.event_stream import (
+    EventStreamDecoder,
+    EventStreamMessage,
+    EventStreamParseError,
+    encode_event_stream_message,
+)
+
+_FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "event_stream_fixtures"
+)
+
+
+def _load_fixture(name: str) -> bytes:
+    with open(os.path.join(_FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def _split_randomly(data: bytes, num_chunks: int, seed: int) -> List[bytes]:
+    rng = random.Random(seed)
+    cuts = sorted(rng.sample(range(1, len(data)), num_chunks - 1))
+    return [data[start:end] for start, end in zip([0] + cuts, cuts + [len(data)])]
+
+
+def _decode_all(event_stream_buffer, chunks: List[bytes]) -> List:
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    messages = []
+    for chunk in chunks:
+        event_stream_buffer.add_data(chunk)
+        for event in event_stream_buffer:
+            messages.append(decoder._parse_message_from_event(event))
+    return messages
+
+
+@pytest.mark.parametrize(
+    "fixture", ["anthropic_claude_invoke_stream.bin", "converse_stream.bin"]
+)
+@pytest.mark.parametrize("num_chunks", [1, 7, 500])
+def test_native_decoder_matches_botocore(fixture, num_chunks):
+    chunks = _split_randomly(_load_fixture(fixture), num_chunks, seed=num_chunks)
+    native_messages = _decode_all(EventStreamDecoder(), chunks)
+    botocore_messages = _decode_all(EventStreamBuffer(), chunks)
+
+    assert len(native_messages) > 400
+    assert native_messages == botocore_messages
+    for message in native_messages:
+        json.loads(message)
+
+
+def test_native_decoder_headers_match_botocore():
+    data = encode_event_stream_message(
+        headers={
+            ":event-type": "chunk",
+            ":message-type": "event",
+            "bool-true": True,
+            "bool-false": False,
+            "bytes": b"\x00\x01",
+            "id": uuid.UUID("6f1a5c52-37a4-4a62-9c0c-1c2a0c7e3b11"),
+        },
+        payload=b'{"bytes":"e30="}',
+    )
+    botocore_buffer = EventStreamBuffer()
+    botocore_buffer.add_data(data)
+    native_decoder = EventStreamDecoder()
+    native_decoder.add_data(data)
+
+    botocore_message = next(iter(botocore_buffer))
+    native_message = next(native_decoder)
+    assert native_message.headers == botocore_message.headers
+    assert native_message.to_response_dict() == botocore_message.to_response_dict()
+
+
+def test_native_decoder_integer_headers():
+    headers = (
+        b"\x04int8\x02\xff"
+        + b"\x05int16\x03"
+        + struct.pack(">h", -2)
+        + b"\x05int32\x04"
+        + struct.pack(">i", 70000)
+        + b"\x05int64\x05"
+        + struct.pack(">q", 2**40)
+        + b"\x02ts\x08"
+        + struct.pack(">q", 1700000000000)
+    )
+    total_length = 12 + len(headers) + 4
+    prelude = struct.pack(">II", total_length, len(headers))
+    prelude += struct.pack(">I", zlib.crc32(prelude))
+    message = prelude + headers
+    message += struct.pack(">I", zlib.crc32(message))
+
+    native_decoder = EventStreamDecoder()
+    native_decoder.add_data(message)
+    decoded = next(native_decoder)
+    assert decoded.headers == {
+        "int8": -1,
+        "int16": -2,
+        "int32": 70000,
+        "int64": 2**40,
+        "ts": 1700000000000,
+    }
+    assert decoded.payload.tobytes() == b""
+
+
+def test_native_decoder_waits_for_complete_frame():
+    data = encode_event_stream_message(
+        headers={":event-type": "messageStop", ":message-type": "event"},
+        payload=b'{"stopReason":"end_turn"}',
+    )
+    native_decoder = EventStreamDecoder()
+    native_decoder.add_data(data[:5])
+    assert list(native_decoder) == []
+    native_decoder.add_data(data[5:-1])
+    assert list(native_decoder) == []
+    native_decoder.add_data(data[-1:] + data)
+    assert len(list(native_decoder)) == 2
+
+
+def test_native_decoder_rejects_checksum_mismatch():
+    data = bytearray(
+        encode_event_stream_message(
+            headers={":event-type": "messageStop", ":message-type": "event"},
+            payload=b'{"stopReason":"end_turn"}',
+        )
+    )
+    data[-6] ^= 0xFF  # corrupt the payload
+    native_decoder = EventStreamDecoder()
+    native_decoder.add_data(bytes(data))
+    with pytest.raises(EventStreamParseError, match="Message checksum mismatch"):
+        next(native_decoder)
+
+    data = bytearray(data)
+    data[0] ^= 0x01  # corrupt the prelude
+    native_decoder = EventStreamDecoder()
+    native_decoder.add_data(bytes(data))
+    with pytest.raises(EventStreamParseError, match="Prelude checksum mismatch"):
+        next(native_decoder)
+
+
+@pytest.mark.parametrize("use_botocore", [False, True])
+def test_exception_frame_raises_bedrock_error(use_botocore):
+    data = encode_event_stream_message(
+        headers={
+            ":exception-type": "throttlingException",
+            ":content-type": "application/json",
+            ":message-type": "exception",
+        },
+        payload=b'{"message":"Too many requests, please wait before trying again."}',
+    )
+    event_stream_buffer = EventStreamBuffer() if use_botocore else EventStreamDecoder()
+    with pytest.raises(BedrockError) as e:
+        _decode_all(event_stream_buffer, [data])
+    assert e.value.status_code == 400
+    assert e.value.message == (
+        'throttlingException {"message":"Too many requests, please wait before trying again."}'
+    )
+
+
+@pytest.mark.parametrize("use_botocore", [False, True])
+def test_error_frame_raises_bedrock_error(use_botocore):
+    data = encode_event_stream_message(
+        headers={
+            ":error-code": "InternalFailure",
+            ":error-message": "An internal error occurred",
+            ":message-type": "error",
+        },
+        payload=b"",
+    )
+    event_stream_buffer = EventStreamBuffer() if use_botocore else EventStreamDecoder()
+    with pytest.raises(BedrockError) as e:
+        _decode_all(event_stream_buffer, [data])
+    assert e.value.status_code == 400
+    assert e.value.message == "InternalFailure An internal error occurred"
+
+
+def _claude_stream_text(chunks: List[bytes]) -> str:
+    decoder = AmazonAnthropicClaudeStreamDecoder(
+        model="anthropic.claude-3-5-sonnet-20241022-v2:0", sync_stream=True
+    )
+    text = ""
+    for chunk in decoder.iter_bytes(iter(chunks)):
+        for choice in chunk.choices:
+            text += choice.delta.content or ""
+    return text
+
+
+def test_iter_bytes_botocore_fallback_matches_native():
+    chunks = _split_randomly(
+        _load_fixture("anthropic_claude_invoke_stream.bin"), 50, seed=1
+    )
+    native_text = _claude_stream_text(chunks)
+    with patch(
+        "litellm.llms.bedrock.common_utils.BEDROCK_USE_BOTOCORE_EVENT_STREAM_DECODER",
+        True,
+    ):
+        botocore_text = _claude_stream_text(chunks)
+    assert len(native_text) > 0
+    assert native_text == botocore_text
+
+
+@pytest.mark.asyncio
+async def test_aiter_bytes_uses_native_decoder():
+    chunks = _split_randomly(_load_fixture("converse_stream.bin"), 50, seed=2)
+
+    async def _aiter():
+        for chunk in chunks:
+            yield chunk
+
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    parsed_events = [event async for event in decoder.aiter_bytes(_aiter())]
+    assert len(parsed_events) == 404
+
+
+def test_parse_message_from_event_accepts_native_message():
+    inner = b'{"type":"message_stop"}'
+    message = EventStreamMessage(
+        headers={":event-type": "chunk", ":message-type": "event"},
+        payload=memoryview(
+            json.dumps({"bytes": base64.b64encode(inner).decode()}).encode()
+        ),
+    )
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-3-5-sonnet-20241022-v2:0")
+    assert decoder._parse_message_from_event(message) == inner.decode()
@@ -0,0 +1,307 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx import http2_transport
+from litellm.llms.custom_httpx.aiohttp_transport import LiteLLMAiohttpTransport
+from litellm.llms.custom_httpx.http2_transport import (
+    HTTP2ConnectionPool,
+    LiteLLMHTTP2Transport,
+    get_http2_connection_stats,
+    is_http2_enabled_for_provider,
+    register_http2_host,
+    should_use_http2_transport,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+
+@pytest.fixture(autouse=True)
+def reset_http2_state(monkeypatch):
+    monkeypatch.setattr(litellm, "http2_providers", [])
+    monkeypatch.delenv("LITELLM_HTTP2_PROVIDERS", raising=False)
+    monkeypatch.setattr(http2_transport, "_http2_hosts", set())
+    monkeypatch.setattr(http2_transport, "_http2_connection_pools", {})
+
+
+def test_http2_enabled_for_provider(monkeypatch):
+    assert is_http2_enabled_for_provider("openai") is False
+    assert should_use_http2_transport("openai") is False
+
+    litellm.http2_providers = ["openai"]
+    assert is_http2_enabled_for_provider("openai") is True
+    assert is_http2_enabled_for_provider(litellm.LlmProviders.OPENAI) is True
+    assert is_http2_enabled_for_provider("anthropic") is False
+
+    monkeypatch.setenv("LITELLM_HTTP2_PROVIDERS", "anthropic, azure")
+    assert is_http2_enabled_for_provider("anthropic") is True
+    assert is_http2_enabled_for_provider("azure") is True
+
+
+def test_registered_host_wraps_every_client():
+    register_http2_host("https://my-endpoint.openai.azure.com/openai/deployments")
+
+    assert http2_transport._http2_hosts == {"my-endpoint.openai.azure.com"}
+    assert should_use_http2_transport(None) is True
+
+
+def test_registering_a_host_drops_clients_cached_without_http2(monkeypatch):
+    from litellm.caching.llm_caching_handler import LLMClientCache
+    from litellm.llms.custom_httpx.http_handler import get_async_httpx_client
+
+    monkeypatch.setattr(litellm, "in_memory_llm_clients_cache", LLMClientCache())
+    client = get_async_httpx_client(llm_provider="azure")
+    # clients share a pooled transport, see transport_pool.py
+    assert not isinstance(client.client._transport.transport, LiteLLMHTTP2Transport)
+
+    register_http2_host("https://my-endpoint.openai.azure.com")
+    new_client = get_async_httpx_client(llm_provider="azure")
+    assert new_client is not client
+    assert isinstance(new_client.client._transport.transport, LiteLLMHTTP2Transport)
+
+    # registering the same host again keeps the cached clients
+    register_http2_host("https://my-endpoint.openai.azure.com/openai")
+    assert get_async_httpx_client(llm_provider="azure") is new_client
+
+
+def test_http2_connection_stats_without_httpcore_internals():
+    pytest.importorskip("h2")
+    pool = http2_transport.get_http2_connection_pool()
+    pool._get_host_state("api.openai.com")
+    with patch.object(pool.transport, "_pool", None):
+        [stats] = pool.get_stats()
+    assert stats["open_connections"] is None
+    assert stats["idle_connections"] is None
+
+    [stats] = pool.get_stats()
+    assert stats["open_connections"] == 0
+
+
+def test_async_http_handler_transport():
+    """The transport is only wrapped when HTTP/2 is configured"""
+    with patch.object(litellm, "disable_aiohttp_transport", False):
+        client = AsyncHTTPHandler(llm_provider="openai")
+        assert isinstance(client.client._transport, LiteLLMAiohttpTransport)
+
+        litellm.http2_providers = ["openai"]
+        client = AsyncHTTPHandler(llm_provider="openai")
+        transport = client.client._transport
+        assert isinstance(transport, LiteLLMHTTP2Transport)
+        assert transport.all_hosts is True
+        assert isinstance(transport.transport, LiteLLMAiohttpTransport)
+
+        client = AsyncHTTPHandler(llm_provider="anthropic")
+        assert isinstance(client.client._transport, LiteLLMAiohttpTransport)
+
+
+@pytest.mark.asyncio
+async def test_http2_transport_routes_by_host():
+    register_http2_host("https://http2.example.com")
+    http2_requests = []
+
+    class MockHTTP2Pool:
+        async def handle_async_request(self, request):
+            http2_requests.append(request.url.host)
+            return httpx.Response(200, content=b"http2")
+
+    transport = LiteLLMHTTP2Transport(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"http1"))
+    )
+    with patch.object(
+        http2_transport, "get_http2_connection_pool", return_value=MockHTTP2Pool()
+    ):
+        async with httpx.AsyncClient(transport=transport) as client:
+            assert (await client.get("https://http2.example.com/v1")).content == b"http2"
+            assert (await client.get("https://other.example.com/v1")).content == b"http1"
+
+    assert http2_requests == ["http2.example.com"]
+
+
+def _mock_h2_transport_response(pool: HTTP2ConnectionPool, gate: asyncio.Event):
+    """Replace the pool's HTTP/2 transport call - every request opens a new connection"""
+
+    async def handle_async_request(request):
+        await request.extensions["trace"]("connection.connect_tcp.complete", {})
+        await gate.wait()
+        return httpx.Response(200, stream=httpx.ByteStream(b"data: hi\n\n"))
+
+    return patch.object(pool.transport, "handle_async_request", handle_async_request)
+
+
+@pytest.mark.asyncio
+async def test_http2_pool_limits_streams_per_host():
+    pytest.importorskip("h2")
+    pool = HTTP2ConnectionPool(verify=False, max_concurrent_streams_per_host=2)
+    gate = asyncio.Event()
+
+    with _mock_h2_transport_response(pool, gate):
+        tasks = [
+            asyncio.create_task(
+                pool.handle_async_request(httpx.Request("POST", "https://api.openai.com/v1"))
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        [stats] = pool.get_stats()
+        assert stats["requests_in_flight"] == 2
+        assert stats["stream_utilization"] == 1.0
+
+        gate.set()
+        responses = await asyncio.gather(*tasks[:2])
+        await asyncio.sleep(0.01)
+        # the stream slot is held until the response body is closed
+        assert tasks[2].done() is False
+
+        await responses[0].aread()
+        await responses[0].aclose()
+        third_response = await asyncio.wait_for(tasks[2], timeout=1)
+        for response in (responses[1], third_response):
+            await response.aread()
+            await response.aclose()
+
+    [stats] = pool.get_stats()
+    assert stats["host"] == "api.openai.com"
+    assert stats["requests_in_flight"] == 0
+    assert stats["peak_requests_in_flight"] == 2
+    assert stats["requests_total"] == 3
+    assert stats["connections_opened"] == 3
+    assert stats["new_connection_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_http2_connection_stats_and_prewarm():
+    pytest.importorskip("h2")
+    litellm.http2_providers = ["anthropic"]
+    client = AsyncHTTPHandler(llm_provider="anthropic")
+    transport = client.client._transport
+    assert isinstance(transport, LiteLLMHTTP2Transport)
+
+    pool = http2_transport.get_http2_connection_pool()
+    assert http2_transport.get_http2_connection_pool() is pool
+    # the HTTP/2 pool never shares the cached SSL context of HTTP/1.1 clients
+    ssl_context = pool.transport._pool._ssl_context
+    assert ssl_context is not litellm.llms.custom_httpx.http_handler.get_ssl_configuration()
+
+    gate = asyncio.Event()
+    gate.set()
+    with _mock_h2_transport_response(pool, gate):
+        await http2_transport.prewarm_http2_connections(
+            ["https://api.anthropic.com/v1/messages", "https://api.anthropic.com"]
+        )
+        response = await client.post("https://api.anthropic.com/v1/messages", json={})
+        assert response.status_code == 200
+
+    [stats] = get_http2_connection_stats()
+    assert stats["host"] == "api.anthropic.com"
+    # one pre-warm request per host
+    assert stats["requests_total"] == 2
+    assert stats["stream_utilization"] is None
+
+
+def test_router_http2_deployment_registers_host():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "azure/gpt-4o",
+                    "api_base": "https://my-endpoint.openai.azure.com",
+                    "api_key": "fake-key",
+                    "http2": True,
+                },
+            },
+            {
+                "model_name": "claude",
+                "litellm_params": {
+                    "model": "anthropic/claude-sonnet-4-5",
+                    "api_key": "fake-key",
+                    "http2": True,
+                },
+            },
+            {
+                "model_name": "gpt-4o-mini",
+                "litellm_params": {"model": "openai/gpt-4o-mini", "api_key": "fake-key"},
+            },
+        ]
+    )
+
+    assert http2_transport._http2_hosts == {
+        "my-endpoint.openai.azure.com",
+        "api.anthropic.com",
+    }
+    assert "http2" in litellm.types.utils.all_litellm_params
+    router.reset()
+
+
+def test_http2_pool_is_per_event_loop():
+    pytest.importorskip("h2")
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def _request():
+        pool = http2_transport.get_http2_connection_pool()
+        response = await pool.handle_async_request(httpx.Request("GET", url))
+        await response.aread()
+        await response.aclose()
+        return pool, response.status_code
+
+    try:
+        first_pool, first_status = asyncio.run(_request())
+        # the first loop is closed - its pooled connection must not be reused
+        second_pool, second_status = asyncio.run(_request())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first_status == second_status == 200
+    assert second_pool is not first_pool
+    get_http2_connection_stats()
+    assert list(http2_transport._http2_connection_pools.values()) == []
+
+
+@pytest.mark.asyncio
+async def test_router_holds_http2_prewarm_task():
+    with patch.object(
+        http2_transport, "prewarm_http2_connections", new=AsyncMock()
+    ) as mock_prewarm:
+        router = litellm.Router(
+            model_list=[
+                {
+                    "model_name": "claude",
+                    "litellm_params": {
+                        "model": "anthropic/claude-sonnet-4-5",
+                        "api_key": "fake-key",
+                        "http2": True,
+                    },
+                }
+            ]
+        )
+        [task] = router._http2_prewarm_tasks
+        await task
+
+    mock_prewarm.assert_awaited_once_with(api_bases=["https://api.anthropic.com"])
+    assert router._http2_prewarm_tasks == set()
+    router.reset()
@@ -0,0 +1,223 @@
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.caching.llm_caching_handler import LLMClientCache
+from litellm.llms.custom_httpx.http_handler import (
+    AsyncHTTPHandler,
+    _get_async_httpx_client_cache_key,
+    get_async_httpx_client,
+)
+from litellm.llms.custom_httpx.transport_pool import (
+    HTTPTransportPool,
+    SharedTransport,
+    get_http_transport_config,
+    http_transport_pool,
+)
+
+
+class MockPooledTransport(httpx.MockTransport):
+    def __init__(self):
+        super().__init__(lambda request: httpx.Response(200, json={"ok": True}))
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _get_config(**kwargs):
+    return get_http_transport_config(
+        ssl_config=kwargs.get("ssl_config", True),
+        cert=None,
+        use_aiohttp_transport=kwargs.get("use_aiohttp_transport", True),
+        llm_provider=kwargs.get("llm_provider"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_transport_closed_with_last_reference():
+    pool = HTTPTransportPool()
+    config = _get_config()
+    created = []
+
+    def create_transport():
+        created.append(MockPooledTransport())
+        return created[-1]
+
+    first = pool.acquire(config, create_transport)
+    second = pool.acquire(config, create_transport)
+    assert len(created) == 1
+    assert first.transport is second.transport
+
+    await first.aclose()
+    # closing twice does not release the reference of `second`
+    await first.aclose()
+    assert created[0].closed is False
+    [stats] = pool.get_stats()
+    assert stats["references"] == 1
+
+    await second.aclose()
+    assert created[0].closed is True
+    assert pool.get_stats() == []
+
+    # the next client gets a new transport
+    pool.acquire(config, create_transport)
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_transport_pool_stats():
+    pool = HTTPTransportPool()
+    shared = pool.acquire(_get_config(), MockPooledTransport)
+
+    async with httpx.AsyncClient(transport=shared) as client:
+        await client.get("https://api.openai.com/v1/models")
+        await client.post("https://api.openai.com/v1/chat/completions")
+        await client.post("https://api.anthropic.com/v1/messages")
+        [stats] = pool.get_stats()
+
+    assert stats["transport"] == "aiohttp"
+    assert stats["http_version"] == "1.1"
+    assert stats["references"] == 1
+    assert stats["requests_total"] == 3
+    assert stats["requests_in_flight"] == 0
+    assert stats["requests_per_host"] == {"api.openai.com": 2, "api.anthropic.com": 1}
+    # closing the client released the transport
+    assert pool.get_stats() == []
+
+
+@pytest.mark.asyncio
+async def test_release_waits_for_in_flight_requests():
+    pool = HTTPTransportPool()
+    created = []
+
+    def create_transport():
+        created.append(MockPooledTransport())
+        return created[-1]
+
+    shared = pool.acquire(_get_config(), create_transport)
+    client = httpx.AsyncClient(transport=shared)
+    async with client.stream("GET", "https://api.openai.com/v1/models") as response:
+        shared.release()
+        assert pool.get_stats() == []
+        # the stream still uses the transport
+        assert created[0].closed is False
+        await response.aread()
+    # closed in the background
+    await asyncio.sleep(0.01)
+    assert created[0].closed is True
+
+    # a released client takes a new reference when it is used again
+    response = await client.get("https://api.openai.com/v1/models")
+    assert response.status_code == 200
+    assert len(created) == 2
+    [stats] = pool.get_stats()
+    assert stats["references"] == 1
+    await client.aclose()
+    assert created[1].closed is True
+
+
+@pytest.mark.asyncio
+async def test_client_cache_eviction_releases_shared_transport():
+    cache = LLMClientCache()
+    client = AsyncHTTPHandler(use_shared_transport=True)
+    pooled = client.client._transport.pooled
+    references = pooled.references
+
+    cache.set_cache(key="client", value=client, ttl=0)
+    await asyncio.sleep(0.01)
+    assert cache.get_cache("client") is None
+    assert pooled.references == references - 1
+
+    client = AsyncHTTPHandler(use_shared_transport=True)
+    cache.set_cache(key="client", value=client)
+    references = client.client._transport.pooled.references
+    cache.flush_cache()
+    assert client.client._transport.pooled.references == references - 1
+
+
+def test_shared_transport_connection_limits(monkeypatch):
+    from litellm.llms.custom_httpx import http_handler
+
+    monkeypatch.setattr(http_handler, "SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS", 1000)
+    monkeypatch.setattr(
+        http_handler, "SHARED_HTTP_TRANSPORT_MAX_CONNECTIONS_PER_HOST", 0
+    )
+    monkeypatch.setattr(http_handler, "TCPConnector", lambda **kwargs: kwargs)
+    monkeypatch.setattr(http_handler, "ClientSession", lambda **kwargs: kwargs)
+    connectors = [
+        AsyncHTTPHandler._create_aiohttp_transport(
+            shared_transport=shared_transport
+        ).client()["connector"]
+        for shared_transport in (True, False)
+    ]
+
+    shared_kwargs, client_kwargs = connectors
+    assert shared_kwargs["limit"] == 1000
+    assert "limit_per_host" not in shared_kwargs
+    assert client_kwargs["limit"] == http_handler.AIOHTTP_CONNECTOR_LIMIT
+    assert (
+        client_kwargs["limit_per_host"] == http_handler.AIOHTTP_CONNECTOR_LIMIT_PER_HOST
+    )
+
+
+def test_transport_config_ignores_timeouts_and_providers():
+    assert _get_config(llm_provider="openai") == _get_config(llm_provider="anthropic")
+    assert _get_config(ssl_config=False) != _get_config(ssl_config=True)
+    assert _get_config(use_aiohttp_transport=False) != _get_config()
+
+
+def test_transport_config_http2_provider(monkeypatch):
+    monkeypatch.setattr(litellm, "http2_providers", ["openai"])
+    assert _get_config(llm_provider="openai").http_version == "2"
+    assert _get_config(llm_provider="anthropic").http_version == "1.1"
+
+
+@pytest.mark.asyncio
+async def test_get_async_httpx_client_shares_transport_across_timeouts():
+    short_timeout_client = get_async_httpx_client(
+        llm_provider=litellm.LlmProviders.OPENAI, params={"timeout": 5.0}
+    )
+    long_timeout_client = get_async_httpx_client(
+        llm_provider=litellm.LlmProviders.ANTHROPIC,
+        params={"timeout": httpx.Timeout(timeout=600.0, connect=5.0)},
+    )
+    other_ssl_client = get_async_httpx_client(
+        llm_provider=litellm.LlmProviders.OPENAI,
+        params={"timeout": 5.0, "ssl_verify": False},
+    )
+
+    short_transport = short_timeout_client.client._transport
+    long_transport = long_timeout_client.client._transport
+    assert isinstance(short_transport, SharedTransport)
+    assert short_transport.pooled is long_transport.pooled
+    assert other_ssl_client.client._transport.pooled is not short_transport.pooled
+    # the timeout stays per client
+    assert short_timeout_client.client.timeout.read == 5.0
+    assert long_timeout_client.client.timeout.read == 600.0
+
+    references = short_transport.pooled.references
+    await short_timeout_client.close()
+    assert short_transport.pooled.references == references - 1
+    assert short_transport.pooled in http_transport_pool._transports.values()
+
+    await long_timeout_client.close()
+    await other_ssl_client.close()
+
+
+def test_async_httpx_client_cache_key():
+    assert _get_async_httpx_client_cache_key(
+        litellm.LlmProviders.OPENAI, {"timeout": 5.0, "ssl_verify": False}
+    ) == _get_async_httpx_client_cache_key(
+        "openai", {"ssl_verify": False, "timeout": 5.0}
+    )
+    assert _get_async_httpx_client_cache_key(
+        "openai", {"timeout": 5.0}
+    ) != _get_async_httpx_client_cache_key("openai", {"timeout": 50.0})
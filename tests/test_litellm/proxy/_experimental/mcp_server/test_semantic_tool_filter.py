@@ -392,3 +392,55 @@ async def test_semantic_filter_hook_skips_no_tools():
     assert result is None, "Hook should skip requests without tools"
     print("✅ Hook correctly skips requests without tools")
 
+
+
+@pytest.mark.asyncio
+async def test_semantic_filter_batch_embeddings_share_one_call():
+    """
+    Test that with batch_embeddings, concurrent queries are embedded in one
+    router call and the router is matched on the precomputed vector.
+    """
+    from litellm.proxy._experimental.mcp_server.semantic_tool_filter import (
+        SemanticMCPToolFilter,
+    )
+
+    tools = [
+        MCPTool(name="gmail_send", description="Send an email", inputSchema={"type": "object"}),
+        MCPTool(name="calendar_create", description="Create an event", inputSchema={"type": "object"}),
+    ]
+
+    async def mock_embedding_async(model, input, **kwargs):
+        return {
+            "data": [
+                {"embedding": [float(len(text))], "index": i}
+                for i, text in enumerate(input)
+            ]
+        }
+
+    mock_router = Mock()
+    mock_router.aembedding = AsyncMock(side_effect=mock_embedding_async)
+
+    filter_instance = SemanticMCPToolFilter(
+        embedding_model="text-embedding-3-small",
+        litellm_router_instance=mock_router,
+        top_k=1,
+        enabled=True,
+        batch_embeddings=True,
+    )
+    filter_instance._tool_map = {t.name: t for t in tools}
+    filter_instance.tool_router = Mock(return_value=[Mock(name="match")])
+    filter_instance.tool_router.return_value[0].name = "gmail_send"
+
+    results = await asyncio.gather(
+        filter_instance.filter_tools(query="send an email", available_tools=tools),
+        filter_instance.filter_tools(query="email bob", available_tools=tools),
+    )
+
+    assert [[t.name for t in r] for r in results] == [["gmail_send"], ["gmail_send"]]
+    mock_router.aembedding.assert_called_once()
+    assert mock_router.aembedding.call_args.kwargs["input"] == [
+        "send an email",
+        "email bob",
+    ]
+    vectors = [c.kwargs["vector"] for c in filter_instance.tool_router.call_args_list]
+    assert vectors == [[13.0], [9.0]]
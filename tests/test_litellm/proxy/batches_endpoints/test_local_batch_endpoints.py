@@ -0,0 +1,164 @@
+import json
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm import Router
+from litellm.batches.local_batch_executor import LocalBatchExecutor
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+from litellm.proxy.batches_endpoints import local_batch_endpoints
+from litellm.proxy.proxy_server import app
+
+client = TestClient(app)
+
+BATCH_ID = "local_batch_" + "0" * 32
+BATCH_INPUT = (
+    json.dumps(
+        {
+            "custom_id": "request-1",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"messages": [{"role": "user", "content": "hi"}]},
+        }
+    )
+    + "\n"
+).encode("utf-8")
+
+
+@pytest.fixture
+def llm_router(monkeypatch, tmp_path) -> Router:
+    llm_router = Router(
+        model_list=[
+            {
+                "model_name": "batch-model",
+                "litellm_params": {
+                    "model": "openai/gpt-4o-mini",
+                    "api_key": "fake-key",
+                    "mock_response": "hi",
+                },
+            }
+        ]
+    )
+    monkeypatch.setattr("litellm.proxy.proxy_server.llm_router", llm_router)
+    monkeypatch.setattr(local_batch_endpoints, "LOCAL_BATCH_STORAGE_DIR", str(tmp_path))
+    monkeypatch.setattr(local_batch_endpoints, "local_batch_executors", {})
+    yield llm_router
+    app.dependency_overrides.pop(user_api_key_auth, None)
+
+
+def _use_key(api_key: str, user_role=LitellmUserRoles.INTERNAL_USER) -> None:
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        api_key=api_key, user_role=user_role
+    )
+
+
+def test_retrieve_local_batch_only_for_creating_key(llm_router, tmp_path):
+    LocalBatchExecutor.create(
+        router=llm_router,
+        batch_dir=str(tmp_path / BATCH_ID),
+        input_file=BATCH_INPUT,
+        model="batch-model",
+        request_metadata={"user_api_key": "hashed-key-1"},
+        batch_id=BATCH_ID,
+    )
+
+    _use_key("hashed-key-1")
+    response = client.get(f"/v1/local_batches/{BATCH_ID}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "validating"
+    assert response.json()["request_counts"]["total"] == 1
+
+    _use_key("hashed-key-2")
+    assert client.get(f"/v1/local_batches/{BATCH_ID}").status_code == 404
+
+    _use_key("hashed-key-2", user_role=LitellmUserRoles.PROXY_ADMIN)
+    assert client.get(f"/v1/local_batches/{BATCH_ID}").status_code == 200
+
+
+def test_retrieve_local_batch_rejects_invalid_batch_ids(llm_router, tmp_path):
+    _use_key("hashed-key-1", user_role=LitellmUserRoles.PROXY_ADMIN)
+    # an existing directory that is not a batch id is never read
+    (tmp_path / "other").mkdir()
+    assert client.get("/v1/local_batches/other").status_code == 404
+    assert client.get(f"/v1/local_batches/{BATCH_ID}").status_code == 404
+
+
+def test_create_local_batch_invalid_input(llm_router, tmp_path):
+    _use_key("hashed-key-1")
+    response = client.post(
+        "/v1/local_batches",
+        files={"file": ("batch.jsonl", b'{"custom_id": "a"}\n', "application/jsonl")},
+        data={"model": "batch-model"},
+    )
+    assert response.status_code == 400
+    assert "body" in response.text
+    # the rejected batch leaves no files behind
+    assert os.listdir(tmp_path) == []
+
+    response = client.post(
+        "/v1/local_batches",
+        files={"file": ("batch.jsonl", BATCH_INPUT, "application/jsonl")},
+        data={"model": "unknown-model"},
+    )
+    assert response.status_code == 400
+
+
+def test_create_local_batch_checks_model_access_of_every_line(llm_router, tmp_path):
+    """Lines without a batch `model` are checked against the key's models too"""
+    llm_router.add_deployment(
+        litellm.types.router.Deployment(
+            model_name="restricted-model",
+            litellm_params={"model": "openai/gpt-4o", "api_key": "fake-key"},
+        )
+    )
+    batch_input = b"".join(
+        json.dumps(
+            {
+                "custom_id": f"request-{model}",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": "hi"}],
+                },
+            }
+        ).encode("utf-8")
+        + b"\n"
+        for model in ("batch-model", "restricted-model")
+    )
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        api_key="hashed-key-1",
+        user_role=LitellmUserRoles.INTERNAL_USER,
+        models=["batch-model"],
+    )
+    response = client.post(
+        "/v1/local_batches",
+        files={"file": ("batch.jsonl", batch_input, "application/jsonl")},
+    )
+    assert response.status_code == 401
+    assert "restricted-model" in response.text
+    assert os.listdir(tmp_path) == []
+
+
+def test_create_local_batch_checks_key_budget(llm_router, tmp_path):
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        api_key="hashed-key-1",
+        user_role=LitellmUserRoles.INTERNAL_USER,
+        spend=10.0,
+        max_budget=5.0,
+    )
+    response = client.post(
+        "/v1/local_batches",
+        files={"file": ("batch.jsonl", BATCH_INPUT, "application/jsonl")},
+        data={"model": "batch-model"},
+    )
+    assert response.status_code == 400
+    assert "Budget has been exceeded" in response.text
+    assert os.listdir(tmp_path) == []
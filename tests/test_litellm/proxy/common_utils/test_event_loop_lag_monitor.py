@@ -0,0 +1,47 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.common_utils.event_loop_lag_monitor import EventLoopLagMonitor
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_detects_blocking_call():
+    monitor = EventLoopLagMonitor(interval_seconds=0.01)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    # block the loop without yielding
+    time.sleep(0.2)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert monitor.max_lag_seconds >= 0.15
+    assert monitor._task is None
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor_disabled_when_interval_is_zero():
+    monitor = EventLoopLagMonitor(interval_seconds=0)
+    monitor.start()
+    assert monitor._task is None
+    await monitor.stop()
+
+
+def test_event_loop_lag_monitor_records_to_prometheus():
+    from litellm.integrations.prometheus import PrometheusLogger
+
+    prometheus_logger = MagicMock(spec=PrometheusLogger)
+    monitor = EventLoopLagMonitor(interval_seconds=0.5)
+    with patch("litellm.callbacks", [prometheus_logger]):
+        monitor._record(0.3)
+
+    prometheus_logger._record_event_loop_lag.assert_called_once_with(0.3)
+    assert monitor.last_lag_seconds == 0.3
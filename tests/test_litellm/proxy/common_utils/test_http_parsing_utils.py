@@ -1,11 +1,13 @@
+import io
 import json
 import os
 import sys
+import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import orjson
 import pytest
-from fastapi import Request
+from fastapi import Request, UploadFile
 from fastapi.testclient import TestClient
 
 sys.path.insert(
@@ -16,11 +18,13 @@ sys.path.insert(
 import litellm
 from litellm.proxy._types import ProxyException
 from litellm.proxy.common_utils.http_parsing_utils import (
+    UploadFileStream,
     _read_request_body,
     _safe_get_request_headers,
     _safe_get_request_parsed_body,
     _safe_get_request_query_params,
     _safe_set_request_parsed_body,
+    convert_upload_files_to_file_data,
     get_form_data,
     get_request_body,
     get_tags_from_request_body,
@@ -761,3 +765,66 @@ async def test_request_body_with_html_script_tags():
             f"Message content with HTML was modified during parsing: "
             f"expected={msg['content']!r}, got={result['messages'][2]['content']!r}"
         )
+
+
+def _make_upload_file(content: bytes, filename: str = "batch.jsonl") -> UploadFile:
+    spooled_file = tempfile.SpooledTemporaryFile(max_size=16)
+    spooled_file.write(content)
+    spooled_file.seek(0)
+    return UploadFile(
+        file=spooled_file,
+        filename=filename,
+        size=len(content),
+        headers={"content-type": "application/jsonl"},  # type: ignore[arg-type]
+    )
+
+
+def test_upload_file_stream_reads_spooled_upload():
+    """UploadFileStream reads the spooled upload in chunks and can be rewound"""
+    content = b'{"custom_id": "1"}\n{"custom_id": "2"}\n'
+    upload_file = _make_upload_file(content)
+    upload_file.file.read(5)  # a consumer already read part of the upload
+
+    stream = UploadFileStream(upload_file)
+
+    assert stream.name == "batch.jsonl"
+    assert stream.content_type == "application/jsonl"
+    assert len(stream) == len(content)
+    assert bool(stream) is True
+    assert stream.readline() == b'{"custom_id": "1"}\n'
+    stream.seek(0)
+    assert b"".join(iter(lambda: stream.read(7), b"")) == content
+    stream.seek(0)
+    assert io.BufferedReader(stream, buffer_size=4).read() == content
+
+
+def test_upload_file_stream_len_without_size():
+    content = b"audio-bytes"
+    upload_file = _make_upload_file(content)
+    upload_file.size = None
+
+    stream = UploadFileStream(upload_file)
+    stream.read(3)
+
+    assert len(stream) == len(content)
+    assert stream.tell() == 3
+
+
+@pytest.mark.asyncio
+async def test_convert_upload_files_to_file_data_stream_files():
+    """stream_files=True passes file objects instead of reading the uploads"""
+    content = b"file-content"
+    form_data = {
+        "file": _make_upload_file(content, filename="a.txt"),
+        "files": [_make_upload_file(content, filename="b.txt")],
+        "purpose": "batch",
+    }
+
+    data = await convert_upload_files_to_file_data(form_data, stream_files=True)
+
+    filename, file_content, _ = data["file"][0]
+    assert filename == "a.txt"
+    assert isinstance(file_content, UploadFileStream)
+    assert file_content.read() == content
+    assert isinstance(data["files"][0][1], UploadFileStream)
+    assert data["purpose"] == "batch"
@@ -25,9 +25,59 @@ class MockLiteLLMTeamMembership:
         return {"count": 1}
 
 
+_TABLE_TO_ENTITY = {
+    "LiteLLM_VerificationToken": "key",
+    "LiteLLM_UserTable": "user",
+    "LiteLLM_TeamTable": "team",
+}
+
+
 class MockDB:
-    def __init__(self):
+    """
+    Simulates the raw SQL issued by the set-based budget reset against `data`
+    """
+
+    def __init__(self, data: Dict[str, List[Any]]):
         self.litellm_teammembership = MockLiteLLMTeamMembership()
+        self.data = data
+        self.queries: List[str] = []
+
+    def _due_items(self, sql: str, now: str) -> List[Any]:
+        entity_type = next(
+            entity for table, entity in _TABLE_TO_ENTITY.items() if table in sql
+        )
+        now_dt = datetime.fromisoformat(now)
+        return [
+            item
+            for item in self.data[entity_type]
+            if item.budget_reset_at is not None
+            and item.budget_reset_at.replace(tzinfo=None) < now_dt
+        ]
+
+    async def query_raw(self, sql: str, *params):
+        self.queries.append(sql)
+        if "SELECT DISTINCT" in sql:
+            durations = {item.budget_duration for item in self._due_items(sql, params[0])}
+            return [{"budget_duration": d} for d in durations]
+
+        # UPDATE ... RETURNING
+        if '"budget_duration" IS NULL' in sql:
+            now, limit = params
+            new_reset_at, duration = None, None
+        else:
+            now, new_reset_at, duration, limit = params
+        matched = [
+            item
+            for item in self._due_items(sql, now)
+            if item.budget_duration == duration and (duration or item.spend != 0)
+        ][:limit]
+        for item in matched:
+            item.spend = 0.0
+            if new_reset_at is not None:
+                item.budget_reset_at = datetime.fromisoformat(new_reset_at).replace(
+                    tzinfo=timezone.utc
+                )
+        return [{"id": item.id} for item in matched]
 
 
 class MockPrismaClient:
@@ -46,7 +96,7 @@ class MockPrismaClient:
             "budget": [],
             "enduser": [],
         }
-        self.db = MockDB()
+        self.db = MockDB(data=self.data)
 
     async def get_data(self, table_name, query_type, **kwargs):
         data = self.data.get(table_name, [])
@@ -89,8 +139,11 @@ class MockPrismaClient:
 
 class MockProxyLogging:
     class MockServiceLogging:
+        def __init__(self):
+            self.success_events: List[Dict[str, Any]] = []
+
         async def async_service_success_hook(self, **kwargs):
-            pass
+            self.success_events.append(kwargs)
 
         async def async_service_failure_hook(self, **kwargs):
             pass
@@ -142,11 +195,10 @@ def test_reset_budget_for_key(reset_budget_job, mock_prisma_client):
     # Run the test
     asyncio.run(reset_budget_job.reset_budget_for_litellm_keys())
 
-    # Verify results
-    assert len(mock_prisma_client.updated_data["key"]) == 1
-    updated_key = mock_prisma_client.updated_data["key"][0]
-    assert updated_key.spend == 0.0
-    assert updated_key.budget_reset_at > now
+    # Verify results - reset happens in the db, rows are never loaded
+    assert mock_prisma_client.updated_data["key"] == []
+    assert test_key.spend == 0.0
+    assert test_key.budget_reset_at > now
 
 
 def test_reset_budget_for_user(reset_budget_job, mock_prisma_client):
@@ -169,10 +221,8 @@ def test_reset_budget_for_user(reset_budget_job, mock_prisma_client):
     asyncio.run(reset_budget_job.reset_budget_for_litellm_users())
 
     # Verify results
-    assert len(mock_prisma_client.updated_data["user"]) == 1
-    updated_user = mock_prisma_client.updated_data["user"][0]
-    assert updated_user.spend == 0.0
-    assert updated_user.budget_reset_at > now
+    assert test_user.spend == 0.0
+    assert test_user.budget_reset_at > now
 
 
 def test_reset_budget_for_team(reset_budget_job, mock_prisma_client):
@@ -195,10 +245,8 @@ def test_reset_budget_for_team(reset_budget_job, mock_prisma_client):
     asyncio.run(reset_budget_job.reset_budget_for_litellm_teams())
 
     # Verify results
-    assert len(mock_prisma_client.updated_data["team"]) == 1
-    updated_team = mock_prisma_client.updated_data["team"][0]
-    assert updated_team.spend == 0.0
-    assert updated_team.budget_reset_at > now
+    assert test_team.spend == 0.0
+    assert test_team.budget_reset_at > now
 
 
 def test_reset_budget_for_enduser(reset_budget_job, mock_prisma_client):
@@ -309,14 +357,98 @@ def test_reset_budget_all(reset_budget_job, mock_prisma_client):
     asyncio.run(reset_budget_job.reset_budget())
 
     # Verify results
-    assert len(mock_prisma_client.updated_data["key"]) == 1
-    assert len(mock_prisma_client.updated_data["user"]) == 1
-    assert len(mock_prisma_client.updated_data["team"]) == 1
     assert len(mock_prisma_client.updated_data["enduser"]) == 1
     assert len(mock_prisma_client.updated_data["budget"]) == 1
 
     # Check that all spends were reset to 0
-    assert mock_prisma_client.updated_data["key"][0].spend == 0.0
-    assert mock_prisma_client.updated_data["user"][0].spend == 0.0
-    assert mock_prisma_client.updated_data["team"][0].spend == 0.0
+    assert test_key.spend == 0.0
+    assert test_user.spend == 0.0
+    assert test_team.spend == 0.0
     assert mock_prisma_client.updated_data["enduser"][0].spend == 0.0
+
+
+def _make_key(key_id: str, budget_reset_at: datetime, budget_duration="30d"):
+    return type(
+        "LiteLLM_VerificationToken",
+        (),
+        {
+            "spend": 10.0,
+            "budget_duration": budget_duration,
+            "budget_reset_at": budget_reset_at,
+            "id": key_id,
+        },
+    )
+
+
+def test_reset_budget_for_keys_is_paginated(mock_prisma_client, mock_proxy_logging):
+    """
+    Due keys are reset in bounded UPDATE pages, and only summary counts are logged
+    """
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    future = datetime.now(timezone.utc) + timedelta(days=1)
+    due_keys = [_make_key(f"key-{i}", past) for i in range(5)]
+    not_due_key = _make_key("key-not-due", future)
+    mock_prisma_client.data["key"] = due_keys + [not_due_key]
+
+    job = ResetBudgetJob(
+        proxy_logging_obj=mock_proxy_logging,
+        prisma_client=mock_prisma_client,
+        page_size=2,
+    )
+
+    async def _run():
+        await job.reset_budget_for_litellm_keys()
+        await asyncio.sleep(0)  # let the service logging task run
+
+    asyncio.run(_run())
+
+    assert all(key.spend == 0.0 for key in due_keys)
+    assert not_due_key.spend == 10.0
+    update_queries = [q for q in mock_prisma_client.db.queries if "UPDATE" in q]
+    assert len(update_queries) == 3  # pages of 2, 2, 1
+
+    event = mock_proxy_logging.service_logging_obj.success_events[0]
+    assert event["event_metadata"] == {
+        "num_budget_durations": 1,
+        "num_keys_updated": 5,
+    }
+
+
+def test_reset_budget_updates_cached_objects(mock_prisma_client, mock_proxy_logging):
+    """
+    Cached team objects are reset in place so auth checks see the new spend
+    """
+    from litellm.caching.dual_cache import DualCache
+
+    past = datetime.now(timezone.utc) - timedelta(minutes=1)
+    test_team = type(
+        "LiteLLM_TeamTable",
+        (),
+        {
+            "spend": 500.0,
+            "budget_duration": "1d",
+            "budget_reset_at": past,
+            "id": "test-team-1",
+        },
+    )
+    mock_prisma_client.data["team"] = [test_team]
+
+    user_api_key_cache = DualCache()
+    user_api_key_cache.set_cache(
+        key="team_id:test-team-1", value={"team_id": "test-team-1", "spend": 500.0}
+    )
+    user_api_key_cache.set_cache(
+        key="team_id:other-team", value={"team_id": "other-team", "spend": 7.0}
+    )
+
+    job = ResetBudgetJob(
+        proxy_logging_obj=mock_proxy_logging,
+        prisma_client=mock_prisma_client,
+        user_api_key_cache=user_api_key_cache,
+    )
+    asyncio.run(job.reset_budget_for_litellm_teams())
+
+    cached_team = user_api_key_cache.get_cache(key="team_id:test-team-1")
+    assert cached_team["spend"] == 0.0
+    assert cached_team["budget_reset_at"] > past
+    assert user_api_key_cache.get_cache(key="team_id:other-team")["spend"] == 7.0
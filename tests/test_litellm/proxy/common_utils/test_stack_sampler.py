@@ -0,0 +1,122 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+from litellm.proxy.common_utils.stack_sampler import StackSampler, profile_event_loop
+
+
+def _busy_loop_for_profiling(duration: float):
+    end = time.perf_counter() + duration
+    x = 0
+    while time.perf_counter() < end:
+        x += 1
+    return x
+
+
+async def _cpu_bound_coroutine(duration: float):
+    # yield once so the profiler task is already sampling
+    await asyncio.sleep(0.01)
+    _busy_loop_for_profiling(duration)
+
+
+@pytest.mark.asyncio
+async def test_profile_event_loop_collapsed_output_has_expected_frames():
+    busy_task = asyncio.create_task(
+        _cpu_bound_coroutine(0.3), name="busy-profiling-task"
+    )
+    sampler = await profile_event_loop(duration_seconds=0.4, interval_seconds=0.005)
+    await busy_task
+
+    assert sampler.num_samples > 0
+    collapsed = sampler.to_collapsed()
+    busy_lines = [
+        line for line in collapsed.splitlines() if "_busy_loop_for_profiling" in line
+    ]
+    assert len(busy_lines) > 0
+    # samples are attributed to the running asyncio task, root-first
+    assert all(line.startswith("task:busy-profiling-task;") for line in busy_lines)
+    # caller frame comes before the leaf frame
+    assert busy_lines[0].index("_cpu_bound_coroutine") < busy_lines[0].index(
+        "_busy_loop_for_profiling"
+    )
+    for line in collapsed.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+
+
+@pytest.mark.asyncio
+async def test_profile_event_loop_speedscope_output():
+    busy_task = asyncio.create_task(_cpu_bound_coroutine(0.2))
+    sampler = await profile_event_loop(duration_seconds=0.3, interval_seconds=0.005)
+    await busy_task
+
+    profile = sampler.to_speedscope(name="test")
+    frames = profile["shared"]["frames"]
+    sampled = profile["profiles"][0]
+    assert sampled["type"] == "sampled"
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert sum(sampled["weights"]) == sampler.num_samples
+    assert any(frame["name"] == "_busy_loop_for_profiling" for frame in frames)
+    for sample in sampled["samples"]:
+        assert all(0 <= idx < len(frames) for idx in sample)
+
+
+@pytest.mark.asyncio
+async def test_profile_event_loop_overhead_is_low():
+    sampler = await profile_event_loop(duration_seconds=0.5, interval_seconds=0.01)
+    assert sampler.num_samples > 0
+    assert sampler.overhead_ratio < 0.02
+
+
+@pytest.mark.asyncio
+async def test_profile_event_loop_rejects_concurrent_profiles():
+    first = asyncio.create_task(profile_event_loop(duration_seconds=0.2))
+    await asyncio.sleep(0.01)
+    with pytest.raises(RuntimeError):
+        await profile_event_loop(duration_seconds=0.1)
+    await first
+
+
+def test_stack_sampler_rejects_invalid_interval():
+    with pytest.raises(ValueError):
+        StackSampler(interval_seconds=0)
+
+
+@pytest.mark.asyncio
+async def test_profile_cpu_endpoint_is_admin_only():
+    from litellm.proxy.common_utils.debug_utils import profile_cpu_endpoint
+
+    with pytest.raises(HTTPException) as exc_info:
+        await profile_cpu_endpoint(
+            user_api_key_dict=UserAPIKeyAuth(user_role=LitellmUserRoles.INTERNAL_USER),
+            duration_seconds=0.1,
+            interval_ms=10,
+            format="collapsed",
+        )
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_profile_cpu_endpoint_returns_collapsed_stacks():
+    from litellm.proxy.common_utils.debug_utils import profile_cpu_endpoint
+
+    busy_task = asyncio.create_task(_cpu_bound_coroutine(0.2))
+    response = await profile_cpu_endpoint(
+        user_api_key_dict=UserAPIKeyAuth(user_role=LitellmUserRoles.PROXY_ADMIN),
+        duration_seconds=0.3,
+        interval_ms=5,
+        format="collapsed",
+    )
+    await busy_task
+
+    assert int(response.headers["x-litellm-profile-samples"]) > 0
+    assert "_busy_loop_for_profiling" in response.body.decode()
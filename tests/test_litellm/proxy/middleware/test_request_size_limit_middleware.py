@@ -0,0 +1,132 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.exceptions import HTTPException
+
+from litellm.proxy.middleware.request_size_limit_middleware import (
+    RequestSizeLimitMiddleware,
+)
+
+
+@pytest.fixture
+def app_with_middleware():
+    app = FastAPI()
+    app.add_middleware(RequestSizeLimitMiddleware)
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        body = await request.body()
+        return {"received": len(body)}
+
+    @app.post("/swallow")
+    async def swallow(request: Request):
+        try:
+            await request.body()
+        except Exception:
+            pass
+        return {"ok": True}
+
+    return app
+
+
+def _limit_settings(max_request_size_mb=1, premium_user=True):
+    return (
+        patch(
+            "litellm.proxy.proxy_server.general_settings",
+            {"max_request_size_mb": max_request_size_mb},
+        ),
+        patch("litellm.proxy.proxy_server.premium_user", premium_user),
+    )
+
+
+def test_request_within_limit_passes(app_with_middleware):
+    general_settings_patch, premium_patch = _limit_settings()
+    with general_settings_patch, premium_patch:
+        client = TestClient(app_with_middleware)
+        response = client.post("/upload", content=b"a" * 1024)
+    assert response.status_code == 200
+    assert response.json() == {"received": 1024}
+
+
+def test_content_length_over_limit_is_rejected(app_with_middleware):
+    general_settings_patch, premium_patch = _limit_settings()
+    with general_settings_patch, premium_patch:
+        client = TestClient(app_with_middleware)
+        response = client.post("/upload", content=b"a" * (1024 * 1024 + 1))
+    assert response.status_code == 413
+    error = response.json()["error"]
+    assert error["param"] == "content-length"
+    assert "Max size is 1.0 MB" in error["message"]
+
+
+def test_streamed_body_over_limit_stops_reading():
+    """Without a Content-Length, the body is rejected once the limit is crossed."""
+    general_settings_patch, premium_patch = _limit_settings()
+    chunk = b"a" * (256 * 1024)
+    received_chunks = 0
+    sent_messages = []
+
+    async def app(scope, receive, send):
+        nonlocal received_chunks
+        while True:
+            message = await receive()
+            received_chunks += 1
+            if not message.get("more_body", False):
+                break
+
+    async def receive():
+        return {"type": "http.request", "body": chunk, "more_body": True}
+
+    async def send(message):
+        sent_messages.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/upload", "headers": []}
+
+    with general_settings_patch, premium_patch:
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(RequestSizeLimitMiddleware(app)(scope, receive, send))
+
+    assert exc_info.value.status_code == 413
+    # 4 chunks make exactly 1MB - the 5th crosses the limit and is never handed on
+    assert received_chunks == 4
+    assert sent_messages == []
+
+
+def test_swallowed_error_still_returns_413(app_with_middleware):
+    general_settings_patch, premium_patch = _limit_settings()
+
+    def body_stream():
+        for _ in range(8):
+            yield b"a" * (256 * 1024)
+
+    with general_settings_patch, premium_patch:
+        client = TestClient(app_with_middleware)
+        response = client.post("/swallow", content=body_stream())
+    assert response.status_code == 413
+    assert json.loads(response.content)["error"]["code"] == "413"
+
+
+@pytest.mark.parametrize(
+    "max_request_size_mb, premium_user",
+    [(None, True), (1, False)],
+)
+def test_no_limit_enforced(app_with_middleware, max_request_size_mb, premium_user):
+    general_settings_patch, premium_patch = _limit_settings(
+        max_request_size_mb=max_request_size_mb, premium_user=premium_user
+    )
+    with general_settings_patch, premium_patch:
+        client = TestClient(app_with_middleware)
+        response = client.post("/upload", content=b"a" * (2 * 1024 * 1024))
+    assert response.status_code == 200
+    assert response.json() == {"received": 2 * 1024 * 1024}
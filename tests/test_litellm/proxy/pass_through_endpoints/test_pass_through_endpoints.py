@@ -14,6 +14,7 @@ sys.path.insert(
     0, os.path.abspath("../../..")
 )  # Adds the parent directory to the system path
 
+from litellm.proxy.common_utils.http_parsing_utils import UploadFileStream
 from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
     HttpPassThroughEndpointHelpers,
     pass_through_request,
@@ -48,12 +49,15 @@ async def test_build_request_files_from_upload_file():
     # Create SpooledTemporaryFile with content type headers
     headers = Headers({"content-type": "text/plain"})
     upload_file = UploadFile(file=file, filename="test.txt", headers=headers)
-    upload_file.read = AsyncMock(return_value=file_content)
 
     result = await HttpPassThroughEndpointHelpers._build_request_files_from_upload_file(
         upload_file
     )
-    assert result == ("test.txt", file_content, "text/plain")
+    filename, content, content_type = result
+    assert (filename, content_type) == ("test.txt", "text/plain")
+    # the upload is forwarded as a file object, not read into memory
+    assert isinstance(content, UploadFileStream)
+    assert content.read() == file_content
 
     # Test with Starlette UploadFile
     file2 = BytesIO(file_content)
@@ -62,12 +66,13 @@ async def test_build_request_files_from_upload_file():
         filename="test2.txt",
         headers=Headers({"content-type": "text/plain"}),
     )
-    starlette_file.read = AsyncMock(return_value=file_content)
 
     result = await HttpPassThroughEndpointHelpers._build_request_files_from_upload_file(
         starlette_file
     )
-    assert result == ("test2.txt", file_content, "text/plain")
+    filename, content, content_type = result
+    assert (filename, content_type) == ("test2.txt", "text/plain")
+    assert content.read() == file_content
 
 
 # Test make_multipart_http_request
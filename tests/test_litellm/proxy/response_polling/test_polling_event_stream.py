@@ -0,0 +1,252 @@
+"""
+Tests for the `state_backend: redis_stream` polling backend - output events are
+appended to a Redis Stream, the response key only gets output snapshots.
+"""
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.response_polling.polling_handler import (
+    STREAM_STATE_FIELD,
+    ResponsePollingHandler,
+    apply_response_stream_event,
+)
+
+
+class InMemoryStreamRedis:
+    """The RedisCache methods used by ResponsePollingHandler, backed by dicts."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.streams: Dict[str, List[Tuple[str, str]]] = {}
+        self._sequence = 0
+
+    async def async_set_cache(self, key, value, ttl=None, **kwargs):
+        self.values[key] = value
+
+    async def async_get_cache(self, key, **kwargs):
+        return self.values.get(key)
+
+    async def async_delete_cache(self, key):
+        self.values.pop(key, None)
+        self.streams.pop(key, None)
+
+    async def async_stream_append(self, key, values, ttl=None, **kwargs):
+        ids = []
+        for value in values:
+            self._sequence += 1
+            entry_id = f"1-{self._sequence}"
+            self.streams.setdefault(key, []).append((entry_id, value))
+            ids.append(entry_id)
+        return ids
+
+    async def async_stream_range(self, key, after_id=None, count=None, **kwargs):
+        entries = self.streams.get(key, [])
+        if after_id is not None:
+            after = int(after_id.split("-")[1])
+            entries = [e for e in entries if int(e[0].split("-")[1]) > after]
+        return list(entries)
+
+    async def async_stream_trim(self, key, min_id):
+        minimum = int(min_id.split("-")[1])
+        entries = self.streams.get(key, [])
+        self.streams[key] = [e for e in entries if int(e[0].split("-")[1]) >= minimum]
+        return len(entries) - len(self.streams[key])
+
+
+def _message_events(item_id: str, words: List[str]) -> List[dict]:
+    events = [
+        {
+            "type": "response.output_item.added",
+            "item": {"id": item_id, "type": "message", "role": "assistant", "content": []},
+        },
+        {
+            "type": "response.content_part.added",
+            "item_id": item_id,
+            "content_index": 0,
+            "part": {"type": "output_text", "text": ""},
+        },
+    ]
+    events += [
+        {
+            "type": "response.output_text.delta",
+            "item_id": item_id,
+            "content_index": 0,
+            "delta": word,
+        }
+        for word in words
+    ]
+    return events
+
+
+def _item_done(item_id: str, text: str) -> dict:
+    return {
+        "type": "response.output_item.done",
+        "item": {
+            "id": item_id,
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": text}],
+        },
+    }
+
+
+async def _write(handler, polling_id, events, output_items, checkpoint=False):
+    # encode first, like the raw SSE chunks background_streaming_task appends
+    encoded = [json.dumps(e) for e in events]
+    for event in events:
+        apply_response_stream_event(output_items, event)
+    await handler.append_events(
+        polling_id=polling_id,
+        events=encoded,
+        output_items=output_items,
+        checkpoint=checkpoint,
+    )
+
+
+@pytest.fixture
+def redis():
+    return InMemoryStreamRedis()
+
+
+async def _new_response(redis, **kwargs) -> Tuple[ResponsePollingHandler, str]:
+    handler = ResponsePollingHandler(
+        redis_cache=redis, state_backend="redis_stream", **kwargs
+    )
+    polling_id = handler.generate_polling_id()
+    await handler.create_initial_state(polling_id=polling_id, request_data={})
+    return handler, polling_id
+
+
+def test_apply_response_stream_event_accumulates_text():
+    output_items: Dict[str, dict] = {}
+    for event in _message_events("msg_1", ["Hello", " world"]):
+        assert apply_response_stream_event(output_items, event) is True
+    assert output_items["msg_1"]["content"][0]["text"] == "Hello world"
+    assert apply_response_stream_event(output_items, {"type": "response.created"}) is False
+
+
+@pytest.mark.asyncio
+async def test_get_state_rebuilds_output_from_events(redis):
+    handler, polling_id = await _new_response(redis)
+    output_items: Dict[str, dict] = {}
+    await _write(handler, polling_id, _message_events("msg_1", ["Hel", "lo"]), output_items)
+
+    header = json.loads(redis.values[handler.get_cache_key(polling_id)])
+    assert header["output"] == []  # deltas are not written to the header
+
+    state = await handler.get_state(polling_id)
+    assert STREAM_STATE_FIELD not in state
+    assert state["output"][0]["content"][0]["text"] == "Hello"
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_snapshot_output_and_trim_events(redis):
+    handler, polling_id = await _new_response(redis, stream_checkpoint_events=1000)
+    events_key = handler.get_events_key(polling_id)
+    output_items: Dict[str, dict] = {}
+
+    await _write(handler, polling_id, _message_events("msg_1", ["a", "b"]), output_items)
+    await _write(handler, polling_id, [_item_done("msg_1", "ab")], output_items, checkpoint=True)
+    await _write(handler, polling_id, _message_events("msg_2", ["c"]), output_items)
+    await _write(handler, polling_id, [_item_done("msg_2", "c")], output_items, checkpoint=True)
+
+    header = json.loads(redis.values[handler.get_cache_key(polling_id)])
+    checkpoint = header[STREAM_STATE_FIELD]["checkpoint"]
+    trimmed_before = header[STREAM_STATE_FIELD]["trimmed_before"]
+    assert checkpoint == redis.streams[events_key][-1][0]
+    # events up to the previous checkpoint are trimmed
+    assert redis.streams[events_key][0][0] == trimmed_before
+    assert [item["id"] for item in header["output"]] == ["msg_1", "msg_2"]
+
+    state = await handler.get_state(polling_id)
+    assert [item["content"][0]["text"] for item in state["output"]] == ["ab", "c"]
+
+
+@pytest.mark.asyncio
+async def test_periodic_checkpoints_trim_long_output_items(redis):
+    handler, polling_id = await _new_response(redis, stream_checkpoint_events=10)
+    output_items: Dict[str, dict] = {}
+    words = [f"w{i} " for i in range(50)]
+    events = _message_events("msg_1", words)
+    for start in range(0, len(events), 4):
+        await _write(handler, polling_id, events[start : start + 4], output_items)
+
+    # checkpoints after 12, 24 and 48 events - the stream keeps events from 24
+    header = json.loads(redis.values[handler.get_cache_key(polling_id)])
+    assert header["output"][0]["content"][0]["text"] == "".join(words[:46])
+    assert len(redis.streams[handler.get_events_key(polling_id)]) == len(events) - 23
+    state = await handler.get_state(polling_id)
+    assert state["output"][0]["content"][0]["text"] == "".join(words)
+
+
+@pytest.mark.asyncio
+async def test_stream_events_resumes_after_last_event_id(redis):
+    handler, polling_id = await _new_response(redis)
+    output_items: Dict[str, dict] = {}
+    await _write(handler, polling_id, _message_events("msg_1", ["a", "b", "c"]), output_items)
+    await handler.update_state(polling_id=polling_id, status="completed")
+
+    received = [e async for e in handler.stream_events(polling_id)]
+    assert len(received) == 5
+    resumed = [
+        e async for e in handler.stream_events(polling_id, last_event_id=received[2][0])
+    ]
+    assert resumed == received[3:]
+    assert [e["delta"] for _, e in resumed] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_stream_events_sends_snapshot_when_resume_point_was_trimmed(redis):
+    handler, polling_id = await _new_response(redis)
+    output_items: Dict[str, dict] = {}
+    await _write(handler, polling_id, _message_events("msg_1", ["a"]), output_items)
+    first_event_id = redis.streams[handler.get_events_key(polling_id)][0][0]
+    await _write(handler, polling_id, [_item_done("msg_1", "a")], output_items, checkpoint=True)
+    await _write(handler, polling_id, _message_events("msg_2", ["b"]), output_items)
+    await _write(handler, polling_id, [_item_done("msg_2", "b")], output_items, checkpoint=True)
+    await handler.update_state(polling_id=polling_id, status="completed")
+
+    received = [
+        e async for e in handler.stream_events(polling_id, last_event_id=first_event_id)
+    ]
+    snapshot_id, snapshot = received[0]
+    assert snapshot["type"] == "response.completed"
+    assert [item["id"] for item in snapshot["response"]["output"]] == ["msg_1", "msg_2"]
+    assert STREAM_STATE_FIELD not in snapshot["response"]
+    assert len(received) == 1
+
+
+@pytest.mark.asyncio
+async def test_json_backend_is_unchanged(redis):
+    handler = ResponsePollingHandler(redis_cache=redis)
+    polling_id = handler.generate_polling_id()
+    await handler.create_initial_state(polling_id=polling_id, request_data={})
+    await handler.update_state(polling_id=polling_id, output=[{"id": "msg_1"}])
+
+    assert handler.use_event_stream is False
+    assert redis.streams == {}
+    assert (await handler.get_state(polling_id))["output"] == [{"id": "msg_1"}]
+    assert [e async for e in handler.stream_events(polling_id)] == []
+
+
+@pytest.mark.asyncio
+async def test_delete_polling_removes_event_stream(redis):
+    handler, polling_id = await _new_response(redis)
+    await _write(handler, polling_id, _message_events("msg_1", ["a"]), {})
+
+    assert await handler.delete_polling(polling_id) is True
+    assert redis.values == {}
+    assert redis.streams == {}
+
+
+def test_unknown_state_backend_raises():
+    with pytest.raises(ValueError):
+        ResponsePollingHandler(state_backend="postgres")  # type: ignore[arg-type]
@@ -0,0 +1,302 @@
+"""
+Tests for archiving spend logs to partitioned files and reading them back.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.db.db_transaction_queue.spend_log_cleanup import SpendLogCleanup
+from litellm.proxy.spend_tracking.spend_logs_archive import (
+    NDJSON_GZIP_EXTENSION,
+    NDJSON_ZSTD_EXTENSION,
+    PARQUET_EXTENSION,
+    LocalSpendLogsArchiveStorage,
+    SpendLogsArchive,
+    deserialize_spend_logs,
+    get_archived_spend_logs,
+    get_spend_logs_archive,
+    serialize_spend_logs,
+)
+
+
+def _spend_log(request_id: str, start_time: datetime, **kwargs) -> dict:
+    log = {
+        "request_id": request_id,
+        "call_type": "acompletion",
+        "api_key": "hashed-key",
+        "spend": 0.5,
+        "total_tokens": 30,
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "startTime": start_time,
+        "endTime": start_time + timedelta(seconds=1),
+        "completionStartTime": None,
+        "model": "gpt-4o",
+        "user": "user-1",
+        "team_id": "team-1",
+        "metadata": {"user_api_key_alias": "alias"},
+        "request_tags": ["prod"],
+        "messages": {},
+        "response": {},
+        "proxy_server_request": {},
+    }
+    log.update(kwargs)
+    return log
+
+
+@pytest.mark.parametrize(
+    "extension", [PARQUET_EXTENSION, NDJSON_ZSTD_EXTENSION, NDJSON_GZIP_EXTENSION]
+)
+def test_serialize_round_trip(extension):
+    if extension == PARQUET_EXTENSION:
+        pytest.importorskip("pyarrow")
+    if extension == NDJSON_ZSTD_EXTENSION:
+        pytest.importorskip("zstandard")
+
+    from litellm.proxy.spend_tracking.spend_logs_archive import _to_archive_record
+
+    start_time = datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+    records = [
+        _to_archive_record(_spend_log("req-1", start_time)),
+        _to_archive_record(
+            _spend_log("req-2", start_time, completionStartTime=start_time)
+        ),
+    ]
+
+    content = serialize_spend_logs(records, extension)
+    result = deserialize_spend_logs(content, f"spend_logs{extension}")
+
+    assert [r["request_id"] for r in result] == ["req-1", "req-2"]
+    assert result[0]["startTime"] == start_time
+    assert result[0]["completionStartTime"] is None
+    assert result[1]["completionStartTime"] == start_time
+    assert result[0]["metadata"] == {"user_api_key_alias": "alias"}
+    assert result[0]["request_tags"] == ["prod"]
+
+
+@pytest.mark.asyncio
+async def test_archive_partitions_by_day_and_reads_range(tmp_path):
+    archive = SpendLogsArchive(
+        storage=LocalSpendLogsArchiveStorage(path=str(tmp_path)),
+        prefix="litellm/spend_logs",
+        archive_format="ndjson",
+    )
+    day_1 = datetime(2025, 1, 1, 23, 59, tzinfo=timezone.utc)
+    day_2 = datetime(2025, 1, 2, 0, 1, tzinfo=timezone.utc)
+
+    keys = await archive.archive_spend_logs(
+        [
+            _spend_log("req-1", day_1),
+            _spend_log("req-2", day_2),
+            _spend_log("req-3", day_2, api_key="other-key"),
+        ]
+    )
+
+    assert len(keys) == 2
+    assert keys[0].startswith("litellm/spend_logs/date=2025-01-01/")
+    assert keys[1].startswith("litellm/spend_logs/date=2025-01-02/")
+
+    all_logs = await archive.read_spend_logs(
+        start_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_time=datetime(2025, 1, 3, tzinfo=timezone.utc),
+    )
+    assert [log["request_id"] for log in all_logs] == ["req-2", "req-3", "req-1"]
+
+    filtered = await archive.read_spend_logs(
+        start_time=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        end_time=datetime(2025, 1, 3, tzinfo=timezone.utc),
+        filters={"api_key": "other-key", "user": None},
+    )
+    assert [log["request_id"] for log in filtered] == ["req-3"]
+
+
+@pytest.mark.asyncio
+async def test_read_spend_logs_dedupes_rows_archived_twice(tmp_path):
+    archive = SpendLogsArchive(
+        storage=LocalSpendLogsArchiveStorage(path=str(tmp_path)),
+        archive_format="ndjson",
+    )
+    start_time = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    await archive.archive_spend_logs([_spend_log("req-1", start_time)])
+    await archive.archive_spend_logs([_spend_log("req-1", start_time)])
+
+    logs = await archive.read_spend_logs(
+        start_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_time=datetime(2025, 1, 2, tzinfo=timezone.utc),
+    )
+    assert len(logs) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_spend_logs_reads_one_partition_at_a_time(tmp_path):
+    storage = LocalSpendLogsArchiveStorage(path=str(tmp_path))
+    archive = SpendLogsArchive(storage=storage, archive_format="ndjson")
+    await archive.archive_spend_logs(
+        [
+            _spend_log(f"req-{day}", datetime(2025, 1, day, 12, tzinfo=timezone.utc))
+            for day in (1, 2, 3)
+        ]
+    )
+
+    read_keys = []
+    read = storage.read
+
+    async def tracked_read(key):
+        read_keys.append(key)
+        return await read(key)
+
+    storage.read = tracked_read  # type: ignore
+    records = archive.iter_spend_logs(
+        start_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        end_time=datetime(2025, 1, 4, tzinfo=timezone.utc),
+    )
+    first = await records.__anext__()
+    assert first["request_id"] == "req-3"
+    assert len(read_keys) == 1
+    assert [record["request_id"] async for record in records] == ["req-2", "req-1"]
+    assert len(read_keys) == 3
+
+
+def test_get_spend_logs_archive_config(tmp_path):
+    assert get_spend_logs_archive({}) is None
+
+    archive = get_spend_logs_archive(
+        {"spend_logs_archive": {"storage": "local", "path": str(tmp_path)}}
+    )
+    assert isinstance(archive, SpendLogsArchive)
+    assert isinstance(archive.storage, LocalSpendLogsArchiveStorage)
+
+    with pytest.raises(ValueError):
+        get_spend_logs_archive({"spend_logs_archive": {"storage": "local"}})
+    with pytest.raises(ValueError):
+        get_spend_logs_archive({"spend_logs_archive": {"storage": "azure"}})
+    with pytest.raises(ValueError):
+        get_spend_logs_archive({"spend_logs_archive": {"storage": "s3"}})
+
+
+@pytest.mark.asyncio
+async def test_get_archived_spend_logs_skips_ranges_inside_retention(tmp_path):
+    general_settings = {
+        "maximum_spend_logs_retention_period": "7d",
+        "spend_logs_archive": {
+            "storage": "local",
+            "path": str(tmp_path),
+            "format": "ndjson",
+        },
+    }
+    old_start_time = datetime.now(timezone.utc) - timedelta(days=30)
+    archive = get_spend_logs_archive(general_settings)
+    assert archive is not None
+    await archive.archive_spend_logs([_spend_log("req-old", old_start_time)])
+
+    recent = await get_archived_spend_logs(
+        start_time=datetime.now(timezone.utc) - timedelta(days=1),
+        end_time=datetime.now(timezone.utc),
+        general_settings=general_settings,
+    )
+    assert recent == []
+
+    old = await get_archived_spend_logs(
+        start_time=old_start_time - timedelta(days=1),
+        end_time=datetime.now(timezone.utc),
+        general_settings=general_settings,
+    )
+    assert [log["request_id"] for log in old] == ["req-old"]
+
+
+def _mock_prisma_client(find_many_side_effect):
+    mock_prisma_client = MagicMock()
+    mock_prisma_client.db.litellm_spendlogs.find_many = AsyncMock(
+        side_effect=find_many_side_effect
+    )
+    mock_prisma_client.db.litellm_spendlogs.delete_many = AsyncMock()
+    return mock_prisma_client
+
+
+def _cleaner(general_settings: dict) -> SpendLogCleanup:
+    cleaner = SpendLogCleanup(general_settings=general_settings)
+    cleaner.pod_lock_manager = None
+    return cleaner
+
+
+@pytest.mark.asyncio
+async def test_cleanup_archives_each_batch_before_deleting(tmp_path):
+    start_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    batch_1 = [
+        SimpleNamespace(**_spend_log(f"req-{i}", start_time + timedelta(minutes=i)))
+        for i in range(3)
+    ]
+    batch_2 = [
+        SimpleNamespace(**_spend_log("req-3", start_time + timedelta(minutes=3)))
+    ]
+    mock_prisma_client = _mock_prisma_client([batch_1, batch_2, []])
+
+    cleaner = _cleaner(
+        {
+            "maximum_spend_logs_retention_period": "7d",
+            "spend_logs_archive": {
+                "storage": "local",
+                "path": str(tmp_path),
+                "format": "ndjson",
+            },
+        }
+    )
+    await cleaner.cleanup_old_spend_logs(mock_prisma_client)
+
+    find_many = mock_prisma_client.db.litellm_spendlogs.find_many
+    delete_many = mock_prisma_client.db.litellm_spendlogs.delete_many
+    assert find_many.call_count == 3
+    assert delete_many.call_count == 2
+    delete_many.assert_any_call(
+        where={"request_id": {"in": ["req-0", "req-1", "req-2"]}}
+    )
+
+    # Second page continues from the last (startTime, request_id) of the first
+    second_where = find_many.call_args_list[1][1]["where"]
+    assert second_where["OR"] == [
+        {"startTime": {"gt": batch_1[-1].startTime}},
+        {"startTime": batch_1[-1].startTime, "request_id": {"gt": "req-2"}},
+    ]
+
+    archive = get_spend_logs_archive(cleaner.general_settings)
+    archived = await archive.read_spend_logs(
+        start_time=start_time, end_time=start_time + timedelta(days=1)
+    )
+    assert sorted(log["request_id"] for log in archived) == [
+        "req-0",
+        "req-1",
+        "req-2",
+        "req-3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_keeps_rows_when_archive_write_fails(tmp_path):
+    start_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    batch = [_spend_log("req-0", start_time)]
+    mock_prisma_client = _mock_prisma_client([[SimpleNamespace(**batch[0])]])
+
+    cleaner = _cleaner(
+        {
+            "maximum_spend_logs_retention_period": "7d",
+            "spend_logs_archive": {"storage": "local", "path": str(tmp_path)},
+        }
+    )
+    failing_archive = MagicMock()
+    failing_archive.archive_spend_logs = AsyncMock(side_effect=OSError("disk full"))
+
+    with pytest.raises(OSError):
+        await cleaner._archive_and_delete_old_logs(
+            mock_prisma_client, start_time + timedelta(days=1), failing_archive
+        )
+
+    mock_prisma_client.db.litellm_spendlogs.delete_many.assert_not_called()
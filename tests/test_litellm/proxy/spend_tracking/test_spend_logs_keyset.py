@@ -0,0 +1,273 @@
+"""
+Tests for keyset pagination and NDJSON streaming of spend logs.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+import litellm.proxy.proxy_server as ps
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+from litellm.proxy.proxy_server import app
+from litellm.proxy.spend_tracking.spend_logs_keyset import (
+    add_spend_logs_keyset_condition,
+    decode_spend_logs_cursor,
+    encode_spend_logs_cursor,
+    get_spend_logs_keyset_page,
+    iter_spend_logs,
+    stream_spend_logs_ndjson,
+)
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _matches(row: dict, where: dict) -> bool:
+    for key, condition in where.items():
+        if key == "AND":
+            if not all(_matches(row, c) for c in condition):
+                return False
+        elif key == "OR":
+            if not any(_matches(row, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = row[key]
+            for op, operand in condition.items():
+                if isinstance(operand, str) and key == "startTime":
+                    operand = datetime.fromisoformat(operand)
+                if op == "gte" and not value >= operand:
+                    return False
+                if op == "lte" and not value <= operand:
+                    return False
+                if op == "gt" and not value > operand:
+                    return False
+                if op == "lt" and not value < operand:
+                    return False
+        elif row[key] != condition:
+            return False
+    return True
+
+
+class _FakeSpendLogsTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.find_many_calls = []
+
+    async def find_many(self, where, order, take):
+        self.find_many_calls.append({"where": where, "order": order, "take": take})
+        reverse = order[0]["startTime"] == "desc"
+        rows = sorted(
+            (r for r in self.rows if _matches(r, where)),
+            key=lambda r: (r["startTime"], r["request_id"]),
+            reverse=reverse,
+        )
+        return rows[:take]
+
+
+class _FakePrismaClient:
+    def __init__(self, rows):
+        self.db = type("DB", (), {})()
+        self.db.litellm_spendlogs = _FakeSpendLogsTable(rows)
+
+    def hash_token(self, token):
+        return f"hashed-{token}"
+
+
+def _rows(n: int, same_start_time_every: int = 3) -> list:
+    # groups of rows share a startTime, so the request_id tie-break matters
+    return [
+        {
+            "request_id": f"req-{i:03d}",
+            "startTime": BASE_TIME + timedelta(seconds=i // same_start_time_every),
+            "api_key": "key-a" if i % 2 == 0 else "key-b",
+            "user": "user-1",
+            "spend": 0.1,
+        }
+        for i in range(n)
+    ]
+
+
+def test_cursor_round_trip():
+    cursor = encode_spend_logs_cursor({"startTime": BASE_TIME, "request_id": "req-1"})
+    assert decode_spend_logs_cursor(cursor) == (BASE_TIME, "req-1")
+
+    with pytest.raises(HTTPException) as e:
+        decode_spend_logs_cursor("not-a-cursor")
+    assert e.value.status_code == 400
+
+
+def test_add_spend_logs_keyset_condition():
+    where = {"api_key": "key-a"}
+    assert add_spend_logs_keyset_condition(where, None, "desc") is where
+
+    cursor = encode_spend_logs_cursor({"startTime": BASE_TIME, "request_id": "req-1"})
+    assert add_spend_logs_keyset_condition(where, cursor, "asc") == {
+        "AND": [
+            where,
+            {
+                "OR": [
+                    {"startTime": {"gt": BASE_TIME}},
+                    {"startTime": BASE_TIME, "request_id": {"gt": "req-1"}},
+                ]
+            },
+        ]
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+async def test_keyset_pages_cover_every_row_once(sort_order):
+    rows = _rows(25)
+    prisma_client = _FakePrismaClient(rows)
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await get_spend_logs_keyset_page(
+            prisma_client=prisma_client,
+            where={},
+            page_size=4,
+            sort_order=sort_order,
+            cursor=cursor,
+        )
+        seen.extend(r["request_id"] for r in page)
+        if cursor is None:
+            break
+
+    expected = [r["request_id"] for r in rows]
+    assert seen == (expected if sort_order == "asc" else expected[::-1])
+
+
+@pytest.mark.asyncio
+async def test_iter_spend_logs_fetches_lazily():
+    prisma_client = _FakePrismaClient(_rows(10))
+    table = prisma_client.db.litellm_spendlogs
+
+    iterator = iter_spend_logs(
+        prisma_client=prisma_client,
+        where={"api_key": "key-a"},
+        batch_size=2,
+    )
+    first = await iterator.__anext__()
+    assert first["request_id"] == "req-008"
+    assert len(table.find_many_calls) == 1
+
+    rest = [row async for row in iterator]
+    assert [first["request_id"]] + [r["request_id"] for r in rest] == [
+        "req-008",
+        "req-006",
+        "req-004",
+        "req-002",
+        "req-000",
+    ]
+    assert all(call["take"] == 3 for call in table.find_many_calls)
+
+
+@pytest.mark.asyncio
+async def test_stream_spend_logs_ndjson_appends_extra_rows():
+    prisma_client = _FakePrismaClient(_rows(2))
+
+    async def archived_rows():
+        yield {"request_id": "archived", "startTime": BASE_TIME}
+
+    lines = [
+        json.loads(chunk)
+        async for chunk in stream_spend_logs_ndjson(
+            prisma_client=prisma_client,
+            where={},
+            extra_rows=archived_rows(),
+        )
+    ]
+    assert [line["request_id"] for line in lines] == ["req-001", "req-000", "archived"]
+
+
+@pytest.fixture
+def admin_client(monkeypatch):
+    prisma_client = _FakePrismaClient(_rows(7))
+    monkeypatch.setattr("litellm.proxy.proxy_server.prisma_client", prisma_client)
+    monkeypatch.setattr(
+        "litellm.proxy.spend_tracking.spend_management_endpoints._is_admin_view_safe",
+        lambda user_api_key_dict: True,
+    )
+    app.dependency_overrides[ps.user_api_key_auth] = lambda: UserAPIKeyAuth(
+        user_role=LitellmUserRoles.PROXY_ADMIN, user_id="admin_user"
+    )
+    yield TestClient(app)
+    app.dependency_overrides.pop(ps.user_api_key_auth, None)
+
+
+def test_ui_view_spend_logs_cursor_pagination(admin_client):
+    params = {
+        "start_date": "2024-12-31 00:00:00",
+        "end_date": "2025-01-02 00:00:00",
+        "pagination": "cursor",
+        "page_size": 3,
+    }
+    seen = []
+    while True:
+        response = admin_client.get("/spend/logs/v2", params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert "total" not in body
+        seen.extend(log["request_id"] for log in body["data"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert seen == [f"req-{i:03d}" for i in range(6, -1, -1)]
+
+
+def test_ui_view_spend_logs_stream(admin_client):
+    response = admin_client.get(
+        "/spend/logs/v2",
+        params={
+            "start_date": "2024-12-31 00:00:00",
+            "end_date": "2025-01-02 00:00:00",
+            "stream": "true",
+            "sort_order": "asc",
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    request_ids = [
+        json.loads(line)["request_id"] for line in response.text.splitlines()
+    ]
+    assert request_ids == [f"req-{i:03d}" for i in range(7)]
+
+
+def test_ui_view_spend_logs_cursor_requires_start_time_sort(admin_client):
+    response = admin_client.get(
+        "/spend/logs/v2",
+        params={
+            "start_date": "2024-12-31 00:00:00",
+            "end_date": "2025-01-02 00:00:00",
+            "pagination": "cursor",
+            "sort_by": "spend",
+        },
+    )
+    assert response.status_code == 400
+
+
+def test_view_spend_logs_stream(admin_client):
+    response = admin_client.get(
+        "/spend/logs",
+        params={
+            "start_date": "2024-12-31",
+            "end_date": "2025-01-02",
+            "api_key": "key-b",
+            "stream": "true",
+        },
+    )
+    assert response.status_code == 200, response.text
+    request_ids = [
+        json.loads(line)["request_id"] for line in response.text.splitlines()
+    ]
+    assert request_ids == ["req-005", "req-003", "req-001"]
@@ -0,0 +1,479 @@
+import json
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../../.."))
+
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+from litellm.proxy.spend_tracking import spend_management_endpoints
+from litellm.proxy.spend_tracking.spend_logs_rollups import (
+    backfill_spend_logs_rollups,
+    get_spend_logs_rollup_transactions,
+    write_spend_logs_with_rollups,
+)
+from litellm.proxy.utils import ProxyUpdateSpend
+
+
+def _spend_log(
+    request_id: str,
+    start_time: datetime,
+    user: str = "user-1",
+    model_group: str = "gpt-4o",
+    model_id: str = "deployment-1",
+    status: str = "success",
+    tags=("prod",),
+    spend: float = 0.5,
+    prompt_tokens: int = 10,
+    completion_tokens: int = 5,
+) -> dict:
+    return {
+        "request_id": request_id,
+        "startTime": start_time,
+        "team_id": "team-1",
+        "api_key": "hashed-key-1",
+        "user": user,
+        "end_user": "",
+        "model": f"openai/{model_group}",
+        "model_group": model_group,
+        "model_id": model_id,
+        "custom_llm_provider": "openai",
+        "status": status,
+        "request_tags": json.dumps(list(tags)),
+        "spend": spend,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _spend_logs():
+    day_1 = datetime(2025, 3, 1, 9, 15, tzinfo=timezone.utc)
+    day_2 = datetime(2025, 3, 2, 23, 59, tzinfo=timezone.utc)
+    return [
+        _spend_log("r1", day_1),
+        _spend_log("r2", day_1 + timedelta(minutes=30), spend=1.0),
+        _spend_log(
+            "r3",
+            day_1 + timedelta(hours=2),
+            model_group="claude",
+            model_id="deployment-2",
+            tags=("prod", "batch"),
+        ),
+        _spend_log("r4", day_1, user="user-2", status="failure", spend=0.0, tags=()),
+        _spend_log("r5", day_2, model_id="", prompt_tokens=100),
+        _spend_log(
+            "r6", day_2, user="user-2", model_group="claude", model_id="deployment-2"
+        ),
+    ]
+
+
+def test_get_spend_logs_rollup_transactions():
+    rollups, tag_rollups = get_spend_logs_rollup_transactions(_spend_logs())
+
+    hourly = [r for r in rollups if r["granularity"] == "hour"]
+    daily = [r for r in rollups if r["granularity"] == "day"]
+    # r1 + r2 share an hour and every dimension
+    assert len(hourly) == 5
+    assert len(daily) == 5
+    (r1_r2,) = [
+        r
+        for r in hourly
+        if r["period_start"] == datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+        and r["user"] == "user-1"
+    ]
+    assert r1_r2["api_requests"] == 2
+    assert r1_r2["spend"] == pytest.approx(1.5)
+    assert r1_r2["total_tokens"] == 30
+
+    for counter in ["api_requests", "spend", "total_tokens", "prompt_tokens"]:
+        assert sum(r[counter] for r in hourly) == pytest.approx(
+            sum(r[counter] for r in daily)
+        )
+    assert sum(r["api_requests"] for r in daily) == 6
+
+    daily_tags: dict = defaultdict(int)
+    for r in tag_rollups:
+        if r["granularity"] == "day":
+            daily_tags[(r["tag"], r["period_start"].day)] += r["api_requests"]
+    assert daily_tags == {("prod", 1): 3, ("batch", 1): 1, ("prod", 2): 2}
+
+
+def test_get_spend_logs_rollup_transactions_accepts_string_timestamps():
+    spend_log = _spend_log("r1", datetime(2025, 3, 1, 9, 15, tzinfo=timezone.utc))
+    spend_log["startTime"] = "2025-03-01T11:15:00+02:00"
+    spend_log["request_tags"] = "not-json"
+    rollups, tag_rollups = get_spend_logs_rollup_transactions([spend_log])
+    assert [r["period_start"] for r in rollups] == [
+        datetime(2025, 3, 1, tzinfo=timezone.utc),
+        datetime(2025, 3, 1, 9, tzinfo=timezone.utc),
+    ]
+    assert tag_rollups == []
+
+
+class _FakeSpendAnalyticsDB:
+    """
+    Answers the spend analytics queries - from the spend logs for queries on LiteLLM_SpendLogs /
+    DailyTagSpend, from the daily rollups for queries on the rollup tables.
+    """
+
+    def __init__(self, spend_logs):
+        self.spend_logs = spend_logs
+        rollups, tag_rollups = get_spend_logs_rollup_transactions(spend_logs)
+        self.daily_rollups = [r for r in rollups if r["granularity"] == "day"]
+        self.daily_tag_rollups = [r for r in tag_rollups if r["granularity"] == "day"]
+        self.queried_tables = []
+
+    def _records(self, sql_query):
+        if "LiteLLM_SpendLogsTagRollup" in sql_query:
+            self.queried_tables.append("rollups")
+            return [dict(r, date=r["period_start"]) for r in self.daily_tag_rollups]
+        if "LiteLLM_SpendLogsRollup" in sql_query:
+            self.queried_tables.append("rollups")
+            return [dict(r, date=r["period_start"]) for r in self.daily_rollups]
+        self.queried_tables.append("spend_logs")
+        records = []
+        for spend_log in self.spend_logs:
+            date = spend_log["startTime"].replace(hour=0, minute=0)
+            tags = json.loads(spend_log["request_tags"])
+            for tag in tags if "DailyTagSpend" in sql_query else [None]:
+                records.append(dict(spend_log, date=date, tag=tag, api_requests=1))
+        return records
+
+    async def query_raw(self, sql_query, start_date, end_date, *args):
+        if isinstance(start_date, str):
+            start_date = datetime.strptime(start_date, "%Y-%m-%d")
+            end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        start_date = start_date.replace(tzinfo=timezone.utc)
+        end_date = end_date.replace(tzinfo=timezone.utc) + timedelta(days=1)
+        records = [
+            r for r in self._records(sql_query) if start_date <= r["date"] < end_date
+        ]
+        if '"user" = $3' in sql_query:
+            records = [r for r in records if r["user"] == args[0]]
+
+        groups: dict = defaultdict(lambda: defaultdict(float))
+        for r in records:
+            if "individual_request_tag" in sql_query:
+                if args and r["tag"] not in args[0]:
+                    continue
+                key = (
+                    (r["tag"],) if args else (r["tag"], r["date"].date().isoformat())
+                )
+                groups[key]["log_count"] += r["api_requests"]
+                groups[key]["total_spend"] += r["spend"]
+            elif "model_id" in sql_query:
+                if not r["model_id"]:
+                    continue
+                groups[(r["model_id"],)]["spend"] += r["spend"]
+            else:
+                key = (r["date"].isoformat(),)
+                if "model_group" in sql_query:
+                    key = (r["model_group"],) + key
+                groups[key]["api_requests"] += r["api_requests"]
+                groups[key]["total_tokens"] += r["total_tokens"]
+
+        rows = []
+        for key, values in groups.items():
+            if "individual_request_tag" in sql_query:
+                row = {"individual_request_tag": key[0]}
+                if len(key) == 2:
+                    row["spend_date"] = key[1]
+            elif "model_id" in sql_query:
+                row = {"model_id": key[0]}
+            else:
+                row = {"date": key[-1]}
+                if len(key) == 2:
+                    row["model_group"] = key[0]
+            for name, value in values.items():
+                row[name] = value if name in ("spend", "total_spend") else int(value)
+            rows.append(row)
+        return rows
+
+
+async def _call_spend_analytics_endpoints(db, user_role, use_rollups):
+    prisma_client = MagicMock()
+    prisma_client.db = db
+    llm_router = MagicMock()
+    llm_router.get_deployment.return_value = None
+    user_api_key_dict = UserAPIKeyAuth(user_role=user_role, user_id="user-1")
+    general_settings = {"use_spend_logs_rollups": use_rollups}
+    with patch("litellm.proxy.proxy_server.prisma_client", prisma_client), patch(
+        "litellm.proxy.proxy_server.general_settings", general_settings
+    ), patch("litellm.proxy.proxy_server.llm_router", llm_router):
+        return [
+            await spend_management_endpoints.get_global_activity(
+                start_date="2025-03-01",
+                end_date="2025-03-02",
+                user_api_key_dict=user_api_key_dict,
+            ),
+            await spend_management_endpoints.get_global_activity(
+                start_date="2025-03-02",
+                end_date="2025-03-02",
+                user_api_key_dict=user_api_key_dict,
+            ),
+            await spend_management_endpoints.get_global_activity_model(
+                start_date="2025-03-01",
+                end_date="2025-03-02",
+                user_api_key_dict=user_api_key_dict,
+            ),
+            await spend_management_endpoints.ui_get_spend_by_tags(
+                start_date="2025-03-01",
+                end_date="2025-03-02",
+                prisma_client=prisma_client,
+            ),
+            await spend_management_endpoints.ui_get_spend_by_tags(
+                start_date="2025-03-01",
+                end_date="2025-03-01",
+                prisma_client=prisma_client,
+                tags_str="batch,prod",
+            ),
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "user_role", [LitellmUserRoles.PROXY_ADMIN, LitellmUserRoles.INTERNAL_USER]
+)
+async def test_spend_analytics_endpoints_rollup_parity(user_role):
+    spend_logs_db = _FakeSpendAnalyticsDB(_spend_logs())
+    rollups_db = _FakeSpendAnalyticsDB(_spend_logs())
+
+    from_spend_logs = await _call_spend_analytics_endpoints(
+        spend_logs_db, user_role, use_rollups=False
+    )
+    from_rollups = await _call_spend_analytics_endpoints(
+        rollups_db, user_role, use_rollups=True
+    )
+
+    assert set(spend_logs_db.queried_tables) == {"spend_logs"}
+    assert set(rollups_db.queried_tables) == {"rollups"}
+    assert from_rollups == from_spend_logs
+    global_activity = from_rollups[0]
+    if user_role == LitellmUserRoles.PROXY_ADMIN:
+        assert global_activity["sum_api_requests"] == 6
+    else:
+        assert global_activity["sum_api_requests"] == 4
+
+
+@pytest.mark.asyncio
+async def test_spend_provider_rollup_parity():
+    from litellm.proxy.spend_tracking.spend_logs_rollups import (
+        get_spend_per_deployment_from_rollups,
+    )
+
+    spend_logs_db = _FakeSpendAnalyticsDB(_spend_logs())
+    rows = await get_spend_per_deployment_from_rollups(
+        MagicMock(db=spend_logs_db),
+        datetime(2025, 3, 1),
+        datetime(2025, 3, 2),
+        user_id="user-1",
+    )
+    expected = await spend_logs_db.query_raw(
+        'SELECT model_id FROM "LiteLLM_SpendLogs" WHERE "user" = $3',
+        datetime(2025, 3, 1),
+        datetime(2025, 3, 2),
+        "user-1",
+    )
+    assert sorted(rows, key=lambda r: r["model_id"]) == sorted(
+        expected, key=lambda r: r["model_id"]
+    )
+    assert spend_logs_db.queried_tables == ["rollups", "spend_logs"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params,expected_args",
+    [
+        ({"group_by": "team"}, []),
+        ({"group_by": "customer"}, []),
+        ({"group_by": "api_key"}, []),
+        ({"group_by": "team", "api_key": "sk-1234"}, ["hashed"]),
+        ({"group_by": "team", "internal_user_id": "user-1"}, ["user-1"]),
+        (
+            {"group_by": "team", "team_id": "team-1", "customer_id": "customer-1"},
+            ["team-1", "customer-1"],
+        ),
+    ],
+)
+async def test_spend_report_served_from_rollups(params, expected_args):
+    prisma_client = MagicMock()
+    prisma_client.db.query_raw = AsyncMock(return_value=[{"api_key": "hashed"}])
+    with patch("litellm.proxy.proxy_server.prisma_client", prisma_client), patch(
+        "litellm.proxy.proxy_server.premium_user", True
+    ), patch(
+        "litellm.proxy.proxy_server.general_settings",
+        {"use_spend_logs_rollups": True},
+    ), patch(
+        "litellm.proxy.spend_tracking.spend_management_endpoints.hash_token",
+        return_value="hashed",
+    ):
+        response = await spend_management_endpoints.get_global_spend_report(
+            start_date="2025-03-01",
+            end_date="2025-03-02",
+            **{
+                "api_key": None,
+                "internal_user_id": None,
+                "team_id": None,
+                "customer_id": None,
+                **params,
+            },
+        )
+
+    assert response == [{"api_key": "hashed"}]
+    sql_query, *args = prisma_client.db.query_raw.call_args.args
+    assert '"LiteLLM_SpendLogsRollup"' in sql_query
+    assert '"LiteLLM_SpendLogs"' not in sql_query
+    assert "granularity = 'day'" in sql_query
+    assert args[2:] == expected_args
+
+
+class _FakeTransaction:
+    def __init__(self, existing_request_ids=()):
+        self.query_raw = AsyncMock(
+            return_value=[{"request_id": r} for r in existing_request_ids]
+        )
+        self.execute_raw = AsyncMock()
+        self.litellm_spendlogs = MagicMock()
+        self.litellm_spendlogs.create_many = AsyncMock()
+        self.batcher = MagicMock()
+
+    def batch_(self):
+        batcher = self.batcher
+
+        class _Batch:
+            async def __aenter__(self):
+                return batcher
+
+            async def __aexit__(self, *args):
+                return False
+
+        return _Batch()
+
+
+def _prisma_client_with_transaction(transaction):
+    class _Tx:
+        async def __aenter__(self):
+            return transaction
+
+        async def __aexit__(self, *args):
+            return False
+
+    prisma_client = MagicMock()
+    prisma_client.db.tx = MagicMock(side_effect=lambda **kwargs: _Tx())
+    return prisma_client
+
+
+@pytest.mark.asyncio
+async def test_write_spend_logs_with_rollups_skips_existing_spend_logs():
+    transaction = _FakeTransaction(existing_request_ids=["r2"])
+    prisma_client = _prisma_client_with_transaction(transaction)
+    spend_logs = _spend_logs()[:3]
+    # r3 re-sent in the same batch
+    spend_logs.append(dict(spend_logs[2]))
+
+    await write_spend_logs_with_rollups(
+        prisma_client=prisma_client, spend_logs=spend_logs
+    )
+
+    transaction.litellm_spendlogs.create_many.assert_awaited_once_with(
+        data=spend_logs, skip_duplicates=True
+    )
+    upserts = transaction.batcher.litellm_spendlogsrollup.upsert.call_args_list
+    hourly_upserts = [
+        call.kwargs["data"]
+        for call in upserts
+        if call.kwargs["data"]["create"]["granularity"] == "hour"
+    ]
+    # r1 and r3 - r2 is already in the DB, the duplicate r3 is not counted twice
+    assert sum(data["create"]["api_requests"] for data in hourly_upserts) == 2
+    assert {data["update"]["spend"]["increment"] for data in hourly_upserts} == {0.5}
+    where = upserts[0].kwargs["where"]
+    (unique_key,) = where.values()
+    assert set(unique_key) == {
+        "granularity",
+        "period_start",
+        "team_id",
+        "api_key",
+        "user",
+        "end_user",
+        "model",
+        "model_group",
+        "model_id",
+        "custom_llm_provider",
+        "status",
+    }
+    tag_upserts = transaction.batcher.litellm_spendlogstagrollup.upsert.call_args_list
+    assert {call.kwargs["data"]["create"]["tag"] for call in tag_upserts} == {
+        "prod",
+        "batch",
+    }
+
+
+@pytest.mark.asyncio
+async def test_backfill_spend_logs_rollups_rebuilds_each_day_under_lock():
+    transaction = _FakeTransaction()
+    prisma_client = _prisma_client_with_transaction(transaction)
+
+    days_rebuilt = await backfill_spend_logs_rollups(
+        prisma_client=prisma_client,
+        start_date=datetime(2025, 3, 1),
+        end_date=datetime(2025, 3, 3),
+    )
+
+    assert days_rebuilt == 3
+    assert prisma_client.db.tx.call_count == 3
+    statements = [call.args for call in transaction.execute_raw.call_args_list]
+    assert len(statements) == 3 * 7
+    first_day = statements[:7]
+    assert first_day[0][0].startswith("LOCK TABLE")
+    assert all(
+        statement[1:] == (datetime(2025, 3, 1), datetime(2025, 3, 2))
+        for statement in first_day[1:]
+    )
+    assert [statement[0].split()[0] for statement in first_day[1:]] == [
+        "DELETE",
+        "DELETE",
+        "INSERT",
+        "INSERT",
+        "INSERT",
+        "INSERT",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_rollups", [True, False])
+async def test_update_spend_logs_writes_rollups_when_enabled(use_rollups):
+    prisma_client = MagicMock()
+    prisma_client.spend_log_transactions = _spend_logs()
+    prisma_client._spend_log_transactions_lock = MagicMock(
+        __aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)
+    )
+    prisma_client.jsonify_object = lambda data: data
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock()
+
+    with patch(
+        "litellm.proxy.proxy_server.general_settings",
+        {"use_spend_logs_rollups": use_rollups},
+    ), patch(
+        "litellm.proxy.spend_tracking.spend_logs_rollups.write_spend_logs_with_rollups",
+        new_callable=AsyncMock,
+    ) as mock_write_with_rollups:
+        await ProxyUpdateSpend.update_spend_logs(
+            n_retry_times=0,
+            prisma_client=prisma_client,
+            db_writer_client=None,
+            proxy_logging_obj=MagicMock(),
+        )
+
+    if use_rollups:
+        mock_write_with_rollups.assert_awaited_once()
+        assert len(mock_write_with_rollups.call_args.kwargs["spend_logs"]) == 6
+        prisma_client.db.litellm_spendlogs.create_many.assert_not_called()
+    else:
+        mock_write_with_rollups.assert_not_called()
+        prisma_client.db.litellm_spendlogs.create_many.assert_awaited_once()
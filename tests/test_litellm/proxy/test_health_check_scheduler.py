@@ -0,0 +1,294 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+import litellm
+from litellm.proxy.health_check import _perform_health_check
+from litellm.proxy.health_check_utils.health_check_scheduler import (
+    MAX_SCHEDULER_SLEEP_SECONDS,
+    HealthCheckScheduler,
+)
+from litellm.router_utils.cooldown_handlers import _async_get_cooldown_deployments
+
+
+def _model_list(num_deployments: int, model_name: str = "gpt-4o"):
+    return [
+        {
+            "model_name": model_name,
+            "litellm_params": {
+                "model": f"openai/gpt-4o-{i}",
+                "api_key": "fake-key",
+            },
+            "model_info": {"id": f"deployment-{i}", "mode": "chat"},
+        }
+        for i in range(num_deployments)
+    ]
+
+
+class _ConcurrencyTracker:
+    def __init__(self, unhealthy_models=()):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+        self.unhealthy_models = set(unhealthy_models)
+
+    async def health_check(self, model_params, **kwargs):
+        self.calls.append(model_params["model"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if model_params["model"] in self.unhealthy_models:
+            return {"error": "litellm.APIError: connection reset"}
+        return {"x-ratelimit-remaining-requests": 10}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_concurrency_and_reports_results():
+    tracker = _ConcurrencyTracker(unhealthy_models={"openai/gpt-4o-3"})
+    scheduler = HealthCheckScheduler(health_check_interval=300, max_concurrency=5)
+    model_list = _model_list(30)
+
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check):
+        checked = await scheduler.run_due_checks(model_list)
+
+    assert len(checked) == 30
+    assert tracker.max_in_flight == 5
+    healthy_endpoints, unhealthy_endpoints = scheduler.get_health_check_results()
+    assert len(healthy_endpoints) == 29
+    assert [e["model"] for e in unhealthy_endpoints] == ["openai/gpt-4o-3"]
+    # checks rewrite litellm_params - the router's model list must be untouched
+    assert "messages" not in model_list[0]["litellm_params"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_only_checks_due_deployments():
+    tracker = _ConcurrencyTracker()
+    scheduler = HealthCheckScheduler(health_check_interval=300, jitter=0.1)
+    model_list = _model_list(3)
+
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check):
+        await scheduler.run_due_checks(model_list)
+        # nothing is due again until ~health_check_interval later
+        assert await scheduler.run_due_checks(model_list) == []
+
+        # new deployments are due immediately, removed ones are dropped
+        new_model_list = model_list[1:] + _model_list(4)[3:]
+        checked = await scheduler.run_due_checks(new_model_list)
+
+    assert [m["model_info"]["id"] for m in checked] == ["deployment-3"]
+    assert set(scheduler._states.keys()) == {
+        "deployment-1",
+        "deployment-2",
+        "deployment-3",
+    }
+    for state in scheduler._states.values():
+        delay = state.next_check_at - time.monotonic()
+        assert 250 < delay <= 330
+    assert scheduler.seconds_until_next_check() == MAX_SCHEDULER_SLEEP_SECONDS
+
+
+def test_scheduler_backs_off_failing_deployments():
+    scheduler = HealthCheckScheduler(
+        health_check_interval=60, jitter=0.0, max_backoff_seconds=600
+    )
+    assert [scheduler._get_next_check_delay(n) for n in range(7)] == [
+        60,
+        60,
+        120,
+        240,
+        480,
+        600,
+        600,
+    ]
+
+    jittered = HealthCheckScheduler(health_check_interval=100, jitter=0.2)
+    delays = [jittered._get_next_check_delay(0) for _ in range(200)]
+    assert all(80 <= delay <= 120 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tracks_consecutive_failures():
+    tracker = _ConcurrencyTracker(unhealthy_models={"openai/gpt-4o-0"})
+    scheduler = HealthCheckScheduler(health_check_interval=60, jitter=0.0)
+    model_list = _model_list(1)
+
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check):
+        for expected_failures, expected_delay in [(1, 60), (2, 120), (3, 240)]:
+            if "deployment-0" in scheduler._states:
+                scheduler._states["deployment-0"].next_check_at = 0
+            await scheduler.run_due_checks(model_list)
+            state = scheduler._states["deployment-0"]
+            assert state.consecutive_failures == expected_failures
+            assert state.next_check_at - time.monotonic() == pytest.approx(
+                expected_delay, abs=1
+            )
+
+        tracker.unhealthy_models.clear()
+        scheduler._states["deployment-0"].next_check_at = 0
+        await scheduler.run_due_checks(model_list)
+    assert scheduler._states["deployment-0"].consecutive_failures == 0
+    assert scheduler._states["deployment-0"].is_healthy is True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_puts_unhealthy_deployments_in_router_cooldown():
+    model_list = _model_list(2) + _model_list(1, model_name="single-deployment-group")
+    model_list[2]["model_info"]["id"] = "single-deployment"
+    model_list[2]["litellm_params"]["model"] = "openai/single"
+    router = litellm.Router(model_list=model_list)
+    tracker = _ConcurrencyTracker(
+        unhealthy_models={"openai/gpt-4o-1", "openai/single"}
+    )
+    scheduler = HealthCheckScheduler(
+        health_check_interval=60,
+        jitter=0.0,
+        llm_router=router,
+        cooldown_unhealthy_deployments=True,
+    )
+
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check):
+        await scheduler.run_due_checks(router.get_model_list())
+
+    cooldown_deployments = await _async_get_cooldown_deployments(
+        litellm_router_instance=router, parent_otel_span=None
+    )
+    assert cooldown_deployments == ["deployment-1"]
+    ((_, cooldown_value),) = router.cooldown_cache.get_active_cooldowns(
+        model_ids=["deployment-1"], parent_otel_span=None
+    )
+    assert cooldown_value["cooldown_time"] == pytest.approx(60)
+    assert "Background health check failed" in cooldown_value["exception_received"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_does_not_cooldown_unless_enabled():
+    router = litellm.Router(model_list=_model_list(2))
+    tracker = _ConcurrencyTracker(unhealthy_models={"openai/gpt-4o-1"})
+    scheduler = HealthCheckScheduler(health_check_interval=60, llm_router=router)
+
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check):
+        await scheduler.run_due_checks(router.get_model_list())
+
+    assert await _async_get_cooldown_deployments(
+        litellm_router_instance=router, parent_otel_span=None
+    ) == []
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_lag():
+    tracker = _ConcurrencyTracker()
+    scheduler = HealthCheckScheduler(health_check_interval=60, max_concurrency=1)
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check), patch(
+        "litellm.proxy.health_check_utils.health_check_scheduler._record_health_check_scheduler_lag"
+    ) as mock_record_lag:
+        await scheduler.run_due_checks(_model_list(3))
+
+    lags = [call.args[0] for call in mock_record_lag.call_args_list]
+    assert len(lags) == 3
+    # checks queued behind the concurrency limit start late
+    assert lags[-1] >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_perform_health_check_bounds_concurrency():
+    tracker = _ConcurrencyTracker(unhealthy_models={"openai/gpt-4o-0"})
+    with patch("litellm.ahealth_check", side_effect=tracker.health_check), patch(
+        "litellm.proxy.health_check.HEALTH_CHECK_MAX_CONCURRENCY", 4
+    ):
+        healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
+            _model_list(20)
+        )
+    assert tracker.max_in_flight == 4
+    assert len(healthy_endpoints) == 19
+    assert len(unhealthy_endpoints) == 1
+
+
+@pytest.mark.asyncio
+async def test_perform_health_check_timeout_only_cancels_slow_check():
+    async def _health_check(model_params, **kwargs):
+        if model_params["model"] == "openai/gpt-4o-0":
+            await asyncio.sleep(5)
+        return {}
+
+    model_list = _model_list(3)
+    model_list[0]["model_info"]["health_check_timeout"] = 0.05
+    with patch("litellm.ahealth_check", side_effect=_health_check):
+        healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
+            model_list
+        )
+    assert len(healthy_endpoints) == 2
+    assert unhealthy_endpoints[0]["error"] == "Timeout exceeded"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_warns_once_for_deployments_without_id():
+    model_list = _model_list(2)
+    model_list[1]["model_info"] = {}
+    scheduler = HealthCheckScheduler(health_check_interval=60)
+
+    with patch(
+        "litellm.proxy.health_check_utils.health_check_scheduler.verbose_proxy_logger.warning"
+    ) as mock_warning:
+        assert len(scheduler.get_due_deployments(model_list)) == 1
+        scheduler.get_due_deployments(model_list)
+
+    mock_warning.assert_called_once()
+    assert "gpt-4o" in mock_warning.call_args.args
+
+
+@pytest.mark.asyncio
+async def test_scheduled_checks_do_not_wait_for_slow_deployments():
+    release_slow_check = asyncio.Event()
+
+    async def _health_check(model_params, **kwargs):
+        if model_params["model"] == "openai/gpt-4o-0":
+            await release_slow_check.wait()
+        return {}
+
+    scheduler = HealthCheckScheduler(health_check_interval=60, max_concurrency=2)
+    model_list = _model_list(3)
+    with patch("litellm.ahealth_check", side_effect=_health_check):
+        assert len(scheduler.schedule_due_checks(model_list)) == 3
+        # the slow check holds one slot, the other checks finish around it
+        for _ in range(100):
+            if scheduler.completed_checks == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert scheduler.completed_checks == 2
+        assert list(scheduler._in_flight_checks) == ["deployment-0"]
+        healthy_endpoints, _ = scheduler.get_health_check_results()
+        assert len(healthy_endpoints) == 2
+        # a check still in flight is not scheduled twice
+        scheduler._states["deployment-0"].next_check_at = 0
+        assert scheduler.schedule_due_checks(model_list) == []
+
+        release_slow_check.set()
+        await asyncio.wait(list(scheduler._in_flight_checks.values()))
+    assert scheduler.completed_checks == 3
+    assert scheduler._in_flight_checks == {}
+
+
+@pytest.mark.asyncio
+async def test_scheduled_check_is_bounded_by_timeout():
+    async def _hanging_check(model):
+        await asyncio.sleep(5)
+
+    model_list = _model_list(1)
+    model_list[0]["model_info"]["health_check_timeout"] = 0.05
+    scheduler = HealthCheckScheduler(health_check_interval=60)
+    with patch(
+        "litellm.proxy.health_check_utils.health_check_scheduler._run_model_health_check",
+        side_effect=_hanging_check,
+    ):
+        await scheduler.run_due_checks(model_list)
+
+    _, unhealthy_endpoints = scheduler.get_health_check_results()
+    assert unhealthy_endpoints[0]["error"] == "Timeout exceeded"
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.rag.ingestion.base_ingestion import (
+    batch_chunks,
+    estimate_chunk_tokens,
+    get_chunk_content_hash,
+)
+from litellm.rag.ingestion.openai_ingestion import OpenAIRAGIngestion
+from litellm.rag.ingestion.s3_vectors_ingestion import S3VectorsRAGIngestion
+
+
+def _s3_ingestion(
+    vector_store_options=None, **embedding_options
+) -> S3VectorsRAGIngestion:
+    ingestion = S3VectorsRAGIngestion(
+        ingest_options={
+            "embedding": {"model": "text-embedding-3-small", **embedding_options},
+            "vector_store": {
+                "custom_llm_provider": "s3_vectors",
+                "vector_bucket_name": "bucket",
+                "index_name": "index",
+                "dimension": 2,
+                "aws_region_name": "us-west-2",
+                **(vector_store_options or {}),
+            },
+        }
+    )
+    ingestion._config_initialized = True
+    return ingestion
+
+
+def test_batch_chunks_respects_size_and_token_limits():
+    chunks = ["a" * 40] * 5  # 11 estimated tokens each
+    assert [len(b) for _, b in batch_chunks(chunks, max_batch_size=2)] == [2, 2, 1]
+    assert [start for start, _ in batch_chunks(chunks, max_batch_size=2)] == [0, 2, 4]
+
+    batches = batch_chunks(chunks, max_batch_size=10, max_batch_tokens=25)
+    assert [len(b) for _, b in batches] == [2, 2, 1]
+
+    # an oversized chunk gets a batch of its own
+    big = "b" * 400
+    assert estimate_chunk_tokens(big) > 25
+    assert batch_chunks(["a", big, "c"], max_batch_tokens=25) == [
+        (0, ["a"]),
+        (1, [big]),
+        (2, ["c"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_batches_requests_with_bounded_concurrency():
+    ingestion = _s3_ingestion(batch_size=2, max_concurrent_requests=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _aembedding(chunks):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[float(c), 0.0] for c in chunks]
+
+    with patch.object(ingestion, "_aembedding", side_effect=_aembedding) as mock:
+        embeddings = await ingestion.embed([str(i) for i in range(7)])
+
+    assert mock.call_count == 4
+    assert max_in_flight == 2
+    assert [e[0] for e in embeddings] == [float(i) for i in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_achunk_runs_off_the_event_loop():
+    ingestion = _s3_ingestion()
+    loop_thread = threading.get_ident()
+    chunk_threads = []
+    original_iter_chunks = ingestion.iter_chunks
+
+    def _iter_chunks(**kwargs):
+        for chunk in original_iter_chunks(**kwargs):
+            chunk_threads.append(threading.get_ident())
+            yield chunk
+
+    with patch.object(ingestion, "iter_chunks", side_effect=_iter_chunks):
+        chunks = await ingestion.achunk(
+            text="hello world", file_content=None, ocr_was_used=False
+        )
+
+    assert chunks == ["hello world"]
+    assert chunk_threads and chunk_threads[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_embedded_while_the_file_is_still_being_split():
+    ingestion = _s3_ingestion(batch_size=2, max_concurrent_requests=1)
+    first_batch_started = threading.Event()
+    waited_for_first_batch = []
+
+    def _iter_chunks(**kwargs):
+        for i in range(6):
+            if i == 5:
+                # splitting is still in progress when the first batch starts
+                waited_for_first_batch.append(first_batch_started.wait(timeout=5))
+            yield str(i)
+
+    async def _embed_and_store_batch(start_index, batch):
+        first_batch_started.set()
+        return len(batch)
+
+    with patch.object(ingestion, "iter_chunks", side_effect=_iter_chunks):
+        written = await ingestion.map_chunk_batches(
+            ingestion.aiter_chunks(text="x", file_content=None, ocr_was_used=False),
+            _embed_and_store_batch,
+        )
+
+    assert written == [2, 2, 2]
+    assert waited_for_first_batch == [True]
+
+
+@pytest.mark.asyncio
+async def test_provider_side_chunking_skips_local_chunks():
+    ingestion = OpenAIRAGIngestion(
+        ingest_options={"vector_store": {"custom_llm_provider": "openai"}}
+    )
+    with patch.object(ingestion, "iter_chunks") as mock_iter_chunks:
+        assert (
+            await ingestion.achunk(
+                text=None, file_content=b"some text", ocr_was_used=False
+            )
+            == []
+        )
+    mock_iter_chunks.assert_not_called()
+
+
+def _s3_response(json_body):
+    response = MagicMock(status_code=200)
+    response.json.return_value = json_body
+    return response
+
+
+@pytest.mark.asyncio
+async def test_s3_vectors_reingest_skips_unchanged_chunks():
+    ingestion = _s3_ingestion(
+        vector_store_options={"delete_orphaned_vectors": True}, batch_size=2
+    )
+    # "new" was inserted before "unchanged", which keeps its key
+    chunks = ["new", "unchanged", "edited"]
+    unchanged_key = f"doc.txt_{get_chunk_content_hash('unchanged')}"
+    old_key = f"doc.txt_{get_chunk_content_hash('old')}"
+    requests = []
+
+    async def _sign_and_execute_request(method, url, data=None):
+        requests.append((url.rsplit("/", 1)[-1], json.loads(data)))
+        if url.endswith("/GetVectors"):
+            return _s3_response({"vectors": [{"key": unchanged_key}]})
+        if url.endswith("/ListVectors"):
+            return _s3_response(
+                {
+                    "vectors": [
+                        {"key": unchanged_key, "metadata": {"filename": "doc.txt"}},
+                        {"key": old_key, "metadata": {"filename": "doc.txt"}},
+                        {"key": "other.txt_1", "metadata": {"filename": "other.txt"}},
+                    ]
+                }
+            )
+        return _s3_response({})
+
+    with patch.object(
+        ingestion, "_sign_and_execute_request", side_effect=_sign_and_execute_request
+    ), patch.object(
+        ingestion,
+        "_aembedding",
+        new=AsyncMock(side_effect=lambda batch: [[1.0, 0.0] for _ in batch]),
+    ) as mock_embedding, patch.object(
+        ingestion, "_put_vectors", new=AsyncMock()
+    ) as mock_put:
+        vector_store_id, filename = await ingestion.embed_and_store(
+            file_content=None, filename="doc.txt", content_type=None, chunks=chunks
+        )
+
+    assert (vector_store_id, filename) == ("bucket:index", "doc.txt")
+    embedded = [c for call in mock_embedding.call_args_list for c in call.args[0]]
+    assert embedded == ["new", "edited"]
+    stored = [v for call in mock_put.call_args_list for v in call.args[0]]
+    assert [v["key"] for v in stored] == [
+        f"doc.txt_{get_chunk_content_hash('new')}",
+        f"doc.txt_{get_chunk_content_hash('edited')}",
+    ]
+    assert stored[1]["metadata"]["chunk_index"] == "2"
+    # only the vector of the removed chunk of this file is deleted
+    [deleted] = [body["keys"] for name, body in requests if name == "DeleteVectors"]
+    assert deleted == [old_key]
+
+
+@pytest.mark.asyncio
+async def test_s3_vectors_failed_ingest_keeps_existing_vectors():
+    ingestion = _s3_ingestion(batch_size=1)
+    request = AsyncMock(return_value=_s3_response({"vectors": []}))
+
+    with patch.object(ingestion, "_sign_and_execute_request", new=request), patch.object(
+        ingestion, "_aembedding", new=AsyncMock(side_effect=Exception("rate limited"))
+    ):
+        with pytest.raises(Exception, match="rate limited"):
+            await ingestion.embed_and_store(
+                file_content=None,
+                filename="doc.txt",
+                content_type=None,
+                chunks=["a", "b", "c"],
+            )
+
+    called = [call.args[1].rsplit("/", 1)[-1] for call in request.call_args_list]
+    assert "ListVectors" not in called
+    assert "DeleteVectors" not in called
+
+
+@pytest.mark.asyncio
+async def test_s3_vectors_reingest_keeps_orphaned_vectors_by_default():
+    ingestion = _s3_ingestion()
+    request = AsyncMock(return_value=_s3_response({"vectors": []}))
+
+    with patch.object(ingestion, "_sign_and_execute_request", new=request), patch.object(
+        ingestion,
+        "_aembedding",
+        new=AsyncMock(side_effect=lambda batch: [[1.0, 0.0] for _ in batch]),
+    ), patch.object(ingestion, "_put_vectors", new=AsyncMock()):
+        await ingestion.embed_and_store(
+            file_content=None, filename="doc.txt", content_type=None, chunks=["a"]
+        )
+
+    called = [call.args[1].rsplit("/", 1)[-1] for call in request.call_args_list]
+    # no ListVectors scan over the whole index
+    assert called == ["GetVectors"]
@@ -0,0 +1,156 @@
+import os
+import random
+import sys
+from typing import List
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.rag.text_splitters import RecursiveCharacterTextSplitter
+
+
+class ReferenceSplitter:
+    """The previous (string joining) implementation, to check output parity."""
+
+    def __init__(self, chunk_size, chunk_overlap, separators=None):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = separators or ["\n\n", "\n", " ", ""]
+
+    def split_text(self, text: str) -> List[str]:
+        return self._split_text(text, self.separators)
+
+    def _split_text(self, text, separators):
+        final_chunks: List[str] = []
+        separator = separators[-1]
+        new_separators: List[str] = []
+        for i, sep in enumerate(separators):
+            if sep == "":
+                separator = sep
+                break
+            if sep in text:
+                separator = sep
+                new_separators = separators[i + 1 :]
+                break
+        splits = text.split(separator) if separator else list(text)
+        good_splits: List[str] = []
+        for split in splits:
+            if len(split) < self.chunk_size:
+                good_splits.append(split)
+            else:
+                if good_splits:
+                    final_chunks.extend(self._merge_splits(good_splits, separator))
+                    good_splits = []
+                if new_separators:
+                    final_chunks.extend(self._split_text(split, new_separators))
+                else:
+                    final_chunks.extend(self._force_split(split))
+        if good_splits:
+            final_chunks.extend(self._merge_splits(good_splits, separator))
+        return final_chunks
+
+    def _merge_splits(self, splits, separator):
+        chunks: List[str] = []
+        current_chunk: List[str] = []
+        current_length = 0
+        for split in splits:
+            split_len = len(split)
+            sep_len = len(separator) if current_chunk else 0
+            if current_length + split_len + sep_len > self.chunk_size:
+                if current_chunk:
+                    chunk_text = separator.join(current_chunk).strip()
+                    if chunk_text:
+                        chunks.append(chunk_text)
+                    while current_length > self.chunk_overlap and len(current_chunk) > 1:
+                        removed = current_chunk.pop(0)
+                        current_length -= len(removed) + len(separator)
+            current_chunk.append(split)
+            current_length += split_len + sep_len
+        if current_chunk:
+            chunk_text = separator.join(current_chunk).strip()
+            if chunk_text:
+                chunks.append(chunk_text)
+        return chunks
+
+    def _force_split(self, text):
+        chunks: List[str] = []
+        start = 0
+        while start < len(text):
+            end = start + self.chunk_size
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+            start = end - self.chunk_overlap if end < len(text) else len(text)
+        return chunks
+
+
+def _random_text(seed: int, length: int) -> str:
+    rng = random.Random(seed)
+    pieces = []
+    while sum(len(p) for p in pieces) < length:
+        roll = rng.random()
+        if roll < 0.05:
+            pieces.append("\n\n")
+        elif roll < 0.1:
+            pieces.append("\n")
+        elif roll < 0.12:
+            # long run without separators
+            pieces.append("x" * rng.randint(50, 400))
+        else:
+            pieces.append("w" * rng.randint(1, 12) + " ")
+    return "".join(pieces)
+
+
+@pytest.mark.parametrize(
+    "chunk_size,chunk_overlap,separators",
+    [
+        (100, 20, None),
+        (50, 0, None),
+        (200, 199, None),
+        (37, 5, None),
+        (60, 10, ["\n\n", "\n", " "]),
+        (80, 15, [". ", "\n"]),
+        (30, 40, None),
+    ],
+)
+@pytest.mark.parametrize("seed", range(5))
+def test_split_text_matches_reference(chunk_size, chunk_overlap, separators, seed):
+    text = _random_text(seed, 5000)
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap, separators=separators
+    )
+    reference = ReferenceSplitter(
+        chunk_size=chunk_size, chunk_overlap=chunk_overlap, separators=separators
+    )
+    assert splitter.split_text(text) == reference.split_text(text)
+
+
+def test_iter_split_text_is_lazy():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=20, chunk_overlap=0)
+    chunks = splitter.iter_split_text("word " * 10_000)
+    assert next(chunks) == "word word word word"
+    assert len(list(chunks)) > 1000
+
+
+def test_length_function_sizes_chunks():
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=5,
+        chunk_overlap=0,
+        length_function=lambda text: len(text.split()),
+    )
+    chunks = splitter.split_text(" ".join(f"w{i}" for i in range(12)))
+    # the separator counts 0 words; like with `len`, the last split of a chunk
+    # is always carried over to the next one
+    assert chunks == ["w0 w1 w2 w3 w4", "w4 w5 w6 w7 w8", "w8 w9 w10 w11"]
+
+
+def test_tokenizer_model_uses_token_counter_tokenizer():
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=10, chunk_overlap=0, tokenizer_model="gpt-4o"
+    )
+    chunks = splitter.split_text("hello world " * 50)
+    assert len(chunks) > 1
+    assert all(splitter.length_function(chunk) <= 10 for chunk in chunks)
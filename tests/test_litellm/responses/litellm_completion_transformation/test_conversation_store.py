@@ -0,0 +1,255 @@
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.responses.litellm_completion_transformation.conversation_store import (
+    ResponsesConversationStore,
+)
+from litellm.responses.litellm_completion_transformation.handler import (
+    LiteLLMCompletionTransformationHandler,
+)
+from litellm.responses.litellm_completion_transformation.session_handler import (
+    ResponsesSessionHandler,
+)
+from litellm.responses.utils import ResponsesAPIRequestUtils
+from litellm.types.utils import Message, ModelResponse
+
+
+def _user(content):
+    return {"role": "user", "content": content}
+
+
+def _assistant(content):
+    return Message(role="assistant", content=content)
+
+
+async def _add_turn(store, response_id, previous_response_id, history, turn):
+    await store.async_add_turn(
+        response_id=response_id,
+        previous_response_id=previous_response_id,
+        session_id="session-1",
+        turn_messages=[_user(turn)],
+        full_input_messages=history + [_user(turn)],
+        output_messages=[_assistant(f"answer to {turn}")],
+    )
+
+
+@pytest.fixture
+def conversation_store():
+    store = ResponsesConversationStore()
+    with patch.object(litellm, "responses_conversation_store", store):
+        yield store
+
+
+@pytest.mark.asyncio
+async def test_get_session_walks_previous_response_ids():
+    store = ResponsesConversationStore()
+    await _add_turn(store, "resp-1", None, [], "hi")
+    await _add_turn(store, "resp-2", "resp-1", [], "how are you")
+
+    session = await store.async_get_session("resp-2")
+    assert session["litellm_session_id"] == "session-1"
+    assert [m["content"] for m in session["messages"]] == [
+        "hi",
+        "answer to hi",
+        "how are you",
+        "answer to how are you",
+    ]
+    assert await store.async_get_session("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_encoded_response_ids_map_to_the_same_turn():
+    store = ResponsesConversationStore()
+    await _add_turn(store, "chatcmpl-1", None, [], "hi")
+    encoded_id = ResponsesAPIRequestUtils._build_responses_api_response_id(
+        custom_llm_provider="anthropic", model_id="model-1", response_id="chatcmpl-1"
+    )
+
+    session = await store.async_get_session(encoded_id)
+    assert session is not None
+    assert len(session["messages"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_compaction_bounds_lookup_reads():
+    store = ResponsesConversationStore(compaction_interval=3)
+    history = []
+    previous = None
+    for i in range(7):
+        await _add_turn(store, f"resp-{i}", previous, list(history), f"q{i}")
+        history += [_user(f"q{i}"), _assistant(f"answer to q{i}")]
+        previous = f"resp-{i}"
+
+    with patch.object(
+        store, "_async_get_entry", wraps=store._async_get_entry
+    ) as get_entry:
+        session = await store.async_get_session("resp-6")
+    assert get_entry.call_count <= 3
+    assert [m["content"] for m in session["messages"]] == [
+        m["content"] if isinstance(m, dict) else m.content for m in history
+    ]
+
+
+@pytest.mark.asyncio
+async def test_turn_after_spend_log_history_is_stored_compacted():
+    store = ResponsesConversationStore()
+    history = [_user("hi"), {"role": "assistant", "content": "hello"}]
+    await _add_turn(store, "resp-2", "resp-from-spend-logs", history, "next")
+
+    session = await store.async_get_session("resp-2")
+    assert [m["content"] for m in session["messages"]] == [
+        "hi",
+        "hello",
+        "next",
+        "answer to next",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_session_handler_reads_store_before_spend_logs(conversation_store):
+    await _add_turn(conversation_store, "resp-1", None, [], "hi")
+
+    with patch.object(
+        ResponsesSessionHandler,
+        "get_all_spend_logs_for_previous_response_id",
+        new=AsyncMock(return_value=[]),
+    ) as spend_logs:
+        session = await ResponsesSessionHandler.get_chat_completion_message_history_for_previous_response_id(
+            "resp-1"
+        )
+        assert len(session["messages"]) == 2
+        spend_logs.assert_not_called()
+
+        await ResponsesSessionHandler.get_chat_completion_message_history_for_previous_response_id(
+            "resp-missing"
+        )
+        spend_logs.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_responses_handler_chains_turns_through_store(conversation_store):
+    responses = [
+        ModelResponse(
+            id=f"chatcmpl-{i}",
+            choices=[{"message": {"role": "assistant", "content": f"reply {i}"}}],
+        )
+        for i in range(2)
+    ]
+    handler = LiteLLMCompletionTransformationHandler()
+    with patch("litellm.acompletion", new=AsyncMock(side_effect=responses)) as acompletion:
+        await handler.response_api_handler(
+            model="anthropic/claude-sonnet-4-5",
+            input="first question",
+            responses_api_request={},
+            custom_llm_provider="anthropic",
+            _is_async=True,
+        )
+        await handler.response_api_handler(
+            model="anthropic/claude-sonnet-4-5",
+            input="second question",
+            responses_api_request={"previous_response_id": "chatcmpl-0"},
+            custom_llm_provider="anthropic",
+            _is_async=True,
+        )
+
+    messages = acompletion.call_args_list[1].kwargs["messages"]
+    assert [m["content"] for m in messages] == [
+        "first question",
+        "reply 0",
+        "second question",
+    ]
+
+
+def test_sync_responses_handler_chains_turns_through_store(conversation_store):
+    responses = [
+        ModelResponse(
+            id=f"chatcmpl-{i}",
+            choices=[{"message": {"role": "assistant", "content": f"reply {i}"}}],
+        )
+        for i in range(3)
+    ]
+    handler = LiteLLMCompletionTransformationHandler()
+    with patch("litellm.completion", side_effect=responses) as completion:
+        for i, question in enumerate(["first", "second", "third"]):
+            handler.response_api_handler(
+                model="anthropic/claude-sonnet-4-5",
+                input=question,
+                responses_api_request=(
+                    {"previous_response_id": f"chatcmpl-{i - 1}"} if i else {}
+                ),
+                custom_llm_provider="anthropic",
+            )
+
+    messages = completion.call_args_list[2].kwargs["messages"]
+    assert [m["content"] for m in messages] == [
+        "first",
+        "reply 0",
+        "second",
+        "reply 1",
+        "third",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_turn_without_loaded_history_is_not_stored_compacted():
+    store = ResponsesConversationStore()
+    await store.async_add_turn(
+        response_id="resp-2",
+        previous_response_id="resp-unknown",
+        session_id="session-1",
+        turn_messages=[_user("next")],
+        full_input_messages=[_user("next")],
+        output_messages=[_assistant("answer to next")],
+        history_loaded=False,
+    )
+    assert await store.async_get_session("resp-2") is None
+
+    # a turn linked to a stored parent does not need the history
+    await _add_turn(store, "resp-1", None, [], "hi")
+    await store.async_add_turn(
+        response_id="resp-3",
+        previous_response_id="resp-1",
+        session_id="session-1",
+        turn_messages=[_user("next")],
+        full_input_messages=[_user("next")],
+        output_messages=[_assistant("answer to next")],
+        history_loaded=False,
+    )
+    session = await store.async_get_session("resp-3")
+    assert len(session["messages"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_responses_handler_skips_store_when_history_is_missing(
+    conversation_store,
+):
+    handler = LiteLLMCompletionTransformationHandler()
+    with patch.object(
+        ResponsesSessionHandler,
+        "get_all_spend_logs_for_previous_response_id",
+        new=AsyncMock(return_value=[]),
+    ), patch(
+        "litellm.acompletion",
+        new=AsyncMock(
+            return_value=ModelResponse(
+                id="chatcmpl-1",
+                choices=[{"message": {"role": "assistant", "content": "reply"}}],
+            )
+        ),
+    ):
+        await handler.response_api_handler(
+            model="anthropic/claude-sonnet-4-5",
+            input="second question",
+            responses_api_request={"previous_response_id": "chatcmpl-expired"},
+            custom_llm_provider="anthropic",
+            _is_async=True,
+        )
+
+    assert await conversation_store.async_get_session("chatcmpl-1") is None